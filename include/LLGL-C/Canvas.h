@@ -10,7 +10,8 @@
 
 
 #include <LLGL-C/Export.h>
-#include <LLGL-C/LLGLWrapper.h>
+#include <LLGL-C/Types.h>
+#include <LLGL-C/Wrapper/CanvasFlags.h>
 #include <LLGL-C/Surface.h>
 
 
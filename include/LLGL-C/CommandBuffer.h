@@ -10,7 +10,13 @@
 
 
 #include <LLGL-C/Export.h>
-#include <LLGL-C/LLGLWrapper.h>
+#include <LLGL-C/Types.h>
+#include <LLGL-C/Wrapper/CommandBufferFlags.h>
+#include <LLGL-C/Wrapper/Format.h>
+#include <LLGL-C/Wrapper/PipelineStateFlags.h>
+#include <LLGL-C/Wrapper/ResourceFlags.h>
+#include <LLGL-C/Wrapper/TextureFlags.h>
+#include <LLGL-C/Wrapper/Types.h>
 #include <stddef.h>
 #include <stdbool.h>
 
@@ -10,7 +10,9 @@
 
 
 #include <LLGL-C/Export.h>
-#include <LLGL-C/LLGLWrapper.h>
+#include <LLGL-C/Types.h>
+#include <LLGL-C/Wrapper/DisplayFlags.h>
+#include <LLGL-C/Wrapper/Types.h>
 #include <stddef.h>
 #include <stdbool.h>
 
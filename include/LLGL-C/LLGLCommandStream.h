@@ -0,0 +1,957 @@
+/*
+ * LLGLCommandStream.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_LLGLCOMMAND_STREAM_H
+#define LLGL_C99_LLGLCOMMAND_STREAM_H
+
+
+#include <LLGL-C/LLGL.h>
+#include <stdint.h>
+#include <stddef.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+#define LLGL_COMMAND_STREAM_ALIGNMENT   ( 8 )
+#define LLGL_COMMAND_STREAM_ALIGN(SIZE) ( ((SIZE) + 7u) & ~((size_t)7u) )
+
+
+/* ----- Enumerations ----- */
+
+typedef enum LLGLCommandOpcode
+{
+    LLGLCommandOpcodeUndefined = 0,
+    LLGLCommandOpcodeUpdateBuffer,
+    LLGLCommandOpcodeCopyBuffer,
+    LLGLCommandOpcodeCopyBufferFromTexture,
+    LLGLCommandOpcodeFillBuffer,
+    LLGLCommandOpcodeCopyTexture,
+    LLGLCommandOpcodeCopyTextureFromBuffer,
+    LLGLCommandOpcodeCopyTextureFromFramebuffer,
+    LLGLCommandOpcodeGenerateMips,
+    LLGLCommandOpcodeGenerateMipsRange,
+    LLGLCommandOpcodeSetViewport,
+    LLGLCommandOpcodeSetViewports,
+    LLGLCommandOpcodeSetScissor,
+    LLGLCommandOpcodeSetScissors,
+    LLGLCommandOpcodeSetVertexBuffer,
+    LLGLCommandOpcodeSetVertexBufferArray,
+    LLGLCommandOpcodeSetIndexBuffer,
+    LLGLCommandOpcodeSetIndexBufferExt,
+    LLGLCommandOpcodeSetResourceHeap,
+    LLGLCommandOpcodeSetResource,
+    LLGLCommandOpcodeResetResourceSlots,
+    LLGLCommandOpcodeBeginRenderPass,
+    LLGLCommandOpcodeBeginRenderPassWithClear,
+    LLGLCommandOpcodeEndRenderPass,
+    LLGLCommandOpcodeClear,
+    LLGLCommandOpcodeClearAttachments,
+    LLGLCommandOpcodeSetPipelineState,
+    LLGLCommandOpcodeSetBlendFactor,
+    LLGLCommandOpcodeSetStencilReference,
+    LLGLCommandOpcodeSetUniforms,
+    LLGLCommandOpcodeBeginQuery,
+    LLGLCommandOpcodeEndQuery,
+    LLGLCommandOpcodeBeginRenderCondition,
+    LLGLCommandOpcodeEndRenderCondition,
+    LLGLCommandOpcodeBeginStreamOutput,
+    LLGLCommandOpcodeEndStreamOutput,
+    LLGLCommandOpcodeDraw,
+    LLGLCommandOpcodeDrawIndexed,
+    LLGLCommandOpcodeDrawIndexedExt,
+    LLGLCommandOpcodeDrawInstanced,
+    LLGLCommandOpcodeDrawInstancedExt,
+    LLGLCommandOpcodeDrawIndexedInstanced,
+    LLGLCommandOpcodeDrawIndexedInstancedExt,
+    LLGLCommandOpcodeDrawIndirect,
+    LLGLCommandOpcodeDrawIndirectExt,
+    LLGLCommandOpcodeDrawIndexedIndirect,
+    LLGLCommandOpcodeDrawIndexedIndirectExt,
+    LLGLCommandOpcodeDispatch,
+    LLGLCommandOpcodeDispatchIndirect,
+    LLGLCommandOpcodePushDebugGroup,
+    LLGLCommandOpcodePopDebugGroup,
+    LLGLCommandOpcodeDoNativeCommand,
+    LLGLCommandOpcodeCount, /* Number of opcodes; packets with this or a greater opcode are skipped by the decoder */
+}
+LLGLCommandOpcode;
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLCommandHeader
+{
+    uint32_t opcode; /* LLGLCommandOpcode */
+    uint32_t size;   /* Packet size in bytes including this header and the trailing payload, aligned to LLGL_COMMAND_STREAM_ALIGNMENT */
+}
+LLGLCommandHeader;
+
+typedef struct LLGLCommandStreamBuffer
+{
+    char*   data;
+    size_t  size;     /* Number of bytes encoded so far */
+    size_t  capacity; /* Number of bytes allocated for data */
+}
+LLGLCommandStreamBuffer;
+
+typedef struct LLGLCommandUpdateBuffer
+{
+    LLGLBuffer dstBuffer;
+    uint64_t   dstOffset;
+    uint16_t   dataSize;
+}
+LLGLCommandUpdateBuffer;
+
+typedef struct LLGLCommandCopyBuffer
+{
+    LLGLBuffer dstBuffer;
+    uint64_t   dstOffset;
+    LLGLBuffer srcBuffer;
+    uint64_t   srcOffset;
+    uint64_t   size;
+}
+LLGLCommandCopyBuffer;
+
+typedef struct LLGLCommandCopyBufferFromTexture
+{
+    LLGLBuffer        dstBuffer;
+    uint64_t          dstOffset;
+    LLGLTexture       srcTexture;
+    LLGLTextureRegion srcRegion;
+    uint32_t          rowStride;
+    uint32_t          layerStride;
+}
+LLGLCommandCopyBufferFromTexture;
+
+typedef struct LLGLCommandFillBuffer
+{
+    LLGLBuffer dstBuffer;
+    uint64_t   dstOffset;
+    uint32_t   value;
+    uint64_t   fillSize;
+}
+LLGLCommandFillBuffer;
+
+typedef struct LLGLCommandCopyTexture
+{
+    LLGLTexture         dstTexture;
+    LLGLTextureLocation dstLocation;
+    LLGLTexture         srcTexture;
+    LLGLTextureLocation srcLocation;
+    LLGLExtent3D        extent;
+}
+LLGLCommandCopyTexture;
+
+typedef struct LLGLCommandCopyTextureFromBuffer
+{
+    LLGLTexture       dstTexture;
+    LLGLTextureRegion dstRegion;
+    LLGLBuffer        srcBuffer;
+    uint64_t          srcOffset;
+    uint32_t          rowStride;
+    uint32_t          layerStride;
+}
+LLGLCommandCopyTextureFromBuffer;
+
+typedef struct LLGLCommandCopyTextureFromFramebuffer
+{
+    LLGLTexture       dstTexture;
+    LLGLTextureRegion dstRegion;
+    LLGLOffset2D      srcOffset;
+}
+LLGLCommandCopyTextureFromFramebuffer;
+
+typedef struct LLGLCommandGenerateMips
+{
+    LLGLTexture texture;
+}
+LLGLCommandGenerateMips;
+
+typedef struct LLGLCommandGenerateMipsRange
+{
+    LLGLTexture            texture;
+    LLGLTextureSubresource subresource;
+}
+LLGLCommandGenerateMipsRange;
+
+typedef struct LLGLCommandSetViewport
+{
+    LLGLViewport viewport;
+}
+LLGLCommandSetViewport;
+
+typedef struct LLGLCommandSetViewports
+{
+    uint32_t numViewports;
+}
+LLGLCommandSetViewports;
+
+typedef struct LLGLCommandSetScissor
+{
+    LLGLScissor scissor;
+}
+LLGLCommandSetScissor;
+
+typedef struct LLGLCommandSetScissors
+{
+    uint32_t numScissors;
+}
+LLGLCommandSetScissors;
+
+typedef struct LLGLCommandSetVertexBuffer
+{
+    LLGLBuffer buffer;
+}
+LLGLCommandSetVertexBuffer;
+
+typedef struct LLGLCommandSetVertexBufferArray
+{
+    LLGLBufferArray bufferArray;
+}
+LLGLCommandSetVertexBufferArray;
+
+typedef struct LLGLCommandSetIndexBuffer
+{
+    LLGLBuffer buffer;
+}
+LLGLCommandSetIndexBuffer;
+
+typedef struct LLGLCommandSetIndexBufferExt
+{
+    LLGLBuffer buffer;
+    LLGLFormat format;
+    uint64_t   offset;
+}
+LLGLCommandSetIndexBufferExt;
+
+typedef struct LLGLCommandSetResourceHeap
+{
+    LLGLResourceHeap resourceHeap;
+    uint32_t         descriptorSet;
+}
+LLGLCommandSetResourceHeap;
+
+typedef struct LLGLCommandSetResource
+{
+    uint32_t     descriptor;
+    LLGLResource resource;
+}
+LLGLCommandSetResource;
+
+typedef struct LLGLCommandResetResourceSlots
+{
+    LLGLResourceType resourceType;
+    uint32_t         firstSlot;
+    uint32_t         numSlots;
+    uint32_t         bindFlags;
+    uint32_t         stageFlags;
+}
+LLGLCommandResetResourceSlots;
+
+typedef struct LLGLCommandBeginRenderPass
+{
+    LLGLRenderTarget renderTarget;
+}
+LLGLCommandBeginRenderPass;
+
+typedef struct LLGLCommandBeginRenderPassWithClear
+{
+    LLGLRenderTarget renderTarget;
+    LLGLRenderPass   renderPass;
+    uint32_t         numClearValues;
+    uint32_t         swapBufferIndex;
+}
+LLGLCommandBeginRenderPassWithClear;
+
+typedef struct LLGLCommandClear
+{
+    uint32_t       flags;
+    LLGLClearValue clearValue;
+}
+LLGLCommandClear;
+
+typedef struct LLGLCommandClearAttachments
+{
+    uint32_t numAttachments;
+}
+LLGLCommandClearAttachments;
+
+typedef struct LLGLCommandSetPipelineState
+{
+    LLGLPipelineState pipelineState;
+}
+LLGLCommandSetPipelineState;
+
+typedef struct LLGLCommandSetBlendFactor
+{
+    float color[4];
+}
+LLGLCommandSetBlendFactor;
+
+typedef struct LLGLCommandSetStencilReference
+{
+    uint32_t        reference;
+    LLGLStencilFace stencilFace;
+}
+LLGLCommandSetStencilReference;
+
+typedef struct LLGLCommandSetUniforms
+{
+    uint32_t first;
+    uint16_t dataSize;
+}
+LLGLCommandSetUniforms;
+
+typedef struct LLGLCommandBeginQuery
+{
+    LLGLQueryHeap queryHeap;
+    uint32_t      query;
+}
+LLGLCommandBeginQuery;
+
+typedef struct LLGLCommandEndQuery
+{
+    LLGLQueryHeap queryHeap;
+    uint32_t      query;
+}
+LLGLCommandEndQuery;
+
+typedef struct LLGLCommandBeginRenderCondition
+{
+    LLGLQueryHeap           queryHeap;
+    uint32_t                query;
+    LLGLRenderConditionMode mode;
+}
+LLGLCommandBeginRenderCondition;
+
+typedef struct LLGLCommandBeginStreamOutput
+{
+    uint32_t numBuffers;
+}
+LLGLCommandBeginStreamOutput;
+
+typedef struct LLGLCommandDraw
+{
+    uint32_t numVertices;
+    uint32_t firstVertex;
+}
+LLGLCommandDraw;
+
+typedef struct LLGLCommandDrawIndexed
+{
+    uint32_t numIndices;
+    uint32_t firstIndex;
+}
+LLGLCommandDrawIndexed;
+
+typedef struct LLGLCommandDrawIndexedExt
+{
+    uint32_t numIndices;
+    uint32_t firstIndex;
+    int32_t  vertexOffset;
+}
+LLGLCommandDrawIndexedExt;
+
+typedef struct LLGLCommandDrawInstanced
+{
+    uint32_t numVertices;
+    uint32_t firstVertex;
+    uint32_t numInstances;
+}
+LLGLCommandDrawInstanced;
+
+typedef struct LLGLCommandDrawInstancedExt
+{
+    uint32_t numVertices;
+    uint32_t firstVertex;
+    uint32_t numInstances;
+    uint32_t firstInstance;
+}
+LLGLCommandDrawInstancedExt;
+
+typedef struct LLGLCommandDrawIndexedInstanced
+{
+    uint32_t numIndices;
+    uint32_t numInstances;
+    uint32_t firstIndex;
+}
+LLGLCommandDrawIndexedInstanced;
+
+typedef struct LLGLCommandDrawIndexedInstancedExt
+{
+    uint32_t numIndices;
+    uint32_t numInstances;
+    uint32_t firstIndex;
+    int32_t  vertexOffset;
+    uint32_t firstInstance;
+}
+LLGLCommandDrawIndexedInstancedExt;
+
+typedef struct LLGLCommandDrawIndirect
+{
+    LLGLBuffer buffer;
+    uint64_t   offset;
+}
+LLGLCommandDrawIndirect;
+
+typedef struct LLGLCommandDrawIndirectExt
+{
+    LLGLBuffer buffer;
+    uint64_t   offset;
+    uint32_t   numCommands;
+    uint32_t   stride;
+}
+LLGLCommandDrawIndirectExt;
+
+typedef struct LLGLCommandDrawIndexedIndirect
+{
+    LLGLBuffer buffer;
+    uint64_t   offset;
+}
+LLGLCommandDrawIndexedIndirect;
+
+typedef struct LLGLCommandDrawIndexedIndirectExt
+{
+    LLGLBuffer buffer;
+    uint64_t   offset;
+    uint32_t   numCommands;
+    uint32_t   stride;
+}
+LLGLCommandDrawIndexedIndirectExt;
+
+typedef struct LLGLCommandDispatch
+{
+    uint32_t numWorkGroupsX;
+    uint32_t numWorkGroupsY;
+    uint32_t numWorkGroupsZ;
+}
+LLGLCommandDispatch;
+
+typedef struct LLGLCommandDispatchIndirect
+{
+    LLGLBuffer buffer;
+    uint64_t   offset;
+}
+LLGLCommandDispatchIndirect;
+
+typedef struct LLGLCommandDoNativeCommand
+{
+    uint64_t nativeCommandSize;
+}
+LLGLCommandDoNativeCommand;
+
+
+/* ----- Functions ----- */
+
+/*
+Appends a packet with the specified opcode to the stream and returns a pointer to its payload of at least 'payloadSize' bytes.
+The stream grows with realloc; release it with free(stream->data). Returns NULL and leaves the stream unchanged
+if the packet size does not fit into LLGLCommandHeader::size or if the stream could not grow.
+*/
+static inline void* llglAllocCommandPacket(LLGLCommandStreamBuffer* stream, LLGLCommandOpcode opcode, size_t payloadSize)
+{
+    if (payloadSize > (size_t)UINT32_MAX - sizeof(LLGLCommandHeader) - (LLGL_COMMAND_STREAM_ALIGNMENT - 1))
+        return NULL;
+
+    const size_t packetSize = sizeof(LLGLCommandHeader) + LLGL_COMMAND_STREAM_ALIGN(payloadSize);
+
+    if (stream->size + packetSize > stream->capacity)
+    {
+        if (stream->size > SIZE_MAX / 2 || packetSize > SIZE_MAX / 2 - stream->size)
+            return NULL;
+        const size_t newCapacity = (stream->size + packetSize) * 2;
+        char* newData = (char*)realloc(stream->data, newCapacity);
+        if (newData == NULL)
+            return NULL;
+        stream->data        = newData;
+        stream->capacity    = newCapacity;
+    }
+
+    LLGLCommandHeader* header = (LLGLCommandHeader*)(stream->data + stream->size);
+    header->opcode  = (uint32_t)opcode;
+    header->size    = (uint32_t)packetSize;
+    stream->size += packetSize;
+
+    return header + 1;
+}
+
+/*
+Replays all packets of the specified command stream against the current command buffer (see llglBegin).
+The stream must be aligned to LLGL_COMMAND_STREAM_ALIGNMENT and is only read by this function.
+Decoding stops at the first packet that is truncated or whose payload does not fit into its packet size.
+Packets with an unknown opcode are skipped. llglBegin, llglEnd, and llglExecute have no opcode, so a stream cannot switch or submit command buffers.
+*/
+LLGL_C_EXPORT void llglExecuteCommandStream(const void* stream, size_t streamSize);
+
+#ifdef LLGL_COMMAND_STREAM_IMPLEMENTATION
+
+LLGL_C_EXPORT void llglExecuteCommandStream(const void* stream, size_t streamSize)
+{
+    const char* streamPos = (const char*)stream;
+    const char* streamEnd = streamPos + streamSize;
+
+    while (streamPos + sizeof(LLGLCommandHeader) <= streamEnd)
+    {
+        const LLGLCommandHeader* header = (const LLGLCommandHeader*)streamPos;
+        const char* payload = streamPos + sizeof(LLGLCommandHeader);
+
+        if (header->size < sizeof(LLGLCommandHeader) || header->size > (size_t)(streamEnd - streamPos))
+            break;
+
+        const char* packetEnd = streamPos + header->size;
+
+        switch (header->opcode)
+        {
+            case LLGLCommandOpcodeUpdateBuffer:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLCommandUpdateBuffer)))
+                    return;
+                const LLGLCommandUpdateBuffer* cmd = (const LLGLCommandUpdateBuffer*)payload;
+                const char* tail = payload + LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLCommandUpdateBuffer));
+                if (cmd->dataSize > (size_t)(packetEnd - tail) / sizeof(char) || LLGL_COMMAND_STREAM_ALIGN(sizeof(char) * cmd->dataSize) > (size_t)(packetEnd - tail))
+                    return;
+                const void* data = (const void*)tail;
+                llglUpdateBuffer(cmd->dstBuffer, cmd->dstOffset, data, cmd->dataSize);
+                break;
+            }
+            case LLGLCommandOpcodeCopyBuffer:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandCopyBuffer))
+                    return;
+                const LLGLCommandCopyBuffer* cmd = (const LLGLCommandCopyBuffer*)payload;
+                llglCopyBuffer(cmd->dstBuffer, cmd->dstOffset, cmd->srcBuffer, cmd->srcOffset, cmd->size);
+                break;
+            }
+            case LLGLCommandOpcodeCopyBufferFromTexture:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandCopyBufferFromTexture))
+                    return;
+                const LLGLCommandCopyBufferFromTexture* cmd = (const LLGLCommandCopyBufferFromTexture*)payload;
+                llglCopyBufferFromTexture(cmd->dstBuffer, cmd->dstOffset, cmd->srcTexture, &cmd->srcRegion, cmd->rowStride, cmd->layerStride);
+                break;
+            }
+            case LLGLCommandOpcodeFillBuffer:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandFillBuffer))
+                    return;
+                const LLGLCommandFillBuffer* cmd = (const LLGLCommandFillBuffer*)payload;
+                llglFillBuffer(cmd->dstBuffer, cmd->dstOffset, cmd->value, cmd->fillSize);
+                break;
+            }
+            case LLGLCommandOpcodeCopyTexture:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandCopyTexture))
+                    return;
+                const LLGLCommandCopyTexture* cmd = (const LLGLCommandCopyTexture*)payload;
+                llglCopyTexture(cmd->dstTexture, &cmd->dstLocation, cmd->srcTexture, &cmd->srcLocation, &cmd->extent);
+                break;
+            }
+            case LLGLCommandOpcodeCopyTextureFromBuffer:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandCopyTextureFromBuffer))
+                    return;
+                const LLGLCommandCopyTextureFromBuffer* cmd = (const LLGLCommandCopyTextureFromBuffer*)payload;
+                llglCopyTextureFromBuffer(cmd->dstTexture, &cmd->dstRegion, cmd->srcBuffer, cmd->srcOffset, cmd->rowStride, cmd->layerStride);
+                break;
+            }
+            case LLGLCommandOpcodeCopyTextureFromFramebuffer:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandCopyTextureFromFramebuffer))
+                    return;
+                const LLGLCommandCopyTextureFromFramebuffer* cmd = (const LLGLCommandCopyTextureFromFramebuffer*)payload;
+                llglCopyTextureFromFramebuffer(cmd->dstTexture, &cmd->dstRegion, &cmd->srcOffset);
+                break;
+            }
+            case LLGLCommandOpcodeGenerateMips:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandGenerateMips))
+                    return;
+                const LLGLCommandGenerateMips* cmd = (const LLGLCommandGenerateMips*)payload;
+                llglGenerateMips(cmd->texture);
+                break;
+            }
+            case LLGLCommandOpcodeGenerateMipsRange:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandGenerateMipsRange))
+                    return;
+                const LLGLCommandGenerateMipsRange* cmd = (const LLGLCommandGenerateMipsRange*)payload;
+                llglGenerateMipsRange(cmd->texture, &cmd->subresource);
+                break;
+            }
+            case LLGLCommandOpcodeSetViewport:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandSetViewport))
+                    return;
+                const LLGLCommandSetViewport* cmd = (const LLGLCommandSetViewport*)payload;
+                llglSetViewport(&cmd->viewport);
+                break;
+            }
+            case LLGLCommandOpcodeSetViewports:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLCommandSetViewports)))
+                    return;
+                const LLGLCommandSetViewports* cmd = (const LLGLCommandSetViewports*)payload;
+                const char* tail = payload + LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLCommandSetViewports));
+                if (cmd->numViewports > (size_t)(packetEnd - tail) / sizeof(LLGLViewport) || LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLViewport) * cmd->numViewports) > (size_t)(packetEnd - tail))
+                    return;
+                const LLGLViewport* viewports = (const LLGLViewport*)tail;
+                llglSetViewports(cmd->numViewports, viewports);
+                break;
+            }
+            case LLGLCommandOpcodeSetScissor:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandSetScissor))
+                    return;
+                const LLGLCommandSetScissor* cmd = (const LLGLCommandSetScissor*)payload;
+                llglSetScissor(&cmd->scissor);
+                break;
+            }
+            case LLGLCommandOpcodeSetScissors:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLCommandSetScissors)))
+                    return;
+                const LLGLCommandSetScissors* cmd = (const LLGLCommandSetScissors*)payload;
+                const char* tail = payload + LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLCommandSetScissors));
+                if (cmd->numScissors > (size_t)(packetEnd - tail) / sizeof(LLGLScissor) || LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLScissor) * cmd->numScissors) > (size_t)(packetEnd - tail))
+                    return;
+                const LLGLScissor* scissors = (const LLGLScissor*)tail;
+                llglSetScissors(cmd->numScissors, scissors);
+                break;
+            }
+            case LLGLCommandOpcodeSetVertexBuffer:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandSetVertexBuffer))
+                    return;
+                const LLGLCommandSetVertexBuffer* cmd = (const LLGLCommandSetVertexBuffer*)payload;
+                llglSetVertexBuffer(cmd->buffer);
+                break;
+            }
+            case LLGLCommandOpcodeSetVertexBufferArray:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandSetVertexBufferArray))
+                    return;
+                const LLGLCommandSetVertexBufferArray* cmd = (const LLGLCommandSetVertexBufferArray*)payload;
+                llglSetVertexBufferArray(cmd->bufferArray);
+                break;
+            }
+            case LLGLCommandOpcodeSetIndexBuffer:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandSetIndexBuffer))
+                    return;
+                const LLGLCommandSetIndexBuffer* cmd = (const LLGLCommandSetIndexBuffer*)payload;
+                llglSetIndexBuffer(cmd->buffer);
+                break;
+            }
+            case LLGLCommandOpcodeSetIndexBufferExt:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandSetIndexBufferExt))
+                    return;
+                const LLGLCommandSetIndexBufferExt* cmd = (const LLGLCommandSetIndexBufferExt*)payload;
+                llglSetIndexBufferExt(cmd->buffer, cmd->format, cmd->offset);
+                break;
+            }
+            case LLGLCommandOpcodeSetResourceHeap:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandSetResourceHeap))
+                    return;
+                const LLGLCommandSetResourceHeap* cmd = (const LLGLCommandSetResourceHeap*)payload;
+                llglSetResourceHeap(cmd->resourceHeap, cmd->descriptorSet);
+                break;
+            }
+            case LLGLCommandOpcodeSetResource:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandSetResource))
+                    return;
+                const LLGLCommandSetResource* cmd = (const LLGLCommandSetResource*)payload;
+                llglSetResource(cmd->descriptor, cmd->resource);
+                break;
+            }
+            case LLGLCommandOpcodeResetResourceSlots:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandResetResourceSlots))
+                    return;
+                const LLGLCommandResetResourceSlots* cmd = (const LLGLCommandResetResourceSlots*)payload;
+                llglResetResourceSlots(cmd->resourceType, cmd->firstSlot, cmd->numSlots, cmd->bindFlags, cmd->stageFlags);
+                break;
+            }
+            case LLGLCommandOpcodeBeginRenderPass:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandBeginRenderPass))
+                    return;
+                const LLGLCommandBeginRenderPass* cmd = (const LLGLCommandBeginRenderPass*)payload;
+                llglBeginRenderPass(cmd->renderTarget);
+                break;
+            }
+            case LLGLCommandOpcodeBeginRenderPassWithClear:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLCommandBeginRenderPassWithClear)))
+                    return;
+                const LLGLCommandBeginRenderPassWithClear* cmd = (const LLGLCommandBeginRenderPassWithClear*)payload;
+                const char* tail = payload + LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLCommandBeginRenderPassWithClear));
+                if (cmd->numClearValues > (size_t)(packetEnd - tail) / sizeof(LLGLClearValue) || LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLClearValue) * cmd->numClearValues) > (size_t)(packetEnd - tail))
+                    return;
+                const LLGLClearValue* clearValues = (const LLGLClearValue*)tail;
+                llglBeginRenderPassWithClear(cmd->renderTarget, cmd->renderPass, cmd->numClearValues, clearValues, cmd->swapBufferIndex);
+                break;
+            }
+            case LLGLCommandOpcodeEndRenderPass:
+            {
+                llglEndRenderPass();
+                break;
+            }
+            case LLGLCommandOpcodeClear:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandClear))
+                    return;
+                const LLGLCommandClear* cmd = (const LLGLCommandClear*)payload;
+                llglClear(cmd->flags, &cmd->clearValue);
+                break;
+            }
+            case LLGLCommandOpcodeClearAttachments:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLCommandClearAttachments)))
+                    return;
+                const LLGLCommandClearAttachments* cmd = (const LLGLCommandClearAttachments*)payload;
+                const char* tail = payload + LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLCommandClearAttachments));
+                if (cmd->numAttachments > (size_t)(packetEnd - tail) / sizeof(LLGLAttachmentClear) || LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLAttachmentClear) * cmd->numAttachments) > (size_t)(packetEnd - tail))
+                    return;
+                const LLGLAttachmentClear* attachments = (const LLGLAttachmentClear*)tail;
+                llglClearAttachments(cmd->numAttachments, attachments);
+                break;
+            }
+            case LLGLCommandOpcodeSetPipelineState:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandSetPipelineState))
+                    return;
+                const LLGLCommandSetPipelineState* cmd = (const LLGLCommandSetPipelineState*)payload;
+                llglSetPipelineState(cmd->pipelineState);
+                break;
+            }
+            case LLGLCommandOpcodeSetBlendFactor:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandSetBlendFactor))
+                    return;
+                const LLGLCommandSetBlendFactor* cmd = (const LLGLCommandSetBlendFactor*)payload;
+                llglSetBlendFactor(cmd->color);
+                break;
+            }
+            case LLGLCommandOpcodeSetStencilReference:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandSetStencilReference))
+                    return;
+                const LLGLCommandSetStencilReference* cmd = (const LLGLCommandSetStencilReference*)payload;
+                llglSetStencilReference(cmd->reference, cmd->stencilFace);
+                break;
+            }
+            case LLGLCommandOpcodeSetUniforms:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLCommandSetUniforms)))
+                    return;
+                const LLGLCommandSetUniforms* cmd = (const LLGLCommandSetUniforms*)payload;
+                const char* tail = payload + LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLCommandSetUniforms));
+                if (cmd->dataSize > (size_t)(packetEnd - tail) / sizeof(char) || LLGL_COMMAND_STREAM_ALIGN(sizeof(char) * cmd->dataSize) > (size_t)(packetEnd - tail))
+                    return;
+                const void* data = (const void*)tail;
+                llglSetUniforms(cmd->first, data, cmd->dataSize);
+                break;
+            }
+            case LLGLCommandOpcodeBeginQuery:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandBeginQuery))
+                    return;
+                const LLGLCommandBeginQuery* cmd = (const LLGLCommandBeginQuery*)payload;
+                llglBeginQuery(cmd->queryHeap, cmd->query);
+                break;
+            }
+            case LLGLCommandOpcodeEndQuery:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandEndQuery))
+                    return;
+                const LLGLCommandEndQuery* cmd = (const LLGLCommandEndQuery*)payload;
+                llglEndQuery(cmd->queryHeap, cmd->query);
+                break;
+            }
+            case LLGLCommandOpcodeBeginRenderCondition:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandBeginRenderCondition))
+                    return;
+                const LLGLCommandBeginRenderCondition* cmd = (const LLGLCommandBeginRenderCondition*)payload;
+                llglBeginRenderCondition(cmd->queryHeap, cmd->query, cmd->mode);
+                break;
+            }
+            case LLGLCommandOpcodeEndRenderCondition:
+            {
+                llglEndRenderCondition();
+                break;
+            }
+            case LLGLCommandOpcodeBeginStreamOutput:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLCommandBeginStreamOutput)))
+                    return;
+                const LLGLCommandBeginStreamOutput* cmd = (const LLGLCommandBeginStreamOutput*)payload;
+                const char* tail = payload + LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLCommandBeginStreamOutput));
+                if (cmd->numBuffers > (size_t)(packetEnd - tail) / sizeof(LLGLBuffer) || LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLBuffer) * cmd->numBuffers) > (size_t)(packetEnd - tail))
+                    return;
+                const LLGLBuffer* buffers = (const LLGLBuffer*)tail;
+                llglBeginStreamOutput(cmd->numBuffers, buffers);
+                break;
+            }
+            case LLGLCommandOpcodeEndStreamOutput:
+            {
+                llglEndStreamOutput();
+                break;
+            }
+            case LLGLCommandOpcodeDraw:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandDraw))
+                    return;
+                const LLGLCommandDraw* cmd = (const LLGLCommandDraw*)payload;
+                llglDraw(cmd->numVertices, cmd->firstVertex);
+                break;
+            }
+            case LLGLCommandOpcodeDrawIndexed:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandDrawIndexed))
+                    return;
+                const LLGLCommandDrawIndexed* cmd = (const LLGLCommandDrawIndexed*)payload;
+                llglDrawIndexed(cmd->numIndices, cmd->firstIndex);
+                break;
+            }
+            case LLGLCommandOpcodeDrawIndexedExt:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandDrawIndexedExt))
+                    return;
+                const LLGLCommandDrawIndexedExt* cmd = (const LLGLCommandDrawIndexedExt*)payload;
+                llglDrawIndexedExt(cmd->numIndices, cmd->firstIndex, cmd->vertexOffset);
+                break;
+            }
+            case LLGLCommandOpcodeDrawInstanced:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandDrawInstanced))
+                    return;
+                const LLGLCommandDrawInstanced* cmd = (const LLGLCommandDrawInstanced*)payload;
+                llglDrawInstanced(cmd->numVertices, cmd->firstVertex, cmd->numInstances);
+                break;
+            }
+            case LLGLCommandOpcodeDrawInstancedExt:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandDrawInstancedExt))
+                    return;
+                const LLGLCommandDrawInstancedExt* cmd = (const LLGLCommandDrawInstancedExt*)payload;
+                llglDrawInstancedExt(cmd->numVertices, cmd->firstVertex, cmd->numInstances, cmd->firstInstance);
+                break;
+            }
+            case LLGLCommandOpcodeDrawIndexedInstanced:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandDrawIndexedInstanced))
+                    return;
+                const LLGLCommandDrawIndexedInstanced* cmd = (const LLGLCommandDrawIndexedInstanced*)payload;
+                llglDrawIndexedInstanced(cmd->numIndices, cmd->numInstances, cmd->firstIndex);
+                break;
+            }
+            case LLGLCommandOpcodeDrawIndexedInstancedExt:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandDrawIndexedInstancedExt))
+                    return;
+                const LLGLCommandDrawIndexedInstancedExt* cmd = (const LLGLCommandDrawIndexedInstancedExt*)payload;
+                llglDrawIndexedInstancedExt(cmd->numIndices, cmd->numInstances, cmd->firstIndex, cmd->vertexOffset, cmd->firstInstance);
+                break;
+            }
+            case LLGLCommandOpcodeDrawIndirect:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandDrawIndirect))
+                    return;
+                const LLGLCommandDrawIndirect* cmd = (const LLGLCommandDrawIndirect*)payload;
+                llglDrawIndirect(cmd->buffer, cmd->offset);
+                break;
+            }
+            case LLGLCommandOpcodeDrawIndirectExt:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandDrawIndirectExt))
+                    return;
+                const LLGLCommandDrawIndirectExt* cmd = (const LLGLCommandDrawIndirectExt*)payload;
+                llglDrawIndirectExt(cmd->buffer, cmd->offset, cmd->numCommands, cmd->stride);
+                break;
+            }
+            case LLGLCommandOpcodeDrawIndexedIndirect:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandDrawIndexedIndirect))
+                    return;
+                const LLGLCommandDrawIndexedIndirect* cmd = (const LLGLCommandDrawIndexedIndirect*)payload;
+                llglDrawIndexedIndirect(cmd->buffer, cmd->offset);
+                break;
+            }
+            case LLGLCommandOpcodeDrawIndexedIndirectExt:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandDrawIndexedIndirectExt))
+                    return;
+                const LLGLCommandDrawIndexedIndirectExt* cmd = (const LLGLCommandDrawIndexedIndirectExt*)payload;
+                llglDrawIndexedIndirectExt(cmd->buffer, cmd->offset, cmd->numCommands, cmd->stride);
+                break;
+            }
+            case LLGLCommandOpcodeDispatch:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandDispatch))
+                    return;
+                const LLGLCommandDispatch* cmd = (const LLGLCommandDispatch*)payload;
+                llglDispatch(cmd->numWorkGroupsX, cmd->numWorkGroupsY, cmd->numWorkGroupsZ);
+                break;
+            }
+            case LLGLCommandOpcodeDispatchIndirect:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + sizeof(LLGLCommandDispatchIndirect))
+                    return;
+                const LLGLCommandDispatchIndirect* cmd = (const LLGLCommandDispatchIndirect*)payload;
+                llglDispatchIndirect(cmd->buffer, cmd->offset);
+                break;
+            }
+            case LLGLCommandOpcodePushDebugGroup:
+            {
+                const char* tail = payload;
+                const char* nameEnd = (const char*)memchr(tail, 0, (size_t)(packetEnd - tail));
+                if (nameEnd == NULL || LLGL_COMMAND_STREAM_ALIGN((size_t)(nameEnd - tail) + 1) > (size_t)(packetEnd - tail))
+                    return;
+                const char* name = tail;
+                llglPushDebugGroup(name);
+                break;
+            }
+            case LLGLCommandOpcodePopDebugGroup:
+            {
+                llglPopDebugGroup();
+                break;
+            }
+            case LLGLCommandOpcodeDoNativeCommand:
+            {
+                if (header->size < sizeof(LLGLCommandHeader) + LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLCommandDoNativeCommand)))
+                    return;
+                const LLGLCommandDoNativeCommand* cmd = (const LLGLCommandDoNativeCommand*)payload;
+                const char* tail = payload + LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLCommandDoNativeCommand));
+                if (cmd->nativeCommandSize > (size_t)(packetEnd - tail) / sizeof(char) || LLGL_COMMAND_STREAM_ALIGN(sizeof(char) * cmd->nativeCommandSize) > (size_t)(packetEnd - tail))
+                    return;
+                const void* nativeCommand = (const void*)tail;
+                llglDoNativeCommand(nativeCommand, cmd->nativeCommandSize);
+                break;
+            }
+            default:
+                break;
+        }
+
+        streamPos += header->size;
+    }
+}
+
+#endif /* LLGL_COMMAND_STREAM_IMPLEMENTATION */
+
+
+#endif /* LLGL_C99_LLGLCOMMAND_STREAM_H */
+
+
+
+/* ================================================================================ */
+
@@ -0,0 +1,1500 @@
+/*
+ * LLGLEnumStrings.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_LLGLENUM_STRINGS_H
+#define LLGL_C99_LLGLENUM_STRINGS_H
+
+
+#include <LLGL-C/LLGL.h>
+#include <stdbool.h>
+#include <stddef.h>
+
+
+/* ----- Functions ----- */
+
+/*
+llgl<Enum>ToString returns the entry name without prefix, e.g. "RGBA8UNorm" for LLGLFormatRGBA8UNorm, or NULL for unknown values.
+llgl<Flags>ToString writes the flag names separated by '|' into the output string and returns the length of the entire string
+like snprintf, e.g. "Color|Stencil" for (LLGLClearColor | LLGLClearStencil). Unknown bits are written as a hexadecimal literal.
+llgl<Enum>FromString and llgl<Flags>FromString return false if the name (or any name separated by '|') is unknown.
+*/
+
+LLGL_C_EXPORT const char* llglRenderConditionModeToString(LLGLRenderConditionMode value);
+LLGL_C_EXPORT bool llglRenderConditionModeFromString(const char* name, LLGLRenderConditionMode* outValue);
+LLGL_C_EXPORT const char* llglStencilFaceToString(LLGLStencilFace value);
+LLGL_C_EXPORT bool llglStencilFaceFromString(const char* name, LLGLStencilFace* outValue);
+LLGL_C_EXPORT const char* llglFormatToString(LLGLFormat value);
+LLGL_C_EXPORT bool llglFormatFromString(const char* name, LLGLFormat* outValue);
+LLGL_C_EXPORT const char* llglImageFormatToString(LLGLImageFormat value);
+LLGL_C_EXPORT bool llglImageFormatFromString(const char* name, LLGLImageFormat* outValue);
+LLGL_C_EXPORT const char* llglDataTypeToString(LLGLDataType value);
+LLGL_C_EXPORT bool llglDataTypeFromString(const char* name, LLGLDataType* outValue);
+LLGL_C_EXPORT const char* llglReportTypeToString(LLGLReportType value);
+LLGL_C_EXPORT bool llglReportTypeFromString(const char* name, LLGLReportType* outValue);
+LLGL_C_EXPORT const char* llglKeyToString(LLGLKey value);
+LLGL_C_EXPORT bool llglKeyFromString(const char* name, LLGLKey* outValue);
+LLGL_C_EXPORT const char* llglUniformTypeToString(LLGLUniformType value);
+LLGL_C_EXPORT bool llglUniformTypeFromString(const char* name, LLGLUniformType* outValue);
+LLGL_C_EXPORT const char* llglPrimitiveTopologyToString(LLGLPrimitiveTopology value);
+LLGL_C_EXPORT bool llglPrimitiveTopologyFromString(const char* name, LLGLPrimitiveTopology* outValue);
+LLGL_C_EXPORT const char* llglCompareOpToString(LLGLCompareOp value);
+LLGL_C_EXPORT bool llglCompareOpFromString(const char* name, LLGLCompareOp* outValue);
+LLGL_C_EXPORT const char* llglStencilOpToString(LLGLStencilOp value);
+LLGL_C_EXPORT bool llglStencilOpFromString(const char* name, LLGLStencilOp* outValue);
+LLGL_C_EXPORT const char* llglBlendOpToString(LLGLBlendOp value);
+LLGL_C_EXPORT bool llglBlendOpFromString(const char* name, LLGLBlendOp* outValue);
+LLGL_C_EXPORT const char* llglBlendArithmeticToString(LLGLBlendArithmetic value);
+LLGL_C_EXPORT bool llglBlendArithmeticFromString(const char* name, LLGLBlendArithmetic* outValue);
+LLGL_C_EXPORT const char* llglPolygonModeToString(LLGLPolygonMode value);
+LLGL_C_EXPORT bool llglPolygonModeFromString(const char* name, LLGLPolygonMode* outValue);
+LLGL_C_EXPORT const char* llglCullModeToString(LLGLCullMode value);
+LLGL_C_EXPORT bool llglCullModeFromString(const char* name, LLGLCullMode* outValue);
+LLGL_C_EXPORT const char* llglLogicOpToString(LLGLLogicOp value);
+LLGL_C_EXPORT bool llglLogicOpFromString(const char* name, LLGLLogicOp* outValue);
+LLGL_C_EXPORT const char* llglTessellationPartitionToString(LLGLTessellationPartition value);
+LLGL_C_EXPORT bool llglTessellationPartitionFromString(const char* name, LLGLTessellationPartition* outValue);
+LLGL_C_EXPORT const char* llglQueryTypeToString(LLGLQueryType value);
+LLGL_C_EXPORT bool llglQueryTypeFromString(const char* name, LLGLQueryType* outValue);
+LLGL_C_EXPORT const char* llglAttachmentLoadOpToString(LLGLAttachmentLoadOp value);
+LLGL_C_EXPORT bool llglAttachmentLoadOpFromString(const char* name, LLGLAttachmentLoadOp* outValue);
+LLGL_C_EXPORT const char* llglAttachmentStoreOpToString(LLGLAttachmentStoreOp value);
+LLGL_C_EXPORT bool llglAttachmentStoreOpFromString(const char* name, LLGLAttachmentStoreOp* outValue);
+LLGL_C_EXPORT const char* llglShadingLanguageToString(LLGLShadingLanguage value);
+LLGL_C_EXPORT bool llglShadingLanguageFromString(const char* name, LLGLShadingLanguage* outValue);
+LLGL_C_EXPORT const char* llglScreenOriginToString(LLGLScreenOrigin value);
+LLGL_C_EXPORT bool llglScreenOriginFromString(const char* name, LLGLScreenOrigin* outValue);
+LLGL_C_EXPORT const char* llglClippingRangeToString(LLGLClippingRange value);
+LLGL_C_EXPORT bool llglClippingRangeFromString(const char* name, LLGLClippingRange* outValue);
+LLGL_C_EXPORT const char* llglCPUAccessToString(LLGLCPUAccess value);
+LLGL_C_EXPORT bool llglCPUAccessFromString(const char* name, LLGLCPUAccess* outValue);
+LLGL_C_EXPORT const char* llglResourceTypeToString(LLGLResourceType value);
+LLGL_C_EXPORT bool llglResourceTypeFromString(const char* name, LLGLResourceType* outValue);
+LLGL_C_EXPORT const char* llglSamplerAddressModeToString(LLGLSamplerAddressMode value);
+LLGL_C_EXPORT bool llglSamplerAddressModeFromString(const char* name, LLGLSamplerAddressMode* outValue);
+LLGL_C_EXPORT const char* llglSamplerFilterToString(LLGLSamplerFilter value);
+LLGL_C_EXPORT bool llglSamplerFilterFromString(const char* name, LLGLSamplerFilter* outValue);
+LLGL_C_EXPORT const char* llglShaderTypeToString(LLGLShaderType value);
+LLGL_C_EXPORT bool llglShaderTypeFromString(const char* name, LLGLShaderType* outValue);
+LLGL_C_EXPORT const char* llglShaderSourceTypeToString(LLGLShaderSourceType value);
+LLGL_C_EXPORT bool llglShaderSourceTypeFromString(const char* name, LLGLShaderSourceType* outValue);
+LLGL_C_EXPORT const char* llglStorageBufferTypeToString(LLGLStorageBufferType value);
+LLGL_C_EXPORT bool llglStorageBufferTypeFromString(const char* name, LLGLStorageBufferType* outValue);
+LLGL_C_EXPORT const char* llglSystemValueToString(LLGLSystemValue value);
+LLGL_C_EXPORT bool llglSystemValueFromString(const char* name, LLGLSystemValue* outValue);
+LLGL_C_EXPORT const char* llglTextureTypeToString(LLGLTextureType value);
+LLGL_C_EXPORT bool llglTextureTypeFromString(const char* name, LLGLTextureType* outValue);
+LLGL_C_EXPORT const char* llglTextureSwizzleToString(LLGLTextureSwizzle value);
+LLGL_C_EXPORT bool llglTextureSwizzleFromString(const char* name, LLGLTextureSwizzle* outValue);
+LLGL_C_EXPORT size_t llglCanvasFlagsToString(long flags, char* outString, size_t outStringSize);
+LLGL_C_EXPORT bool llglCanvasFlagsFromString(const char* names, long* outFlags);
+LLGL_C_EXPORT size_t llglCommandBufferFlagsToString(long flags, char* outString, size_t outStringSize);
+LLGL_C_EXPORT bool llglCommandBufferFlagsFromString(const char* names, long* outFlags);
+LLGL_C_EXPORT size_t llglClearFlagsToString(long flags, char* outString, size_t outStringSize);
+LLGL_C_EXPORT bool llglClearFlagsFromString(const char* names, long* outFlags);
+LLGL_C_EXPORT size_t llglFormatFlagsToString(long flags, char* outString, size_t outStringSize);
+LLGL_C_EXPORT bool llglFormatFlagsFromString(const char* names, long* outFlags);
+LLGL_C_EXPORT size_t llglColorMaskFlagsToString(long flags, char* outString, size_t outStringSize);
+LLGL_C_EXPORT bool llglColorMaskFlagsFromString(const char* names, long* outFlags);
+LLGL_C_EXPORT size_t llglRenderSystemFlagsToString(long flags, char* outString, size_t outStringSize);
+LLGL_C_EXPORT bool llglRenderSystemFlagsFromString(const char* names, long* outFlags);
+LLGL_C_EXPORT size_t llglBindFlagsToString(long flags, char* outString, size_t outStringSize);
+LLGL_C_EXPORT bool llglBindFlagsFromString(const char* names, long* outFlags);
+LLGL_C_EXPORT size_t llglCPUAccessFlagsToString(long flags, char* outString, size_t outStringSize);
+LLGL_C_EXPORT bool llglCPUAccessFlagsFromString(const char* names, long* outFlags);
+LLGL_C_EXPORT size_t llglMiscFlagsToString(long flags, char* outString, size_t outStringSize);
+LLGL_C_EXPORT bool llglMiscFlagsFromString(const char* names, long* outFlags);
+LLGL_C_EXPORT size_t llglBarrierFlagsToString(long flags, char* outString, size_t outStringSize);
+LLGL_C_EXPORT bool llglBarrierFlagsFromString(const char* names, long* outFlags);
+LLGL_C_EXPORT size_t llglShaderCompileFlagsToString(long flags, char* outString, size_t outStringSize);
+LLGL_C_EXPORT bool llglShaderCompileFlagsFromString(const char* names, long* outFlags);
+LLGL_C_EXPORT size_t llglStageFlagsToString(long flags, char* outString, size_t outStringSize);
+LLGL_C_EXPORT bool llglStageFlagsFromString(const char* names, long* outFlags);
+LLGL_C_EXPORT size_t llglResizeBuffersFlagsToString(long flags, char* outString, size_t outStringSize);
+LLGL_C_EXPORT bool llglResizeBuffersFlagsFromString(const char* names, long* outFlags);
+LLGL_C_EXPORT size_t llglWindowFlagsToString(long flags, char* outString, size_t outStringSize);
+LLGL_C_EXPORT bool llglWindowFlagsFromString(const char* names, long* outFlags);
+
+#ifdef LLGL_ENUM_STRINGS_IMPLEMENTATION
+
+#include <stdio.h>
+#include <string.h>
+
+typedef struct LLGLEnumEntry
+{
+    const char* name;
+    long        value;
+}
+LLGLEnumEntry;
+
+static int llglCompareEnumName(const char* name, size_t nameLen, const char* entryName)
+{
+    const int order = strncmp(name, entryName, nameLen);
+    return (order != 0 ? order : (entryName[nameLen] != '\0' ? -1 : 0));
+}
+
+/* Binary search in entries sorted by name */
+static const LLGLEnumEntry* llglFindEnumEntryByName(const LLGLEnumEntry* entries, size_t numEntries, const char* name, size_t nameLen)
+{
+    size_t first = 0, last = numEntries;
+    while (first < last)
+    {
+        const size_t mid = first + (last - first) / 2;
+        const int order = llglCompareEnumName(name, nameLen, entries[mid].name);
+        if (order == 0)
+            return &entries[mid];
+        if (order < 0)
+            last = mid;
+        else
+            first = mid + 1;
+    }
+    return NULL;
+}
+
+/* Binary search in entries sorted by value */
+static const char* llglFindEnumNameByValue(const LLGLEnumEntry* entries, size_t numEntries, long value)
+{
+    size_t first = 0, last = numEntries;
+    while (first < last)
+    {
+        const size_t mid = first + (last - first) / 2;
+        if (entries[mid].value == value)
+            return entries[mid].name;
+        if (value < entries[mid].value)
+            last = mid;
+        else
+            first = mid + 1;
+    }
+    return NULL;
+}
+
+static size_t llglAppendString(char* outString, size_t outStringSize, size_t len, const char* str)
+{
+    for (; *str != '\0'; ++str, ++len)
+    {
+        if (len + 1 < outStringSize)
+            outString[len] = *str;
+    }
+    if (outStringSize > 0)
+        outString[len + 1 < outStringSize ? len : outStringSize - 1] = '\0';
+    return len;
+}
+
+/* Decomposes flags greedily in the order of the specified entries */
+static size_t llglFlagsToString(const LLGLEnumEntry* entries, size_t numEntries, long flags, char* outString, size_t outStringSize)
+{
+    size_t len = 0;
+    if (outStringSize > 0)
+        outString[0] = '\0';
+    for (size_t i = 0; i < numEntries; ++i)
+    {
+        const long value = entries[i].value;
+        if (value != 0 ? (flags & value) == value : (flags == 0 && len == 0))
+        {
+            if (len > 0)
+                len = llglAppendString(outString, outStringSize, len, "|");
+            len = llglAppendString(outString, outStringSize, len, entries[i].name);
+            flags &= ~value;
+        }
+    }
+    if (flags != 0)
+    {
+        char hexString[32];
+        snprintf(hexString, sizeof(hexString), "0x%lX", (unsigned long)flags);
+        if (len > 0)
+            len = llglAppendString(outString, outStringSize, len, "|");
+        len = llglAppendString(outString, outStringSize, len, hexString);
+    }
+    return len;
+}
+
+static bool llglFlagsFromString(const LLGLEnumEntry* entries, size_t numEntries, const char* names, long* outFlags)
+{
+    long flags = 0;
+    while (*names != '\0')
+    {
+        const char* nameEnd = strchr(names, '|');
+        const size_t nameLen = (nameEnd != NULL ? (size_t)(nameEnd - names) : strlen(names));
+        const LLGLEnumEntry* entry = llglFindEnumEntryByName(entries, numEntries, names, nameLen);
+        if (entry == NULL)
+            return false;
+        flags |= entry->value;
+        names += (nameEnd != NULL ? nameLen + 1 : nameLen);
+    }
+    *outFlags = flags;
+    return true;
+}
+
+static const char* const g_llglRenderConditionModeNames[] =
+{
+    "Wait", "NoWait", "ByRegionWait", "ByRegionNoWait", "WaitInverted", "NoWaitInverted", "ByRegionWaitInverted",
+    "ByRegionNoWaitInverted",
+};
+
+static const LLGLEnumEntry g_llglRenderConditionModeEntries[] =
+{
+    { "ByRegionNoWait", 3 }, { "ByRegionNoWaitInverted", 7 }, { "ByRegionWait", 2 }, { "ByRegionWaitInverted", 6 },
+    { "NoWait", 1 }, { "NoWaitInverted", 5 }, { "Wait", 0 }, { "WaitInverted", 4 },
+};
+
+LLGL_C_EXPORT const char* llglRenderConditionModeToString(LLGLRenderConditionMode value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglRenderConditionModeNames)/sizeof(g_llglRenderConditionModeNames[0])) ? g_llglRenderConditionModeNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglRenderConditionModeFromString(const char* name, LLGLRenderConditionMode* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglRenderConditionModeEntries, sizeof(g_llglRenderConditionModeEntries)/sizeof(g_llglRenderConditionModeEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLRenderConditionMode)entry->value;
+    return true;
+}
+
+static const char* const g_llglStencilFaceNames[] =
+{
+    "FrontAndBack", "Front", "Back",
+};
+
+static const LLGLEnumEntry g_llglStencilFaceEntries[] =
+{
+    { "Back", 2 }, { "Front", 1 }, { "FrontAndBack", 0 },
+};
+
+LLGL_C_EXPORT const char* llglStencilFaceToString(LLGLStencilFace value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglStencilFaceNames)/sizeof(g_llglStencilFaceNames[0])) ? g_llglStencilFaceNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglStencilFaceFromString(const char* name, LLGLStencilFace* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglStencilFaceEntries, sizeof(g_llglStencilFaceEntries)/sizeof(g_llglStencilFaceEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLStencilFace)entry->value;
+    return true;
+}
+
+static const char* const g_llglFormatNames[] =
+{
+    "Undefined", "A8UNorm", "R8UNorm", "R8SNorm", "R8UInt", "R8SInt", "R16UNorm", "R16SNorm", "R16UInt", "R16SInt",
+    "R16Float", "R32UInt", "R32SInt", "R32Float", "R64Float", "RG8UNorm", "RG8SNorm", "RG8UInt", "RG8SInt",
+    "RG16UNorm", "RG16SNorm", "RG16UInt", "RG16SInt", "RG16Float", "RG32UInt", "RG32SInt", "RG32Float", "RG64Float",
+    "RGB8UNorm", "RGB8UNorm_sRGB", "RGB8SNorm", "RGB8UInt", "RGB8SInt", "RGB16UNorm", "RGB16SNorm", "RGB16UInt",
+    "RGB16SInt", "RGB16Float", "RGB32UInt", "RGB32SInt", "RGB32Float", "RGB64Float", "RGBA8UNorm", "RGBA8UNorm_sRGB",
+    "RGBA8SNorm", "RGBA8UInt", "RGBA8SInt", "RGBA16UNorm", "RGBA16SNorm", "RGBA16UInt", "RGBA16SInt", "RGBA16Float",
+    "RGBA32UInt", "RGBA32SInt", "RGBA32Float", "RGBA64Float", "BGRA8UNorm", "BGRA8UNorm_sRGB", "BGRA8SNorm",
+    "BGRA8UInt", "BGRA8SInt", "RGB10A2UNorm", "RGB10A2UInt", "RG11B10Float", "RGB9E5Float", "D16UNorm",
+    "D24UNormS8UInt", "D32Float", "D32FloatS8X24UInt", "BC1UNorm", "BC1UNorm_sRGB", "BC2UNorm", "BC2UNorm_sRGB",
+    "BC3UNorm", "BC3UNorm_sRGB", "BC4UNorm", "BC4SNorm", "BC5UNorm", "BC5SNorm",
+};
+
+static const LLGLEnumEntry g_llglFormatEntries[] =
+{
+    { "A8UNorm", 1 }, { "BC1UNorm", 69 }, { "BC1UNorm_sRGB", 70 }, { "BC2UNorm", 71 }, { "BC2UNorm_sRGB", 72 },
+    { "BC3UNorm", 73 }, { "BC3UNorm_sRGB", 74 }, { "BC4SNorm", 76 }, { "BC4UNorm", 75 }, { "BC5SNorm", 78 },
+    { "BC5UNorm", 77 }, { "BGRA8SInt", 60 }, { "BGRA8SNorm", 58 }, { "BGRA8UInt", 59 }, { "BGRA8UNorm", 56 },
+    { "BGRA8UNorm_sRGB", 57 }, { "D16UNorm", 65 }, { "D24UNormS8UInt", 66 }, { "D32Float", 67 },
+    { "D32FloatS8X24UInt", 68 }, { "R16Float", 10 }, { "R16SInt", 9 }, { "R16SNorm", 7 }, { "R16UInt", 8 },
+    { "R16UNorm", 6 }, { "R32Float", 13 }, { "R32SInt", 12 }, { "R32UInt", 11 }, { "R64Float", 14 }, { "R8SInt", 5 },
+    { "R8SNorm", 3 }, { "R8UInt", 4 }, { "R8UNorm", 2 }, { "RG11B10Float", 63 }, { "RG16Float", 23 },
+    { "RG16SInt", 22 }, { "RG16SNorm", 20 }, { "RG16UInt", 21 }, { "RG16UNorm", 19 }, { "RG32Float", 26 },
+    { "RG32SInt", 25 }, { "RG32UInt", 24 }, { "RG64Float", 27 }, { "RG8SInt", 18 }, { "RG8SNorm", 16 },
+    { "RG8UInt", 17 }, { "RG8UNorm", 15 }, { "RGB10A2UInt", 62 }, { "RGB10A2UNorm", 61 }, { "RGB16Float", 37 },
+    { "RGB16SInt", 36 }, { "RGB16SNorm", 34 }, { "RGB16UInt", 35 }, { "RGB16UNorm", 33 }, { "RGB32Float", 40 },
+    { "RGB32SInt", 39 }, { "RGB32UInt", 38 }, { "RGB64Float", 41 }, { "RGB8SInt", 32 }, { "RGB8SNorm", 30 },
+    { "RGB8UInt", 31 }, { "RGB8UNorm", 28 }, { "RGB8UNorm_sRGB", 29 }, { "RGB9E5Float", 64 }, { "RGBA16Float", 51 },
+    { "RGBA16SInt", 50 }, { "RGBA16SNorm", 48 }, { "RGBA16UInt", 49 }, { "RGBA16UNorm", 47 }, { "RGBA32Float", 54 },
+    { "RGBA32SInt", 53 }, { "RGBA32UInt", 52 }, { "RGBA64Float", 55 }, { "RGBA8SInt", 46 }, { "RGBA8SNorm", 44 },
+    { "RGBA8UInt", 45 }, { "RGBA8UNorm", 42 }, { "RGBA8UNorm_sRGB", 43 }, { "Undefined", 0 },
+};
+
+LLGL_C_EXPORT const char* llglFormatToString(LLGLFormat value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglFormatNames)/sizeof(g_llglFormatNames[0])) ? g_llglFormatNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglFormatFromString(const char* name, LLGLFormat* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglFormatEntries, sizeof(g_llglFormatEntries)/sizeof(g_llglFormatEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLFormat)entry->value;
+    return true;
+}
+
+static const char* const g_llglImageFormatNames[] =
+{
+    "Alpha", "R", "RG", "RGB", "BGR", "RGBA", "BGRA", "ARGB", "ABGR", "Depth", "DepthStencil", "Stencil", "BC1", "BC2",
+    "BC3", "BC4", "BC5",
+};
+
+static const LLGLEnumEntry g_llglImageFormatEntries[] =
+{
+    { "ABGR", 8 }, { "ARGB", 7 }, { "Alpha", 0 }, { "BC1", 12 }, { "BC2", 13 }, { "BC3", 14 }, { "BC4", 15 },
+    { "BC5", 16 }, { "BGR", 4 }, { "BGRA", 6 }, { "Depth", 9 }, { "DepthStencil", 10 }, { "R", 1 }, { "RG", 2 },
+    { "RGB", 3 }, { "RGBA", 5 }, { "Stencil", 11 },
+};
+
+LLGL_C_EXPORT const char* llglImageFormatToString(LLGLImageFormat value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglImageFormatNames)/sizeof(g_llglImageFormatNames[0])) ? g_llglImageFormatNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglImageFormatFromString(const char* name, LLGLImageFormat* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglImageFormatEntries, sizeof(g_llglImageFormatEntries)/sizeof(g_llglImageFormatEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLImageFormat)entry->value;
+    return true;
+}
+
+static const char* const g_llglDataTypeNames[] =
+{
+    "Undefined", "Int8", "UInt8", "Int16", "UInt16", "Int32", "UInt32", "Float16", "Float32", "Float64",
+};
+
+static const LLGLEnumEntry g_llglDataTypeEntries[] =
+{
+    { "Float16", 7 }, { "Float32", 8 }, { "Float64", 9 }, { "Int16", 3 }, { "Int32", 5 }, { "Int8", 1 },
+    { "UInt16", 4 }, { "UInt32", 6 }, { "UInt8", 2 }, { "Undefined", 0 },
+};
+
+LLGL_C_EXPORT const char* llglDataTypeToString(LLGLDataType value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglDataTypeNames)/sizeof(g_llglDataTypeNames[0])) ? g_llglDataTypeNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglDataTypeFromString(const char* name, LLGLDataType* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglDataTypeEntries, sizeof(g_llglDataTypeEntries)/sizeof(g_llglDataTypeEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLDataType)entry->value;
+    return true;
+}
+
+static const char* const g_llglReportTypeNames[] =
+{
+    "Default", "Error",
+};
+
+static const LLGLEnumEntry g_llglReportTypeEntries[] =
+{
+    { "Default", 0 }, { "Error", 1 },
+};
+
+LLGL_C_EXPORT const char* llglReportTypeToString(LLGLReportType value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglReportTypeNames)/sizeof(g_llglReportTypeNames[0])) ? g_llglReportTypeNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglReportTypeFromString(const char* name, LLGLReportType* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglReportTypeEntries, sizeof(g_llglReportTypeEntries)/sizeof(g_llglReportTypeEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLReportType)entry->value;
+    return true;
+}
+
+static const char* const g_llglKeyNames[] =
+{
+    "LButton", "RButton", "Cancel", "MButton", "XButton1", "XButton2", "Back", "Tab", "Clear", "Return", "Shift",
+    "Control", "Menu", "Pause", "Capital", "Escape", "Space", "PageUp", "PageDown", "End", "Home", "Left", "Up",
+    "Right", "Down", "Select", "Print", "Exe", "Snapshot", "Insert", "Delete", "Help", "D0", "D1", "D2", "D3", "D4",
+    "D5", "D6", "D7", "D8", "D9", "A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "K", "L", "M", "N", "O", "P", "Q",
+    "R", "S", "T", "U", "V", "W", "X", "Y", "Z", "LWin", "RWin", "Apps", "Sleep", "Keypad0", "Keypad1", "Keypad2",
+    "Keypad3", "Keypad4", "Keypad5", "Keypad6", "Keypad7", "Keypad8", "Keypad9", "KeypadMultiply", "KeypadPlus",
+    "KeypadSeparator", "KeypadMinus", "KeypadDecimal", "KeypadDivide", "F1", "F2", "F3", "F4", "F5", "F6", "F7", "F8",
+    "F9", "F10", "F11", "F12", "F13", "F14", "F15", "F16", "F17", "F18", "F19", "F20", "F21", "F22", "F23", "F24",
+    "NumLock", "ScrollLock", "LShift", "RShift", "LControl", "RControl", "LMenu", "RMenu", "BrowserBack",
+    "BrowserForward", "BrowserRefresh", "BrowserStop", "BrowserSearch", "BrowserFavorits", "BrowserHome", "VolumeMute",
+    "VolumeDown", "VolumeUp", "MediaNextTrack", "MediaPrevTrack", "MediaStop", "MediaPlayPause", "LaunchMail",
+    "LaunchMediaSelect", "LaunchApp1", "LaunchApp2", "Plus", "Comma", "Minus", "Period", "Exponent", "Attn", "CrSel",
+    "ExSel", "ErEOF", "Play", "Zoom", "NoName", "PA1", "OEMClear", "Any",
+};
+
+static const LLGLEnumEntry g_llglKeyEntries[] =
+{
+    { "A", 42 }, { "Any", 152 }, { "Apps", 70 }, { "Attn", 143 }, { "B", 43 }, { "Back", 6 }, { "BrowserBack", 120 },
+    { "BrowserFavorits", 125 }, { "BrowserForward", 121 }, { "BrowserHome", 126 }, { "BrowserRefresh", 122 },
+    { "BrowserSearch", 124 }, { "BrowserStop", 123 }, { "C", 44 }, { "Cancel", 2 }, { "Capital", 14 }, { "Clear", 8 },
+    { "Comma", 139 }, { "Control", 11 }, { "CrSel", 144 }, { "D", 45 }, { "D0", 32 }, { "D1", 33 }, { "D2", 34 },
+    { "D3", 35 }, { "D4", 36 }, { "D5", 37 }, { "D6", 38 }, { "D7", 39 }, { "D8", 40 }, { "D9", 41 }, { "Delete", 30 },
+    { "Down", 24 }, { "E", 46 }, { "End", 19 }, { "ErEOF", 146 }, { "Escape", 15 }, { "ExSel", 145 }, { "Exe", 27 },
+    { "Exponent", 142 }, { "F", 47 }, { "F1", 88 }, { "F10", 97 }, { "F11", 98 }, { "F12", 99 }, { "F13", 100 },
+    { "F14", 101 }, { "F15", 102 }, { "F16", 103 }, { "F17", 104 }, { "F18", 105 }, { "F19", 106 }, { "F2", 89 },
+    { "F20", 107 }, { "F21", 108 }, { "F22", 109 }, { "F23", 110 }, { "F24", 111 }, { "F3", 90 }, { "F4", 91 },
+    { "F5", 92 }, { "F6", 93 }, { "F7", 94 }, { "F8", 95 }, { "F9", 96 }, { "G", 48 }, { "H", 49 }, { "Help", 31 },
+    { "Home", 20 }, { "I", 50 }, { "Insert", 29 }, { "J", 51 }, { "K", 52 }, { "Keypad0", 72 }, { "Keypad1", 73 },
+    { "Keypad2", 74 }, { "Keypad3", 75 }, { "Keypad4", 76 }, { "Keypad5", 77 }, { "Keypad6", 78 }, { "Keypad7", 79 },
+    { "Keypad8", 80 }, { "Keypad9", 81 }, { "KeypadDecimal", 86 }, { "KeypadDivide", 87 }, { "KeypadMinus", 85 },
+    { "KeypadMultiply", 82 }, { "KeypadPlus", 83 }, { "KeypadSeparator", 84 }, { "L", 53 }, { "LButton", 0 },
+    { "LControl", 116 }, { "LMenu", 118 }, { "LShift", 114 }, { "LWin", 68 }, { "LaunchApp1", 136 },
+    { "LaunchApp2", 137 }, { "LaunchMail", 134 }, { "LaunchMediaSelect", 135 }, { "Left", 21 }, { "M", 54 },
+    { "MButton", 3 }, { "MediaNextTrack", 130 }, { "MediaPlayPause", 133 }, { "MediaPrevTrack", 131 },
+    { "MediaStop", 132 }, { "Menu", 12 }, { "Minus", 140 }, { "N", 55 }, { "NoName", 149 }, { "NumLock", 112 },
+    { "O", 56 }, { "OEMClear", 151 }, { "P", 57 }, { "PA1", 150 }, { "PageDown", 18 }, { "PageUp", 17 },
+    { "Pause", 13 }, { "Period", 141 }, { "Play", 147 }, { "Plus", 138 }, { "Print", 26 }, { "Q", 58 }, { "R", 59 },
+    { "RButton", 1 }, { "RControl", 117 }, { "RMenu", 119 }, { "RShift", 115 }, { "RWin", 69 }, { "Return", 9 },
+    { "Right", 23 }, { "S", 60 }, { "ScrollLock", 113 }, { "Select", 25 }, { "Shift", 10 }, { "Sleep", 71 },
+    { "Snapshot", 28 }, { "Space", 16 }, { "T", 61 }, { "Tab", 7 }, { "U", 62 }, { "Up", 22 }, { "V", 63 },
+    { "VolumeDown", 128 }, { "VolumeMute", 127 }, { "VolumeUp", 129 }, { "W", 64 }, { "X", 65 }, { "XButton1", 4 },
+    { "XButton2", 5 }, { "Y", 66 }, { "Z", 67 }, { "Zoom", 148 },
+};
+
+LLGL_C_EXPORT const char* llglKeyToString(LLGLKey value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglKeyNames)/sizeof(g_llglKeyNames[0])) ? g_llglKeyNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglKeyFromString(const char* name, LLGLKey* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglKeyEntries, sizeof(g_llglKeyEntries)/sizeof(g_llglKeyEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLKey)entry->value;
+    return true;
+}
+
+static const char* const g_llglUniformTypeNames[] =
+{
+    "Undefined", "Float1", "Float2", "Float3", "Float4", "Double1", "Double2", "Double3", "Double4", "Int1", "Int2",
+    "Int3", "Int4", "UInt1", "UInt2", "UInt3", "UInt4", "Bool1", "Bool2", "Bool3", "Bool4", "Float2x2", "Float2x3",
+    "Float2x4", "Float3x2", "Float3x3", "Float3x4", "Float4x2", "Float4x3", "Float4x4", "Double2x2", "Double2x3",
+    "Double2x4", "Double3x2", "Double3x3", "Double3x4", "Double4x2", "Double4x3", "Double4x4", "Sampler", "Image",
+    "AtomicCounter",
+};
+
+static const LLGLEnumEntry g_llglUniformTypeEntries[] =
+{
+    { "AtomicCounter", 41 }, { "Bool1", 17 }, { "Bool2", 18 }, { "Bool3", 19 }, { "Bool4", 20 }, { "Double1", 5 },
+    { "Double2", 6 }, { "Double2x2", 30 }, { "Double2x3", 31 }, { "Double2x4", 32 }, { "Double3", 7 },
+    { "Double3x2", 33 }, { "Double3x3", 34 }, { "Double3x4", 35 }, { "Double4", 8 }, { "Double4x2", 36 },
+    { "Double4x3", 37 }, { "Double4x4", 38 }, { "Float1", 1 }, { "Float2", 2 }, { "Float2x2", 21 }, { "Float2x3", 22 },
+    { "Float2x4", 23 }, { "Float3", 3 }, { "Float3x2", 24 }, { "Float3x3", 25 }, { "Float3x4", 26 }, { "Float4", 4 },
+    { "Float4x2", 27 }, { "Float4x3", 28 }, { "Float4x4", 29 }, { "Image", 40 }, { "Int1", 9 }, { "Int2", 10 },
+    { "Int3", 11 }, { "Int4", 12 }, { "Sampler", 39 }, { "UInt1", 13 }, { "UInt2", 14 }, { "UInt3", 15 },
+    { "UInt4", 16 }, { "Undefined", 0 },
+};
+
+LLGL_C_EXPORT const char* llglUniformTypeToString(LLGLUniformType value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglUniformTypeNames)/sizeof(g_llglUniformTypeNames[0])) ? g_llglUniformTypeNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglUniformTypeFromString(const char* name, LLGLUniformType* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglUniformTypeEntries, sizeof(g_llglUniformTypeEntries)/sizeof(g_llglUniformTypeEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLUniformType)entry->value;
+    return true;
+}
+
+static const char* const g_llglPrimitiveTopologyNames[] =
+{
+    "PointList", "LineList", "LineStrip", "LineListAdjacency", "LineStripAdjacency", "TriangleList", "TriangleStrip",
+    "TriangleListAdjacency", "TriangleStripAdjacency", "Patches1", "Patches2", "Patches3", "Patches4", "Patches5",
+    "Patches6", "Patches7", "Patches8", "Patches9", "Patches10", "Patches11", "Patches12", "Patches13", "Patches14",
+    "Patches15", "Patches16", "Patches17", "Patches18", "Patches19", "Patches20", "Patches21", "Patches22",
+    "Patches23", "Patches24", "Patches25", "Patches26", "Patches27", "Patches28", "Patches29", "Patches30",
+    "Patches31", "Patches32",
+};
+
+static const LLGLEnumEntry g_llglPrimitiveTopologyEntries[] =
+{
+    { "LineList", 1 }, { "LineListAdjacency", 3 }, { "LineStrip", 2 }, { "LineStripAdjacency", 4 }, { "Patches1", 9 },
+    { "Patches10", 18 }, { "Patches11", 19 }, { "Patches12", 20 }, { "Patches13", 21 }, { "Patches14", 22 },
+    { "Patches15", 23 }, { "Patches16", 24 }, { "Patches17", 25 }, { "Patches18", 26 }, { "Patches19", 27 },
+    { "Patches2", 10 }, { "Patches20", 28 }, { "Patches21", 29 }, { "Patches22", 30 }, { "Patches23", 31 },
+    { "Patches24", 32 }, { "Patches25", 33 }, { "Patches26", 34 }, { "Patches27", 35 }, { "Patches28", 36 },
+    { "Patches29", 37 }, { "Patches3", 11 }, { "Patches30", 38 }, { "Patches31", 39 }, { "Patches32", 40 },
+    { "Patches4", 12 }, { "Patches5", 13 }, { "Patches6", 14 }, { "Patches7", 15 }, { "Patches8", 16 },
+    { "Patches9", 17 }, { "PointList", 0 }, { "TriangleList", 5 }, { "TriangleListAdjacency", 7 },
+    { "TriangleStrip", 6 }, { "TriangleStripAdjacency", 8 },
+};
+
+LLGL_C_EXPORT const char* llglPrimitiveTopologyToString(LLGLPrimitiveTopology value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglPrimitiveTopologyNames)/sizeof(g_llglPrimitiveTopologyNames[0])) ? g_llglPrimitiveTopologyNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglPrimitiveTopologyFromString(const char* name, LLGLPrimitiveTopology* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglPrimitiveTopologyEntries, sizeof(g_llglPrimitiveTopologyEntries)/sizeof(g_llglPrimitiveTopologyEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLPrimitiveTopology)entry->value;
+    return true;
+}
+
+static const char* const g_llglCompareOpNames[] =
+{
+    "NeverPass", "Less", "Equal", "LessEqual", "Greater", "NotEqual", "GreaterEqual", "AlwaysPass",
+};
+
+static const LLGLEnumEntry g_llglCompareOpEntries[] =
+{
+    { "AlwaysPass", 7 }, { "Equal", 2 }, { "Greater", 4 }, { "GreaterEqual", 6 }, { "Less", 1 }, { "LessEqual", 3 },
+    { "NeverPass", 0 }, { "NotEqual", 5 },
+};
+
+LLGL_C_EXPORT const char* llglCompareOpToString(LLGLCompareOp value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglCompareOpNames)/sizeof(g_llglCompareOpNames[0])) ? g_llglCompareOpNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglCompareOpFromString(const char* name, LLGLCompareOp* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglCompareOpEntries, sizeof(g_llglCompareOpEntries)/sizeof(g_llglCompareOpEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLCompareOp)entry->value;
+    return true;
+}
+
+static const char* const g_llglStencilOpNames[] =
+{
+    "Keep", "Zero", "Replace", "IncClamp", "DecClamp", "Invert", "IncWrap", "DecWrap",
+};
+
+static const LLGLEnumEntry g_llglStencilOpEntries[] =
+{
+    { "DecClamp", 4 }, { "DecWrap", 7 }, { "IncClamp", 3 }, { "IncWrap", 6 }, { "Invert", 5 }, { "Keep", 0 },
+    { "Replace", 2 }, { "Zero", 1 },
+};
+
+LLGL_C_EXPORT const char* llglStencilOpToString(LLGLStencilOp value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglStencilOpNames)/sizeof(g_llglStencilOpNames[0])) ? g_llglStencilOpNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglStencilOpFromString(const char* name, LLGLStencilOp* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglStencilOpEntries, sizeof(g_llglStencilOpEntries)/sizeof(g_llglStencilOpEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLStencilOp)entry->value;
+    return true;
+}
+
+static const char* const g_llglBlendOpNames[] =
+{
+    "Zero", "One", "SrcColor", "InvSrcColor", "SrcAlpha", "InvSrcAlpha", "DstColor", "InvDstColor", "DstAlpha",
+    "InvDstAlpha", "SrcAlphaSaturate", "BlendFactor", "InvBlendFactor", "Src1Color", "InvSrc1Color", "Src1Alpha",
+    "InvSrc1Alpha",
+};
+
+static const LLGLEnumEntry g_llglBlendOpEntries[] =
+{
+    { "BlendFactor", 11 }, { "DstAlpha", 8 }, { "DstColor", 6 }, { "InvBlendFactor", 12 }, { "InvDstAlpha", 9 },
+    { "InvDstColor", 7 }, { "InvSrc1Alpha", 16 }, { "InvSrc1Color", 14 }, { "InvSrcAlpha", 5 }, { "InvSrcColor", 3 },
+    { "One", 1 }, { "Src1Alpha", 15 }, { "Src1Color", 13 }, { "SrcAlpha", 4 }, { "SrcAlphaSaturate", 10 },
+    { "SrcColor", 2 }, { "Zero", 0 },
+};
+
+LLGL_C_EXPORT const char* llglBlendOpToString(LLGLBlendOp value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglBlendOpNames)/sizeof(g_llglBlendOpNames[0])) ? g_llglBlendOpNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglBlendOpFromString(const char* name, LLGLBlendOp* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglBlendOpEntries, sizeof(g_llglBlendOpEntries)/sizeof(g_llglBlendOpEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLBlendOp)entry->value;
+    return true;
+}
+
+static const char* const g_llglBlendArithmeticNames[] =
+{
+    "Add", "Subtract", "RevSubtract", "Min", "Max",
+};
+
+static const LLGLEnumEntry g_llglBlendArithmeticEntries[] =
+{
+    { "Add", 0 }, { "Max", 4 }, { "Min", 3 }, { "RevSubtract", 2 }, { "Subtract", 1 },
+};
+
+LLGL_C_EXPORT const char* llglBlendArithmeticToString(LLGLBlendArithmetic value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglBlendArithmeticNames)/sizeof(g_llglBlendArithmeticNames[0])) ? g_llglBlendArithmeticNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglBlendArithmeticFromString(const char* name, LLGLBlendArithmetic* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglBlendArithmeticEntries, sizeof(g_llglBlendArithmeticEntries)/sizeof(g_llglBlendArithmeticEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLBlendArithmetic)entry->value;
+    return true;
+}
+
+static const char* const g_llglPolygonModeNames[] =
+{
+    "Fill", "Wireframe", "Points",
+};
+
+static const LLGLEnumEntry g_llglPolygonModeEntries[] =
+{
+    { "Fill", 0 }, { "Points", 2 }, { "Wireframe", 1 },
+};
+
+LLGL_C_EXPORT const char* llglPolygonModeToString(LLGLPolygonMode value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglPolygonModeNames)/sizeof(g_llglPolygonModeNames[0])) ? g_llglPolygonModeNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglPolygonModeFromString(const char* name, LLGLPolygonMode* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglPolygonModeEntries, sizeof(g_llglPolygonModeEntries)/sizeof(g_llglPolygonModeEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLPolygonMode)entry->value;
+    return true;
+}
+
+static const char* const g_llglCullModeNames[] =
+{
+    "Disabled", "Front", "Back",
+};
+
+static const LLGLEnumEntry g_llglCullModeEntries[] =
+{
+    { "Back", 2 }, { "Disabled", 0 }, { "Front", 1 },
+};
+
+LLGL_C_EXPORT const char* llglCullModeToString(LLGLCullMode value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglCullModeNames)/sizeof(g_llglCullModeNames[0])) ? g_llglCullModeNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglCullModeFromString(const char* name, LLGLCullMode* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglCullModeEntries, sizeof(g_llglCullModeEntries)/sizeof(g_llglCullModeEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLCullMode)entry->value;
+    return true;
+}
+
+static const char* const g_llglLogicOpNames[] =
+{
+    "Disabled", "Clear", "Set", "Copy", "CopyInverted", "NoOp", "Invert", "AND", "ANDReverse", "ANDInverted", "NAND",
+    "OR", "ORReverse", "ORInverted", "NOR", "XOR", "Equiv",
+};
+
+static const LLGLEnumEntry g_llglLogicOpEntries[] =
+{
+    { "AND", 7 }, { "ANDInverted", 9 }, { "ANDReverse", 8 }, { "Clear", 1 }, { "Copy", 3 }, { "CopyInverted", 4 },
+    { "Disabled", 0 }, { "Equiv", 16 }, { "Invert", 6 }, { "NAND", 10 }, { "NOR", 14 }, { "NoOp", 5 }, { "OR", 11 },
+    { "ORInverted", 13 }, { "ORReverse", 12 }, { "Set", 2 }, { "XOR", 15 },
+};
+
+LLGL_C_EXPORT const char* llglLogicOpToString(LLGLLogicOp value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglLogicOpNames)/sizeof(g_llglLogicOpNames[0])) ? g_llglLogicOpNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglLogicOpFromString(const char* name, LLGLLogicOp* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglLogicOpEntries, sizeof(g_llglLogicOpEntries)/sizeof(g_llglLogicOpEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLLogicOp)entry->value;
+    return true;
+}
+
+static const char* const g_llglTessellationPartitionNames[] =
+{
+    "Undefined", "Integer", "Pow2", "FractionalOdd", "FractionalEven",
+};
+
+static const LLGLEnumEntry g_llglTessellationPartitionEntries[] =
+{
+    { "FractionalEven", 4 }, { "FractionalOdd", 3 }, { "Integer", 1 }, { "Pow2", 2 }, { "Undefined", 0 },
+};
+
+LLGL_C_EXPORT const char* llglTessellationPartitionToString(LLGLTessellationPartition value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglTessellationPartitionNames)/sizeof(g_llglTessellationPartitionNames[0])) ? g_llglTessellationPartitionNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglTessellationPartitionFromString(const char* name, LLGLTessellationPartition* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglTessellationPartitionEntries, sizeof(g_llglTessellationPartitionEntries)/sizeof(g_llglTessellationPartitionEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLTessellationPartition)entry->value;
+    return true;
+}
+
+static const char* const g_llglQueryTypeNames[] =
+{
+    "SamplesPassed", "AnySamplesPassed", "AnySamplesPassedConservative", "TimeElapsed", "StreamOutPrimitivesWritten",
+    "StreamOutOverflow", "PipelineStatistics",
+};
+
+static const LLGLEnumEntry g_llglQueryTypeEntries[] =
+{
+    { "AnySamplesPassed", 1 }, { "AnySamplesPassedConservative", 2 }, { "PipelineStatistics", 6 },
+    { "SamplesPassed", 0 }, { "StreamOutOverflow", 5 }, { "StreamOutPrimitivesWritten", 4 }, { "TimeElapsed", 3 },
+};
+
+LLGL_C_EXPORT const char* llglQueryTypeToString(LLGLQueryType value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglQueryTypeNames)/sizeof(g_llglQueryTypeNames[0])) ? g_llglQueryTypeNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglQueryTypeFromString(const char* name, LLGLQueryType* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglQueryTypeEntries, sizeof(g_llglQueryTypeEntries)/sizeof(g_llglQueryTypeEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLQueryType)entry->value;
+    return true;
+}
+
+static const char* const g_llglAttachmentLoadOpNames[] =
+{
+    "Undefined", "Load", "Clear",
+};
+
+static const LLGLEnumEntry g_llglAttachmentLoadOpEntries[] =
+{
+    { "Clear", 2 }, { "Load", 1 }, { "Undefined", 0 },
+};
+
+LLGL_C_EXPORT const char* llglAttachmentLoadOpToString(LLGLAttachmentLoadOp value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglAttachmentLoadOpNames)/sizeof(g_llglAttachmentLoadOpNames[0])) ? g_llglAttachmentLoadOpNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglAttachmentLoadOpFromString(const char* name, LLGLAttachmentLoadOp* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglAttachmentLoadOpEntries, sizeof(g_llglAttachmentLoadOpEntries)/sizeof(g_llglAttachmentLoadOpEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLAttachmentLoadOp)entry->value;
+    return true;
+}
+
+static const char* const g_llglAttachmentStoreOpNames[] =
+{
+    "Undefined", "Store",
+};
+
+static const LLGLEnumEntry g_llglAttachmentStoreOpEntries[] =
+{
+    { "Store", 1 }, { "Undefined", 0 },
+};
+
+LLGL_C_EXPORT const char* llglAttachmentStoreOpToString(LLGLAttachmentStoreOp value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglAttachmentStoreOpNames)/sizeof(g_llglAttachmentStoreOpNames[0])) ? g_llglAttachmentStoreOpNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglAttachmentStoreOpFromString(const char* name, LLGLAttachmentStoreOp* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglAttachmentStoreOpEntries, sizeof(g_llglAttachmentStoreOpEntries)/sizeof(g_llglAttachmentStoreOpEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLAttachmentStoreOp)entry->value;
+    return true;
+}
+
+static const LLGLEnumEntry g_llglShadingLanguageValues[] =
+{
+    { "VersionBitmask", 65535 }, { "GLSL", 65536 }, { "GLSL_110", 65646 }, { "GLSL_120", 65656 },
+    { "GLSL_130", 65666 }, { "GLSL_140", 65676 }, { "GLSL_150", 65686 }, { "GLSL_330", 65866 }, { "GLSL_400", 65936 },
+    { "GLSL_410", 65946 }, { "GLSL_420", 65956 }, { "GLSL_430", 65966 }, { "GLSL_440", 65976 }, { "GLSL_450", 65986 },
+    { "GLSL_460", 65996 }, { "ESSL", 131072 }, { "ESSL_100", 131172 }, { "ESSL_300", 131372 }, { "ESSL_310", 131382 },
+    { "ESSL_320", 131392 }, { "HLSL", 196608 }, { "HLSL_2_0", 196808 }, { "HLSL_2_0a", 196809 },
+    { "HLSL_2_0b", 196810 }, { "HLSL_3_0", 196908 }, { "HLSL_4_0", 197008 }, { "HLSL_4_1", 197018 },
+    { "HLSL_5_0", 197108 }, { "HLSL_5_1", 197118 }, { "HLSL_6_0", 197208 }, { "HLSL_6_1", 197209 },
+    { "HLSL_6_2", 197210 }, { "HLSL_6_3", 197211 }, { "HLSL_6_4", 197212 }, { "Metal", 262144 },
+    { "Metal_1_0", 262244 }, { "Metal_1_1", 262254 }, { "Metal_1_2", 262264 }, { "Metal_2_0", 262344 },
+    { "Metal_2_1", 262354 }, { "SPIRV", 327680 }, { "SPIRV_100", 327780 },
+};
+
+static const LLGLEnumEntry g_llglShadingLanguageEntries[] =
+{
+    { "ESSL", 131072 }, { "ESSL_100", 131172 }, { "ESSL_300", 131372 }, { "ESSL_310", 131382 }, { "ESSL_320", 131392 },
+    { "GLSL", 65536 }, { "GLSL_110", 65646 }, { "GLSL_120", 65656 }, { "GLSL_130", 65666 }, { "GLSL_140", 65676 },
+    { "GLSL_150", 65686 }, { "GLSL_330", 65866 }, { "GLSL_400", 65936 }, { "GLSL_410", 65946 }, { "GLSL_420", 65956 },
+    { "GLSL_430", 65966 }, { "GLSL_440", 65976 }, { "GLSL_450", 65986 }, { "GLSL_460", 65996 }, { "HLSL", 196608 },
+    { "HLSL_2_0", 196808 }, { "HLSL_2_0a", 196809 }, { "HLSL_2_0b", 196810 }, { "HLSL_3_0", 196908 },
+    { "HLSL_4_0", 197008 }, { "HLSL_4_1", 197018 }, { "HLSL_5_0", 197108 }, { "HLSL_5_1", 197118 },
+    { "HLSL_6_0", 197208 }, { "HLSL_6_1", 197209 }, { "HLSL_6_2", 197210 }, { "HLSL_6_3", 197211 },
+    { "HLSL_6_4", 197212 }, { "Metal", 262144 }, { "Metal_1_0", 262244 }, { "Metal_1_1", 262254 },
+    { "Metal_1_2", 262264 }, { "Metal_2_0", 262344 }, { "Metal_2_1", 262354 }, { "SPIRV", 327680 },
+    { "SPIRV_100", 327780 }, { "VersionBitmask", 65535 },
+};
+
+LLGL_C_EXPORT const char* llglShadingLanguageToString(LLGLShadingLanguage value)
+{
+    return llglFindEnumNameByValue(g_llglShadingLanguageValues, sizeof(g_llglShadingLanguageValues)/sizeof(g_llglShadingLanguageValues[0]), (long)value);
+}
+
+LLGL_C_EXPORT bool llglShadingLanguageFromString(const char* name, LLGLShadingLanguage* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglShadingLanguageEntries, sizeof(g_llglShadingLanguageEntries)/sizeof(g_llglShadingLanguageEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLShadingLanguage)entry->value;
+    return true;
+}
+
+static const char* const g_llglScreenOriginNames[] =
+{
+    "LowerLeft", "UpperLeft",
+};
+
+static const LLGLEnumEntry g_llglScreenOriginEntries[] =
+{
+    { "LowerLeft", 0 }, { "UpperLeft", 1 },
+};
+
+LLGL_C_EXPORT const char* llglScreenOriginToString(LLGLScreenOrigin value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglScreenOriginNames)/sizeof(g_llglScreenOriginNames[0])) ? g_llglScreenOriginNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglScreenOriginFromString(const char* name, LLGLScreenOrigin* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglScreenOriginEntries, sizeof(g_llglScreenOriginEntries)/sizeof(g_llglScreenOriginEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLScreenOrigin)entry->value;
+    return true;
+}
+
+static const char* const g_llglClippingRangeNames[] =
+{
+    "MinusOneToOne", "ZeroToOne",
+};
+
+static const LLGLEnumEntry g_llglClippingRangeEntries[] =
+{
+    { "MinusOneToOne", 0 }, { "ZeroToOne", 1 },
+};
+
+LLGL_C_EXPORT const char* llglClippingRangeToString(LLGLClippingRange value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglClippingRangeNames)/sizeof(g_llglClippingRangeNames[0])) ? g_llglClippingRangeNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglClippingRangeFromString(const char* name, LLGLClippingRange* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglClippingRangeEntries, sizeof(g_llglClippingRangeEntries)/sizeof(g_llglClippingRangeEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLClippingRange)entry->value;
+    return true;
+}
+
+static const char* const g_llglCPUAccessNames[] =
+{
+    "ReadOnly", "WriteOnly", "WriteDiscard", "ReadWrite",
+};
+
+static const LLGLEnumEntry g_llglCPUAccessEntries[] =
+{
+    { "ReadOnly", 0 }, { "ReadWrite", 3 }, { "WriteDiscard", 2 }, { "WriteOnly", 1 },
+};
+
+LLGL_C_EXPORT const char* llglCPUAccessToString(LLGLCPUAccess value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglCPUAccessNames)/sizeof(g_llglCPUAccessNames[0])) ? g_llglCPUAccessNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglCPUAccessFromString(const char* name, LLGLCPUAccess* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglCPUAccessEntries, sizeof(g_llglCPUAccessEntries)/sizeof(g_llglCPUAccessEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLCPUAccess)entry->value;
+    return true;
+}
+
+static const char* const g_llglResourceTypeNames[] =
+{
+    "Undefined", "Buffer", "Texture", "Sampler",
+};
+
+static const LLGLEnumEntry g_llglResourceTypeEntries[] =
+{
+    { "Buffer", 1 }, { "Sampler", 3 }, { "Texture", 2 }, { "Undefined", 0 },
+};
+
+LLGL_C_EXPORT const char* llglResourceTypeToString(LLGLResourceType value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglResourceTypeNames)/sizeof(g_llglResourceTypeNames[0])) ? g_llglResourceTypeNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglResourceTypeFromString(const char* name, LLGLResourceType* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglResourceTypeEntries, sizeof(g_llglResourceTypeEntries)/sizeof(g_llglResourceTypeEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLResourceType)entry->value;
+    return true;
+}
+
+static const char* const g_llglSamplerAddressModeNames[] =
+{
+    "Repeat", "Mirror", "Clamp", "Border", "MirrorOnce",
+};
+
+static const LLGLEnumEntry g_llglSamplerAddressModeEntries[] =
+{
+    { "Border", 3 }, { "Clamp", 2 }, { "Mirror", 1 }, { "MirrorOnce", 4 }, { "Repeat", 0 },
+};
+
+LLGL_C_EXPORT const char* llglSamplerAddressModeToString(LLGLSamplerAddressMode value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglSamplerAddressModeNames)/sizeof(g_llglSamplerAddressModeNames[0])) ? g_llglSamplerAddressModeNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglSamplerAddressModeFromString(const char* name, LLGLSamplerAddressMode* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglSamplerAddressModeEntries, sizeof(g_llglSamplerAddressModeEntries)/sizeof(g_llglSamplerAddressModeEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLSamplerAddressMode)entry->value;
+    return true;
+}
+
+static const char* const g_llglSamplerFilterNames[] =
+{
+    "Nearest", "Linear",
+};
+
+static const LLGLEnumEntry g_llglSamplerFilterEntries[] =
+{
+    { "Linear", 1 }, { "Nearest", 0 },
+};
+
+LLGL_C_EXPORT const char* llglSamplerFilterToString(LLGLSamplerFilter value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglSamplerFilterNames)/sizeof(g_llglSamplerFilterNames[0])) ? g_llglSamplerFilterNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglSamplerFilterFromString(const char* name, LLGLSamplerFilter* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglSamplerFilterEntries, sizeof(g_llglSamplerFilterEntries)/sizeof(g_llglSamplerFilterEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLSamplerFilter)entry->value;
+    return true;
+}
+
+static const char* const g_llglShaderTypeNames[] =
+{
+    "Undefined", "Vertex", "TessControl", "TessEvaluation", "Geometry", "Fragment", "Compute",
+};
+
+static const LLGLEnumEntry g_llglShaderTypeEntries[] =
+{
+    { "Compute", 6 }, { "Fragment", 5 }, { "Geometry", 4 }, { "TessControl", 2 }, { "TessEvaluation", 3 },
+    { "Undefined", 0 }, { "Vertex", 1 },
+};
+
+LLGL_C_EXPORT const char* llglShaderTypeToString(LLGLShaderType value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglShaderTypeNames)/sizeof(g_llglShaderTypeNames[0])) ? g_llglShaderTypeNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglShaderTypeFromString(const char* name, LLGLShaderType* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglShaderTypeEntries, sizeof(g_llglShaderTypeEntries)/sizeof(g_llglShaderTypeEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLShaderType)entry->value;
+    return true;
+}
+
+static const char* const g_llglShaderSourceTypeNames[] =
+{
+    "CodeString", "CodeFile", "BinaryBuffer", "BinaryFile",
+};
+
+static const LLGLEnumEntry g_llglShaderSourceTypeEntries[] =
+{
+    { "BinaryBuffer", 2 }, { "BinaryFile", 3 }, { "CodeFile", 1 }, { "CodeString", 0 },
+};
+
+LLGL_C_EXPORT const char* llglShaderSourceTypeToString(LLGLShaderSourceType value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglShaderSourceTypeNames)/sizeof(g_llglShaderSourceTypeNames[0])) ? g_llglShaderSourceTypeNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglShaderSourceTypeFromString(const char* name, LLGLShaderSourceType* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglShaderSourceTypeEntries, sizeof(g_llglShaderSourceTypeEntries)/sizeof(g_llglShaderSourceTypeEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLShaderSourceType)entry->value;
+    return true;
+}
+
+static const char* const g_llglStorageBufferTypeNames[] =
+{
+    "Undefined", "TypedBuffer", "StructuredBuffer", "ByteAddressBuffer", "RWTypedBuffer", "RWStructuredBuffer",
+    "RWByteAddressBuffer", "AppendStructuredBuffer", "ConsumeStructuredBuffer",
+};
+
+static const LLGLEnumEntry g_llglStorageBufferTypeEntries[] =
+{
+    { "AppendStructuredBuffer", 7 }, { "ByteAddressBuffer", 3 }, { "ConsumeStructuredBuffer", 8 },
+    { "RWByteAddressBuffer", 6 }, { "RWStructuredBuffer", 5 }, { "RWTypedBuffer", 4 }, { "StructuredBuffer", 2 },
+    { "TypedBuffer", 1 }, { "Undefined", 0 },
+};
+
+LLGL_C_EXPORT const char* llglStorageBufferTypeToString(LLGLStorageBufferType value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglStorageBufferTypeNames)/sizeof(g_llglStorageBufferTypeNames[0])) ? g_llglStorageBufferTypeNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglStorageBufferTypeFromString(const char* name, LLGLStorageBufferType* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglStorageBufferTypeEntries, sizeof(g_llglStorageBufferTypeEntries)/sizeof(g_llglStorageBufferTypeEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLStorageBufferType)entry->value;
+    return true;
+}
+
+static const char* const g_llglSystemValueNames[] =
+{
+    "Undefined", "ClipDistance", "Color", "CullDistance", "Depth", "DepthGreater", "DepthLess", "FrontFacing",
+    "InstanceID", "Position", "PrimitiveID", "RenderTargetIndex", "SampleMask", "SampleID", "Stencil", "VertexID",
+    "ViewportIndex",
+};
+
+static const LLGLEnumEntry g_llglSystemValueEntries[] =
+{
+    { "ClipDistance", 1 }, { "Color", 2 }, { "CullDistance", 3 }, { "Depth", 4 }, { "DepthGreater", 5 },
+    { "DepthLess", 6 }, { "FrontFacing", 7 }, { "InstanceID", 8 }, { "Position", 9 }, { "PrimitiveID", 10 },
+    { "RenderTargetIndex", 11 }, { "SampleID", 13 }, { "SampleMask", 12 }, { "Stencil", 14 }, { "Undefined", 0 },
+    { "VertexID", 15 }, { "ViewportIndex", 16 },
+};
+
+LLGL_C_EXPORT const char* llglSystemValueToString(LLGLSystemValue value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglSystemValueNames)/sizeof(g_llglSystemValueNames[0])) ? g_llglSystemValueNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglSystemValueFromString(const char* name, LLGLSystemValue* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglSystemValueEntries, sizeof(g_llglSystemValueEntries)/sizeof(g_llglSystemValueEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLSystemValue)entry->value;
+    return true;
+}
+
+static const char* const g_llglTextureTypeNames[] =
+{
+    "Texture1D", "Texture2D", "Texture3D", "TextureCube", "Texture1DArray", "Texture2DArray", "TextureCubeArray",
+    "Texture2DMS", "Texture2DMSArray",
+};
+
+static const LLGLEnumEntry g_llglTextureTypeEntries[] =
+{
+    { "Texture1D", 0 }, { "Texture1DArray", 4 }, { "Texture2D", 1 }, { "Texture2DArray", 5 }, { "Texture2DMS", 7 },
+    { "Texture2DMSArray", 8 }, { "Texture3D", 2 }, { "TextureCube", 3 }, { "TextureCubeArray", 6 },
+};
+
+LLGL_C_EXPORT const char* llglTextureTypeToString(LLGLTextureType value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglTextureTypeNames)/sizeof(g_llglTextureTypeNames[0])) ? g_llglTextureTypeNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglTextureTypeFromString(const char* name, LLGLTextureType* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglTextureTypeEntries, sizeof(g_llglTextureTypeEntries)/sizeof(g_llglTextureTypeEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLTextureType)entry->value;
+    return true;
+}
+
+static const char* const g_llglTextureSwizzleNames[] =
+{
+    "Zero", "One", "Red", "Green", "Blue", "Alpha",
+};
+
+static const LLGLEnumEntry g_llglTextureSwizzleEntries[] =
+{
+    { "Alpha", 5 }, { "Blue", 4 }, { "Green", 3 }, { "One", 1 }, { "Red", 2 }, { "Zero", 0 },
+};
+
+LLGL_C_EXPORT const char* llglTextureSwizzleToString(LLGLTextureSwizzle value)
+{
+    const long index = (long)value;
+    return (index >= 0 && index < (long)(sizeof(g_llglTextureSwizzleNames)/sizeof(g_llglTextureSwizzleNames[0])) ? g_llglTextureSwizzleNames[index] : NULL);
+}
+
+LLGL_C_EXPORT bool llglTextureSwizzleFromString(const char* name, LLGLTextureSwizzle* outValue)
+{
+    const LLGLEnumEntry* entry = llglFindEnumEntryByName(g_llglTextureSwizzleEntries, sizeof(g_llglTextureSwizzleEntries)/sizeof(g_llglTextureSwizzleEntries[0]), name, strlen(name));
+    if (entry == NULL)
+        return false;
+    *outValue = (LLGLTextureSwizzle)entry->value;
+    return true;
+}
+
+static const LLGLEnumEntry g_llglCanvasFlagsBits[] =
+{
+    { "Borderless", 1 },
+};
+
+static const LLGLEnumEntry g_llglCanvasFlagsEntries[] =
+{
+    { "Borderless", 1 },
+};
+
+LLGL_C_EXPORT size_t llglCanvasFlagsToString(long flags, char* outString, size_t outStringSize)
+{
+    return llglFlagsToString(g_llglCanvasFlagsBits, sizeof(g_llglCanvasFlagsBits)/sizeof(g_llglCanvasFlagsBits[0]), flags, outString, outStringSize);
+}
+
+LLGL_C_EXPORT bool llglCanvasFlagsFromString(const char* names, long* outFlags)
+{
+    return llglFlagsFromString(g_llglCanvasFlagsEntries, sizeof(g_llglCanvasFlagsEntries)/sizeof(g_llglCanvasFlagsEntries[0]), names, outFlags);
+}
+
+static const LLGLEnumEntry g_llglCommandBufferFlagsBits[] =
+{
+    { "Secondary", 1 }, { "MultiSubmit", 2 }, { "ImmediateSubmit", 4 },
+};
+
+static const LLGLEnumEntry g_llglCommandBufferFlagsEntries[] =
+{
+    { "ImmediateSubmit", 4 }, { "MultiSubmit", 2 }, { "Secondary", 1 },
+};
+
+LLGL_C_EXPORT size_t llglCommandBufferFlagsToString(long flags, char* outString, size_t outStringSize)
+{
+    return llglFlagsToString(g_llglCommandBufferFlagsBits, sizeof(g_llglCommandBufferFlagsBits)/sizeof(g_llglCommandBufferFlagsBits[0]), flags, outString, outStringSize);
+}
+
+LLGL_C_EXPORT bool llglCommandBufferFlagsFromString(const char* names, long* outFlags)
+{
+    return llglFlagsFromString(g_llglCommandBufferFlagsEntries, sizeof(g_llglCommandBufferFlagsEntries)/sizeof(g_llglCommandBufferFlagsEntries[0]), names, outFlags);
+}
+
+static const LLGLEnumEntry g_llglClearFlagsBits[] =
+{
+    { "All", 7 }, { "ColorDepth", 3 }, { "DepthStencil", 6 }, { "Color", 1 }, { "Depth", 2 }, { "Stencil", 4 },
+};
+
+static const LLGLEnumEntry g_llglClearFlagsEntries[] =
+{
+    { "All", 7 }, { "Color", 1 }, { "ColorDepth", 3 }, { "Depth", 2 }, { "DepthStencil", 6 }, { "Stencil", 4 },
+};
+
+LLGL_C_EXPORT size_t llglClearFlagsToString(long flags, char* outString, size_t outStringSize)
+{
+    return llglFlagsToString(g_llglClearFlagsBits, sizeof(g_llglClearFlagsBits)/sizeof(g_llglClearFlagsBits[0]), flags, outString, outStringSize);
+}
+
+LLGL_C_EXPORT bool llglClearFlagsFromString(const char* names, long* outFlags)
+{
+    return llglFlagsFromString(g_llglClearFlagsEntries, sizeof(g_llglClearFlagsEntries)/sizeof(g_llglClearFlagsEntries[0]), names, outFlags);
+}
+
+static const LLGLEnumEntry g_llglFormatFlagsBits[] =
+{
+    { "HasDepthStencil", 3 }, { "IsUnsignedInteger", 96 }, { "HasDepth", 1 }, { "HasStencil", 2 },
+    { "IsColorSpace_sRGB", 4 }, { "IsCompressed", 8 }, { "IsNormalized", 16 }, { "IsInteger", 32 },
+    { "IsUnsigned", 64 }, { "IsPacked", 128 }, { "SupportsRenderTarget", 256 }, { "SupportsMips", 512 },
+    { "SupportsGenerateMips", 1024 }, { "SupportsTexture1D", 2048 }, { "SupportsTexture2D", 4096 },
+    { "SupportsTexture3D", 8192 }, { "SupportsTextureCube", 16384 }, { "SupportsVertex", 32768 },
+};
+
+static const LLGLEnumEntry g_llglFormatFlagsEntries[] =
+{
+    { "HasDepth", 1 }, { "HasDepthStencil", 3 }, { "HasStencil", 2 }, { "IsColorSpace_sRGB", 4 },
+    { "IsCompressed", 8 }, { "IsInteger", 32 }, { "IsNormalized", 16 }, { "IsPacked", 128 }, { "IsUnsigned", 64 },
+    { "IsUnsignedInteger", 96 }, { "SupportsGenerateMips", 1024 }, { "SupportsMips", 512 },
+    { "SupportsRenderTarget", 256 }, { "SupportsTexture1D", 2048 }, { "SupportsTexture2D", 4096 },
+    { "SupportsTexture3D", 8192 }, { "SupportsTextureCube", 16384 }, { "SupportsVertex", 32768 },
+};
+
+LLGL_C_EXPORT size_t llglFormatFlagsToString(long flags, char* outString, size_t outStringSize)
+{
+    return llglFlagsToString(g_llglFormatFlagsBits, sizeof(g_llglFormatFlagsBits)/sizeof(g_llglFormatFlagsBits[0]), flags, outString, outStringSize);
+}
+
+LLGL_C_EXPORT bool llglFormatFlagsFromString(const char* names, long* outFlags)
+{
+    return llglFlagsFromString(g_llglFormatFlagsEntries, sizeof(g_llglFormatFlagsEntries)/sizeof(g_llglFormatFlagsEntries[0]), names, outFlags);
+}
+
+static const LLGLEnumEntry g_llglColorMaskFlagsBits[] =
+{
+    { "All", 15 }, { "R", 1 }, { "G", 2 }, { "B", 4 }, { "A", 8 }, { "Zero", 0 },
+};
+
+static const LLGLEnumEntry g_llglColorMaskFlagsEntries[] =
+{
+    { "A", 8 }, { "All", 15 }, { "B", 4 }, { "G", 2 }, { "R", 1 }, { "Zero", 0 },
+};
+
+LLGL_C_EXPORT size_t llglColorMaskFlagsToString(long flags, char* outString, size_t outStringSize)
+{
+    return llglFlagsToString(g_llglColorMaskFlagsBits, sizeof(g_llglColorMaskFlagsBits)/sizeof(g_llglColorMaskFlagsBits[0]), flags, outString, outStringSize);
+}
+
+LLGL_C_EXPORT bool llglColorMaskFlagsFromString(const char* names, long* outFlags)
+{
+    return llglFlagsFromString(g_llglColorMaskFlagsEntries, sizeof(g_llglColorMaskFlagsEntries)/sizeof(g_llglColorMaskFlagsEntries[0]), names, outFlags);
+}
+
+static const LLGLEnumEntry g_llglRenderSystemFlagsBits[] =
+{
+    { "DebugDevice", 1 }, { "PreferNVIDIA", 2 }, { "PreferAMD", 4 }, { "PreferIntel", 8 },
+};
+
+static const LLGLEnumEntry g_llglRenderSystemFlagsEntries[] =
+{
+    { "DebugDevice", 1 }, { "PreferAMD", 4 }, { "PreferIntel", 8 }, { "PreferNVIDIA", 2 },
+};
+
+LLGL_C_EXPORT size_t llglRenderSystemFlagsToString(long flags, char* outString, size_t outStringSize)
+{
+    return llglFlagsToString(g_llglRenderSystemFlagsBits, sizeof(g_llglRenderSystemFlagsBits)/sizeof(g_llglRenderSystemFlagsBits[0]), flags, outString, outStringSize);
+}
+
+LLGL_C_EXPORT bool llglRenderSystemFlagsFromString(const char* names, long* outFlags)
+{
+    return llglFlagsFromString(g_llglRenderSystemFlagsEntries, sizeof(g_llglRenderSystemFlagsEntries)/sizeof(g_llglRenderSystemFlagsEntries[0]), names, outFlags);
+}
+
+static const LLGLEnumEntry g_llglBindFlagsBits[] =
+{
+    { "VertexBuffer", 1 }, { "IndexBuffer", 2 }, { "ConstantBuffer", 4 }, { "StreamOutputBuffer", 8 },
+    { "IndirectBuffer", 16 }, { "Sampled", 32 }, { "Storage", 64 }, { "ColorAttachment", 128 },
+    { "DepthStencilAttachment", 256 }, { "CombinedSampler", 512 }, { "CopySrc", 1024 }, { "CopyDst", 2048 },
+};
+
+static const LLGLEnumEntry g_llglBindFlagsEntries[] =
+{
+    { "ColorAttachment", 128 }, { "CombinedSampler", 512 }, { "ConstantBuffer", 4 }, { "CopyDst", 2048 },
+    { "CopySrc", 1024 }, { "DepthStencilAttachment", 256 }, { "IndexBuffer", 2 }, { "IndirectBuffer", 16 },
+    { "Sampled", 32 }, { "Storage", 64 }, { "StreamOutputBuffer", 8 }, { "VertexBuffer", 1 },
+};
+
+LLGL_C_EXPORT size_t llglBindFlagsToString(long flags, char* outString, size_t outStringSize)
+{
+    return llglFlagsToString(g_llglBindFlagsBits, sizeof(g_llglBindFlagsBits)/sizeof(g_llglBindFlagsBits[0]), flags, outString, outStringSize);
+}
+
+LLGL_C_EXPORT bool llglBindFlagsFromString(const char* names, long* outFlags)
+{
+    return llglFlagsFromString(g_llglBindFlagsEntries, sizeof(g_llglBindFlagsEntries)/sizeof(g_llglBindFlagsEntries[0]), names, outFlags);
+}
+
+static const LLGLEnumEntry g_llglCPUAccessFlagsBits[] =
+{
+    { "ReadWrite", 3 }, { "Read", 1 }, { "Write", 2 },
+};
+
+static const LLGLEnumEntry g_llglCPUAccessFlagsEntries[] =
+{
+    { "Read", 1 }, { "ReadWrite", 3 }, { "Write", 2 },
+};
+
+LLGL_C_EXPORT size_t llglCPUAccessFlagsToString(long flags, char* outString, size_t outStringSize)
+{
+    return llglFlagsToString(g_llglCPUAccessFlagsBits, sizeof(g_llglCPUAccessFlagsBits)/sizeof(g_llglCPUAccessFlagsBits[0]), flags, outString, outStringSize);
+}
+
+LLGL_C_EXPORT bool llglCPUAccessFlagsFromString(const char* names, long* outFlags)
+{
+    return llglFlagsFromString(g_llglCPUAccessFlagsEntries, sizeof(g_llglCPUAccessFlagsEntries)/sizeof(g_llglCPUAccessFlagsEntries[0]), names, outFlags);
+}
+
+static const LLGLEnumEntry g_llglMiscFlagsBits[] =
+{
+    { "DynamicUsage", 1 }, { "FixedSamples", 2 }, { "GenerateMips", 4 }, { "NoInitialData", 8 }, { "Append", 16 },
+    { "Counter", 32 },
+};
+
+static const LLGLEnumEntry g_llglMiscFlagsEntries[] =
+{
+    { "Append", 16 }, { "Counter", 32 }, { "DynamicUsage", 1 }, { "FixedSamples", 2 }, { "GenerateMips", 4 },
+    { "NoInitialData", 8 },
+};
+
+LLGL_C_EXPORT size_t llglMiscFlagsToString(long flags, char* outString, size_t outStringSize)
+{
+    return llglFlagsToString(g_llglMiscFlagsBits, sizeof(g_llglMiscFlagsBits)/sizeof(g_llglMiscFlagsBits[0]), flags, outString, outStringSize);
+}
+
+LLGL_C_EXPORT bool llglMiscFlagsFromString(const char* names, long* outFlags)
+{
+    return llglFlagsFromString(g_llglMiscFlagsEntries, sizeof(g_llglMiscFlagsEntries)/sizeof(g_llglMiscFlagsEntries[0]), names, outFlags);
+}
+
+static const LLGLEnumEntry g_llglBarrierFlagsBits[] =
+{
+    { "Storage", 3 }, { "StorageBuffer", 1 }, { "StorageTexture", 2 },
+};
+
+static const LLGLEnumEntry g_llglBarrierFlagsEntries[] =
+{
+    { "Storage", 3 }, { "StorageBuffer", 1 }, { "StorageTexture", 2 },
+};
+
+LLGL_C_EXPORT size_t llglBarrierFlagsToString(long flags, char* outString, size_t outStringSize)
+{
+    return llglFlagsToString(g_llglBarrierFlagsBits, sizeof(g_llglBarrierFlagsBits)/sizeof(g_llglBarrierFlagsBits[0]), flags, outString, outStringSize);
+}
+
+LLGL_C_EXPORT bool llglBarrierFlagsFromString(const char* names, long* outFlags)
+{
+    return llglFlagsFromString(g_llglBarrierFlagsEntries, sizeof(g_llglBarrierFlagsEntries)/sizeof(g_llglBarrierFlagsEntries[0]), names, outFlags);
+}
+
+static const LLGLEnumEntry g_llglShaderCompileFlagsBits[] =
+{
+    { "Debug", 1 }, { "NoOptimization", 2 }, { "OptimizationLevel1", 4 }, { "OptimizationLevel2", 8 },
+    { "OptimizationLevel3", 16 }, { "WarningsAreErrors", 32 }, { "PatchClippingOrigin", 64 },
+    { "SeparateShader", 128 }, { "DefaultLibrary", 256 },
+};
+
+static const LLGLEnumEntry g_llglShaderCompileFlagsEntries[] =
+{
+    { "Debug", 1 }, { "DefaultLibrary", 256 }, { "NoOptimization", 2 }, { "OptimizationLevel1", 4 },
+    { "OptimizationLevel2", 8 }, { "OptimizationLevel3", 16 }, { "PatchClippingOrigin", 64 },
+    { "SeparateShader", 128 }, { "WarningsAreErrors", 32 },
+};
+
+LLGL_C_EXPORT size_t llglShaderCompileFlagsToString(long flags, char* outString, size_t outStringSize)
+{
+    return llglFlagsToString(g_llglShaderCompileFlagsBits, sizeof(g_llglShaderCompileFlagsBits)/sizeof(g_llglShaderCompileFlagsBits[0]), flags, outString, outStringSize);
+}
+
+LLGL_C_EXPORT bool llglShaderCompileFlagsFromString(const char* names, long* outFlags)
+{
+    return llglFlagsFromString(g_llglShaderCompileFlagsEntries, sizeof(g_llglShaderCompileFlagsEntries)/sizeof(g_llglShaderCompileFlagsEntries[0]), names, outFlags);
+}
+
+static const LLGLEnumEntry g_llglStageFlagsBits[] =
+{
+    { "AllStages", 63 }, { "AllGraphicsStages", 31 }, { "AllTessStages", 6 }, { "VertexStage", 1 },
+    { "TessControlStage", 2 }, { "TessEvaluationStage", 4 }, { "GeometryStage", 8 }, { "FragmentStage", 16 },
+    { "ComputeStage", 32 },
+};
+
+static const LLGLEnumEntry g_llglStageFlagsEntries[] =
+{
+    { "AllGraphicsStages", 31 }, { "AllStages", 63 }, { "AllTessStages", 6 }, { "ComputeStage", 32 },
+    { "FragmentStage", 16 }, { "GeometryStage", 8 }, { "TessControlStage", 2 }, { "TessEvaluationStage", 4 },
+    { "VertexStage", 1 },
+};
+
+LLGL_C_EXPORT size_t llglStageFlagsToString(long flags, char* outString, size_t outStringSize)
+{
+    return llglFlagsToString(g_llglStageFlagsBits, sizeof(g_llglStageFlagsBits)/sizeof(g_llglStageFlagsBits[0]), flags, outString, outStringSize);
+}
+
+LLGL_C_EXPORT bool llglStageFlagsFromString(const char* names, long* outFlags)
+{
+    return llglFlagsFromString(g_llglStageFlagsEntries, sizeof(g_llglStageFlagsEntries)/sizeof(g_llglStageFlagsEntries[0]), names, outFlags);
+}
+
+static const LLGLEnumEntry g_llglResizeBuffersFlagsBits[] =
+{
+    { "AdaptSurface", 1 }, { "FullscreenMode", 2 }, { "WindowedMode", 4 },
+};
+
+static const LLGLEnumEntry g_llglResizeBuffersFlagsEntries[] =
+{
+    { "AdaptSurface", 1 }, { "FullscreenMode", 2 }, { "WindowedMode", 4 },
+};
+
+LLGL_C_EXPORT size_t llglResizeBuffersFlagsToString(long flags, char* outString, size_t outStringSize)
+{
+    return llglFlagsToString(g_llglResizeBuffersFlagsBits, sizeof(g_llglResizeBuffersFlagsBits)/sizeof(g_llglResizeBuffersFlagsBits[0]), flags, outString, outStringSize);
+}
+
+LLGL_C_EXPORT bool llglResizeBuffersFlagsFromString(const char* names, long* outFlags)
+{
+    return llglFlagsFromString(g_llglResizeBuffersFlagsEntries, sizeof(g_llglResizeBuffersFlagsEntries)/sizeof(g_llglResizeBuffersFlagsEntries[0]), names, outFlags);
+}
+
+static const LLGLEnumEntry g_llglWindowFlagsBits[] =
+{
+    { "Visible", 1 }, { "Borderless", 2 }, { "Resizable", 4 }, { "Centered", 8 }, { "AcceptDropFiles", 16 },
+    { "DisableClearOnResize", 32 }, { "DisableSizeScaling", 64 },
+};
+
+static const LLGLEnumEntry g_llglWindowFlagsEntries[] =
+{
+    { "AcceptDropFiles", 16 }, { "Borderless", 2 }, { "Centered", 8 }, { "DisableClearOnResize", 32 },
+    { "DisableSizeScaling", 64 }, { "Resizable", 4 }, { "Visible", 1 },
+};
+
+LLGL_C_EXPORT size_t llglWindowFlagsToString(long flags, char* outString, size_t outStringSize)
+{
+    return llglFlagsToString(g_llglWindowFlagsBits, sizeof(g_llglWindowFlagsBits)/sizeof(g_llglWindowFlagsBits[0]), flags, outString, outStringSize);
+}
+
+LLGL_C_EXPORT bool llglWindowFlagsFromString(const char* names, long* outFlags)
+{
+    return llglFlagsFromString(g_llglWindowFlagsEntries, sizeof(g_llglWindowFlagsEntries)/sizeof(g_llglWindowFlagsEntries[0]), names, outFlags);
+}
+
+#endif /* LLGL_ENUM_STRINGS_IMPLEMENTATION */
+
+
+#endif /* LLGL_C99_LLGLENUM_STRINGS_H */
+
+
+
+/* ================================================================================ */
+
@@ -0,0 +1,125 @@
+/*
+ * LLGLFormatTable.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_LLGLFORMAT_TABLE_H
+#define LLGL_C99_LLGLFORMAT_TABLE_H
+
+
+#include <LLGL-C/LLGLWrapper.h>
+#include <LLGL-C/Export.h>
+
+
+#define LLGL_FORMAT_TABLE_SIZE ( 79 )
+
+
+/* ----- Tables ----- */
+
+static const LLGLFormatAttributes g_llglFormatTable[LLGL_FORMAT_TABLE_SIZE] =
+{
+    {    0, 0, 0, 0, LLGLImageFormatR,               LLGLDataTypeUndefined,         0x00000000 }, /* Undefined */
+    {    8, 1, 1, 1, LLGLImageFormatAlpha,           LLGLDataTypeUInt8,             0x00007F70 }, /* A8UNorm */
+    {    8, 1, 1, 1, LLGLImageFormatR,               LLGLDataTypeUInt8,             0x0000FF70 }, /* R8UNorm */
+    {    8, 1, 1, 1, LLGLImageFormatR,               LLGLDataTypeInt8,              0x0000FF70 }, /* R8SNorm */
+    {    8, 1, 1, 1, LLGLImageFormatR,               LLGLDataTypeUInt8,             0x0000FF60 }, /* R8UInt */
+    {    8, 1, 1, 1, LLGLImageFormatR,               LLGLDataTypeInt8,              0x0000FF20 }, /* R8SInt */
+    {   16, 1, 1, 1, LLGLImageFormatR,               LLGLDataTypeUInt16,            0x0000FF70 }, /* R16UNorm */
+    {   16, 1, 1, 1, LLGLImageFormatR,               LLGLDataTypeInt16,             0x0000FF30 }, /* R16SNorm */
+    {   16, 1, 1, 1, LLGLImageFormatR,               LLGLDataTypeUInt16,            0x0000FF60 }, /* R16UInt */
+    {   16, 1, 1, 1, LLGLImageFormatR,               LLGLDataTypeInt16,             0x0000FF20 }, /* R16SInt */
+    {   16, 1, 1, 1, LLGLImageFormatR,               LLGLDataTypeFloat16,           0x0000FF00 }, /* R16Float */
+    {   32, 1, 1, 1, LLGLImageFormatR,               LLGLDataTypeUInt32,            0x0000FF60 }, /* R32UInt */
+    {   32, 1, 1, 1, LLGLImageFormatR,               LLGLDataTypeInt32,             0x0000FF20 }, /* R32SInt */
+    {   32, 1, 1, 1, LLGLImageFormatR,               LLGLDataTypeFloat32,           0x0000FF00 }, /* R32Float */
+    {   64, 1, 1, 1, LLGLImageFormatR,               LLGLDataTypeFloat64,           0x0000FF00 }, /* R64Float */
+    {   16, 1, 1, 2, LLGLImageFormatRG,              LLGLDataTypeUInt8,             0x0000FF70 }, /* RG8UNorm */
+    {   16, 1, 1, 2, LLGLImageFormatRG,              LLGLDataTypeInt8,              0x0000FF30 }, /* RG8SNorm */
+    {   16, 1, 1, 2, LLGLImageFormatRG,              LLGLDataTypeUInt8,             0x0000FF60 }, /* RG8UInt */
+    {   16, 1, 1, 2, LLGLImageFormatRG,              LLGLDataTypeInt8,              0x0000FF20 }, /* RG8SInt */
+    {   32, 1, 1, 2, LLGLImageFormatRG,              LLGLDataTypeUInt16,            0x0000FF70 }, /* RG16UNorm */
+    {   32, 1, 1, 2, LLGLImageFormatRG,              LLGLDataTypeInt16,             0x0000FF30 }, /* RG16SNorm */
+    {   32, 1, 1, 2, LLGLImageFormatRG,              LLGLDataTypeUInt16,            0x0000FF60 }, /* RG16UInt */
+    {   32, 1, 1, 2, LLGLImageFormatRG,              LLGLDataTypeInt16,             0x0000FF20 }, /* RG16SInt */
+    {   32, 1, 1, 2, LLGLImageFormatRG,              LLGLDataTypeFloat16,           0x0000FF00 }, /* RG16Float */
+    {   64, 1, 1, 2, LLGLImageFormatRG,              LLGLDataTypeUInt32,            0x0000FF60 }, /* RG32UInt */
+    {   64, 1, 1, 2, LLGLImageFormatRG,              LLGLDataTypeInt32,             0x0000FF20 }, /* RG32SInt */
+    {   64, 1, 1, 2, LLGLImageFormatRG,              LLGLDataTypeFloat32,           0x0000FF00 }, /* RG32Float */
+    {  128, 1, 1, 2, LLGLImageFormatRG,              LLGLDataTypeFloat64,           0x0000FF00 }, /* RG64Float */
+    {   24, 1, 1, 3, LLGLImageFormatRGB,             LLGLDataTypeUInt8,             0x0000FF70 }, /* RGB8UNorm */
+    {   24, 1, 1, 3, LLGLImageFormatRGB,             LLGLDataTypeUInt8,             0x0000FF74 }, /* RGB8UNorm_sRGB */
+    {   24, 1, 1, 3, LLGLImageFormatRGB,             LLGLDataTypeInt8,              0x0000FF30 }, /* RGB8SNorm */
+    {   24, 1, 1, 3, LLGLImageFormatRGB,             LLGLDataTypeUInt8,             0x0000FF60 }, /* RGB8UInt */
+    {   24, 1, 1, 3, LLGLImageFormatRGB,             LLGLDataTypeInt8,              0x0000FF20 }, /* RGB8SInt */
+    {   48, 1, 1, 3, LLGLImageFormatRGB,             LLGLDataTypeUInt16,            0x0000FF70 }, /* RGB16UNorm */
+    {   48, 1, 1, 3, LLGLImageFormatRGB,             LLGLDataTypeInt16,             0x0000FF30 }, /* RGB16SNorm */
+    {   48, 1, 1, 3, LLGLImageFormatRGB,             LLGLDataTypeUInt16,            0x0000FF60 }, /* RGB16UInt */
+    {   48, 1, 1, 3, LLGLImageFormatRGB,             LLGLDataTypeInt16,             0x0000FF20 }, /* RGB16SInt */
+    {   48, 1, 1, 3, LLGLImageFormatRGB,             LLGLDataTypeFloat16,           0x0000FF00 }, /* RGB16Float */
+    {   96, 1, 1, 3, LLGLImageFormatRGB,             LLGLDataTypeUInt32,            0x0000FF60 }, /* RGB32UInt */
+    {   96, 1, 1, 3, LLGLImageFormatRGB,             LLGLDataTypeInt32,             0x0000FF20 }, /* RGB32SInt */
+    {   96, 1, 1, 3, LLGLImageFormatRGB,             LLGLDataTypeFloat32,           0x0000FF00 }, /* RGB32Float */
+    {  192, 1, 1, 3, LLGLImageFormatRGB,             LLGLDataTypeFloat64,           0x0000FF00 }, /* RGB64Float */
+    {   32, 1, 1, 4, LLGLImageFormatRGBA,            LLGLDataTypeUInt8,             0x0000FF70 }, /* RGBA8UNorm */
+    {   32, 1, 1, 4, LLGLImageFormatRGBA,            LLGLDataTypeUInt8,             0x0000FF74 }, /* RGBA8UNorm_sRGB */
+    {   32, 1, 1, 4, LLGLImageFormatRGBA,            LLGLDataTypeInt8,              0x0000FF30 }, /* RGBA8SNorm */
+    {   32, 1, 1, 4, LLGLImageFormatRGBA,            LLGLDataTypeUInt8,             0x0000FF60 }, /* RGBA8UInt */
+    {   32, 1, 1, 4, LLGLImageFormatRGBA,            LLGLDataTypeInt8,              0x0000FF20 }, /* RGBA8SInt */
+    {   64, 1, 1, 4, LLGLImageFormatRGBA,            LLGLDataTypeUInt16,            0x0000FF70 }, /* RGBA16UNorm */
+    {   64, 1, 1, 4, LLGLImageFormatRGBA,            LLGLDataTypeInt16,             0x0000FF30 }, /* RGBA16SNorm */
+    {   64, 1, 1, 4, LLGLImageFormatRGBA,            LLGLDataTypeUInt16,            0x0000FF60 }, /* RGBA16UInt */
+    {   64, 1, 1, 4, LLGLImageFormatRGBA,            LLGLDataTypeInt16,             0x0000FF20 }, /* RGBA16SInt */
+    {   64, 1, 1, 4, LLGLImageFormatRGBA,            LLGLDataTypeFloat16,           0x0000FF00 }, /* RGBA16Float */
+    {  128, 1, 1, 4, LLGLImageFormatRGBA,            LLGLDataTypeUInt32,            0x0000FF60 }, /* RGBA32UInt */
+    {  128, 1, 1, 4, LLGLImageFormatRGBA,            LLGLDataTypeInt32,             0x0000FF20 }, /* RGBA32SInt */
+    {  128, 1, 1, 4, LLGLImageFormatRGBA,            LLGLDataTypeFloat32,           0x0000FF00 }, /* RGBA32Float */
+    {  256, 1, 1, 4, LLGLImageFormatRGBA,            LLGLDataTypeFloat64,           0x0000FF00 }, /* RGBA64Float */
+    {   32, 1, 1, 4, LLGLImageFormatBGRA,            LLGLDataTypeUInt8,             0x00007F70 }, /* BGRA8UNorm */
+    {   32, 1, 1, 4, LLGLImageFormatBGRA,            LLGLDataTypeUInt8,             0x00007F74 }, /* BGRA8UNorm_sRGB */
+    {   32, 1, 1, 4, LLGLImageFormatBGRA,            LLGLDataTypeInt8,              0x00007F30 }, /* BGRA8SNorm */
+    {   32, 1, 1, 4, LLGLImageFormatBGRA,            LLGLDataTypeUInt8,             0x00007F60 }, /* BGRA8UInt */
+    {   32, 1, 1, 4, LLGLImageFormatBGRA,            LLGLDataTypeInt8,              0x00007F20 }, /* BGRA8SInt */
+    {   32, 1, 1, 4, LLGLImageFormatRGBA,            LLGLDataTypeUndefined,         0x00007FF0 }, /* RGB10A2UNorm */
+    {   32, 1, 1, 4, LLGLImageFormatRGBA,            LLGLDataTypeUndefined,         0x00007FE0 }, /* RGB10A2UInt */
+    {   32, 1, 1, 3, LLGLImageFormatRGB,             LLGLDataTypeUndefined,         0x00007FC0 }, /* RG11B10Float */
+    {   32, 1, 1, 3, LLGLImageFormatRGB,             LLGLDataTypeUndefined,         0x00007AC0 }, /* RGB9E5Float */
+    {   16, 1, 1, 1, LLGLImageFormatDepth,           LLGLDataTypeUInt16,            0x00005B71 }, /* D16UNorm */
+    {   32, 1, 1, 2, LLGLImageFormatDepthStencil,    LLGLDataTypeUInt32,            0x00005B73 }, /* D24UNormS8UInt */
+    {   32, 1, 1, 1, LLGLImageFormatDepth,           LLGLDataTypeFloat32,           0x00005B01 }, /* D32Float */
+    {   64, 1, 1, 2, LLGLImageFormatDepthStencil,    LLGLDataTypeFloat32,           0x00005B03 }, /* D32FloatS8X24UInt */
+    {   64, 4, 4, 4, LLGLImageFormatBC1,             LLGLDataTypeUInt8,             0x00007278 }, /* BC1UNorm */
+    {   64, 4, 4, 4, LLGLImageFormatBC1,             LLGLDataTypeUInt8,             0x0000727C }, /* BC1UNorm_sRGB */
+    {  128, 4, 4, 4, LLGLImageFormatBC2,             LLGLDataTypeUInt8,             0x00007278 }, /* BC2UNorm */
+    {  128, 4, 4, 4, LLGLImageFormatBC2,             LLGLDataTypeUInt8,             0x0000727C }, /* BC2UNorm_sRGB */
+    {  128, 4, 4, 4, LLGLImageFormatBC3,             LLGLDataTypeUInt8,             0x00007278 }, /* BC3UNorm */
+    {  128, 4, 4, 4, LLGLImageFormatBC3,             LLGLDataTypeUInt8,             0x0000727C }, /* BC3UNorm_sRGB */
+    {   64, 4, 4, 1, LLGLImageFormatBC4,             LLGLDataTypeUInt8,             0x00007278 }, /* BC4UNorm */
+    {   64, 4, 4, 1, LLGLImageFormatBC4,             LLGLDataTypeInt8,              0x00007238 }, /* BC4SNorm */
+    {  128, 4, 4, 2, LLGLImageFormatBC5,             LLGLDataTypeUInt8,             0x00007278 }, /* BC5UNorm */
+    {  128, 4, 4, 2, LLGLImageFormatBC5,             LLGLDataTypeInt8,              0x00007238 }, /* BC5SNorm */
+};
+
+
+/* ----- Functions ----- */
+
+/* Native lookup of format attributes (see C99FlagsAndDescriptors.cpp) */
+LLGL_C_EXPORT const LLGLFormatAttributes* llglGetFormatAttribs(LLGLFormat format);
+
+/* Same as llglGetFormatAttribs but without a call into the native library */
+static inline const LLGLFormatAttributes* llglLookupFormatAttribs(LLGLFormat format)
+{
+    const size_t index = (size_t)format;
+    return &g_llglFormatTable[index < LLGL_FORMAT_TABLE_SIZE ? index : 0];
+}
+
+
+#endif /* LLGL_C99_LLGLFORMAT_TABLE_H */
+
+
+
+/* ================================================================================ */
+
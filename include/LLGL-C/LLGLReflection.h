@@ -0,0 +1,1085 @@
+/*
+ * LLGLReflection.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_LLGLREFLECTION_H
+#define LLGL_C99_LLGLREFLECTION_H
+
+
+#include <LLGL-C/LLGL.h>
+#include <stddef.h>
+#include <stdint.h>
+
+
+#define LLGL_NUM_STRUCT_TYPES ( 67 )
+
+
+/* ----- Enumerations ----- */
+
+typedef enum LLGLStructType
+{
+    LLGLStructTypeCanvasDescriptor,
+    LLGLStructTypeClearValue,
+    LLGLStructTypeCommandBufferDescriptor,
+    LLGLStructTypeDrawIndirectArguments,
+    LLGLStructTypeDrawIndexedIndirectArguments,
+    LLGLStructTypeDrawPatchIndirectArguments,
+    LLGLStructTypeDispatchIndirectArguments,
+    LLGLStructTypeBindingSlot,
+    LLGLStructTypeViewport,
+    LLGLStructTypeScissor,
+    LLGLStructTypeDepthBiasDescriptor,
+    LLGLStructTypeComputePipelineDescriptor,
+    LLGLStructTypeQueryPipelineStatistics,
+    LLGLStructTypeRendererInfo,
+    LLGLStructTypeRenderingFeatures,
+    LLGLStructTypeRenderingLimits,
+    LLGLStructTypeResourceHeapDescriptor,
+    LLGLStructTypeShaderMacro,
+    LLGLStructTypeTextureSubresource,
+    LLGLStructTypeSubresourceFootprint,
+    LLGLStructTypeExtent2D,
+    LLGLStructTypeExtent3D,
+    LLGLStructTypeOffset2D,
+    LLGLStructTypeOffset3D,
+    LLGLStructTypeBufferViewDescriptor,
+    LLGLStructTypeAttachmentClear,
+    LLGLStructTypeDisplayModeDescriptor,
+    LLGLStructTypeFormatAttributes,
+    LLGLStructTypeFragmentAttribute,
+    LLGLStructTypeImageView,
+    LLGLStructTypeMutableImageView,
+    LLGLStructTypeBindingDescriptor,
+    LLGLStructTypeUniformDescriptor,
+    LLGLStructTypeDepthDescriptor,
+    LLGLStructTypeStencilFaceDescriptor,
+    LLGLStructTypeRasterizerDescriptor,
+    LLGLStructTypeBlendTargetDescriptor,
+    LLGLStructTypeTessellationDescriptor,
+    LLGLStructTypeQueryHeapDescriptor,
+    LLGLStructTypeAttachmentFormatDescriptor,
+    LLGLStructTypeRenderSystemDescriptor,
+    LLGLStructTypeRenderingCapabilities,
+    LLGLStructTypeAttachmentDescriptor,
+    LLGLStructTypeSamplerDescriptor,
+    LLGLStructTypeComputeShaderAttributes,
+    LLGLStructTypeSwapChainDescriptor,
+    LLGLStructTypeTextureSwizzleRGBA,
+    LLGLStructTypeTextureLocation,
+    LLGLStructTypeTextureRegion,
+    LLGLStructTypeTextureDescriptor,
+    LLGLStructTypeVertexAttribute,
+    LLGLStructTypeWindowDescriptor,
+    LLGLStructTypeBufferDescriptor,
+    LLGLStructTypeStaticSamplerDescriptor,
+    LLGLStructTypeStencilDescriptor,
+    LLGLStructTypeBlendDescriptor,
+    LLGLStructTypeRenderPassDescriptor,
+    LLGLStructTypeRenderTargetDescriptor,
+    LLGLStructTypeVertexShaderAttributes,
+    LLGLStructTypeFragmentShaderAttributes,
+    LLGLStructTypeShaderResourceReflection,
+    LLGLStructTypeTextureViewDescriptor,
+    LLGLStructTypePipelineLayoutDescriptor,
+    LLGLStructTypeGraphicsPipelineDescriptor,
+    LLGLStructTypeResourceViewDescriptor,
+    LLGLStructTypeShaderDescriptor,
+    LLGLStructTypeShaderReflection,
+}
+LLGLStructType;
+
+typedef enum LLGLFieldKind
+{
+    LLGLFieldKindScalar,        /* Plain bytes: integers, floats, booleans, enumerations, flags, and merged bitfields */
+    LLGLFieldKindString,        /* Null-terminated string (const char*) */
+    LLGLFieldKindStruct,        /* Nested struct described by LLGLFieldInfo::type */
+    LLGLFieldKindArray,         /* Pointer to elements; the number of elements is stored in the field at LLGLFieldInfo::countField */
+    LLGLFieldKindStringArray,   /* Pointer to strings; the number of strings is stored in the field at LLGLFieldInfo::countField */
+    LLGLFieldKindText,          /* Pointer to characters with the length in LLGLFieldInfo::countField or null-terminated if the length is 0 */
+    LLGLFieldKindObject,        /* Interface handle such as LLGLTexture; reflected by identity */
+    LLGLFieldKindPointer,       /* Opaque pointer or function pointer; reflected by address */
+}
+LLGLFieldKind;
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLStructInfo LLGLStructInfo;
+
+typedef struct LLGLFieldInfo
+{
+    const char*             name;       /* Field name, e.g. "vertexAttribs" */
+    size_t                  offset;     /* Byte offset within the struct */
+    size_t                  size;       /* Size of the field or of a single element for arrays */
+    size_t                  count;      /* Number of elements for fixed size arrays, 1 otherwise */
+    LLGLFieldKind           kind;
+    int                     countField; /* Index of the size_t field with the number of elements for array kinds, -1 otherwise */
+    const LLGLStructInfo*   type;       /* Struct info of nested structs and struct elements, NULL otherwise */
+}
+LLGLFieldInfo;
+
+struct LLGLStructInfo
+{
+    const char*             name;       /* Struct name without prefix, e.g. "BufferDescriptor" */
+    size_t                  size;
+    size_t                  numFields;
+    const LLGLFieldInfo*    fields;
+};
+
+
+/* ----- Functions ----- */
+
+/*
+llglGetStructInfo returns the reflection table of the specified struct type or NULL if the type is out of range.
+llglHashStruct hashes all fields of a struct in a single pass including strings, arrays, and nested structs, but excluding padding bytes.
+llglSerializeStruct writes all fields of a struct into the output buffer and returns the size of the entire serialization like snprintf.
+Strings are written as 32-bit length (0xFFFFFFFF for NULL) followed by the characters, arrays as 64-bit element count followed by the elements.
+Objects and pointers are written by value and are therefore only valid within the same process.
+Neither function allocates memory.
+*/
+
+LLGL_C_EXPORT const LLGLStructInfo* llglGetStructInfo(LLGLStructType type);
+LLGL_C_EXPORT uint64_t llglHashStruct(const LLGLStructInfo* info, const void* data, uint64_t seed);
+LLGL_C_EXPORT size_t llglSerializeStruct(const LLGLStructInfo* info, const void* data, void* buffer, size_t bufferSize);
+
+#ifdef LLGL_REFLECTION_IMPLEMENTATION
+
+#include <string.h>
+
+#define LLGL_REFLECT_FIELD(STRUCT, FIELD, KIND, TYPE) \
+    { #FIELD, offsetof(LLGL ## STRUCT, FIELD), sizeof(((const LLGL ## STRUCT*)0)->FIELD), 1, LLGLFieldKind ## KIND, -1, TYPE }
+
+#define LLGL_REFLECT_ARRAY(STRUCT, FIELD, COUNT, KIND, TYPE) \
+    { #FIELD, offsetof(LLGL ## STRUCT, FIELD), sizeof(((const LLGL ## STRUCT*)0)->FIELD[0]), COUNT, LLGLFieldKind ## KIND, -1, TYPE }
+
+#define LLGL_REFLECT_DYNAMIC_ARRAY(STRUCT, FIELD, KIND, COUNT_FIELD, TYPE) \
+    { #FIELD, offsetof(LLGL ## STRUCT, FIELD), sizeof(((const LLGL ## STRUCT*)0)->FIELD[0]), 1, LLGLFieldKind ## KIND, COUNT_FIELD, TYPE }
+
+#define LLGL_REFLECT_BUFFER(STRUCT, FIELD, KIND, COUNT_FIELD) \
+    { #FIELD, offsetof(LLGL ## STRUCT, FIELD), 1, 1, LLGLFieldKind ## KIND, COUNT_FIELD, NULL }
+
+#define LLGL_REFLECT_BITFIELD(STRUCT, FIELD, OFFSET, SIZE) \
+    { #FIELD, OFFSET, SIZE, 1, LLGLFieldKindScalar, -1, NULL }
+
+#define LLGL_REFLECT_STRUCT(STRUCT) \
+    static const LLGLStructInfo g_llglStructInfo ## STRUCT = { #STRUCT, sizeof(LLGL ## STRUCT), sizeof(g_llglFields ## STRUCT)/sizeof(g_llglFields ## STRUCT[0]), g_llglFields ## STRUCT }
+
+static const LLGLFieldInfo g_llglFieldsCanvasDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(CanvasDescriptor, title, String, NULL),
+    LLGL_REFLECT_FIELD(CanvasDescriptor, flags, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(CanvasDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsClearValue[] =
+{
+    LLGL_REFLECT_ARRAY(ClearValue, color, 4, Scalar, NULL),
+    LLGL_REFLECT_FIELD(ClearValue, depth, Scalar, NULL),
+    LLGL_REFLECT_FIELD(ClearValue, stencil, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(ClearValue);
+
+static const LLGLFieldInfo g_llglFieldsCommandBufferDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(CommandBufferDescriptor, flags, Scalar, NULL),
+    LLGL_REFLECT_FIELD(CommandBufferDescriptor, numNativeBuffers, Scalar, NULL),
+    LLGL_REFLECT_FIELD(CommandBufferDescriptor, minStagingPoolSize, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(CommandBufferDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsDrawIndirectArguments[] =
+{
+    LLGL_REFLECT_FIELD(DrawIndirectArguments, numVertices, Scalar, NULL),
+    LLGL_REFLECT_FIELD(DrawIndirectArguments, numInstances, Scalar, NULL),
+    LLGL_REFLECT_FIELD(DrawIndirectArguments, firstVertex, Scalar, NULL),
+    LLGL_REFLECT_FIELD(DrawIndirectArguments, firstInstance, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(DrawIndirectArguments);
+
+static const LLGLFieldInfo g_llglFieldsDrawIndexedIndirectArguments[] =
+{
+    LLGL_REFLECT_FIELD(DrawIndexedIndirectArguments, numIndices, Scalar, NULL),
+    LLGL_REFLECT_FIELD(DrawIndexedIndirectArguments, numInstances, Scalar, NULL),
+    LLGL_REFLECT_FIELD(DrawIndexedIndirectArguments, firstIndex, Scalar, NULL),
+    LLGL_REFLECT_FIELD(DrawIndexedIndirectArguments, vertexOffset, Scalar, NULL),
+    LLGL_REFLECT_FIELD(DrawIndexedIndirectArguments, firstInstance, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(DrawIndexedIndirectArguments);
+
+static const LLGLFieldInfo g_llglFieldsDrawPatchIndirectArguments[] =
+{
+    LLGL_REFLECT_FIELD(DrawPatchIndirectArguments, numPatches, Scalar, NULL),
+    LLGL_REFLECT_FIELD(DrawPatchIndirectArguments, numInstances, Scalar, NULL),
+    LLGL_REFLECT_FIELD(DrawPatchIndirectArguments, firstPatch, Scalar, NULL),
+    LLGL_REFLECT_FIELD(DrawPatchIndirectArguments, firstInstance, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(DrawPatchIndirectArguments);
+
+static const LLGLFieldInfo g_llglFieldsDispatchIndirectArguments[] =
+{
+    LLGL_REFLECT_ARRAY(DispatchIndirectArguments, numThreadGroups, 3, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(DispatchIndirectArguments);
+
+static const LLGLFieldInfo g_llglFieldsBindingSlot[] =
+{
+    LLGL_REFLECT_FIELD(BindingSlot, index, Scalar, NULL),
+    LLGL_REFLECT_FIELD(BindingSlot, set, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(BindingSlot);
+
+static const LLGLFieldInfo g_llglFieldsViewport[] =
+{
+    LLGL_REFLECT_FIELD(Viewport, x, Scalar, NULL),
+    LLGL_REFLECT_FIELD(Viewport, y, Scalar, NULL),
+    LLGL_REFLECT_FIELD(Viewport, width, Scalar, NULL),
+    LLGL_REFLECT_FIELD(Viewport, height, Scalar, NULL),
+    LLGL_REFLECT_FIELD(Viewport, minDepth, Scalar, NULL),
+    LLGL_REFLECT_FIELD(Viewport, maxDepth, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(Viewport);
+
+static const LLGLFieldInfo g_llglFieldsScissor[] =
+{
+    LLGL_REFLECT_FIELD(Scissor, x, Scalar, NULL),
+    LLGL_REFLECT_FIELD(Scissor, y, Scalar, NULL),
+    LLGL_REFLECT_FIELD(Scissor, width, Scalar, NULL),
+    LLGL_REFLECT_FIELD(Scissor, height, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(Scissor);
+
+static const LLGLFieldInfo g_llglFieldsDepthBiasDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(DepthBiasDescriptor, constantFactor, Scalar, NULL),
+    LLGL_REFLECT_FIELD(DepthBiasDescriptor, slopeFactor, Scalar, NULL),
+    LLGL_REFLECT_FIELD(DepthBiasDescriptor, clamp, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(DepthBiasDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsComputePipelineDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(ComputePipelineDescriptor, pipelineLayout, Object, NULL),
+    LLGL_REFLECT_FIELD(ComputePipelineDescriptor, computeShader, Object, NULL),
+};
+LLGL_REFLECT_STRUCT(ComputePipelineDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsQueryPipelineStatistics[] =
+{
+    LLGL_REFLECT_FIELD(QueryPipelineStatistics, inputAssemblyVertices, Scalar, NULL),
+    LLGL_REFLECT_FIELD(QueryPipelineStatistics, inputAssemblyPrimitives, Scalar, NULL),
+    LLGL_REFLECT_FIELD(QueryPipelineStatistics, vertexShaderInvocations, Scalar, NULL),
+    LLGL_REFLECT_FIELD(QueryPipelineStatistics, geometryShaderInvocations, Scalar, NULL),
+    LLGL_REFLECT_FIELD(QueryPipelineStatistics, geometryShaderPrimitives, Scalar, NULL),
+    LLGL_REFLECT_FIELD(QueryPipelineStatistics, clippingInvocations, Scalar, NULL),
+    LLGL_REFLECT_FIELD(QueryPipelineStatistics, clippingPrimitives, Scalar, NULL),
+    LLGL_REFLECT_FIELD(QueryPipelineStatistics, fragmentShaderInvocations, Scalar, NULL),
+    LLGL_REFLECT_FIELD(QueryPipelineStatistics, tessControlShaderInvocations, Scalar, NULL),
+    LLGL_REFLECT_FIELD(QueryPipelineStatistics, tessEvaluationShaderInvocations, Scalar, NULL),
+    LLGL_REFLECT_FIELD(QueryPipelineStatistics, computeShaderInvocations, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(QueryPipelineStatistics);
+
+static const LLGLFieldInfo g_llglFieldsRendererInfo[] =
+{
+    LLGL_REFLECT_FIELD(RendererInfo, rendererName, String, NULL),
+    LLGL_REFLECT_FIELD(RendererInfo, deviceName, String, NULL),
+    LLGL_REFLECT_FIELD(RendererInfo, vendorName, String, NULL),
+    LLGL_REFLECT_FIELD(RendererInfo, shadingLanguageName, String, NULL),
+    LLGL_REFLECT_FIELD(RendererInfo, numExtensionNames, Scalar, NULL),
+    LLGL_REFLECT_DYNAMIC_ARRAY(RendererInfo, extensionNames, StringArray, 4, NULL),
+    LLGL_REFLECT_FIELD(RendererInfo, numPipelineCacheID, Scalar, NULL),
+    LLGL_REFLECT_DYNAMIC_ARRAY(RendererInfo, pipelineCacheID, Array, 6, NULL),
+};
+LLGL_REFLECT_STRUCT(RendererInfo);
+
+static const LLGLFieldInfo g_llglFieldsRenderingFeatures[] =
+{
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasRenderTargets, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, has3DTextures, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasCubeTextures, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasArrayTextures, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasCubeArrayTextures, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasMultiSampleTextures, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasMultiSampleArrayTextures, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasTextureViews, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasTextureViewSwizzle, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasTextureViewFormatSwizzle, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasBufferViews, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasSamplers, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasConstantBuffers, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasStorageBuffers, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasUniforms, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasGeometryShaders, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasTessellationShaders, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasTessellatorStage, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasComputeShaders, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasInstancing, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasOffsetInstancing, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasIndirectDrawing, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasViewportArrays, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasConservativeRasterization, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasStreamOutputs, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasLogicOp, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasPipelineCaching, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasPipelineStatistics, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingFeatures, hasRenderCondition, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(RenderingFeatures);
+
+static const LLGLFieldInfo g_llglFieldsRenderingLimits[] =
+{
+    LLGL_REFLECT_ARRAY(RenderingLimits, lineWidthRange, 2, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingLimits, maxTextureArrayLayers, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingLimits, maxColorAttachments, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingLimits, maxPatchVertices, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingLimits, max1DTextureSize, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingLimits, max2DTextureSize, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingLimits, max3DTextureSize, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingLimits, maxCubeTextureSize, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingLimits, maxAnisotropy, Scalar, NULL),
+    LLGL_REFLECT_ARRAY(RenderingLimits, maxComputeShaderWorkGroups, 3, Scalar, NULL),
+    LLGL_REFLECT_ARRAY(RenderingLimits, maxComputeShaderWorkGroupSize, 3, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingLimits, maxViewports, Scalar, NULL),
+    LLGL_REFLECT_ARRAY(RenderingLimits, maxViewportSize, 2, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingLimits, maxBufferSize, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingLimits, maxConstantBufferSize, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingLimits, maxStreamOutputs, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingLimits, maxTessFactor, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingLimits, minConstantBufferAlignment, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingLimits, minSampledBufferAlignment, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingLimits, minStorageBufferAlignment, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingLimits, maxColorBufferSamples, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingLimits, maxDepthBufferSamples, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingLimits, maxStencilBufferSamples, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingLimits, maxNoAttachmentSamples, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(RenderingLimits);
+
+static const LLGLFieldInfo g_llglFieldsResourceHeapDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(ResourceHeapDescriptor, pipelineLayout, Object, NULL),
+    LLGL_REFLECT_FIELD(ResourceHeapDescriptor, numResourceViews, Scalar, NULL),
+    LLGL_REFLECT_FIELD(ResourceHeapDescriptor, barrierFlags, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(ResourceHeapDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsShaderMacro[] =
+{
+    LLGL_REFLECT_FIELD(ShaderMacro, name, String, NULL),
+    LLGL_REFLECT_FIELD(ShaderMacro, definition, String, NULL),
+};
+LLGL_REFLECT_STRUCT(ShaderMacro);
+
+static const LLGLFieldInfo g_llglFieldsTextureSubresource[] =
+{
+    LLGL_REFLECT_FIELD(TextureSubresource, baseArrayLayer, Scalar, NULL),
+    LLGL_REFLECT_FIELD(TextureSubresource, numArrayLayers, Scalar, NULL),
+    LLGL_REFLECT_FIELD(TextureSubresource, baseMipLevel, Scalar, NULL),
+    LLGL_REFLECT_FIELD(TextureSubresource, numMipLevels, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(TextureSubresource);
+
+static const LLGLFieldInfo g_llglFieldsSubresourceFootprint[] =
+{
+    LLGL_REFLECT_FIELD(SubresourceFootprint, size, Scalar, NULL),
+    LLGL_REFLECT_FIELD(SubresourceFootprint, rowAlignment, Scalar, NULL),
+    LLGL_REFLECT_FIELD(SubresourceFootprint, rowSize, Scalar, NULL),
+    LLGL_REFLECT_FIELD(SubresourceFootprint, rowStride, Scalar, NULL),
+    LLGL_REFLECT_FIELD(SubresourceFootprint, layerSize, Scalar, NULL),
+    LLGL_REFLECT_FIELD(SubresourceFootprint, layerStride, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(SubresourceFootprint);
+
+static const LLGLFieldInfo g_llglFieldsExtent2D[] =
+{
+    LLGL_REFLECT_FIELD(Extent2D, width, Scalar, NULL),
+    LLGL_REFLECT_FIELD(Extent2D, height, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(Extent2D);
+
+static const LLGLFieldInfo g_llglFieldsExtent3D[] =
+{
+    LLGL_REFLECT_FIELD(Extent3D, width, Scalar, NULL),
+    LLGL_REFLECT_FIELD(Extent3D, height, Scalar, NULL),
+    LLGL_REFLECT_FIELD(Extent3D, depth, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(Extent3D);
+
+static const LLGLFieldInfo g_llglFieldsOffset2D[] =
+{
+    LLGL_REFLECT_FIELD(Offset2D, x, Scalar, NULL),
+    LLGL_REFLECT_FIELD(Offset2D, y, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(Offset2D);
+
+static const LLGLFieldInfo g_llglFieldsOffset3D[] =
+{
+    LLGL_REFLECT_FIELD(Offset3D, x, Scalar, NULL),
+    LLGL_REFLECT_FIELD(Offset3D, y, Scalar, NULL),
+    LLGL_REFLECT_FIELD(Offset3D, z, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(Offset3D);
+
+static const LLGLFieldInfo g_llglFieldsBufferViewDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(BufferViewDescriptor, format, Scalar, NULL),
+    LLGL_REFLECT_FIELD(BufferViewDescriptor, offset, Scalar, NULL),
+    LLGL_REFLECT_FIELD(BufferViewDescriptor, size, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(BufferViewDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsAttachmentClear[] =
+{
+    LLGL_REFLECT_FIELD(AttachmentClear, flags, Scalar, NULL),
+    LLGL_REFLECT_FIELD(AttachmentClear, colorAttachment, Scalar, NULL),
+    LLGL_REFLECT_FIELD(AttachmentClear, clearValue, Struct, &g_llglStructInfoClearValue),
+};
+LLGL_REFLECT_STRUCT(AttachmentClear);
+
+static const LLGLFieldInfo g_llglFieldsDisplayModeDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(DisplayModeDescriptor, resolution, Struct, &g_llglStructInfoExtent2D),
+    LLGL_REFLECT_FIELD(DisplayModeDescriptor, refreshRate, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(DisplayModeDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsFormatAttributes[] =
+{
+    LLGL_REFLECT_FIELD(FormatAttributes, bitSize, Scalar, NULL),
+    LLGL_REFLECT_FIELD(FormatAttributes, blockWidth, Scalar, NULL),
+    LLGL_REFLECT_FIELD(FormatAttributes, blockHeight, Scalar, NULL),
+    LLGL_REFLECT_FIELD(FormatAttributes, components, Scalar, NULL),
+    LLGL_REFLECT_FIELD(FormatAttributes, format, Scalar, NULL),
+    LLGL_REFLECT_FIELD(FormatAttributes, dataType, Scalar, NULL),
+    LLGL_REFLECT_FIELD(FormatAttributes, flags, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(FormatAttributes);
+
+static const LLGLFieldInfo g_llglFieldsFragmentAttribute[] =
+{
+    LLGL_REFLECT_FIELD(FragmentAttribute, name, String, NULL),
+    LLGL_REFLECT_FIELD(FragmentAttribute, format, Scalar, NULL),
+    LLGL_REFLECT_FIELD(FragmentAttribute, location, Scalar, NULL),
+    LLGL_REFLECT_FIELD(FragmentAttribute, systemValue, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(FragmentAttribute);
+
+static const LLGLFieldInfo g_llglFieldsImageView[] =
+{
+    LLGL_REFLECT_FIELD(ImageView, format, Scalar, NULL),
+    LLGL_REFLECT_FIELD(ImageView, dataType, Scalar, NULL),
+    LLGL_REFLECT_BUFFER(ImageView, data, Array, 3),
+    LLGL_REFLECT_FIELD(ImageView, dataSize, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(ImageView);
+
+static const LLGLFieldInfo g_llglFieldsMutableImageView[] =
+{
+    LLGL_REFLECT_FIELD(MutableImageView, format, Scalar, NULL),
+    LLGL_REFLECT_FIELD(MutableImageView, dataType, Scalar, NULL),
+    LLGL_REFLECT_BUFFER(MutableImageView, data, Array, 3),
+    LLGL_REFLECT_FIELD(MutableImageView, dataSize, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(MutableImageView);
+
+static const LLGLFieldInfo g_llglFieldsBindingDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(BindingDescriptor, name, String, NULL),
+    LLGL_REFLECT_FIELD(BindingDescriptor, type, Scalar, NULL),
+    LLGL_REFLECT_FIELD(BindingDescriptor, bindFlags, Scalar, NULL),
+    LLGL_REFLECT_FIELD(BindingDescriptor, stageFlags, Scalar, NULL),
+    LLGL_REFLECT_FIELD(BindingDescriptor, slot, Struct, &g_llglStructInfoBindingSlot),
+    LLGL_REFLECT_FIELD(BindingDescriptor, arraySize, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(BindingDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsUniformDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(UniformDescriptor, name, String, NULL),
+    LLGL_REFLECT_FIELD(UniformDescriptor, type, Scalar, NULL),
+    LLGL_REFLECT_FIELD(UniformDescriptor, arraySize, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(UniformDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsDepthDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(DepthDescriptor, testEnabled, Scalar, NULL),
+    LLGL_REFLECT_FIELD(DepthDescriptor, writeEnabled, Scalar, NULL),
+    LLGL_REFLECT_FIELD(DepthDescriptor, compareOp, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(DepthDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsStencilFaceDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(StencilFaceDescriptor, stencilFailOp, Scalar, NULL),
+    LLGL_REFLECT_FIELD(StencilFaceDescriptor, depthFailOp, Scalar, NULL),
+    LLGL_REFLECT_FIELD(StencilFaceDescriptor, depthPassOp, Scalar, NULL),
+    LLGL_REFLECT_FIELD(StencilFaceDescriptor, compareOp, Scalar, NULL),
+    LLGL_REFLECT_FIELD(StencilFaceDescriptor, readMask, Scalar, NULL),
+    LLGL_REFLECT_FIELD(StencilFaceDescriptor, writeMask, Scalar, NULL),
+    LLGL_REFLECT_FIELD(StencilFaceDescriptor, reference, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(StencilFaceDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsRasterizerDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(RasterizerDescriptor, polygonMode, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RasterizerDescriptor, cullMode, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RasterizerDescriptor, depthBias, Struct, &g_llglStructInfoDepthBiasDescriptor),
+    LLGL_REFLECT_FIELD(RasterizerDescriptor, frontCCW, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RasterizerDescriptor, discardEnabled, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RasterizerDescriptor, depthClampEnabled, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RasterizerDescriptor, scissorTestEnabled, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RasterizerDescriptor, multiSampleEnabled, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RasterizerDescriptor, antiAliasedLineEnabled, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RasterizerDescriptor, conservativeRasterization, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RasterizerDescriptor, lineWidth, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(RasterizerDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsBlendTargetDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(BlendTargetDescriptor, blendEnabled, Scalar, NULL),
+    LLGL_REFLECT_FIELD(BlendTargetDescriptor, srcColor, Scalar, NULL),
+    LLGL_REFLECT_FIELD(BlendTargetDescriptor, dstColor, Scalar, NULL),
+    LLGL_REFLECT_FIELD(BlendTargetDescriptor, colorArithmetic, Scalar, NULL),
+    LLGL_REFLECT_FIELD(BlendTargetDescriptor, srcAlpha, Scalar, NULL),
+    LLGL_REFLECT_FIELD(BlendTargetDescriptor, dstAlpha, Scalar, NULL),
+    LLGL_REFLECT_FIELD(BlendTargetDescriptor, alphaArithmetic, Scalar, NULL),
+    LLGL_REFLECT_FIELD(BlendTargetDescriptor, colorMask, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(BlendTargetDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsTessellationDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(TessellationDescriptor, partition, Scalar, NULL),
+    LLGL_REFLECT_FIELD(TessellationDescriptor, maxTessFactor, Scalar, NULL),
+    LLGL_REFLECT_FIELD(TessellationDescriptor, outputWindingCCW, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(TessellationDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsQueryHeapDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(QueryHeapDescriptor, type, Scalar, NULL),
+    LLGL_REFLECT_FIELD(QueryHeapDescriptor, numQueries, Scalar, NULL),
+    LLGL_REFLECT_FIELD(QueryHeapDescriptor, renderCondition, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(QueryHeapDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsAttachmentFormatDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(AttachmentFormatDescriptor, format, Scalar, NULL),
+    LLGL_REFLECT_FIELD(AttachmentFormatDescriptor, loadOp, Scalar, NULL),
+    LLGL_REFLECT_FIELD(AttachmentFormatDescriptor, storeOp, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(AttachmentFormatDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsRenderSystemDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(RenderSystemDescriptor, moduleName, String, NULL),
+    LLGL_REFLECT_FIELD(RenderSystemDescriptor, flags, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderSystemDescriptor, profiler, Pointer, NULL),
+    LLGL_REFLECT_FIELD(RenderSystemDescriptor, debugger, Object, NULL),
+    LLGL_REFLECT_BUFFER(RenderSystemDescriptor, rendererConfig, Array, 5),
+    LLGL_REFLECT_FIELD(RenderSystemDescriptor, rendererConfigSize, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(RenderSystemDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsRenderingCapabilities[] =
+{
+    LLGL_REFLECT_FIELD(RenderingCapabilities, screenOrigin, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingCapabilities, clippingRange, Scalar, NULL),
+    LLGL_REFLECT_FIELD(RenderingCapabilities, numShadingLanguages, Scalar, NULL),
+    LLGL_REFLECT_DYNAMIC_ARRAY(RenderingCapabilities, shadingLanguages, Array, 2, NULL),
+    LLGL_REFLECT_FIELD(RenderingCapabilities, numTextureFormats, Scalar, NULL),
+    LLGL_REFLECT_DYNAMIC_ARRAY(RenderingCapabilities, textureFormats, Array, 4, NULL),
+    LLGL_REFLECT_FIELD(RenderingCapabilities, features, Struct, &g_llglStructInfoRenderingFeatures),
+    LLGL_REFLECT_FIELD(RenderingCapabilities, limits, Struct, &g_llglStructInfoRenderingLimits),
+};
+LLGL_REFLECT_STRUCT(RenderingCapabilities);
+
+static const LLGLFieldInfo g_llglFieldsAttachmentDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(AttachmentDescriptor, format, Scalar, NULL),
+    LLGL_REFLECT_FIELD(AttachmentDescriptor, texture, Object, NULL),
+    LLGL_REFLECT_FIELD(AttachmentDescriptor, mipLevel, Scalar, NULL),
+    LLGL_REFLECT_FIELD(AttachmentDescriptor, arrayLayer, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(AttachmentDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsSamplerDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(SamplerDescriptor, addressModeU, Scalar, NULL),
+    LLGL_REFLECT_FIELD(SamplerDescriptor, addressModeV, Scalar, NULL),
+    LLGL_REFLECT_FIELD(SamplerDescriptor, addressModeW, Scalar, NULL),
+    LLGL_REFLECT_FIELD(SamplerDescriptor, minFilter, Scalar, NULL),
+    LLGL_REFLECT_FIELD(SamplerDescriptor, magFilter, Scalar, NULL),
+    LLGL_REFLECT_FIELD(SamplerDescriptor, mipMapFilter, Scalar, NULL),
+    LLGL_REFLECT_FIELD(SamplerDescriptor, mipMapEnabled, Scalar, NULL),
+    LLGL_REFLECT_FIELD(SamplerDescriptor, mipMapLODBias, Scalar, NULL),
+    LLGL_REFLECT_FIELD(SamplerDescriptor, minLOD, Scalar, NULL),
+    LLGL_REFLECT_FIELD(SamplerDescriptor, maxLOD, Scalar, NULL),
+    LLGL_REFLECT_FIELD(SamplerDescriptor, maxAnisotropy, Scalar, NULL),
+    LLGL_REFLECT_FIELD(SamplerDescriptor, compareEnabled, Scalar, NULL),
+    LLGL_REFLECT_FIELD(SamplerDescriptor, compareOp, Scalar, NULL),
+    LLGL_REFLECT_ARRAY(SamplerDescriptor, borderColor, 4, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(SamplerDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsComputeShaderAttributes[] =
+{
+    LLGL_REFLECT_FIELD(ComputeShaderAttributes, workGroupSize, Struct, &g_llglStructInfoExtent3D),
+};
+LLGL_REFLECT_STRUCT(ComputeShaderAttributes);
+
+static const LLGLFieldInfo g_llglFieldsSwapChainDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(SwapChainDescriptor, resolution, Struct, &g_llglStructInfoExtent2D),
+    LLGL_REFLECT_FIELD(SwapChainDescriptor, colorBits, Scalar, NULL),
+    LLGL_REFLECT_FIELD(SwapChainDescriptor, depthBits, Scalar, NULL),
+    LLGL_REFLECT_FIELD(SwapChainDescriptor, stencilBits, Scalar, NULL),
+    LLGL_REFLECT_FIELD(SwapChainDescriptor, samples, Scalar, NULL),
+    LLGL_REFLECT_FIELD(SwapChainDescriptor, swapBuffers, Scalar, NULL),
+    LLGL_REFLECT_FIELD(SwapChainDescriptor, fullscreen, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(SwapChainDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsTextureSwizzleRGBA[] =
+{
+    LLGL_REFLECT_BITFIELD(TextureSwizzleRGBA, r, 0, 4),
+};
+LLGL_REFLECT_STRUCT(TextureSwizzleRGBA);
+
+static const LLGLFieldInfo g_llglFieldsTextureLocation[] =
+{
+    LLGL_REFLECT_FIELD(TextureLocation, offset, Struct, &g_llglStructInfoOffset3D),
+    LLGL_REFLECT_FIELD(TextureLocation, arrayLayer, Scalar, NULL),
+    LLGL_REFLECT_FIELD(TextureLocation, mipLevel, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(TextureLocation);
+
+static const LLGLFieldInfo g_llglFieldsTextureRegion[] =
+{
+    LLGL_REFLECT_FIELD(TextureRegion, subresource, Struct, &g_llglStructInfoTextureSubresource),
+    LLGL_REFLECT_FIELD(TextureRegion, offset, Struct, &g_llglStructInfoOffset3D),
+    LLGL_REFLECT_FIELD(TextureRegion, extent, Struct, &g_llglStructInfoExtent3D),
+};
+LLGL_REFLECT_STRUCT(TextureRegion);
+
+static const LLGLFieldInfo g_llglFieldsTextureDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(TextureDescriptor, type, Scalar, NULL),
+    LLGL_REFLECT_FIELD(TextureDescriptor, bindFlags, Scalar, NULL),
+    LLGL_REFLECT_FIELD(TextureDescriptor, miscFlags, Scalar, NULL),
+    LLGL_REFLECT_FIELD(TextureDescriptor, format, Scalar, NULL),
+    LLGL_REFLECT_FIELD(TextureDescriptor, extent, Struct, &g_llglStructInfoExtent3D),
+    LLGL_REFLECT_FIELD(TextureDescriptor, arrayLayers, Scalar, NULL),
+    LLGL_REFLECT_FIELD(TextureDescriptor, mipLevels, Scalar, NULL),
+    LLGL_REFLECT_FIELD(TextureDescriptor, samples, Scalar, NULL),
+    LLGL_REFLECT_FIELD(TextureDescriptor, clearValue, Struct, &g_llglStructInfoClearValue),
+};
+LLGL_REFLECT_STRUCT(TextureDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsVertexAttribute[] =
+{
+    LLGL_REFLECT_FIELD(VertexAttribute, name, String, NULL),
+    LLGL_REFLECT_FIELD(VertexAttribute, format, Scalar, NULL),
+    LLGL_REFLECT_FIELD(VertexAttribute, location, Scalar, NULL),
+    LLGL_REFLECT_FIELD(VertexAttribute, semanticIndex, Scalar, NULL),
+    LLGL_REFLECT_FIELD(VertexAttribute, systemValue, Scalar, NULL),
+    LLGL_REFLECT_FIELD(VertexAttribute, slot, Scalar, NULL),
+    LLGL_REFLECT_FIELD(VertexAttribute, offset, Scalar, NULL),
+    LLGL_REFLECT_FIELD(VertexAttribute, stride, Scalar, NULL),
+    LLGL_REFLECT_FIELD(VertexAttribute, instanceDivisor, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(VertexAttribute);
+
+static const LLGLFieldInfo g_llglFieldsWindowDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(WindowDescriptor, title, String, NULL),
+    LLGL_REFLECT_FIELD(WindowDescriptor, position, Struct, &g_llglStructInfoOffset2D),
+    LLGL_REFLECT_FIELD(WindowDescriptor, size, Struct, &g_llglStructInfoExtent2D),
+    LLGL_REFLECT_FIELD(WindowDescriptor, flags, Scalar, NULL),
+    LLGL_REFLECT_BUFFER(WindowDescriptor, windowContext, Array, 5),
+    LLGL_REFLECT_FIELD(WindowDescriptor, windowContextSize, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(WindowDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsBufferDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(BufferDescriptor, size, Scalar, NULL),
+    LLGL_REFLECT_FIELD(BufferDescriptor, stride, Scalar, NULL),
+    LLGL_REFLECT_FIELD(BufferDescriptor, format, Scalar, NULL),
+    LLGL_REFLECT_FIELD(BufferDescriptor, bindFlags, Scalar, NULL),
+    LLGL_REFLECT_FIELD(BufferDescriptor, cpuAccessFlags, Scalar, NULL),
+    LLGL_REFLECT_FIELD(BufferDescriptor, miscFlags, Scalar, NULL),
+    LLGL_REFLECT_FIELD(BufferDescriptor, numVertexAttribs, Scalar, NULL),
+    LLGL_REFLECT_DYNAMIC_ARRAY(BufferDescriptor, vertexAttribs, Array, 6, &g_llglStructInfoVertexAttribute),
+};
+LLGL_REFLECT_STRUCT(BufferDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsStaticSamplerDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(StaticSamplerDescriptor, name, String, NULL),
+    LLGL_REFLECT_FIELD(StaticSamplerDescriptor, stageFlags, Scalar, NULL),
+    LLGL_REFLECT_FIELD(StaticSamplerDescriptor, slot, Struct, &g_llglStructInfoBindingSlot),
+    LLGL_REFLECT_FIELD(StaticSamplerDescriptor, sampler, Struct, &g_llglStructInfoSamplerDescriptor),
+};
+LLGL_REFLECT_STRUCT(StaticSamplerDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsStencilDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(StencilDescriptor, testEnabled, Scalar, NULL),
+    LLGL_REFLECT_FIELD(StencilDescriptor, referenceDynamic, Scalar, NULL),
+    LLGL_REFLECT_FIELD(StencilDescriptor, front, Struct, &g_llglStructInfoStencilFaceDescriptor),
+    LLGL_REFLECT_FIELD(StencilDescriptor, back, Struct, &g_llglStructInfoStencilFaceDescriptor),
+};
+LLGL_REFLECT_STRUCT(StencilDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsBlendDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(BlendDescriptor, alphaToCoverageEnabled, Scalar, NULL),
+    LLGL_REFLECT_FIELD(BlendDescriptor, independentBlendEnabled, Scalar, NULL),
+    LLGL_REFLECT_FIELD(BlendDescriptor, sampleMask, Scalar, NULL),
+    LLGL_REFLECT_FIELD(BlendDescriptor, logicOp, Scalar, NULL),
+    LLGL_REFLECT_ARRAY(BlendDescriptor, blendFactor, 4, Scalar, NULL),
+    LLGL_REFLECT_FIELD(BlendDescriptor, blendFactorDynamic, Scalar, NULL),
+    LLGL_REFLECT_ARRAY(BlendDescriptor, targets, 8, Struct, &g_llglStructInfoBlendTargetDescriptor),
+};
+LLGL_REFLECT_STRUCT(BlendDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsRenderPassDescriptor[] =
+{
+    LLGL_REFLECT_ARRAY(RenderPassDescriptor, colorAttachments, 8, Struct, &g_llglStructInfoAttachmentFormatDescriptor),
+    LLGL_REFLECT_FIELD(RenderPassDescriptor, depthAttachment, Struct, &g_llglStructInfoAttachmentFormatDescriptor),
+    LLGL_REFLECT_FIELD(RenderPassDescriptor, stencilAttachment, Struct, &g_llglStructInfoAttachmentFormatDescriptor),
+    LLGL_REFLECT_FIELD(RenderPassDescriptor, samples, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(RenderPassDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsRenderTargetDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(RenderTargetDescriptor, renderPass, Object, NULL),
+    LLGL_REFLECT_FIELD(RenderTargetDescriptor, resolution, Struct, &g_llglStructInfoExtent2D),
+    LLGL_REFLECT_FIELD(RenderTargetDescriptor, samples, Scalar, NULL),
+    LLGL_REFLECT_ARRAY(RenderTargetDescriptor, colorAttachments, 8, Struct, &g_llglStructInfoAttachmentDescriptor),
+    LLGL_REFLECT_ARRAY(RenderTargetDescriptor, resolveAttachments, 8, Struct, &g_llglStructInfoAttachmentDescriptor),
+    LLGL_REFLECT_FIELD(RenderTargetDescriptor, depthStencilAttachment, Struct, &g_llglStructInfoAttachmentDescriptor),
+};
+LLGL_REFLECT_STRUCT(RenderTargetDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsVertexShaderAttributes[] =
+{
+    LLGL_REFLECT_FIELD(VertexShaderAttributes, numInputAttribs, Scalar, NULL),
+    LLGL_REFLECT_DYNAMIC_ARRAY(VertexShaderAttributes, inputAttribs, Array, 0, &g_llglStructInfoVertexAttribute),
+    LLGL_REFLECT_FIELD(VertexShaderAttributes, numOutputAttribs, Scalar, NULL),
+    LLGL_REFLECT_DYNAMIC_ARRAY(VertexShaderAttributes, outputAttribs, Array, 2, &g_llglStructInfoVertexAttribute),
+};
+LLGL_REFLECT_STRUCT(VertexShaderAttributes);
+
+static const LLGLFieldInfo g_llglFieldsFragmentShaderAttributes[] =
+{
+    LLGL_REFLECT_FIELD(FragmentShaderAttributes, numOutputAttribs, Scalar, NULL),
+    LLGL_REFLECT_DYNAMIC_ARRAY(FragmentShaderAttributes, outputAttribs, Array, 0, &g_llglStructInfoFragmentAttribute),
+};
+LLGL_REFLECT_STRUCT(FragmentShaderAttributes);
+
+static const LLGLFieldInfo g_llglFieldsShaderResourceReflection[] =
+{
+    LLGL_REFLECT_FIELD(ShaderResourceReflection, binding, Struct, &g_llglStructInfoBindingDescriptor),
+    LLGL_REFLECT_FIELD(ShaderResourceReflection, constantBufferSize, Scalar, NULL),
+    LLGL_REFLECT_FIELD(ShaderResourceReflection, storageBufferType, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(ShaderResourceReflection);
+
+static const LLGLFieldInfo g_llglFieldsTextureViewDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(TextureViewDescriptor, type, Scalar, NULL),
+    LLGL_REFLECT_FIELD(TextureViewDescriptor, format, Scalar, NULL),
+    LLGL_REFLECT_FIELD(TextureViewDescriptor, subresource, Struct, &g_llglStructInfoTextureSubresource),
+    LLGL_REFLECT_FIELD(TextureViewDescriptor, swizzle, Struct, &g_llglStructInfoTextureSwizzleRGBA),
+};
+LLGL_REFLECT_STRUCT(TextureViewDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsPipelineLayoutDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(PipelineLayoutDescriptor, numHeapBindings, Scalar, NULL),
+    LLGL_REFLECT_DYNAMIC_ARRAY(PipelineLayoutDescriptor, heapBindings, Array, 0, &g_llglStructInfoBindingDescriptor),
+    LLGL_REFLECT_FIELD(PipelineLayoutDescriptor, numBindings, Scalar, NULL),
+    LLGL_REFLECT_DYNAMIC_ARRAY(PipelineLayoutDescriptor, bindings, Array, 2, &g_llglStructInfoBindingDescriptor),
+    LLGL_REFLECT_FIELD(PipelineLayoutDescriptor, numStaticSamplers, Scalar, NULL),
+    LLGL_REFLECT_DYNAMIC_ARRAY(PipelineLayoutDescriptor, staticSamplers, Array, 4, &g_llglStructInfoStaticSamplerDescriptor),
+    LLGL_REFLECT_FIELD(PipelineLayoutDescriptor, numUniforms, Scalar, NULL),
+    LLGL_REFLECT_DYNAMIC_ARRAY(PipelineLayoutDescriptor, uniforms, Array, 6, &g_llglStructInfoUniformDescriptor),
+};
+LLGL_REFLECT_STRUCT(PipelineLayoutDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsGraphicsPipelineDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(GraphicsPipelineDescriptor, pipelineLayout, Object, NULL),
+    LLGL_REFLECT_FIELD(GraphicsPipelineDescriptor, renderPass, Object, NULL),
+    LLGL_REFLECT_FIELD(GraphicsPipelineDescriptor, vertexShader, Object, NULL),
+    LLGL_REFLECT_FIELD(GraphicsPipelineDescriptor, tessControlShader, Object, NULL),
+    LLGL_REFLECT_FIELD(GraphicsPipelineDescriptor, tessEvaluationShader, Object, NULL),
+    LLGL_REFLECT_FIELD(GraphicsPipelineDescriptor, geometryShader, Object, NULL),
+    LLGL_REFLECT_FIELD(GraphicsPipelineDescriptor, fragmentShader, Object, NULL),
+    LLGL_REFLECT_FIELD(GraphicsPipelineDescriptor, indexFormat, Scalar, NULL),
+    LLGL_REFLECT_FIELD(GraphicsPipelineDescriptor, primitiveTopology, Scalar, NULL),
+    LLGL_REFLECT_FIELD(GraphicsPipelineDescriptor, numViewports, Scalar, NULL),
+    LLGL_REFLECT_DYNAMIC_ARRAY(GraphicsPipelineDescriptor, viewports, Array, 9, &g_llglStructInfoViewport),
+    LLGL_REFLECT_FIELD(GraphicsPipelineDescriptor, numScissors, Scalar, NULL),
+    LLGL_REFLECT_DYNAMIC_ARRAY(GraphicsPipelineDescriptor, scissors, Array, 11, &g_llglStructInfoScissor),
+    LLGL_REFLECT_FIELD(GraphicsPipelineDescriptor, depth, Struct, &g_llglStructInfoDepthDescriptor),
+    LLGL_REFLECT_FIELD(GraphicsPipelineDescriptor, stencil, Struct, &g_llglStructInfoStencilDescriptor),
+    LLGL_REFLECT_FIELD(GraphicsPipelineDescriptor, rasterizer, Struct, &g_llglStructInfoRasterizerDescriptor),
+    LLGL_REFLECT_FIELD(GraphicsPipelineDescriptor, blend, Struct, &g_llglStructInfoBlendDescriptor),
+    LLGL_REFLECT_FIELD(GraphicsPipelineDescriptor, tessellation, Struct, &g_llglStructInfoTessellationDescriptor),
+};
+LLGL_REFLECT_STRUCT(GraphicsPipelineDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsResourceViewDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(ResourceViewDescriptor, resource, Object, NULL),
+    LLGL_REFLECT_FIELD(ResourceViewDescriptor, textureView, Struct, &g_llglStructInfoTextureViewDescriptor),
+    LLGL_REFLECT_FIELD(ResourceViewDescriptor, bufferView, Struct, &g_llglStructInfoBufferViewDescriptor),
+    LLGL_REFLECT_FIELD(ResourceViewDescriptor, initialCount, Scalar, NULL),
+};
+LLGL_REFLECT_STRUCT(ResourceViewDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsShaderDescriptor[] =
+{
+    LLGL_REFLECT_FIELD(ShaderDescriptor, type, Scalar, NULL),
+    LLGL_REFLECT_BUFFER(ShaderDescriptor, source, Text, 2),
+    LLGL_REFLECT_FIELD(ShaderDescriptor, sourceSize, Scalar, NULL),
+    LLGL_REFLECT_FIELD(ShaderDescriptor, sourceType, Scalar, NULL),
+    LLGL_REFLECT_FIELD(ShaderDescriptor, entryPoint, String, NULL),
+    LLGL_REFLECT_FIELD(ShaderDescriptor, profile, String, NULL),
+    LLGL_REFLECT_FIELD(ShaderDescriptor, defines, Pointer, NULL),
+    LLGL_REFLECT_FIELD(ShaderDescriptor, flags, Scalar, NULL),
+    LLGL_REFLECT_FIELD(ShaderDescriptor, name, String, NULL),
+    LLGL_REFLECT_FIELD(ShaderDescriptor, vertex, Struct, &g_llglStructInfoVertexShaderAttributes),
+    LLGL_REFLECT_FIELD(ShaderDescriptor, fragment, Struct, &g_llglStructInfoFragmentShaderAttributes),
+    LLGL_REFLECT_FIELD(ShaderDescriptor, compute, Struct, &g_llglStructInfoComputeShaderAttributes),
+};
+LLGL_REFLECT_STRUCT(ShaderDescriptor);
+
+static const LLGLFieldInfo g_llglFieldsShaderReflection[] =
+{
+    LLGL_REFLECT_FIELD(ShaderReflection, numResources, Scalar, NULL),
+    LLGL_REFLECT_DYNAMIC_ARRAY(ShaderReflection, resources, Array, 0, &g_llglStructInfoShaderResourceReflection),
+    LLGL_REFLECT_FIELD(ShaderReflection, numUniforms, Scalar, NULL),
+    LLGL_REFLECT_DYNAMIC_ARRAY(ShaderReflection, uniforms, Array, 2, &g_llglStructInfoUniformDescriptor),
+    LLGL_REFLECT_FIELD(ShaderReflection, vertex, Struct, &g_llglStructInfoVertexShaderAttributes),
+    LLGL_REFLECT_FIELD(ShaderReflection, fragment, Struct, &g_llglStructInfoFragmentShaderAttributes),
+    LLGL_REFLECT_FIELD(ShaderReflection, compute, Struct, &g_llglStructInfoComputeShaderAttributes),
+};
+LLGL_REFLECT_STRUCT(ShaderReflection);
+
+static const LLGLStructInfo* const g_llglStructInfos[LLGL_NUM_STRUCT_TYPES] =
+{
+    &g_llglStructInfoCanvasDescriptor,
+    &g_llglStructInfoClearValue,
+    &g_llglStructInfoCommandBufferDescriptor,
+    &g_llglStructInfoDrawIndirectArguments,
+    &g_llglStructInfoDrawIndexedIndirectArguments,
+    &g_llglStructInfoDrawPatchIndirectArguments,
+    &g_llglStructInfoDispatchIndirectArguments,
+    &g_llglStructInfoBindingSlot,
+    &g_llglStructInfoViewport,
+    &g_llglStructInfoScissor,
+    &g_llglStructInfoDepthBiasDescriptor,
+    &g_llglStructInfoComputePipelineDescriptor,
+    &g_llglStructInfoQueryPipelineStatistics,
+    &g_llglStructInfoRendererInfo,
+    &g_llglStructInfoRenderingFeatures,
+    &g_llglStructInfoRenderingLimits,
+    &g_llglStructInfoResourceHeapDescriptor,
+    &g_llglStructInfoShaderMacro,
+    &g_llglStructInfoTextureSubresource,
+    &g_llglStructInfoSubresourceFootprint,
+    &g_llglStructInfoExtent2D,
+    &g_llglStructInfoExtent3D,
+    &g_llglStructInfoOffset2D,
+    &g_llglStructInfoOffset3D,
+    &g_llglStructInfoBufferViewDescriptor,
+    &g_llglStructInfoAttachmentClear,
+    &g_llglStructInfoDisplayModeDescriptor,
+    &g_llglStructInfoFormatAttributes,
+    &g_llglStructInfoFragmentAttribute,
+    &g_llglStructInfoImageView,
+    &g_llglStructInfoMutableImageView,
+    &g_llglStructInfoBindingDescriptor,
+    &g_llglStructInfoUniformDescriptor,
+    &g_llglStructInfoDepthDescriptor,
+    &g_llglStructInfoStencilFaceDescriptor,
+    &g_llglStructInfoRasterizerDescriptor,
+    &g_llglStructInfoBlendTargetDescriptor,
+    &g_llglStructInfoTessellationDescriptor,
+    &g_llglStructInfoQueryHeapDescriptor,
+    &g_llglStructInfoAttachmentFormatDescriptor,
+    &g_llglStructInfoRenderSystemDescriptor,
+    &g_llglStructInfoRenderingCapabilities,
+    &g_llglStructInfoAttachmentDescriptor,
+    &g_llglStructInfoSamplerDescriptor,
+    &g_llglStructInfoComputeShaderAttributes,
+    &g_llglStructInfoSwapChainDescriptor,
+    &g_llglStructInfoTextureSwizzleRGBA,
+    &g_llglStructInfoTextureLocation,
+    &g_llglStructInfoTextureRegion,
+    &g_llglStructInfoTextureDescriptor,
+    &g_llglStructInfoVertexAttribute,
+    &g_llglStructInfoWindowDescriptor,
+    &g_llglStructInfoBufferDescriptor,
+    &g_llglStructInfoStaticSamplerDescriptor,
+    &g_llglStructInfoStencilDescriptor,
+    &g_llglStructInfoBlendDescriptor,
+    &g_llglStructInfoRenderPassDescriptor,
+    &g_llglStructInfoRenderTargetDescriptor,
+    &g_llglStructInfoVertexShaderAttributes,
+    &g_llglStructInfoFragmentShaderAttributes,
+    &g_llglStructInfoShaderResourceReflection,
+    &g_llglStructInfoTextureViewDescriptor,
+    &g_llglStructInfoPipelineLayoutDescriptor,
+    &g_llglStructInfoGraphicsPipelineDescriptor,
+    &g_llglStructInfoResourceViewDescriptor,
+    &g_llglStructInfoShaderDescriptor,
+    &g_llglStructInfoShaderReflection,
+};
+
+typedef struct LLGLReflectionWriter
+{
+    void    (*write)(struct LLGLReflectionWriter* self, const void* data, size_t size);
+    uint64_t hash;
+    char*   buffer;
+    size_t  bufferSize;
+    size_t  size;
+}
+LLGLReflectionWriter;
+
+/* 64-bit FNV-1a */
+static void llglReflectionWriteHash(LLGLReflectionWriter* self, const void* data, size_t size)
+{
+    const unsigned char* bytes = (const unsigned char*)data;
+    for (size_t i = 0; i < size; ++i)
+    {
+        self->hash ^= bytes[i];
+        self->hash *= 0x00000100000001B3ull;
+    }
+}
+
+static void llglReflectionWriteBuffer(LLGLReflectionWriter* self, const void* data, size_t size)
+{
+    if (self->size < self->bufferSize)
+    {
+        const size_t remaining = self->bufferSize - self->size;
+        memcpy(self->buffer + self->size, data, size < remaining ? size : remaining);
+    }
+    self->size += size;
+}
+
+static void llglReflectString(LLGLReflectionWriter* writer, const char* str, size_t len)
+{
+    const uint32_t len32 = (str != NULL ? (uint32_t)len : 0xFFFFFFFFu);
+    writer->write(writer, &len32, sizeof(len32));
+    if (str != NULL)
+        writer->write(writer, str, len);
+}
+
+static void llglReflectStruct(LLGLReflectionWriter* writer, const LLGLStructInfo* info, const char* data)
+{
+    for (size_t i = 0; i < info->numFields; ++i)
+    {
+        const LLGLFieldInfo* field = &info->fields[i];
+        const char* fieldData = data + field->offset;
+        switch (field->kind)
+        {
+            case LLGLFieldKindScalar:
+            case LLGLFieldKindObject:
+            case LLGLFieldKindPointer:
+            {
+                writer->write(writer, fieldData, field->size * field->count);
+            }
+            break;
+
+            case LLGLFieldKindString:
+            {
+                const char* str = *(const char* const*)fieldData;
+                llglReflectString(writer, str, (str != NULL ? strlen(str) : 0));
+            }
+            break;
+
+            case LLGLFieldKindStruct:
+            {
+                for (size_t j = 0; j < field->count; ++j)
+                    llglReflectStruct(writer, field->type, fieldData + j * field->size);
+            }
+            break;
+
+            case LLGLFieldKindText:
+            {
+                const char* str = *(const char* const*)fieldData;
+                const size_t len = *(const size_t*)(data + info->fields[field->countField].offset);
+                llglReflectString(writer, str, (str != NULL && len == 0 ? strlen(str) : len));
+            }
+            break;
+
+            case LLGLFieldKindArray:
+            case LLGLFieldKindStringArray:
+            {
+                const char* elements = *(const char* const*)fieldData;
+                const uint64_t count = (elements != NULL ? (uint64_t)*(const size_t*)(data + info->fields[field->countField].offset) : 0);
+                writer->write(writer, &count, sizeof(count));
+                if (field->kind == LLGLFieldKindStringArray)
+                {
+                    for (uint64_t j = 0; j < count; ++j)
+                    {
+                        const char* str = ((const char* const*)elements)[j];
+                        llglReflectString(writer, str, (str != NULL ? strlen(str) : 0));
+                    }
+                }
+                else if (field->type != NULL)
+                {
+                    for (uint64_t j = 0; j < count; ++j)
+                        llglReflectStruct(writer, field->type, elements + j * field->size);
+                }
+                else if (count > 0)
+                    writer->write(writer, elements, (size_t)count * field->size);
+            }
+            break;
+        }
+    }
+}
+
+LLGL_C_EXPORT const LLGLStructInfo* llglGetStructInfo(LLGLStructType type)
+{
+    return ((size_t)type < LLGL_NUM_STRUCT_TYPES ? g_llglStructInfos[type] : NULL);
+}
+
+LLGL_C_EXPORT uint64_t llglHashStruct(const LLGLStructInfo* info, const void* data, uint64_t seed)
+{
+    LLGLReflectionWriter writer = { llglReflectionWriteHash, 0xCBF29CE484222325ull ^ seed, NULL, 0, 0 };
+    llglReflectStruct(&writer, info, (const char*)data);
+    return writer.hash;
+}
+
+LLGL_C_EXPORT size_t llglSerializeStruct(const LLGLStructInfo* info, const void* data, void* buffer, size_t bufferSize)
+{
+    LLGLReflectionWriter writer = { llglReflectionWriteBuffer, 0, (char*)buffer, bufferSize, 0 };
+    llglReflectStruct(&writer, info, (const char*)data);
+    return writer.size;
+}
+
+#endif /* LLGL_REFLECTION_IMPLEMENTATION */
+
+
+#endif /* LLGL_C99_LLGLREFLECTION_H */
+
+
+
+/* ================================================================================ */
+
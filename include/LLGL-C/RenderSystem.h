@@ -10,7 +10,21 @@
 
 
 #include <LLGL-C/Export.h>
-#include <LLGL-C/LLGLWrapper.h>
+#include <LLGL-C/Types.h>
+#include <LLGL-C/Wrapper/BufferFlags.h>
+#include <LLGL-C/Wrapper/CommandBufferFlags.h>
+#include <LLGL-C/Wrapper/ImageFlags.h>
+#include <LLGL-C/Wrapper/PipelineLayoutFlags.h>
+#include <LLGL-C/Wrapper/PipelineStateFlags.h>
+#include <LLGL-C/Wrapper/QueryHeapFlags.h>
+#include <LLGL-C/Wrapper/RenderPassFlags.h>
+#include <LLGL-C/Wrapper/RenderSystemFlags.h>
+#include <LLGL-C/Wrapper/RenderTargetFlags.h>
+#include <LLGL-C/Wrapper/ResourceHeapFlags.h>
+#include <LLGL-C/Wrapper/SamplerFlags.h>
+#include <LLGL-C/Wrapper/ShaderFlags.h>
+#include <LLGL-C/Wrapper/SwapChainFlags.h>
+#include <LLGL-C/Wrapper/TextureFlags.h>
 
 
 LLGL_C_EXPORT int llglLoadRenderSystem(const char* moduleName);
@@ -10,7 +10,7 @@
 
 
 #include <LLGL-C/Export.h>
-#include <LLGL-C/LLGLWrapper.h>
+#include <LLGL-C/Types.h>
 
 
 LLGL_C_EXPORT void llglSetName(LLGLRenderSystemChild renderSystemChild, const char* name);
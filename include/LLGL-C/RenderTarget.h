@@ -10,8 +10,10 @@
 
 
 #include <LLGL-C/Export.h>
-#include <LLGL-C/LLGLWrapper.h>
+#include <LLGL-C/Types.h>
+#include <LLGL-C/Wrapper/Types.h>
 #include <stdint.h>
+#include <stdbool.h>
 
 
 LLGL_C_EXPORT void llglGetRenderTargetResolution(LLGLRenderTarget renderTarget, LLGLExtent2D* outResolution);
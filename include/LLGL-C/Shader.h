@@ -10,7 +10,9 @@
 
 
 #include <LLGL-C/Export.h>
-#include <LLGL-C/LLGLWrapper.h>
+#include <LLGL-C/Types.h>
+#include <LLGL-C/Wrapper/ShaderFlags.h>
+#include <LLGL-C/Wrapper/ShaderReflection.h>
 
 
 LLGL_C_EXPORT LLGLReport llglGetShaderReport(LLGLShader shader);
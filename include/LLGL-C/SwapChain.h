@@ -10,8 +10,11 @@
 
 
 #include <LLGL-C/Export.h>
-#include <LLGL-C/LLGLWrapper.h>
+#include <LLGL-C/Types.h>
+#include <LLGL-C/Wrapper/Format.h>
+#include <LLGL-C/Wrapper/Types.h>
 #include <stdint.h>
+#include <stdbool.h>
 
 
 LLGL_C_EXPORT void llglPresent(LLGLSwapChain swapChain);
@@ -10,7 +10,10 @@
 
 
 #include <LLGL-C/Export.h>
-#include <LLGL-C/LLGLWrapper.h>
+#include <LLGL-C/Types.h>
+#include <LLGL-C/Wrapper/Format.h>
+#include <LLGL-C/Wrapper/TextureFlags.h>
+#include <LLGL-C/Wrapper/Types.h>
 
 
 LLGL_C_EXPORT LLGLTextureType llglGetTextureType(LLGLTexture texture);
@@ -10,7 +10,10 @@
 
 
 #include <LLGL-C/Export.h>
-#include <LLGL-C/LLGLWrapper.h>
+#include <LLGL-C/Types.h>
+#include <LLGL-C/Wrapper/Key.h>
+#include <LLGL-C/Wrapper/Types.h>
+#include <LLGL-C/Wrapper/WindowFlags.h>
 #include <stdbool.h>
 
 
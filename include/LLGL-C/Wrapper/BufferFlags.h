@@ -0,0 +1,63 @@
+/*
+ * BufferFlags.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_BUFFER_FLAGS_H
+#define LLGL_C99_WRAPPER_BUFFER_FLAGS_H
+
+
+#include <stddef.h>
+#include <stdint.h>
+#include <LLGL-C/Wrapper/Format.h>
+#include <LLGL-C/Wrapper/VertexAttribute.h>
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLBufferDescriptor
+{
+    uint64_t                   size;             /* = 0 */
+    uint32_t                   stride;           /* = 0 */
+    LLGLFormat                 format;           /* = LLGLFormatUndefined */
+    long                       bindFlags;        /* = 0 */
+    long                       cpuAccessFlags;   /* = 0 */
+    long                       miscFlags;        /* = 0 */
+    size_t                     numVertexAttribs; /* = 0 */
+    const LLGLVertexAttribute* vertexAttribs;    /* = NULL */
+}
+LLGLBufferDescriptor;
+
+#define LLGL_BUFFERDESCRIPTOR_INIT { .size = 0, .stride = 0, .format = LLGLFormatUndefined, .bindFlags = 0, .cpuAccessFlags = 0, .miscFlags = 0 }
+
+typedef struct LLGLBufferViewDescriptor
+{
+    LLGLFormat format; /* = LLGLFormatUndefined */
+    uint64_t   offset; /* = 0 */
+    uint64_t   size;   /* = LLGL_WHOLE_SIZE */
+}
+LLGLBufferViewDescriptor;
+
+#define LLGL_BUFFERVIEWDESCRIPTOR_INIT { .format = LLGLFormatUndefined, .offset = 0, .size = (-1) }
+
+
+/* ----- Default values ----- */
+
+#ifndef __cplusplus
+
+static const LLGLBufferDescriptor     g_llglBufferDescriptorDefault     = LLGL_BUFFERDESCRIPTOR_INIT;
+static const LLGLBufferViewDescriptor g_llglBufferViewDescriptorDefault = LLGL_BUFFERVIEWDESCRIPTOR_INIT;
+
+#endif /* __cplusplus */
+
+
+#endif /* LLGL_C99_WRAPPER_BUFFER_FLAGS_H */
+
+
+
+/* ================================================================================ */
+
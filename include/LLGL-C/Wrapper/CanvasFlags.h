@@ -0,0 +1,49 @@
+/*
+ * CanvasFlags.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_CANVAS_FLAGS_H
+#define LLGL_C99_WRAPPER_CANVAS_FLAGS_H
+
+
+/* ----- Flags ----- */
+
+typedef enum LLGLCanvasFlags
+{
+    LLGLCanvasBorderless = (1 << 0),
+}
+LLGLCanvasFlags;
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLCanvasDescriptor
+{
+    const char* title;
+    long        flags; /* = 0 */
+}
+LLGLCanvasDescriptor;
+
+#define LLGL_CANVASDESCRIPTOR_INIT { .flags = 0 }
+
+
+/* ----- Default values ----- */
+
+#ifndef __cplusplus
+
+static const LLGLCanvasDescriptor g_llglCanvasDescriptorDefault = LLGL_CANVASDESCRIPTOR_INIT;
+
+#endif /* __cplusplus */
+
+
+#endif /* LLGL_C99_WRAPPER_CANVAS_FLAGS_H */
+
+
+
+/* ================================================================================ */
+
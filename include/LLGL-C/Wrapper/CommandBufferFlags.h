@@ -0,0 +1,112 @@
+/*
+ * CommandBufferFlags.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_COMMAND_BUFFER_FLAGS_H
+#define LLGL_C99_WRAPPER_COMMAND_BUFFER_FLAGS_H
+
+
+#include <stdint.h>
+
+
+/* ----- Enumerations ----- */
+
+typedef enum LLGLRenderConditionMode
+{
+    LLGLRenderConditionModeWait,
+    LLGLRenderConditionModeNoWait,
+    LLGLRenderConditionModeByRegionWait,
+    LLGLRenderConditionModeByRegionNoWait,
+    LLGLRenderConditionModeWaitInverted,
+    LLGLRenderConditionModeNoWaitInverted,
+    LLGLRenderConditionModeByRegionWaitInverted,
+    LLGLRenderConditionModeByRegionNoWaitInverted,
+}
+LLGLRenderConditionMode;
+
+typedef enum LLGLStencilFace
+{
+    LLGLStencilFaceFrontAndBack,
+    LLGLStencilFaceFront,
+    LLGLStencilFaceBack,
+}
+LLGLStencilFace;
+
+
+/* ----- Flags ----- */
+
+typedef enum LLGLCommandBufferFlags
+{
+    LLGLCommandBufferSecondary       = (1 << 0),
+    LLGLCommandBufferMultiSubmit     = (1 << 1),
+    LLGLCommandBufferImmediateSubmit = (1 << 2),
+}
+LLGLCommandBufferFlags;
+
+typedef enum LLGLClearFlags
+{
+    LLGLClearColor        = (1 << 0),
+    LLGLClearDepth        = (1 << 1),
+    LLGLClearStencil      = (1 << 2),
+    LLGLClearColorDepth   = (LLGLClearColor | LLGLClearDepth),
+    LLGLClearDepthStencil = (LLGLClearDepth | LLGLClearStencil),
+    LLGLClearAll          = (LLGLClearColor | LLGLClearDepth | LLGLClearStencil),
+}
+LLGLClearFlags;
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLClearValue
+{
+    float    color[4]; /* = {0.0f,0.0f,0.0f,0.0f} */
+    float    depth;    /* = 1.0f */
+    uint32_t stencil;  /* = 0 */
+}
+LLGLClearValue;
+
+#define LLGL_CLEARVALUE_INIT { .color = {0.0f,0.0f,0.0f,0.0f}, .depth = 1.0f, .stencil = 0 }
+
+typedef struct LLGLAttachmentClear
+{
+    long           flags;           /* = 0 */
+    uint32_t       colorAttachment; /* = 0 */
+    LLGLClearValue clearValue;
+}
+LLGLAttachmentClear;
+
+#define LLGL_ATTACHMENTCLEAR_INIT { .flags = 0, .colorAttachment = 0, .clearValue = LLGL_CLEARVALUE_INIT }
+
+typedef struct LLGLCommandBufferDescriptor
+{
+    long     flags;              /* = 0 */
+    uint32_t numNativeBuffers;   /* = 2 */
+    uint64_t minStagingPoolSize; /* = (0xFFFF+1) */
+}
+LLGLCommandBufferDescriptor;
+
+#define LLGL_COMMANDBUFFERDESCRIPTOR_INIT { .flags = 0, .numNativeBuffers = 2, .minStagingPoolSize = (0xFFFF+1) }
+
+
+/* ----- Default values ----- */
+
+#ifndef __cplusplus
+
+static const LLGLClearValue              g_llglClearValueDefault              = LLGL_CLEARVALUE_INIT;
+static const LLGLAttachmentClear         g_llglAttachmentClearDefault         = LLGL_ATTACHMENTCLEAR_INIT;
+static const LLGLCommandBufferDescriptor g_llglCommandBufferDescriptorDefault = LLGL_COMMANDBUFFERDESCRIPTOR_INIT;
+
+#endif /* __cplusplus */
+
+
+#endif /* LLGL_C99_WRAPPER_COMMAND_BUFFER_FLAGS_H */
+
+
+
+/* ================================================================================ */
+
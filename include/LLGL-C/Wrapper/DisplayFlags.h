@@ -0,0 +1,44 @@
+/*
+ * DisplayFlags.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_DISPLAY_FLAGS_H
+#define LLGL_C99_WRAPPER_DISPLAY_FLAGS_H
+
+
+#include <stdint.h>
+#include <LLGL-C/Wrapper/Types.h>
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLDisplayModeDescriptor
+{
+    LLGLExtent2D resolution;
+    uint32_t     refreshRate; /* = 0 */
+}
+LLGLDisplayModeDescriptor;
+
+#define LLGL_DISPLAYMODEDESCRIPTOR_INIT { .resolution = LLGL_EXTENT2D_INIT, .refreshRate = 0 }
+
+
+/* ----- Default values ----- */
+
+#ifndef __cplusplus
+
+static const LLGLDisplayModeDescriptor g_llglDisplayModeDescriptorDefault = LLGL_DISPLAYMODEDESCRIPTOR_INIT;
+
+#endif /* __cplusplus */
+
+
+#endif /* LLGL_C99_WRAPPER_DISPLAY_FLAGS_H */
+
+
+
+/* ================================================================================ */
+
@@ -0,0 +1,47 @@
+/*
+ * FragmentAttribute.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_FRAGMENT_ATTRIBUTE_H
+#define LLGL_C99_WRAPPER_FRAGMENT_ATTRIBUTE_H
+
+
+#include <stdint.h>
+#include <LLGL-C/Wrapper/Format.h>
+#include <LLGL-C/Wrapper/SystemValue.h>
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLFragmentAttribute
+{
+    const char*     name;
+    LLGLFormat      format;      /* = LLGLFormatRGBA32Float */
+    uint32_t        location;    /* = 0 */
+    LLGLSystemValue systemValue; /* = LLGLSystemValueUndefined */
+}
+LLGLFragmentAttribute;
+
+#define LLGL_FRAGMENTATTRIBUTE_INIT { .format = LLGLFormatRGBA32Float, .location = 0, .systemValue = LLGLSystemValueUndefined }
+
+
+/* ----- Default values ----- */
+
+#ifndef __cplusplus
+
+static const LLGLFragmentAttribute g_llglFragmentAttributeDefault = LLGL_FRAGMENTATTRIBUTE_INIT;
+
+#endif /* __cplusplus */
+
+
+#endif /* LLGL_C99_WRAPPER_FRAGMENT_ATTRIBUTE_H */
+
+
+
+/* ================================================================================ */
+
@@ -0,0 +1,58 @@
+/*
+ * ImageFlags.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_IMAGE_FLAGS_H
+#define LLGL_C99_WRAPPER_IMAGE_FLAGS_H
+
+
+#include <stddef.h>
+#include <LLGL-C/Wrapper/Format.h>
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLImageView
+{
+    LLGLImageFormat format;   /* = LLGLImageFormatRGBA */
+    LLGLDataType    dataType; /* = LLGLDataTypeUInt8 */
+    const void*     data;     /* = NULL */
+    size_t          dataSize; /* = 0 */
+}
+LLGLImageView;
+
+#define LLGL_IMAGEVIEW_INIT { .format = LLGLImageFormatRGBA, .dataType = LLGLDataTypeUInt8, .dataSize = 0 }
+
+typedef struct LLGLMutableImageView
+{
+    LLGLImageFormat format;   /* = LLGLImageFormatRGBA */
+    LLGLDataType    dataType; /* = LLGLDataTypeUInt8 */
+    void*           data;     /* = NULL */
+    size_t          dataSize; /* = 0 */
+}
+LLGLMutableImageView;
+
+#define LLGL_MUTABLEIMAGEVIEW_INIT { .format = LLGLImageFormatRGBA, .dataType = LLGLDataTypeUInt8, .dataSize = 0 }
+
+
+/* ----- Default values ----- */
+
+#ifndef __cplusplus
+
+static const LLGLImageView        g_llglImageViewDefault        = LLGL_IMAGEVIEW_INIT;
+static const LLGLMutableImageView g_llglMutableImageViewDefault = LLGL_MUTABLEIMAGEVIEW_INIT;
+
+#endif /* __cplusplus */
+
+
+#endif /* LLGL_C99_WRAPPER_IMAGE_FLAGS_H */
+
+
+
+/* ================================================================================ */
+
@@ -0,0 +1,79 @@
+/*
+ * IndirectArguments.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_INDIRECT_ARGUMENTS_H
+#define LLGL_C99_WRAPPER_INDIRECT_ARGUMENTS_H
+
+
+#include <stdint.h>
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLDrawIndirectArguments
+{
+    uint32_t numVertices;
+    uint32_t numInstances;
+    uint32_t firstVertex;
+    uint32_t firstInstance;
+}
+LLGLDrawIndirectArguments;
+
+#define LLGL_DRAWINDIRECTARGUMENTS_INIT { 0 }
+
+typedef struct LLGLDrawIndexedIndirectArguments
+{
+    uint32_t numIndices;
+    uint32_t numInstances;
+    uint32_t firstIndex;
+    int32_t  vertexOffset;
+    uint32_t firstInstance;
+}
+LLGLDrawIndexedIndirectArguments;
+
+#define LLGL_DRAWINDEXEDINDIRECTARGUMENTS_INIT { 0 }
+
+typedef struct LLGLDrawPatchIndirectArguments
+{
+    uint32_t numPatches;
+    uint32_t numInstances;
+    uint32_t firstPatch;
+    uint32_t firstInstance;
+}
+LLGLDrawPatchIndirectArguments;
+
+#define LLGL_DRAWPATCHINDIRECTARGUMENTS_INIT { 0 }
+
+typedef struct LLGLDispatchIndirectArguments
+{
+    uint32_t numThreadGroups[3];
+}
+LLGLDispatchIndirectArguments;
+
+#define LLGL_DISPATCHINDIRECTARGUMENTS_INIT { 0 }
+
+
+/* ----- Default values ----- */
+
+#ifndef __cplusplus
+
+static const LLGLDrawIndirectArguments        g_llglDrawIndirectArgumentsDefault        = LLGL_DRAWINDIRECTARGUMENTS_INIT;
+static const LLGLDrawIndexedIndirectArguments g_llglDrawIndexedIndirectArgumentsDefault = LLGL_DRAWINDEXEDINDIRECTARGUMENTS_INIT;
+static const LLGLDrawPatchIndirectArguments   g_llglDrawPatchIndirectArgumentsDefault   = LLGL_DRAWPATCHINDIRECTARGUMENTS_INIT;
+static const LLGLDispatchIndirectArguments    g_llglDispatchIndirectArgumentsDefault    = LLGL_DISPATCHINDIRECTARGUMENTS_INIT;
+
+#endif /* __cplusplus */
+
+
+#endif /* LLGL_C99_WRAPPER_INDIRECT_ARGUMENTS_H */
+
+
+
+/* ================================================================================ */
+
@@ -0,0 +1,180 @@
+/*
+ * Key.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_KEY_H
+#define LLGL_C99_WRAPPER_KEY_H
+
+
+/* ----- Enumerations ----- */
+
+typedef enum LLGLKey
+{
+    LLGLKeyLButton,
+    LLGLKeyRButton,
+    LLGLKeyCancel,
+    LLGLKeyMButton,
+    LLGLKeyXButton1,
+    LLGLKeyXButton2,
+    LLGLKeyBack,
+    LLGLKeyTab,
+    LLGLKeyClear,
+    LLGLKeyReturn,
+    LLGLKeyShift,
+    LLGLKeyControl,
+    LLGLKeyMenu,
+    LLGLKeyPause,
+    LLGLKeyCapital,
+    LLGLKeyEscape,
+    LLGLKeySpace,
+    LLGLKeyPageUp,
+    LLGLKeyPageDown,
+    LLGLKeyEnd,
+    LLGLKeyHome,
+    LLGLKeyLeft,
+    LLGLKeyUp,
+    LLGLKeyRight,
+    LLGLKeyDown,
+    LLGLKeySelect,
+    LLGLKeyPrint,
+    LLGLKeyExe,
+    LLGLKeySnapshot,
+    LLGLKeyInsert,
+    LLGLKeyDelete,
+    LLGLKeyHelp,
+    LLGLKeyD0,
+    LLGLKeyD1,
+    LLGLKeyD2,
+    LLGLKeyD3,
+    LLGLKeyD4,
+    LLGLKeyD5,
+    LLGLKeyD6,
+    LLGLKeyD7,
+    LLGLKeyD8,
+    LLGLKeyD9,
+    LLGLKeyA,
+    LLGLKeyB,
+    LLGLKeyC,
+    LLGLKeyD,
+    LLGLKeyE,
+    LLGLKeyF,
+    LLGLKeyG,
+    LLGLKeyH,
+    LLGLKeyI,
+    LLGLKeyJ,
+    LLGLKeyK,
+    LLGLKeyL,
+    LLGLKeyM,
+    LLGLKeyN,
+    LLGLKeyO,
+    LLGLKeyP,
+    LLGLKeyQ,
+    LLGLKeyR,
+    LLGLKeyS,
+    LLGLKeyT,
+    LLGLKeyU,
+    LLGLKeyV,
+    LLGLKeyW,
+    LLGLKeyX,
+    LLGLKeyY,
+    LLGLKeyZ,
+    LLGLKeyLWin,
+    LLGLKeyRWin,
+    LLGLKeyApps,
+    LLGLKeySleep,
+    LLGLKeyKeypad0,
+    LLGLKeyKeypad1,
+    LLGLKeyKeypad2,
+    LLGLKeyKeypad3,
+    LLGLKeyKeypad4,
+    LLGLKeyKeypad5,
+    LLGLKeyKeypad6,
+    LLGLKeyKeypad7,
+    LLGLKeyKeypad8,
+    LLGLKeyKeypad9,
+    LLGLKeyKeypadMultiply,
+    LLGLKeyKeypadPlus,
+    LLGLKeyKeypadSeparator,
+    LLGLKeyKeypadMinus,
+    LLGLKeyKeypadDecimal,
+    LLGLKeyKeypadDivide,
+    LLGLKeyF1,
+    LLGLKeyF2,
+    LLGLKeyF3,
+    LLGLKeyF4,
+    LLGLKeyF5,
+    LLGLKeyF6,
+    LLGLKeyF7,
+    LLGLKeyF8,
+    LLGLKeyF9,
+    LLGLKeyF10,
+    LLGLKeyF11,
+    LLGLKeyF12,
+    LLGLKeyF13,
+    LLGLKeyF14,
+    LLGLKeyF15,
+    LLGLKeyF16,
+    LLGLKeyF17,
+    LLGLKeyF18,
+    LLGLKeyF19,
+    LLGLKeyF20,
+    LLGLKeyF21,
+    LLGLKeyF22,
+    LLGLKeyF23,
+    LLGLKeyF24,
+    LLGLKeyNumLock,
+    LLGLKeyScrollLock,
+    LLGLKeyLShift,
+    LLGLKeyRShift,
+    LLGLKeyLControl,
+    LLGLKeyRControl,
+    LLGLKeyLMenu,
+    LLGLKeyRMenu,
+    LLGLKeyBrowserBack,
+    LLGLKeyBrowserForward,
+    LLGLKeyBrowserRefresh,
+    LLGLKeyBrowserStop,
+    LLGLKeyBrowserSearch,
+    LLGLKeyBrowserFavorits,
+    LLGLKeyBrowserHome,
+    LLGLKeyVolumeMute,
+    LLGLKeyVolumeDown,
+    LLGLKeyVolumeUp,
+    LLGLKeyMediaNextTrack,
+    LLGLKeyMediaPrevTrack,
+    LLGLKeyMediaStop,
+    LLGLKeyMediaPlayPause,
+    LLGLKeyLaunchMail,
+    LLGLKeyLaunchMediaSelect,
+    LLGLKeyLaunchApp1,
+    LLGLKeyLaunchApp2,
+    LLGLKeyPlus,
+    LLGLKeyComma,
+    LLGLKeyMinus,
+    LLGLKeyPeriod,
+    LLGLKeyExponent,
+    LLGLKeyAttn,
+    LLGLKeyCrSel,
+    LLGLKeyExSel,
+    LLGLKeyErEOF,
+    LLGLKeyPlay,
+    LLGLKeyZoom,
+    LLGLKeyNoName,
+    LLGLKeyPA1,
+    LLGLKeyOEMClear,
+    LLGLKeyAny,
+}
+LLGLKey;
+
+
+#endif /* LLGL_C99_WRAPPER_KEY_H */
+
+
+
+/* ================================================================================ */
+
@@ -0,0 +1,29 @@
+/*
+ * Log.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_LOG_H
+#define LLGL_C99_WRAPPER_LOG_H
+
+
+/* ----- Enumerations ----- */
+
+typedef enum LLGLReportType
+{
+    LLGLReportTypeDefault = 0,
+    LLGLReportTypeError,
+}
+LLGLReportType;
+
+
+#endif /* LLGL_C99_WRAPPER_LOG_H */
+
+
+
+/* ================================================================================ */
+
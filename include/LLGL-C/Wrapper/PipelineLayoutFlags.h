@@ -0,0 +1,149 @@
+/*
+ * PipelineLayoutFlags.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_PIPELINE_LAYOUT_FLAGS_H
+#define LLGL_C99_WRAPPER_PIPELINE_LAYOUT_FLAGS_H
+
+
+#include <stddef.h>
+#include <stdint.h>
+#include <LLGL-C/Wrapper/ResourceFlags.h>
+#include <LLGL-C/Wrapper/SamplerFlags.h>
+
+
+/* ----- Enumerations ----- */
+
+typedef enum LLGLUniformType
+{
+    LLGLUniformTypeUndefined,
+    LLGLUniformTypeFloat1,
+    LLGLUniformTypeFloat2,
+    LLGLUniformTypeFloat3,
+    LLGLUniformTypeFloat4,
+    LLGLUniformTypeDouble1,
+    LLGLUniformTypeDouble2,
+    LLGLUniformTypeDouble3,
+    LLGLUniformTypeDouble4,
+    LLGLUniformTypeInt1,
+    LLGLUniformTypeInt2,
+    LLGLUniformTypeInt3,
+    LLGLUniformTypeInt4,
+    LLGLUniformTypeUInt1,
+    LLGLUniformTypeUInt2,
+    LLGLUniformTypeUInt3,
+    LLGLUniformTypeUInt4,
+    LLGLUniformTypeBool1,
+    LLGLUniformTypeBool2,
+    LLGLUniformTypeBool3,
+    LLGLUniformTypeBool4,
+    LLGLUniformTypeFloat2x2,
+    LLGLUniformTypeFloat2x3,
+    LLGLUniformTypeFloat2x4,
+    LLGLUniformTypeFloat3x2,
+    LLGLUniformTypeFloat3x3,
+    LLGLUniformTypeFloat3x4,
+    LLGLUniformTypeFloat4x2,
+    LLGLUniformTypeFloat4x3,
+    LLGLUniformTypeFloat4x4,
+    LLGLUniformTypeDouble2x2,
+    LLGLUniformTypeDouble2x3,
+    LLGLUniformTypeDouble2x4,
+    LLGLUniformTypeDouble3x2,
+    LLGLUniformTypeDouble3x3,
+    LLGLUniformTypeDouble3x4,
+    LLGLUniformTypeDouble4x2,
+    LLGLUniformTypeDouble4x3,
+    LLGLUniformTypeDouble4x4,
+    LLGLUniformTypeSampler,
+    LLGLUniformTypeImage,
+    LLGLUniformTypeAtomicCounter,
+}
+LLGLUniformType;
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLBindingSlot
+{
+    uint32_t index; /* = 0 */
+    uint32_t set;   /* = 0 */
+}
+LLGLBindingSlot;
+
+#define LLGL_BINDINGSLOT_INIT { .index = 0, .set = 0 }
+
+typedef struct LLGLBindingDescriptor
+{
+    const char*      name;
+    LLGLResourceType type;       /* = LLGLResourceTypeUndefined */
+    long             bindFlags;  /* = 0 */
+    long             stageFlags; /* = 0 */
+    LLGLBindingSlot  slot;
+    uint32_t         arraySize;  /* = 0 */
+}
+LLGLBindingDescriptor;
+
+#define LLGL_BINDINGDESCRIPTOR_INIT { .type = LLGLResourceTypeUndefined, .bindFlags = 0, .stageFlags = 0, .slot = LLGL_BINDINGSLOT_INIT, .arraySize = 0 }
+
+typedef struct LLGLStaticSamplerDescriptor
+{
+    const char*           name;
+    long                  stageFlags; /* = 0 */
+    LLGLBindingSlot       slot;
+    LLGLSamplerDescriptor sampler;
+}
+LLGLStaticSamplerDescriptor;
+
+#define LLGL_STATICSAMPLERDESCRIPTOR_INIT { .stageFlags = 0, .slot = LLGL_BINDINGSLOT_INIT, .sampler = LLGL_SAMPLERDESCRIPTOR_INIT }
+
+typedef struct LLGLUniformDescriptor
+{
+    const char*     name;
+    LLGLUniformType type;      /* = LLGLUniformTypeUndefined */
+    uint32_t        arraySize; /* = 0 */
+}
+LLGLUniformDescriptor;
+
+#define LLGL_UNIFORMDESCRIPTOR_INIT { .type = LLGLUniformTypeUndefined, .arraySize = 0 }
+
+typedef struct LLGLPipelineLayoutDescriptor
+{
+    size_t                             numHeapBindings;   /* = 0 */
+    const LLGLBindingDescriptor*       heapBindings;      /* = NULL */
+    size_t                             numBindings;       /* = 0 */
+    const LLGLBindingDescriptor*       bindings;          /* = NULL */
+    size_t                             numStaticSamplers; /* = 0 */
+    const LLGLStaticSamplerDescriptor* staticSamplers;    /* = NULL */
+    size_t                             numUniforms;       /* = 0 */
+    const LLGLUniformDescriptor*       uniforms;          /* = NULL */
+}
+LLGLPipelineLayoutDescriptor;
+
+#define LLGL_PIPELINELAYOUTDESCRIPTOR_INIT { 0 }
+
+
+/* ----- Default values ----- */
+
+#ifndef __cplusplus
+
+static const LLGLBindingSlot              g_llglBindingSlotDefault              = LLGL_BINDINGSLOT_INIT;
+static const LLGLBindingDescriptor        g_llglBindingDescriptorDefault        = LLGL_BINDINGDESCRIPTOR_INIT;
+static const LLGLStaticSamplerDescriptor  g_llglStaticSamplerDescriptorDefault  = LLGL_STATICSAMPLERDESCRIPTOR_INIT;
+static const LLGLUniformDescriptor        g_llglUniformDescriptorDefault        = LLGL_UNIFORMDESCRIPTOR_INIT;
+static const LLGLPipelineLayoutDescriptor g_llglPipelineLayoutDescriptorDefault = LLGL_PIPELINELAYOUTDESCRIPTOR_INIT;
+
+#endif /* __cplusplus */
+
+
+#endif /* LLGL_C99_WRAPPER_PIPELINE_LAYOUT_FLAGS_H */
+
+
+
+/* ================================================================================ */
+
@@ -0,0 +1,378 @@
+/*
+ * PipelineStateFlags.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_PIPELINE_STATE_FLAGS_H
+#define LLGL_C99_WRAPPER_PIPELINE_STATE_FLAGS_H
+
+
+#include <stdbool.h>
+#include <stddef.h>
+#include <stdint.h>
+#include <LLGL-C/Types.h>
+#include <LLGL-C/Wrapper/Format.h>
+
+
+/* ----- Enumerations ----- */
+
+typedef enum LLGLPrimitiveTopology
+{
+    LLGLPrimitiveTopologyPointList,
+    LLGLPrimitiveTopologyLineList,
+    LLGLPrimitiveTopologyLineStrip,
+    LLGLPrimitiveTopologyLineListAdjacency,
+    LLGLPrimitiveTopologyLineStripAdjacency,
+    LLGLPrimitiveTopologyTriangleList,
+    LLGLPrimitiveTopologyTriangleStrip,
+    LLGLPrimitiveTopologyTriangleListAdjacency,
+    LLGLPrimitiveTopologyTriangleStripAdjacency,
+    LLGLPrimitiveTopologyPatches1,
+    LLGLPrimitiveTopologyPatches2,
+    LLGLPrimitiveTopologyPatches3,
+    LLGLPrimitiveTopologyPatches4,
+    LLGLPrimitiveTopologyPatches5,
+    LLGLPrimitiveTopologyPatches6,
+    LLGLPrimitiveTopologyPatches7,
+    LLGLPrimitiveTopologyPatches8,
+    LLGLPrimitiveTopologyPatches9,
+    LLGLPrimitiveTopologyPatches10,
+    LLGLPrimitiveTopologyPatches11,
+    LLGLPrimitiveTopologyPatches12,
+    LLGLPrimitiveTopologyPatches13,
+    LLGLPrimitiveTopologyPatches14,
+    LLGLPrimitiveTopologyPatches15,
+    LLGLPrimitiveTopologyPatches16,
+    LLGLPrimitiveTopologyPatches17,
+    LLGLPrimitiveTopologyPatches18,
+    LLGLPrimitiveTopologyPatches19,
+    LLGLPrimitiveTopologyPatches20,
+    LLGLPrimitiveTopologyPatches21,
+    LLGLPrimitiveTopologyPatches22,
+    LLGLPrimitiveTopologyPatches23,
+    LLGLPrimitiveTopologyPatches24,
+    LLGLPrimitiveTopologyPatches25,
+    LLGLPrimitiveTopologyPatches26,
+    LLGLPrimitiveTopologyPatches27,
+    LLGLPrimitiveTopologyPatches28,
+    LLGLPrimitiveTopologyPatches29,
+    LLGLPrimitiveTopologyPatches30,
+    LLGLPrimitiveTopologyPatches31,
+    LLGLPrimitiveTopologyPatches32,
+}
+LLGLPrimitiveTopology;
+
+typedef enum LLGLCompareOp
+{
+    LLGLCompareOpNeverPass,
+    LLGLCompareOpLess,
+    LLGLCompareOpEqual,
+    LLGLCompareOpLessEqual,
+    LLGLCompareOpGreater,
+    LLGLCompareOpNotEqual,
+    LLGLCompareOpGreaterEqual,
+    LLGLCompareOpAlwaysPass,
+}
+LLGLCompareOp;
+
+typedef enum LLGLStencilOp
+{
+    LLGLStencilOpKeep,
+    LLGLStencilOpZero,
+    LLGLStencilOpReplace,
+    LLGLStencilOpIncClamp,
+    LLGLStencilOpDecClamp,
+    LLGLStencilOpInvert,
+    LLGLStencilOpIncWrap,
+    LLGLStencilOpDecWrap,
+}
+LLGLStencilOp;
+
+typedef enum LLGLBlendOp
+{
+    LLGLBlendOpZero,
+    LLGLBlendOpOne,
+    LLGLBlendOpSrcColor,
+    LLGLBlendOpInvSrcColor,
+    LLGLBlendOpSrcAlpha,
+    LLGLBlendOpInvSrcAlpha,
+    LLGLBlendOpDstColor,
+    LLGLBlendOpInvDstColor,
+    LLGLBlendOpDstAlpha,
+    LLGLBlendOpInvDstAlpha,
+    LLGLBlendOpSrcAlphaSaturate,
+    LLGLBlendOpBlendFactor,
+    LLGLBlendOpInvBlendFactor,
+    LLGLBlendOpSrc1Color,
+    LLGLBlendOpInvSrc1Color,
+    LLGLBlendOpSrc1Alpha,
+    LLGLBlendOpInvSrc1Alpha,
+}
+LLGLBlendOp;
+
+typedef enum LLGLBlendArithmetic
+{
+    LLGLBlendArithmeticAdd,
+    LLGLBlendArithmeticSubtract,
+    LLGLBlendArithmeticRevSubtract,
+    LLGLBlendArithmeticMin,
+    LLGLBlendArithmeticMax,
+}
+LLGLBlendArithmetic;
+
+typedef enum LLGLPolygonMode
+{
+    LLGLPolygonModeFill,
+    LLGLPolygonModeWireframe,
+    LLGLPolygonModePoints,
+}
+LLGLPolygonMode;
+
+typedef enum LLGLCullMode
+{
+    LLGLCullModeDisabled,
+    LLGLCullModeFront,
+    LLGLCullModeBack,
+}
+LLGLCullMode;
+
+typedef enum LLGLLogicOp
+{
+    LLGLLogicOpDisabled,
+    LLGLLogicOpClear,
+    LLGLLogicOpSet,
+    LLGLLogicOpCopy,
+    LLGLLogicOpCopyInverted,
+    LLGLLogicOpNoOp,
+    LLGLLogicOpInvert,
+    LLGLLogicOpAND,
+    LLGLLogicOpANDReverse,
+    LLGLLogicOpANDInverted,
+    LLGLLogicOpNAND,
+    LLGLLogicOpOR,
+    LLGLLogicOpORReverse,
+    LLGLLogicOpORInverted,
+    LLGLLogicOpNOR,
+    LLGLLogicOpXOR,
+    LLGLLogicOpEquiv,
+}
+LLGLLogicOp;
+
+typedef enum LLGLTessellationPartition
+{
+    LLGLTessellationPartitionUndefined,
+    LLGLTessellationPartitionInteger,
+    LLGLTessellationPartitionPow2,
+    LLGLTessellationPartitionFractionalOdd,
+    LLGLTessellationPartitionFractionalEven,
+}
+LLGLTessellationPartition;
+
+
+/* ----- Flags ----- */
+
+typedef enum LLGLColorMaskFlags
+{
+    LLGLColorMaskZero = 0,
+    LLGLColorMaskR    = (1 << 0),
+    LLGLColorMaskG    = (1 << 1),
+    LLGLColorMaskB    = (1 << 2),
+    LLGLColorMaskA    = (1 << 3),
+    LLGLColorMaskAll  = (LLGLColorMaskR | LLGLColorMaskG | LLGLColorMaskB | LLGLColorMaskA),
+}
+LLGLColorMaskFlags;
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLViewport
+{
+    float x;        /* = 0.0f */
+    float y;        /* = 0.0f */
+    float width;    /* = 0.0f */
+    float height;   /* = 0.0f */
+    float minDepth; /* = 0.0f */
+    float maxDepth; /* = 1.0f */
+}
+LLGLViewport;
+
+#define LLGL_VIEWPORT_INIT { .x = 0.0f, .y = 0.0f, .width = 0.0f, .height = 0.0f, .minDepth = 0.0f, .maxDepth = 1.0f }
+
+typedef struct LLGLScissor
+{
+    int32_t x;      /* = 0 */
+    int32_t y;      /* = 0 */
+    int32_t width;  /* = 0 */
+    int32_t height; /* = 0 */
+}
+LLGLScissor;
+
+#define LLGL_SCISSOR_INIT { .x = 0, .y = 0, .width = 0, .height = 0 }
+
+typedef struct LLGLDepthDescriptor
+{
+    bool          testEnabled;  /* = false */
+    bool          writeEnabled; /* = false */
+    LLGLCompareOp compareOp;    /* = LLGLCompareOpLess */
+}
+LLGLDepthDescriptor;
+
+#define LLGL_DEPTHDESCRIPTOR_INIT { .testEnabled = false, .writeEnabled = false, .compareOp = LLGLCompareOpLess }
+
+typedef struct LLGLStencilFaceDescriptor
+{
+    LLGLStencilOp stencilFailOp; /* = LLGLStencilOpKeep */
+    LLGLStencilOp depthFailOp;   /* = LLGLStencilOpKeep */
+    LLGLStencilOp depthPassOp;   /* = LLGLStencilOpKeep */
+    LLGLCompareOp compareOp;     /* = LLGLCompareOpLess */
+    uint32_t      readMask;      /* = ~0u */
+    uint32_t      writeMask;     /* = ~0u */
+    uint32_t      reference;     /* = 0u */
+}
+LLGLStencilFaceDescriptor;
+
+#define LLGL_STENCILFACEDESCRIPTOR_INIT { .stencilFailOp = LLGLStencilOpKeep, .depthFailOp = LLGLStencilOpKeep, .depthPassOp = LLGLStencilOpKeep, .compareOp = LLGLCompareOpLess, .readMask = ~0u, .writeMask = ~0u, .reference = 0u }
+
+typedef struct LLGLStencilDescriptor
+{
+    bool                      testEnabled;      /* = false */
+    bool                      referenceDynamic; /* = false */
+    LLGLStencilFaceDescriptor front;
+    LLGLStencilFaceDescriptor back;
+}
+LLGLStencilDescriptor;
+
+#define LLGL_STENCILDESCRIPTOR_INIT { .testEnabled = false, .referenceDynamic = false, .front = LLGL_STENCILFACEDESCRIPTOR_INIT, .back = LLGL_STENCILFACEDESCRIPTOR_INIT }
+
+typedef struct LLGLDepthBiasDescriptor
+{
+    float constantFactor; /* = 0.0f */
+    float slopeFactor;    /* = 0.0f */
+    float clamp;          /* = 0.0f */
+}
+LLGLDepthBiasDescriptor;
+
+#define LLGL_DEPTHBIASDESCRIPTOR_INIT { .constantFactor = 0.0f, .slopeFactor = 0.0f, .clamp = 0.0f }
+
+typedef struct LLGLRasterizerDescriptor
+{
+    LLGLPolygonMode         polygonMode;               /* = LLGLPolygonModeFill */
+    LLGLCullMode            cullMode;                  /* = LLGLCullModeDisabled */
+    LLGLDepthBiasDescriptor depthBias;
+    bool                    frontCCW;                  /* = false */
+    bool                    discardEnabled;            /* = false */
+    bool                    depthClampEnabled;         /* = false */
+    bool                    scissorTestEnabled;        /* = false */
+    bool                    multiSampleEnabled;        /* = false */
+    bool                    antiAliasedLineEnabled;    /* = false */
+    bool                    conservativeRasterization; /* = false */
+    float                   lineWidth;                 /* = 1.0f */
+}
+LLGLRasterizerDescriptor;
+
+#define LLGL_RASTERIZERDESCRIPTOR_INIT { .polygonMode = LLGLPolygonModeFill, .cullMode = LLGLCullModeDisabled, .depthBias = LLGL_DEPTHBIASDESCRIPTOR_INIT, .frontCCW = false, .discardEnabled = false, .depthClampEnabled = false, .scissorTestEnabled = false, .multiSampleEnabled = false, .antiAliasedLineEnabled = false, .conservativeRasterization = false, .lineWidth = 1.0f }
+
+typedef struct LLGLBlendTargetDescriptor
+{
+    bool                blendEnabled;    /* = false */
+    LLGLBlendOp         srcColor;        /* = LLGLBlendOpSrcAlpha */
+    LLGLBlendOp         dstColor;        /* = LLGLBlendOpInvSrcAlpha */
+    LLGLBlendArithmetic colorArithmetic; /* = LLGLBlendArithmeticAdd */
+    LLGLBlendOp         srcAlpha;        /* = LLGLBlendOpSrcAlpha */
+    LLGLBlendOp         dstAlpha;        /* = LLGLBlendOpInvSrcAlpha */
+    LLGLBlendArithmetic alphaArithmetic; /* = LLGLBlendArithmeticAdd */
+    uint8_t             colorMask;       /* = LLGLColorMaskAll */
+}
+LLGLBlendTargetDescriptor;
+
+#define LLGL_BLENDTARGETDESCRIPTOR_INIT { .blendEnabled = false, .srcColor = LLGLBlendOpSrcAlpha, .dstColor = LLGLBlendOpInvSrcAlpha, .colorArithmetic = LLGLBlendArithmeticAdd, .srcAlpha = LLGLBlendOpSrcAlpha, .dstAlpha = LLGLBlendOpInvSrcAlpha, .alphaArithmetic = LLGLBlendArithmeticAdd, .colorMask = LLGLColorMaskAll }
+
+typedef struct LLGLBlendDescriptor
+{
+    bool                      alphaToCoverageEnabled;  /* = false */
+    bool                      independentBlendEnabled; /* = false */
+    uint32_t                  sampleMask;              /* = ~0u */
+    LLGLLogicOp               logicOp;                 /* = LLGLLogicOpDisabled */
+    float                     blendFactor[4];          /* = {0.0f,0.0f,0.0f,0.0f} */
+    bool                      blendFactorDynamic;      /* = false */
+    LLGLBlendTargetDescriptor targets[8];
+}
+LLGLBlendDescriptor;
+
+#define LLGL_BLENDDESCRIPTOR_INIT { .alphaToCoverageEnabled = false, .independentBlendEnabled = false, .sampleMask = ~0u, .logicOp = LLGLLogicOpDisabled, .blendFactor = {0.0f,0.0f,0.0f,0.0f}, .blendFactorDynamic = false, .targets = { LLGL_BLENDTARGETDESCRIPTOR_INIT, LLGL_BLENDTARGETDESCRIPTOR_INIT, LLGL_BLENDTARGETDESCRIPTOR_INIT, LLGL_BLENDTARGETDESCRIPTOR_INIT, LLGL_BLENDTARGETDESCRIPTOR_INIT, LLGL_BLENDTARGETDESCRIPTOR_INIT, LLGL_BLENDTARGETDESCRIPTOR_INIT, LLGL_BLENDTARGETDESCRIPTOR_INIT } }
+
+typedef struct LLGLTessellationDescriptor
+{
+    LLGLTessellationPartition partition;        /* = LLGLTessellationPartitionUndefined */
+    uint32_t                  maxTessFactor;    /* = 64 */
+    bool                      outputWindingCCW; /* = false */
+}
+LLGLTessellationDescriptor;
+
+#define LLGL_TESSELLATIONDESCRIPTOR_INIT { .partition = LLGLTessellationPartitionUndefined, .maxTessFactor = 64, .outputWindingCCW = false }
+
+typedef struct LLGLGraphicsPipelineDescriptor
+{
+    LLGLPipelineLayout         pipelineLayout;       /* = LLGL_NULL_OBJECT */
+    LLGLRenderPass             renderPass;           /* = LLGL_NULL_OBJECT */
+    LLGLShader                 vertexShader;         /* = LLGL_NULL_OBJECT */
+    LLGLShader                 tessControlShader;    /* = LLGL_NULL_OBJECT */
+    LLGLShader                 tessEvaluationShader; /* = LLGL_NULL_OBJECT */
+    LLGLShader                 geometryShader;       /* = LLGL_NULL_OBJECT */
+    LLGLShader                 fragmentShader;       /* = LLGL_NULL_OBJECT */
+    LLGLFormat                 indexFormat;          /* = LLGLFormatUndefined */
+    LLGLPrimitiveTopology      primitiveTopology;    /* = LLGLPrimitiveTopologyTriangleList */
+    size_t                     numViewports;         /* = 0 */
+    const LLGLViewport*        viewports;            /* = NULL */
+    size_t                     numScissors;          /* = 0 */
+    const LLGLScissor*         scissors;             /* = NULL */
+    LLGLDepthDescriptor        depth;
+    LLGLStencilDescriptor      stencil;
+    LLGLRasterizerDescriptor   rasterizer;
+    LLGLBlendDescriptor        blend;
+    LLGLTessellationDescriptor tessellation;
+}
+LLGLGraphicsPipelineDescriptor;
+
+#define LLGL_GRAPHICSPIPELINEDESCRIPTOR_INIT { .indexFormat = LLGLFormatUndefined, .primitiveTopology = LLGLPrimitiveTopologyTriangleList, .depth = LLGL_DEPTHDESCRIPTOR_INIT, .stencil = LLGL_STENCILDESCRIPTOR_INIT, .rasterizer = LLGL_RASTERIZERDESCRIPTOR_INIT, .blend = LLGL_BLENDDESCRIPTOR_INIT, .tessellation = LLGL_TESSELLATIONDESCRIPTOR_INIT }
+
+typedef struct LLGLComputePipelineDescriptor
+{
+    LLGLPipelineLayout pipelineLayout; /* = LLGL_NULL_OBJECT */
+    LLGLShader         computeShader;  /* = LLGL_NULL_OBJECT */
+}
+LLGLComputePipelineDescriptor;
+
+#define LLGL_COMPUTEPIPELINEDESCRIPTOR_INIT { 0 }
+
+
+/* ----- Default values ----- */
+
+#ifndef __cplusplus
+
+static const LLGLViewport                   g_llglViewportDefault                   = LLGL_VIEWPORT_INIT;
+static const LLGLScissor                    g_llglScissorDefault                    = LLGL_SCISSOR_INIT;
+static const LLGLDepthDescriptor            g_llglDepthDescriptorDefault            = LLGL_DEPTHDESCRIPTOR_INIT;
+static const LLGLStencilFaceDescriptor      g_llglStencilFaceDescriptorDefault      = LLGL_STENCILFACEDESCRIPTOR_INIT;
+static const LLGLStencilDescriptor          g_llglStencilDescriptorDefault          = LLGL_STENCILDESCRIPTOR_INIT;
+static const LLGLDepthBiasDescriptor        g_llglDepthBiasDescriptorDefault        = LLGL_DEPTHBIASDESCRIPTOR_INIT;
+static const LLGLRasterizerDescriptor       g_llglRasterizerDescriptorDefault       = LLGL_RASTERIZERDESCRIPTOR_INIT;
+static const LLGLBlendTargetDescriptor      g_llglBlendTargetDescriptorDefault      = LLGL_BLENDTARGETDESCRIPTOR_INIT;
+static const LLGLBlendDescriptor            g_llglBlendDescriptorDefault            = LLGL_BLENDDESCRIPTOR_INIT;
+static const LLGLTessellationDescriptor     g_llglTessellationDescriptorDefault     = LLGL_TESSELLATIONDESCRIPTOR_INIT;
+static const LLGLGraphicsPipelineDescriptor g_llglGraphicsPipelineDescriptorDefault = LLGL_GRAPHICSPIPELINEDESCRIPTOR_INIT;
+static const LLGLComputePipelineDescriptor  g_llglComputePipelineDescriptorDefault  = LLGL_COMPUTEPIPELINEDESCRIPTOR_INIT;
+
+#endif /* __cplusplus */
+
+
+#endif /* LLGL_C99_WRAPPER_PIPELINE_STATE_FLAGS_H */
+
+
+
+/* ================================================================================ */
+
@@ -0,0 +1,79 @@
+/*
+ * QueryHeapFlags.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_QUERY_HEAP_FLAGS_H
+#define LLGL_C99_WRAPPER_QUERY_HEAP_FLAGS_H
+
+
+#include <stdbool.h>
+#include <stdint.h>
+
+
+/* ----- Enumerations ----- */
+
+typedef enum LLGLQueryType
+{
+    LLGLQueryTypeSamplesPassed,
+    LLGLQueryTypeAnySamplesPassed,
+    LLGLQueryTypeAnySamplesPassedConservative,
+    LLGLQueryTypeTimeElapsed,
+    LLGLQueryTypeStreamOutPrimitivesWritten,
+    LLGLQueryTypeStreamOutOverflow,
+    LLGLQueryTypePipelineStatistics,
+}
+LLGLQueryType;
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLQueryPipelineStatistics
+{
+    uint64_t inputAssemblyVertices;           /* = 0 */
+    uint64_t inputAssemblyPrimitives;         /* = 0 */
+    uint64_t vertexShaderInvocations;         /* = 0 */
+    uint64_t geometryShaderInvocations;       /* = 0 */
+    uint64_t geometryShaderPrimitives;        /* = 0 */
+    uint64_t clippingInvocations;             /* = 0 */
+    uint64_t clippingPrimitives;              /* = 0 */
+    uint64_t fragmentShaderInvocations;       /* = 0 */
+    uint64_t tessControlShaderInvocations;    /* = 0 */
+    uint64_t tessEvaluationShaderInvocations; /* = 0 */
+    uint64_t computeShaderInvocations;        /* = 0 */
+}
+LLGLQueryPipelineStatistics;
+
+#define LLGL_QUERYPIPELINESTATISTICS_INIT { .inputAssemblyVertices = 0, .inputAssemblyPrimitives = 0, .vertexShaderInvocations = 0, .geometryShaderInvocations = 0, .geometryShaderPrimitives = 0, .clippingInvocations = 0, .clippingPrimitives = 0, .fragmentShaderInvocations = 0, .tessControlShaderInvocations = 0, .tessEvaluationShaderInvocations = 0, .computeShaderInvocations = 0 }
+
+typedef struct LLGLQueryHeapDescriptor
+{
+    LLGLQueryType type;            /* = LLGLQueryTypeSamplesPassed */
+    uint32_t      numQueries;      /* = 1 */
+    bool          renderCondition; /* = false */
+}
+LLGLQueryHeapDescriptor;
+
+#define LLGL_QUERYHEAPDESCRIPTOR_INIT { .type = LLGLQueryTypeSamplesPassed, .numQueries = 1, .renderCondition = false }
+
+
+/* ----- Default values ----- */
+
+#ifndef __cplusplus
+
+static const LLGLQueryPipelineStatistics g_llglQueryPipelineStatisticsDefault = LLGL_QUERYPIPELINESTATISTICS_INIT;
+static const LLGLQueryHeapDescriptor     g_llglQueryHeapDescriptorDefault     = LLGL_QUERYHEAPDESCRIPTOR_INIT;
+
+#endif /* __cplusplus */
+
+
+#endif /* LLGL_C99_WRAPPER_QUERY_HEAP_FLAGS_H */
+
+
+
+/* ================================================================================ */
+
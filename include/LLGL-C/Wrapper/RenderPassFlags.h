@@ -0,0 +1,75 @@
+/*
+ * RenderPassFlags.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_RENDER_PASS_FLAGS_H
+#define LLGL_C99_WRAPPER_RENDER_PASS_FLAGS_H
+
+
+#include <stdint.h>
+#include <LLGL-C/Wrapper/Format.h>
+
+
+/* ----- Enumerations ----- */
+
+typedef enum LLGLAttachmentLoadOp
+{
+    LLGLAttachmentLoadOpUndefined,
+    LLGLAttachmentLoadOpLoad,
+    LLGLAttachmentLoadOpClear,
+}
+LLGLAttachmentLoadOp;
+
+typedef enum LLGLAttachmentStoreOp
+{
+    LLGLAttachmentStoreOpUndefined,
+    LLGLAttachmentStoreOpStore,
+}
+LLGLAttachmentStoreOp;
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLAttachmentFormatDescriptor
+{
+    LLGLFormat            format;  /* = LLGLFormatUndefined */
+    LLGLAttachmentLoadOp  loadOp;  /* = LLGLAttachmentLoadOpUndefined */
+    LLGLAttachmentStoreOp storeOp; /* = LLGLAttachmentStoreOpUndefined */
+}
+LLGLAttachmentFormatDescriptor;
+
+#define LLGL_ATTACHMENTFORMATDESCRIPTOR_INIT { .format = LLGLFormatUndefined, .loadOp = LLGLAttachmentLoadOpUndefined, .storeOp = LLGLAttachmentStoreOpUndefined }
+
+typedef struct LLGLRenderPassDescriptor
+{
+    LLGLAttachmentFormatDescriptor colorAttachments[8];
+    LLGLAttachmentFormatDescriptor depthAttachment;
+    LLGLAttachmentFormatDescriptor stencilAttachment;
+    uint32_t                       samples;             /* = 1 */
+}
+LLGLRenderPassDescriptor;
+
+#define LLGL_RENDERPASSDESCRIPTOR_INIT { .colorAttachments = { LLGL_ATTACHMENTFORMATDESCRIPTOR_INIT, LLGL_ATTACHMENTFORMATDESCRIPTOR_INIT, LLGL_ATTACHMENTFORMATDESCRIPTOR_INIT, LLGL_ATTACHMENTFORMATDESCRIPTOR_INIT, LLGL_ATTACHMENTFORMATDESCRIPTOR_INIT, LLGL_ATTACHMENTFORMATDESCRIPTOR_INIT, LLGL_ATTACHMENTFORMATDESCRIPTOR_INIT, LLGL_ATTACHMENTFORMATDESCRIPTOR_INIT }, .depthAttachment = LLGL_ATTACHMENTFORMATDESCRIPTOR_INIT, .stencilAttachment = LLGL_ATTACHMENTFORMATDESCRIPTOR_INIT, .samples = 1 }
+
+
+/* ----- Default values ----- */
+
+#ifndef __cplusplus
+
+static const LLGLAttachmentFormatDescriptor g_llglAttachmentFormatDescriptorDefault = LLGL_ATTACHMENTFORMATDESCRIPTOR_INIT;
+static const LLGLRenderPassDescriptor       g_llglRenderPassDescriptorDefault       = LLGL_RENDERPASSDESCRIPTOR_INIT;
+
+#endif /* __cplusplus */
+
+
+#endif /* LLGL_C99_WRAPPER_RENDER_PASS_FLAGS_H */
+
+
+
+/* ================================================================================ */
+
@@ -0,0 +1,261 @@
+/*
+ * RenderSystemFlags.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_RENDER_SYSTEM_FLAGS_H
+#define LLGL_C99_WRAPPER_RENDER_SYSTEM_FLAGS_H
+
+
+#include <stdbool.h>
+#include <stddef.h>
+#include <stdint.h>
+#include <LLGL-C/Types.h>
+#include <LLGL-C/Wrapper/Format.h>
+
+#if defined LLGL_OS_ANDROID
+#   include <android_native_app_glue.h>
+#endif /* defined LLGL_OS_ANDROID */
+
+
+/* ----- Constants ----- */
+
+#define LLGL_RENDERERID_UNDEFINED   ( 0x00000000 )
+#define LLGL_RENDERERID_NULL        ( 0x00000001 )
+#define LLGL_RENDERERID_OPENGL      ( 0x00000002 )
+#define LLGL_RENDERERID_OPENGLES1   ( 0x00000003 )
+#define LLGL_RENDERERID_OPENGLES2   ( 0x00000004 )
+#define LLGL_RENDERERID_OPENGLES3   ( 0x00000005 )
+#define LLGL_RENDERERID_DIRECT3D9   ( 0x00000006 )
+#define LLGL_RENDERERID_DIRECT3D10  ( 0x00000007 )
+#define LLGL_RENDERERID_DIRECT3D11  ( 0x00000008 )
+#define LLGL_RENDERERID_DIRECT3D12  ( 0x00000009 )
+#define LLGL_RENDERERID_VULKAN      ( 0x0000000A )
+#define LLGL_RENDERERID_METAL       ( 0x0000000B )
+#define LLGL_RENDERERID_RESERVED    ( 0x000000FF )
+
+
+/* ----- Enumerations ----- */
+
+typedef enum LLGLShadingLanguage
+{
+    LLGLShadingLanguageGLSL           = (0x10000),
+    LLGLShadingLanguageGLSL_110       = (0x10000|110),
+    LLGLShadingLanguageGLSL_120       = (0x10000|120),
+    LLGLShadingLanguageGLSL_130       = (0x10000|130),
+    LLGLShadingLanguageGLSL_140       = (0x10000|140),
+    LLGLShadingLanguageGLSL_150       = (0x10000|150),
+    LLGLShadingLanguageGLSL_330       = (0x10000|330),
+    LLGLShadingLanguageGLSL_400       = (0x10000|400),
+    LLGLShadingLanguageGLSL_410       = (0x10000|410),
+    LLGLShadingLanguageGLSL_420       = (0x10000|420),
+    LLGLShadingLanguageGLSL_430       = (0x10000|430),
+    LLGLShadingLanguageGLSL_440       = (0x10000|440),
+    LLGLShadingLanguageGLSL_450       = (0x10000|450),
+    LLGLShadingLanguageGLSL_460       = (0x10000|460),
+    LLGLShadingLanguageESSL           = (0x20000),
+    LLGLShadingLanguageESSL_100       = (0x20000|100),
+    LLGLShadingLanguageESSL_300       = (0x20000|300),
+    LLGLShadingLanguageESSL_310       = (0x20000|310),
+    LLGLShadingLanguageESSL_320       = (0x20000|320),
+    LLGLShadingLanguageHLSL           = (0x30000),
+    LLGLShadingLanguageHLSL_2_0       = (0x30000|200),
+    LLGLShadingLanguageHLSL_2_0a      = (0x30000|201),
+    LLGLShadingLanguageHLSL_2_0b      = (0x30000|202),
+    LLGLShadingLanguageHLSL_3_0       = (0x30000|300),
+    LLGLShadingLanguageHLSL_4_0       = (0x30000|400),
+    LLGLShadingLanguageHLSL_4_1       = (0x30000|410),
+    LLGLShadingLanguageHLSL_5_0       = (0x30000|500),
+    LLGLShadingLanguageHLSL_5_1       = (0x30000|510),
+    LLGLShadingLanguageHLSL_6_0       = (0x30000|600),
+    LLGLShadingLanguageHLSL_6_1       = (0x30000|601),
+    LLGLShadingLanguageHLSL_6_2       = (0x30000|602),
+    LLGLShadingLanguageHLSL_6_3       = (0x30000|603),
+    LLGLShadingLanguageHLSL_6_4       = (0x30000|604),
+    LLGLShadingLanguageMetal          = (0x40000),
+    LLGLShadingLanguageMetal_1_0      = (0x40000|100),
+    LLGLShadingLanguageMetal_1_1      = (0x40000|110),
+    LLGLShadingLanguageMetal_1_2      = (0x40000|120),
+    LLGLShadingLanguageMetal_2_0      = (0x40000|200),
+    LLGLShadingLanguageMetal_2_1      = (0x40000|210),
+    LLGLShadingLanguageSPIRV          = (0x50000),
+    LLGLShadingLanguageSPIRV_100      = (0x50000|100),
+    LLGLShadingLanguageVersionBitmask = 0x0000ffff,
+}
+LLGLShadingLanguage;
+
+typedef enum LLGLScreenOrigin
+{
+    LLGLScreenOriginLowerLeft,
+    LLGLScreenOriginUpperLeft,
+}
+LLGLScreenOrigin;
+
+typedef enum LLGLClippingRange
+{
+    LLGLClippingRangeMinusOneToOne,
+    LLGLClippingRangeZeroToOne,
+}
+LLGLClippingRange;
+
+typedef enum LLGLCPUAccess
+{
+    LLGLCPUAccessReadOnly,
+    LLGLCPUAccessWriteOnly,
+    LLGLCPUAccessWriteDiscard,
+    LLGLCPUAccessReadWrite,
+}
+LLGLCPUAccess;
+
+
+/* ----- Flags ----- */
+
+typedef enum LLGLRenderSystemFlags
+{
+    LLGLRenderSystemDebugDevice  = (1 << 0),
+    LLGLRenderSystemPreferNVIDIA = (1 << 1),
+    LLGLRenderSystemPreferAMD    = (1 << 2),
+    LLGLRenderSystemPreferIntel  = (1 << 3),
+}
+LLGLRenderSystemFlags;
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLRendererInfo
+{
+    const char*        rendererName;
+    const char*        deviceName;
+    const char*        vendorName;
+    const char*        shadingLanguageName;
+    size_t             numExtensionNames;   /* = 0 */
+    const char* const* extensionNames;      /* = NULL */
+    size_t             numPipelineCacheID;  /* = 0 */
+    const char*        pipelineCacheID;     /* = NULL */
+}
+LLGLRendererInfo;
+
+#define LLGL_RENDERERINFO_INIT { 0 }
+
+typedef struct LLGLRenderSystemDescriptor
+{
+    const char*           moduleName;
+    long                  flags;              /* = 0 */
+    void*                 profiler;           /* = NULL */
+    LLGLRenderingDebugger debugger;           /* = LLGL_NULL_OBJECT */
+    const void*           rendererConfig;     /* = NULL */
+    size_t                rendererConfigSize; /* = 0 */
+#if defined LLGL_OS_ANDROID
+    android_app*          androidApp;
+#endif /* defined LLGL_OS_ANDROID */
+}
+LLGLRenderSystemDescriptor;
+
+#define LLGL_RENDERSYSTEMDESCRIPTOR_INIT { .flags = 0, .rendererConfigSize = 0 }
+
+typedef struct LLGLRenderingFeatures
+{
+    bool hasRenderTargets;             /* = false */
+    bool has3DTextures;                /* = false */
+    bool hasCubeTextures;              /* = false */
+    bool hasArrayTextures;             /* = false */
+    bool hasCubeArrayTextures;         /* = false */
+    bool hasMultiSampleTextures;       /* = false */
+    bool hasMultiSampleArrayTextures;  /* = false */
+    bool hasTextureViews;              /* = false */
+    bool hasTextureViewSwizzle;        /* = false */
+    bool hasTextureViewFormatSwizzle;  /* = false */
+    bool hasBufferViews;               /* = false */
+    bool hasSamplers;                  /* LLGLRenderingFeatures.hasSamplers is deprecated since 0.04b; All backends must support sampler states either natively or emulated. */
+    bool hasConstantBuffers;           /* = false */
+    bool hasStorageBuffers;            /* = false */
+    bool hasUniforms;                  /* LLGLRenderingFeatures.hasUniforms is deprecated since 0.04b; All backends must support uniforms either natively or emulated. */
+    bool hasGeometryShaders;           /* = false */
+    bool hasTessellationShaders;       /* = false */
+    bool hasTessellatorStage;          /* = false */
+    bool hasComputeShaders;            /* = false */
+    bool hasInstancing;                /* = false */
+    bool hasOffsetInstancing;          /* = false */
+    bool hasIndirectDrawing;           /* = false */
+    bool hasViewportArrays;            /* = false */
+    bool hasConservativeRasterization; /* = false */
+    bool hasStreamOutputs;             /* = false */
+    bool hasLogicOp;                   /* = false */
+    bool hasPipelineCaching;           /* = false */
+    bool hasPipelineStatistics;        /* = false */
+    bool hasRenderCondition;           /* = false */
+}
+LLGLRenderingFeatures;
+
+#define LLGL_RENDERINGFEATURES_INIT { .hasRenderTargets = false, .has3DTextures = false, .hasCubeTextures = false, .hasArrayTextures = false, .hasCubeArrayTextures = false, .hasMultiSampleTextures = false, .hasMultiSampleArrayTextures = false, .hasTextureViews = false, .hasTextureViewSwizzle = false, .hasTextureViewFormatSwizzle = false, .hasBufferViews = false, .hasSamplers = true, .hasConstantBuffers = false, .hasStorageBuffers = false, .hasUniforms = true, .hasGeometryShaders = false, .hasTessellationShaders = false, .hasTessellatorStage = false, .hasComputeShaders = false, .hasInstancing = false, .hasOffsetInstancing = false, .hasIndirectDrawing = false, .hasViewportArrays = false, .hasConservativeRasterization = false, .hasStreamOutputs = false, .hasLogicOp = false, .hasPipelineCaching = false, .hasPipelineStatistics = false, .hasRenderCondition = false }
+
+typedef struct LLGLRenderingLimits
+{
+    float    lineWidthRange[2];                /* = {1.0f,1.0f} */
+    uint32_t maxTextureArrayLayers;            /* = 0 */
+    uint32_t maxColorAttachments;              /* = 0 */
+    uint32_t maxPatchVertices;                 /* = 0 */
+    uint32_t max1DTextureSize;                 /* = 0 */
+    uint32_t max2DTextureSize;                 /* = 0 */
+    uint32_t max3DTextureSize;                 /* = 0 */
+    uint32_t maxCubeTextureSize;               /* = 0 */
+    uint32_t maxAnisotropy;                    /* = 0 */
+    uint32_t maxComputeShaderWorkGroups[3];    /* = {0,0,0} */
+    uint32_t maxComputeShaderWorkGroupSize[3]; /* = {0,0,0} */
+    uint32_t maxViewports;                     /* = 0 */
+    uint32_t maxViewportSize[2];               /* = {0,0} */
+    uint64_t maxBufferSize;                    /* = 0 */
+    uint64_t maxConstantBufferSize;            /* = 0 */
+    uint32_t maxStreamOutputs;                 /* = 0 */
+    uint32_t maxTessFactor;                    /* = 0 */
+    uint64_t minConstantBufferAlignment;       /* = 0 */
+    uint64_t minSampledBufferAlignment;        /* = 0 */
+    uint64_t minStorageBufferAlignment;        /* = 0 */
+    uint32_t maxColorBufferSamples;            /* = 0 */
+    uint32_t maxDepthBufferSamples;            /* = 0 */
+    uint32_t maxStencilBufferSamples;          /* = 0 */
+    uint32_t maxNoAttachmentSamples;           /* = 0 */
+}
+LLGLRenderingLimits;
+
+#define LLGL_RENDERINGLIMITS_INIT { .lineWidthRange = {1.0f,1.0f}, .maxTextureArrayLayers = 0, .maxColorAttachments = 0, .maxPatchVertices = 0, .max1DTextureSize = 0, .max2DTextureSize = 0, .max3DTextureSize = 0, .maxCubeTextureSize = 0, .maxAnisotropy = 0, .maxComputeShaderWorkGroups = {0,0,0}, .maxComputeShaderWorkGroupSize = {0,0,0}, .maxViewports = 0, .maxViewportSize = {0,0}, .maxBufferSize = 0, .maxConstantBufferSize = 0, .maxStreamOutputs = 0, .maxTessFactor = 0, .minConstantBufferAlignment = 0, .minSampledBufferAlignment = 0, .minStorageBufferAlignment = 0, .maxColorBufferSamples = 0, .maxDepthBufferSamples = 0, .maxStencilBufferSamples = 0, .maxNoAttachmentSamples = 0 }
+
+typedef struct LLGLRenderingCapabilities
+{
+    LLGLScreenOrigin           screenOrigin;        /* = LLGLScreenOriginUpperLeft */
+    LLGLClippingRange          clippingRange;       /* = LLGLClippingRangeZeroToOne */
+    size_t                     numShadingLanguages; /* = 0 */
+    const LLGLShadingLanguage* shadingLanguages;    /* = NULL */
+    size_t                     numTextureFormats;   /* = 0 */
+    const LLGLFormat*          textureFormats;      /* = NULL */
+    LLGLRenderingFeatures      features;
+    LLGLRenderingLimits        limits;
+}
+LLGLRenderingCapabilities;
+
+#define LLGL_RENDERINGCAPABILITIES_INIT { .screenOrigin = LLGLScreenOriginUpperLeft, .clippingRange = LLGLClippingRangeZeroToOne, .features = LLGL_RENDERINGFEATURES_INIT, .limits = LLGL_RENDERINGLIMITS_INIT }
+
+
+/* ----- Default values ----- */
+
+#ifndef __cplusplus
+
+static const LLGLRendererInfo           g_llglRendererInfoDefault           = LLGL_RENDERERINFO_INIT;
+static const LLGLRenderSystemDescriptor g_llglRenderSystemDescriptorDefault = LLGL_RENDERSYSTEMDESCRIPTOR_INIT;
+static const LLGLRenderingFeatures      g_llglRenderingFeaturesDefault      = LLGL_RENDERINGFEATURES_INIT;
+static const LLGLRenderingLimits        g_llglRenderingLimitsDefault        = LLGL_RENDERINGLIMITS_INIT;
+static const LLGLRenderingCapabilities  g_llglRenderingCapabilitiesDefault  = LLGL_RENDERINGCAPABILITIES_INIT;
+
+#endif /* __cplusplus */
+
+
+#endif /* LLGL_C99_WRAPPER_RENDER_SYSTEM_FLAGS_H */
+
+
+
+/* ================================================================================ */
+
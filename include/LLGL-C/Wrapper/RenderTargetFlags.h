@@ -0,0 +1,62 @@
+/*
+ * RenderTargetFlags.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_RENDER_TARGET_FLAGS_H
+#define LLGL_C99_WRAPPER_RENDER_TARGET_FLAGS_H
+
+
+#include <stdint.h>
+#include <LLGL-C/Types.h>
+#include <LLGL-C/Wrapper/Format.h>
+#include <LLGL-C/Wrapper/Types.h>
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLAttachmentDescriptor
+{
+    LLGLFormat  format;     /* = LLGLFormatUndefined */
+    LLGLTexture texture;    /* = LLGL_NULL_OBJECT */
+    uint32_t    mipLevel;   /* = 0 */
+    uint32_t    arrayLayer; /* = 0 */
+}
+LLGLAttachmentDescriptor;
+
+#define LLGL_ATTACHMENTDESCRIPTOR_INIT { .format = LLGLFormatUndefined, .mipLevel = 0, .arrayLayer = 0 }
+
+typedef struct LLGLRenderTargetDescriptor
+{
+    LLGLRenderPass           renderPass;             /* = LLGL_NULL_OBJECT */
+    LLGLExtent2D             resolution;
+    uint32_t                 samples;                /* = 1 */
+    LLGLAttachmentDescriptor colorAttachments[8];
+    LLGLAttachmentDescriptor resolveAttachments[8];
+    LLGLAttachmentDescriptor depthStencilAttachment;
+}
+LLGLRenderTargetDescriptor;
+
+#define LLGL_RENDERTARGETDESCRIPTOR_INIT { .resolution = LLGL_EXTENT2D_INIT, .samples = 1, .colorAttachments = { LLGL_ATTACHMENTDESCRIPTOR_INIT, LLGL_ATTACHMENTDESCRIPTOR_INIT, LLGL_ATTACHMENTDESCRIPTOR_INIT, LLGL_ATTACHMENTDESCRIPTOR_INIT, LLGL_ATTACHMENTDESCRIPTOR_INIT, LLGL_ATTACHMENTDESCRIPTOR_INIT, LLGL_ATTACHMENTDESCRIPTOR_INIT, LLGL_ATTACHMENTDESCRIPTOR_INIT }, .resolveAttachments = { LLGL_ATTACHMENTDESCRIPTOR_INIT, LLGL_ATTACHMENTDESCRIPTOR_INIT, LLGL_ATTACHMENTDESCRIPTOR_INIT, LLGL_ATTACHMENTDESCRIPTOR_INIT, LLGL_ATTACHMENTDESCRIPTOR_INIT, LLGL_ATTACHMENTDESCRIPTOR_INIT, LLGL_ATTACHMENTDESCRIPTOR_INIT, LLGL_ATTACHMENTDESCRIPTOR_INIT }, .depthStencilAttachment = LLGL_ATTACHMENTDESCRIPTOR_INIT }
+
+
+/* ----- Default values ----- */
+
+#ifndef __cplusplus
+
+static const LLGLAttachmentDescriptor   g_llglAttachmentDescriptorDefault   = LLGL_ATTACHMENTDESCRIPTOR_INIT;
+static const LLGLRenderTargetDescriptor g_llglRenderTargetDescriptorDefault = LLGL_RENDERTARGETDESCRIPTOR_INIT;
+
+#endif /* __cplusplus */
+
+
+#endif /* LLGL_C99_WRAPPER_RENDER_TARGET_FLAGS_H */
+
+
+
+/* ================================================================================ */
+
@@ -0,0 +1,70 @@
+/*
+ * ResourceHeapFlags.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_RESOURCE_HEAP_FLAGS_H
+#define LLGL_C99_WRAPPER_RESOURCE_HEAP_FLAGS_H
+
+
+#include <stdint.h>
+#include <LLGL-C/Types.h>
+#include <LLGL-C/Wrapper/BufferFlags.h>
+#include <LLGL-C/Wrapper/TextureFlags.h>
+
+
+/* ----- Flags ----- */
+
+typedef enum LLGLBarrierFlags
+{
+    LLGLBarrierStorageBuffer  = (1 << 0),
+    LLGLBarrierStorageTexture = (1 << 1),
+    LLGLBarrierStorage        = (LLGLBarrierStorageBuffer | LLGLBarrierStorageTexture),
+}
+LLGLBarrierFlags;
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLResourceViewDescriptor
+{
+    LLGLResource              resource;     /* = LLGL_NULL_OBJECT */
+    LLGLTextureViewDescriptor textureView;
+    LLGLBufferViewDescriptor  bufferView;
+    uint32_t                  initialCount; /* = 0 */
+}
+LLGLResourceViewDescriptor;
+
+#define LLGL_RESOURCEVIEWDESCRIPTOR_INIT { .textureView = LLGL_TEXTUREVIEWDESCRIPTOR_INIT, .bufferView = LLGL_BUFFERVIEWDESCRIPTOR_INIT, .initialCount = 0 }
+
+typedef struct LLGLResourceHeapDescriptor
+{
+    LLGLPipelineLayout pipelineLayout;   /* = LLGL_NULL_OBJECT */
+    uint32_t           numResourceViews; /* = 0 */
+    long               barrierFlags;     /* = 0 */
+}
+LLGLResourceHeapDescriptor;
+
+#define LLGL_RESOURCEHEAPDESCRIPTOR_INIT { .numResourceViews = 0, .barrierFlags = 0 }
+
+
+/* ----- Default values ----- */
+
+#ifndef __cplusplus
+
+static const LLGLResourceViewDescriptor g_llglResourceViewDescriptorDefault = LLGL_RESOURCEVIEWDESCRIPTOR_INIT;
+static const LLGLResourceHeapDescriptor g_llglResourceHeapDescriptorDefault = LLGL_RESOURCEHEAPDESCRIPTOR_INIT;
+
+#endif /* __cplusplus */
+
+
+#endif /* LLGL_C99_WRAPPER_RESOURCE_HEAP_FLAGS_H */
+
+
+
+/* ================================================================================ */
+
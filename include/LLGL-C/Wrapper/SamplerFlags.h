@@ -0,0 +1,77 @@
+/*
+ * SamplerFlags.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_SAMPLER_FLAGS_H
+#define LLGL_C99_WRAPPER_SAMPLER_FLAGS_H
+
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <LLGL-C/Wrapper/PipelineStateFlags.h>
+
+
+/* ----- Enumerations ----- */
+
+typedef enum LLGLSamplerAddressMode
+{
+    LLGLSamplerAddressModeRepeat,
+    LLGLSamplerAddressModeMirror,
+    LLGLSamplerAddressModeClamp,
+    LLGLSamplerAddressModeBorder,
+    LLGLSamplerAddressModeMirrorOnce,
+}
+LLGLSamplerAddressMode;
+
+typedef enum LLGLSamplerFilter
+{
+    LLGLSamplerFilterNearest,
+    LLGLSamplerFilterLinear,
+}
+LLGLSamplerFilter;
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLSamplerDescriptor
+{
+    LLGLSamplerAddressMode addressModeU;   /* = LLGLSamplerAddressModeRepeat */
+    LLGLSamplerAddressMode addressModeV;   /* = LLGLSamplerAddressModeRepeat */
+    LLGLSamplerAddressMode addressModeW;   /* = LLGLSamplerAddressModeRepeat */
+    LLGLSamplerFilter      minFilter;      /* = LLGLSamplerFilterLinear */
+    LLGLSamplerFilter      magFilter;      /* = LLGLSamplerFilterLinear */
+    LLGLSamplerFilter      mipMapFilter;   /* = LLGLSamplerFilterLinear */
+    bool                   mipMapEnabled;  /* = true */
+    float                  mipMapLODBias;  /* = 0.0f */
+    float                  minLOD;         /* = 0.0f */
+    float                  maxLOD;         /* = 1000.0f */
+    uint32_t               maxAnisotropy;  /* = 1 */
+    bool                   compareEnabled; /* = false */
+    LLGLCompareOp          compareOp;      /* = LLGLCompareOpLess */
+    float                  borderColor[4]; /* = {0.0f,0.0f,0.0f,0.0f} */
+}
+LLGLSamplerDescriptor;
+
+#define LLGL_SAMPLERDESCRIPTOR_INIT { .addressModeU = LLGLSamplerAddressModeRepeat, .addressModeV = LLGLSamplerAddressModeRepeat, .addressModeW = LLGLSamplerAddressModeRepeat, .minFilter = LLGLSamplerFilterLinear, .magFilter = LLGLSamplerFilterLinear, .mipMapFilter = LLGLSamplerFilterLinear, .mipMapEnabled = true, .mipMapLODBias = 0.0f, .minLOD = 0.0f, .maxLOD = 1000.0f, .maxAnisotropy = 1, .compareEnabled = false, .compareOp = LLGLCompareOpLess, .borderColor = {0.0f,0.0f,0.0f,0.0f} }
+
+
+/* ----- Default values ----- */
+
+#ifndef __cplusplus
+
+static const LLGLSamplerDescriptor g_llglSamplerDescriptorDefault = LLGL_SAMPLERDESCRIPTOR_INIT;
+
+#endif /* __cplusplus */
+
+
+#endif /* LLGL_C99_WRAPPER_SAMPLER_FLAGS_H */
+
+
+
+/* ================================================================================ */
+
@@ -0,0 +1,152 @@
+/*
+ * ShaderFlags.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_SHADER_FLAGS_H
+#define LLGL_C99_WRAPPER_SHADER_FLAGS_H
+
+
+#include <stddef.h>
+#include <LLGL-C/Wrapper/FragmentAttribute.h>
+#include <LLGL-C/Wrapper/Types.h>
+#include <LLGL-C/Wrapper/VertexAttribute.h>
+
+
+/* ----- Enumerations ----- */
+
+typedef enum LLGLShaderType
+{
+    LLGLShaderTypeUndefined,
+    LLGLShaderTypeVertex,
+    LLGLShaderTypeTessControl,
+    LLGLShaderTypeTessEvaluation,
+    LLGLShaderTypeGeometry,
+    LLGLShaderTypeFragment,
+    LLGLShaderTypeCompute,
+}
+LLGLShaderType;
+
+typedef enum LLGLShaderSourceType
+{
+    LLGLShaderSourceTypeCodeString,
+    LLGLShaderSourceTypeCodeFile,
+    LLGLShaderSourceTypeBinaryBuffer,
+    LLGLShaderSourceTypeBinaryFile,
+}
+LLGLShaderSourceType;
+
+
+/* ----- Flags ----- */
+
+typedef enum LLGLShaderCompileFlags
+{
+    LLGLShaderCompileDebug               = (1 << 0),
+    LLGLShaderCompileNoOptimization      = (1 << 1),
+    LLGLShaderCompileOptimizationLevel1  = (1 << 2),
+    LLGLShaderCompileOptimizationLevel2  = (1 << 3),
+    LLGLShaderCompileOptimizationLevel3  = (1 << 4),
+    LLGLShaderCompileWarningsAreErrors   = (1 << 5),
+    LLGLShaderCompilePatchClippingOrigin = (1 << 6),
+    LLGLShaderCompileSeparateShader      = (1 << 7),
+    LLGLShaderCompileDefaultLibrary      = (1 << 8),
+}
+LLGLShaderCompileFlags;
+
+typedef enum LLGLStageFlags
+{
+    LLGLStageVertexStage         = (1 << 0),
+    LLGLStageTessControlStage    = (1 << 1),
+    LLGLStageTessEvaluationStage = (1 << 2),
+    LLGLStageGeometryStage       = (1 << 3),
+    LLGLStageFragmentStage       = (1 << 4),
+    LLGLStageComputeStage        = (1 << 5),
+    LLGLStageAllTessStages       = (LLGLStageTessControlStage | LLGLStageTessEvaluationStage),
+    LLGLStageAllGraphicsStages   = (LLGLStageVertexStage | LLGLStageAllTessStages | LLGLStageGeometryStage | LLGLStageFragmentStage),
+    LLGLStageAllStages           = (LLGLStageAllGraphicsStages | LLGLStageComputeStage),
+}
+LLGLStageFlags;
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLShaderMacro
+{
+    const char* name;       /* = NULL */
+    const char* definition; /* = NULL */
+}
+LLGLShaderMacro;
+
+#define LLGL_SHADERMACRO_INIT { 0 }
+
+typedef struct LLGLVertexShaderAttributes
+{
+    size_t                     numInputAttribs;  /* = 0 */
+    const LLGLVertexAttribute* inputAttribs;     /* = NULL */
+    size_t                     numOutputAttribs; /* = 0 */
+    const LLGLVertexAttribute* outputAttribs;    /* = NULL */
+}
+LLGLVertexShaderAttributes;
+
+#define LLGL_VERTEXSHADERATTRIBUTES_INIT { 0 }
+
+typedef struct LLGLFragmentShaderAttributes
+{
+    size_t                       numOutputAttribs; /* = 0 */
+    const LLGLFragmentAttribute* outputAttribs;    /* = NULL */
+}
+LLGLFragmentShaderAttributes;
+
+#define LLGL_FRAGMENTSHADERATTRIBUTES_INIT { 0 }
+
+typedef struct LLGLComputeShaderAttributes
+{
+    LLGLExtent3D workGroupSize; /* = {1,1,1} */
+}
+LLGLComputeShaderAttributes;
+
+#define LLGL_COMPUTESHADERATTRIBUTES_INIT { .workGroupSize = {1,1,1} }
+
+typedef struct LLGLShaderDescriptor
+{
+    LLGLShaderType               type;       /* = LLGLShaderTypeUndefined */
+    const char*                  source;     /* = NULL */
+    size_t                       sourceSize; /* = 0 */
+    LLGLShaderSourceType         sourceType; /* = LLGLShaderSourceTypeCodeFile */
+    const char*                  entryPoint; /* = NULL */
+    const char*                  profile;    /* = NULL */
+    const LLGLShaderMacro*       defines;    /* = NULL */
+    long                         flags;      /* = 0 */
+    const char*                  name;       /* = NULL */
+    LLGLVertexShaderAttributes   vertex;
+    LLGLFragmentShaderAttributes fragment;
+    LLGLComputeShaderAttributes  compute;
+}
+LLGLShaderDescriptor;
+
+#define LLGL_SHADERDESCRIPTOR_INIT { .type = LLGLShaderTypeUndefined, .sourceSize = 0, .sourceType = LLGLShaderSourceTypeCodeFile, .flags = 0, .compute = LLGL_COMPUTESHADERATTRIBUTES_INIT }
+
+
+/* ----- Default values ----- */
+
+#ifndef __cplusplus
+
+static const LLGLShaderMacro              g_llglShaderMacroDefault              = LLGL_SHADERMACRO_INIT;
+static const LLGLVertexShaderAttributes   g_llglVertexShaderAttributesDefault   = LLGL_VERTEXSHADERATTRIBUTES_INIT;
+static const LLGLFragmentShaderAttributes g_llglFragmentShaderAttributesDefault = LLGL_FRAGMENTSHADERATTRIBUTES_INIT;
+static const LLGLComputeShaderAttributes  g_llglComputeShaderAttributesDefault  = LLGL_COMPUTESHADERATTRIBUTES_INIT;
+static const LLGLShaderDescriptor         g_llglShaderDescriptorDefault         = LLGL_SHADERDESCRIPTOR_INIT;
+
+#endif /* __cplusplus */
+
+
+#endif /* LLGL_C99_WRAPPER_SHADER_FLAGS_H */
+
+
+
+/* ================================================================================ */
+
@@ -0,0 +1,79 @@
+/*
+ * ShaderReflection.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_SHADER_REFLECTION_H
+#define LLGL_C99_WRAPPER_SHADER_REFLECTION_H
+
+
+#include <stddef.h>
+#include <stdint.h>
+#include <LLGL-C/Wrapper/PipelineLayoutFlags.h>
+#include <LLGL-C/Wrapper/ShaderFlags.h>
+
+
+/* ----- Enumerations ----- */
+
+typedef enum LLGLStorageBufferType
+{
+    LLGLStorageBufferTypeUndefined,
+    LLGLStorageBufferTypeTypedBuffer,
+    LLGLStorageBufferTypeStructuredBuffer,
+    LLGLStorageBufferTypeByteAddressBuffer,
+    LLGLStorageBufferTypeRWTypedBuffer,
+    LLGLStorageBufferTypeRWStructuredBuffer,
+    LLGLStorageBufferTypeRWByteAddressBuffer,
+    LLGLStorageBufferTypeAppendStructuredBuffer,
+    LLGLStorageBufferTypeConsumeStructuredBuffer,
+}
+LLGLStorageBufferType;
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLShaderResourceReflection
+{
+    LLGLBindingDescriptor binding;
+    uint32_t              constantBufferSize; /* = 0 */
+    LLGLStorageBufferType storageBufferType;  /* = LLGLStorageBufferTypeUndefined */
+}
+LLGLShaderResourceReflection;
+
+#define LLGL_SHADERRESOURCEREFLECTION_INIT { .binding = LLGL_BINDINGDESCRIPTOR_INIT, .constantBufferSize = 0, .storageBufferType = LLGLStorageBufferTypeUndefined }
+
+typedef struct LLGLShaderReflection
+{
+    size_t                              numResources; /* = 0 */
+    const LLGLShaderResourceReflection* resources;    /* = NULL */
+    size_t                              numUniforms;  /* = 0 */
+    const LLGLUniformDescriptor*        uniforms;     /* = NULL */
+    LLGLVertexShaderAttributes          vertex;
+    LLGLFragmentShaderAttributes        fragment;
+    LLGLComputeShaderAttributes         compute;
+}
+LLGLShaderReflection;
+
+#define LLGL_SHADERREFLECTION_INIT { .compute = LLGL_COMPUTESHADERATTRIBUTES_INIT }
+
+
+/* ----- Default values ----- */
+
+#ifndef __cplusplus
+
+static const LLGLShaderResourceReflection g_llglShaderResourceReflectionDefault = LLGL_SHADERRESOURCEREFLECTION_INIT;
+static const LLGLShaderReflection         g_llglShaderReflectionDefault         = LLGL_SHADERREFLECTION_INIT;
+
+#endif /* __cplusplus */
+
+
+#endif /* LLGL_C99_WRAPPER_SHADER_REFLECTION_H */
+
+
+
+/* ================================================================================ */
+
@@ -0,0 +1,61 @@
+/*
+ * SwapChainFlags.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_SWAP_CHAIN_FLAGS_H
+#define LLGL_C99_WRAPPER_SWAP_CHAIN_FLAGS_H
+
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <LLGL-C/Wrapper/Types.h>
+
+
+/* ----- Flags ----- */
+
+typedef enum LLGLResizeBuffersFlags
+{
+    LLGLResizeBuffersAdaptSurface   = (1 << 0),
+    LLGLResizeBuffersFullscreenMode = (1 << 1),
+    LLGLResizeBuffersWindowedMode   = (1 << 2),
+}
+LLGLResizeBuffersFlags;
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLSwapChainDescriptor
+{
+    LLGLExtent2D resolution;
+    int          colorBits;   /* = 32 */
+    int          depthBits;   /* = 24 */
+    int          stencilBits; /* = 8 */
+    uint32_t     samples;     /* = 1 */
+    uint32_t     swapBuffers; /* = 2 */
+    bool         fullscreen;  /* = false */
+}
+LLGLSwapChainDescriptor;
+
+#define LLGL_SWAPCHAINDESCRIPTOR_INIT { .resolution = LLGL_EXTENT2D_INIT, .colorBits = 32, .depthBits = 24, .stencilBits = 8, .samples = 1, .swapBuffers = 2, .fullscreen = false }
+
+
+/* ----- Default values ----- */
+
+#ifndef __cplusplus
+
+static const LLGLSwapChainDescriptor g_llglSwapChainDescriptorDefault = LLGL_SWAPCHAINDESCRIPTOR_INIT;
+
+#endif /* __cplusplus */
+
+
+#endif /* LLGL_C99_WRAPPER_SWAP_CHAIN_FLAGS_H */
+
+
+
+/* ================================================================================ */
+
@@ -0,0 +1,44 @@
+/*
+ * SystemValue.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_SYSTEM_VALUE_H
+#define LLGL_C99_WRAPPER_SYSTEM_VALUE_H
+
+
+/* ----- Enumerations ----- */
+
+typedef enum LLGLSystemValue
+{
+    LLGLSystemValueUndefined,
+    LLGLSystemValueClipDistance,
+    LLGLSystemValueColor,
+    LLGLSystemValueCullDistance,
+    LLGLSystemValueDepth,
+    LLGLSystemValueDepthGreater,
+    LLGLSystemValueDepthLess,
+    LLGLSystemValueFrontFacing,
+    LLGLSystemValueInstanceID,
+    LLGLSystemValuePosition,
+    LLGLSystemValuePrimitiveID,
+    LLGLSystemValueRenderTargetIndex,
+    LLGLSystemValueSampleMask,
+    LLGLSystemValueSampleID,
+    LLGLSystemValueStencil,
+    LLGLSystemValueVertexID,
+    LLGLSystemValueViewportIndex,
+}
+LLGLSystemValue;
+
+
+#endif /* LLGL_C99_WRAPPER_SYSTEM_VALUE_H */
+
+
+
+/* ================================================================================ */
+
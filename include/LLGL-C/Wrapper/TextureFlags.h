@@ -0,0 +1,154 @@
+/*
+ * TextureFlags.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_TEXTURE_FLAGS_H
+#define LLGL_C99_WRAPPER_TEXTURE_FLAGS_H
+
+
+#include <stdint.h>
+#include <LLGL-C/Wrapper/CommandBufferFlags.h>
+#include <LLGL-C/Wrapper/Format.h>
+#include <LLGL-C/Wrapper/ResourceFlags.h>
+#include <LLGL-C/Wrapper/Types.h>
+
+
+/* ----- Enumerations ----- */
+
+typedef enum LLGLTextureType
+{
+    LLGLTextureTypeTexture1D,
+    LLGLTextureTypeTexture2D,
+    LLGLTextureTypeTexture3D,
+    LLGLTextureTypeTextureCube,
+    LLGLTextureTypeTexture1DArray,
+    LLGLTextureTypeTexture2DArray,
+    LLGLTextureTypeTextureCubeArray,
+    LLGLTextureTypeTexture2DMS,
+    LLGLTextureTypeTexture2DMSArray,
+}
+LLGLTextureType;
+
+typedef enum LLGLTextureSwizzle
+{
+    LLGLTextureSwizzleZero,
+    LLGLTextureSwizzleOne,
+    LLGLTextureSwizzleRed,
+    LLGLTextureSwizzleGreen,
+    LLGLTextureSwizzleBlue,
+    LLGLTextureSwizzleAlpha,
+}
+LLGLTextureSwizzle;
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLTextureSwizzleRGBA
+{
+    LLGLTextureSwizzle r : 8; /* = LLGLTextureSwizzleRed */
+    LLGLTextureSwizzle g : 8; /* = LLGLTextureSwizzleGreen */
+    LLGLTextureSwizzle b : 8; /* = LLGLTextureSwizzleBlue */
+    LLGLTextureSwizzle a : 8; /* = LLGLTextureSwizzleAlpha */
+}
+LLGLTextureSwizzleRGBA;
+
+#define LLGL_TEXTURESWIZZLERGBA_INIT { .r = LLGLTextureSwizzleRed, .g = LLGLTextureSwizzleGreen, .b = LLGLTextureSwizzleBlue, .a = LLGLTextureSwizzleAlpha }
+
+typedef struct LLGLTextureSubresource
+{
+    uint32_t baseArrayLayer; /* = 0 */
+    uint32_t numArrayLayers; /* = 1 */
+    uint32_t baseMipLevel;   /* = 0 */
+    uint32_t numMipLevels;   /* = 1 */
+}
+LLGLTextureSubresource;
+
+#define LLGL_TEXTURESUBRESOURCE_INIT { .baseArrayLayer = 0, .numArrayLayers = 1, .baseMipLevel = 0, .numMipLevels = 1 }
+
+typedef struct LLGLTextureLocation
+{
+    LLGLOffset3D offset;
+    uint32_t     arrayLayer; /* = 0 */
+    uint32_t     mipLevel;   /* = 0 */
+}
+LLGLTextureLocation;
+
+#define LLGL_TEXTURELOCATION_INIT { .offset = LLGL_OFFSET3D_INIT, .arrayLayer = 0, .mipLevel = 0 }
+
+typedef struct LLGLTextureRegion
+{
+    LLGLTextureSubresource subresource;
+    LLGLOffset3D           offset;
+    LLGLExtent3D           extent;
+}
+LLGLTextureRegion;
+
+#define LLGL_TEXTUREREGION_INIT { .subresource = LLGL_TEXTURESUBRESOURCE_INIT, .offset = LLGL_OFFSET3D_INIT, .extent = LLGL_EXTENT3D_INIT }
+
+typedef struct LLGLTextureDescriptor
+{
+    LLGLTextureType type;        /* = LLGLTextureTypeTexture2D */
+    long            bindFlags;   /* = (LLGLBindSampled | LLGLBindColorAttachment) */
+    long            miscFlags;   /* = (LLGLMiscFixedSamples | LLGLMiscGenerateMips) */
+    LLGLFormat      format;      /* = LLGLFormatRGBA8UNorm */
+    LLGLExtent3D    extent;      /* = {1,1,1} */
+    uint32_t        arrayLayers; /* = 1 */
+    uint32_t        mipLevels;   /* = 0 */
+    uint32_t        samples;     /* = 1 */
+    LLGLClearValue  clearValue;
+}
+LLGLTextureDescriptor;
+
+#define LLGL_TEXTUREDESCRIPTOR_INIT { .type = LLGLTextureTypeTexture2D, .bindFlags = (LLGLBindSampled | LLGLBindColorAttachment), .miscFlags = (LLGLMiscFixedSamples | LLGLMiscGenerateMips), .format = LLGLFormatRGBA8UNorm, .extent = {1,1,1}, .arrayLayers = 1, .mipLevels = 0, .samples = 1, .clearValue = LLGL_CLEARVALUE_INIT }
+
+typedef struct LLGLTextureViewDescriptor
+{
+    LLGLTextureType        type;        /* = LLGLTextureTypeTexture2D */
+    LLGLFormat             format;      /* = LLGLFormatRGBA8UNorm */
+    LLGLTextureSubresource subresource;
+    LLGLTextureSwizzleRGBA swizzle;
+}
+LLGLTextureViewDescriptor;
+
+#define LLGL_TEXTUREVIEWDESCRIPTOR_INIT { .type = LLGLTextureTypeTexture2D, .format = LLGLFormatRGBA8UNorm, .subresource = LLGL_TEXTURESUBRESOURCE_INIT, .swizzle = LLGL_TEXTURESWIZZLERGBA_INIT }
+
+typedef struct LLGLSubresourceFootprint
+{
+    uint64_t size;         /* = 0 */
+    uint32_t rowAlignment; /* = 0 */
+    uint32_t rowSize;      /* = 0 */
+    uint32_t rowStride;    /* = 0 */
+    uint32_t layerSize;    /* = 0 */
+    uint32_t layerStride;  /* = 0 */
+}
+LLGLSubresourceFootprint;
+
+#define LLGL_SUBRESOURCEFOOTPRINT_INIT { .size = 0, .rowAlignment = 0, .rowSize = 0, .rowStride = 0, .layerSize = 0, .layerStride = 0 }
+
+
+/* ----- Default values ----- */
+
+#ifndef __cplusplus
+
+static const LLGLTextureSwizzleRGBA    g_llglTextureSwizzleRGBADefault    = LLGL_TEXTURESWIZZLERGBA_INIT;
+static const LLGLTextureSubresource    g_llglTextureSubresourceDefault    = LLGL_TEXTURESUBRESOURCE_INIT;
+static const LLGLTextureLocation       g_llglTextureLocationDefault       = LLGL_TEXTURELOCATION_INIT;
+static const LLGLTextureRegion         g_llglTextureRegionDefault         = LLGL_TEXTUREREGION_INIT;
+static const LLGLTextureDescriptor     g_llglTextureDescriptorDefault     = LLGL_TEXTUREDESCRIPTOR_INIT;
+static const LLGLTextureViewDescriptor g_llglTextureViewDescriptorDefault = LLGL_TEXTUREVIEWDESCRIPTOR_INIT;
+static const LLGLSubresourceFootprint  g_llglSubresourceFootprintDefault  = LLGL_SUBRESOURCEFOOTPRINT_INIT;
+
+#endif /* __cplusplus */
+
+
+#endif /* LLGL_C99_WRAPPER_TEXTURE_FLAGS_H */
+
+
+
+/* ================================================================================ */
+
@@ -0,0 +1,75 @@
+/*
+ * Types.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_TYPES_H
+#define LLGL_C99_WRAPPER_TYPES_H
+
+
+#include <stdint.h>
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLExtent2D
+{
+    uint32_t width;  /* = 0 */
+    uint32_t height; /* = 0 */
+}
+LLGLExtent2D;
+
+#define LLGL_EXTENT2D_INIT { .width = 0, .height = 0 }
+
+typedef struct LLGLExtent3D
+{
+    uint32_t width;  /* = 0 */
+    uint32_t height; /* = 0 */
+    uint32_t depth;  /* = 0 */
+}
+LLGLExtent3D;
+
+#define LLGL_EXTENT3D_INIT { .width = 0, .height = 0, .depth = 0 }
+
+typedef struct LLGLOffset2D
+{
+    int32_t x; /* = 0 */
+    int32_t y; /* = 0 */
+}
+LLGLOffset2D;
+
+#define LLGL_OFFSET2D_INIT { .x = 0, .y = 0 }
+
+typedef struct LLGLOffset3D
+{
+    int32_t x; /* = 0 */
+    int32_t y; /* = 0 */
+    int32_t z; /* = 0 */
+}
+LLGLOffset3D;
+
+#define LLGL_OFFSET3D_INIT { .x = 0, .y = 0, .z = 0 }
+
+
+/* ----- Default values ----- */
+
+#ifndef __cplusplus
+
+static const LLGLExtent2D g_llglExtent2DDefault = LLGL_EXTENT2D_INIT;
+static const LLGLExtent3D g_llglExtent3DDefault = LLGL_EXTENT3D_INIT;
+static const LLGLOffset2D g_llglOffset2DDefault = LLGL_OFFSET2D_INIT;
+static const LLGLOffset3D g_llglOffset3DDefault = LLGL_OFFSET3D_INIT;
+
+#endif /* __cplusplus */
+
+
+#endif /* LLGL_C99_WRAPPER_TYPES_H */
+
+
+
+/* ================================================================================ */
+
@@ -0,0 +1,52 @@
+/*
+ * VertexAttribute.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_VERTEX_ATTRIBUTE_H
+#define LLGL_C99_WRAPPER_VERTEX_ATTRIBUTE_H
+
+
+#include <stdint.h>
+#include <LLGL-C/Wrapper/Format.h>
+#include <LLGL-C/Wrapper/SystemValue.h>
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLVertexAttribute
+{
+    const char*     name;
+    LLGLFormat      format;          /* = LLGLFormatRGBA32Float */
+    uint32_t        location;        /* = 0 */
+    uint32_t        semanticIndex;   /* = 0 */
+    LLGLSystemValue systemValue;     /* = LLGLSystemValueUndefined */
+    uint32_t        slot;            /* = 0 */
+    uint32_t        offset;          /* = 0 */
+    uint32_t        stride;          /* = 0 */
+    uint32_t        instanceDivisor; /* = 0 */
+}
+LLGLVertexAttribute;
+
+#define LLGL_VERTEXATTRIBUTE_INIT { .format = LLGLFormatRGBA32Float, .location = 0, .semanticIndex = 0, .systemValue = LLGLSystemValueUndefined, .slot = 0, .offset = 0, .stride = 0, .instanceDivisor = 0 }
+
+
+/* ----- Default values ----- */
+
+#ifndef __cplusplus
+
+static const LLGLVertexAttribute g_llglVertexAttributeDefault = LLGL_VERTEXATTRIBUTE_INIT;
+
+#endif /* __cplusplus */
+
+
+#endif /* LLGL_C99_WRAPPER_VERTEX_ATTRIBUTE_H */
+
+
+
+/* ================================================================================ */
+
@@ -0,0 +1,63 @@
+/*
+ * WindowFlags.h
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+#ifndef LLGL_C99_WRAPPER_WINDOW_FLAGS_H
+#define LLGL_C99_WRAPPER_WINDOW_FLAGS_H
+
+
+#include <stddef.h>
+#include <LLGL-C/Wrapper/Types.h>
+
+
+/* ----- Flags ----- */
+
+typedef enum LLGLWindowFlags
+{
+    LLGLWindowVisible              = (1 << 0),
+    LLGLWindowBorderless           = (1 << 1),
+    LLGLWindowResizable            = (1 << 2),
+    LLGLWindowCentered             = (1 << 3),
+    LLGLWindowAcceptDropFiles      = (1 << 4),
+    LLGLWindowDisableClearOnResize = (1 << 5),
+    LLGLWindowDisableSizeScaling   = (1 << 6),
+}
+LLGLWindowFlags;
+
+
+/* ----- Structures ----- */
+
+typedef struct LLGLWindowDescriptor
+{
+    const char*  title;
+    LLGLOffset2D position;
+    LLGLExtent2D size;
+    long         flags;             /* = 0 */
+    const void*  windowContext;     /* = NULL */
+    size_t       windowContextSize; /* = 0 */
+}
+LLGLWindowDescriptor;
+
+#define LLGL_WINDOWDESCRIPTOR_INIT { .position = LLGL_OFFSET2D_INIT, .size = LLGL_EXTENT2D_INIT, .flags = 0, .windowContextSize = 0 }
+
+
+/* ----- Default values ----- */
+
+#ifndef __cplusplus
+
+static const LLGLWindowDescriptor g_llglWindowDescriptorDefault = LLGL_WINDOWDESCRIPTOR_INIT;
+
+#endif /* __cplusplus */
+
+
+#endif /* LLGL_C99_WRAPPER_WINDOW_FLAGS_H */
+
+
+
+/* ================================================================================ */
+
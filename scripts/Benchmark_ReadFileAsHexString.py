@@ -0,0 +1,74 @@
+#
+# Benchmark_ReadFileAsHexString.py
+#
+# Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+# Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+#
+
+# Measures the throughput of ReadFileAsHexString.py for the serial path and for printHexStringParallel with 1, 2, 4, and 8 worker processes.
+# The parallel path is called directly, so it is measured even on inputs and machines where '-jobs N' would fall back to the serial path.
+# Usage: 'python3 scripts/Benchmark_ReadFileAsHexString.py [SIZE_MB [FILE]]'; a random file of SIZE_MB (64 by default) is generated if FILE is omitted.
+
+import hashlib
+import os
+import sys
+import tempfile
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+sys.path.insert(0, SCRIPT_DIR)
+import ReadFileAsHexString
+
+# Number of worker processes that are measured
+WORKER_COUNTS = [1, 2, 4, 8]
+
+# Number of runs per configuration; the fastest run is reported
+NUM_RUNS = 3
+
+# Writes the output of 'encode(out)' to a temporary file and returns the duration of the fastest run and the SHA-256 digest of the output
+def measure(encode):
+    bestDuration = None
+    digest = None
+    for _ in range(NUM_RUNS):
+        with tempfile.TemporaryFile('w+') as out:
+            startTime = time.perf_counter()
+            encode(out)
+            out.flush()
+            duration = time.perf_counter() - startTime
+            out.seek(0)
+            digest = hashlib.sha256(out.read().encode('ascii')).hexdigest()
+        bestDuration = duration if bestDuration is None else min(bestDuration, duration)
+    return bestDuration, digest
+
+def runBenchmark(filename):
+    size = os.path.getsize(filename)
+    options = dict(columns=16, spaces=4, offsets='cxx')
+
+    def report(label, duration):
+        print(f'{label:<10} {duration:8.3f} s {size / (1024*1024) / max(duration, 1e-9):8.1f} MB/s')
+
+    print(f'{size} bytes, {ReadFileAsHexString.availableCpus()} CPUs available, fastest of {NUM_RUNS} runs')
+    serialDuration, serialDigest = measure(lambda out: ReadFileAsHexString.printHexString(filename, out=out, **options))
+    report('serial', serialDuration)
+    for jobs in WORKER_COUNTS:
+        duration, digest = measure(lambda out: ReadFileAsHexString.printHexStringParallel(filename, jobs, out=out, **options))
+        if digest != serialDigest:
+            raise RuntimeError(f'output of {jobs} jobs differs from the serial path')
+        report(f'{jobs} jobs', duration)
+
+def main(args):
+    sizeMB = int(args[1]) if len(args) > 1 else 64
+    if len(args) > 2:
+        runBenchmark(args[2])
+    else:
+        with tempfile.TemporaryDirectory() as tempDir:
+            filename = os.path.join(tempDir, 'blob.bin')
+            with open(filename, 'wb') as file:
+                for _ in range(sizeMB):
+                    file.write(os.urandom(1024*1024))
+            runBenchmark(filename)
+
+if __name__ == '__main__':
+    # The worker processes import this file as module when they are spawned instead of forked
+    main(sys.argv)
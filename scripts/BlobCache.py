@@ -0,0 +1,65 @@
+#
+# BlobCache.py
+#
+# Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+# Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+#
+
+# Content hashes and the cache file of generated output files for ReadFileAsHexString.py (see -cache and -dedupe).
+# The cache file has one 'KEY OUTPUT' entry per line, where OUTPUT is relative to the cache file.
+
+import hashlib
+import os
+
+# Returns the SHA-256 digest of the content of the specified file as hex string
+def fileHash(filename, chunkSize=65536):
+    digest = hashlib.sha256()
+    try:
+        with open(filename, mode="rb") as file:
+            while True:
+                chunk = file.read(chunkSize)
+                if not chunk:
+                    break
+                digest.update(chunk)
+    except IOError:
+        raise OSError('failed to open file: ' + filename)
+    return digest.hexdigest()
+
+# Returns the SHA-256 digest of the specified bytes as hex string, which equals fileHash for a file with the same content
+def dataHash(data):
+    return hashlib.sha256(data).hexdigest()
+
+# Returns the dictionary of output files to their keys in the specified cache file, which is empty if the file does not exist yet
+def readCache(filename):
+    cache = {}
+    if os.path.isfile(filename):
+        try:
+            with open(filename) as file:
+                for line in file:
+                    tokens = line.split()
+                    if len(tokens) == 2:
+                        cache[tokens[1]] = tokens[0]
+        except IOError:
+            raise OSError('failed to read cache file: ' + filename)
+    return cache
+
+# Writes the specified dictionary of output files to their keys, one 'KEY OUTPUT' entry per line
+def writeCache(filename, cache):
+    try:
+        with open(filename, 'w') as file:
+            for outputFile in sorted(cache):
+                file.write(f'{cache[outputFile]} {outputFile}\n')
+    except IOError:
+        raise OSError('failed to write cache file: ' + filename)
+
+# Returns the cache key of an output file, which changes with the content of the input file, the declaration options, and the generator script
+def cacheKey(scriptHash, inputHash, name, includePath, options):
+    return hashlib.sha256(f'{scriptHash} {inputHash} {name} {includePath} {options}'.encode('utf-8')).hexdigest()
+
+# Returns true if the specified output file exists and its entry 'cachedFile' in the cache has the specified key.
+# Otherwise, the key is stored in the cache, since the output file is about to be generated.
+def isUpToDate(cache, cachedFile, key, outputFile):
+    if cache.get(cachedFile) == key and os.path.isfile(outputFile):
+        return True
+    cache[cachedFile] = key
+    return False
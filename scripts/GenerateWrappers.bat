@@ -62,22 +62,50 @@ set INPUT_FN=^
     %CINCLUDE%\Timer.h ^
     %CINCLUDE%\Window.h
 
-REM Generate wrapper for C99, C#
-call :Generate .\LLGLWrapper.h -c99
+REM Generate wrapper for C99 (one header per module in .\Wrapper plus umbrella header), C#
+call :Generate .\LLGLWrapper.h "-c99 -split=.\Wrapper"
 call :Generate .\LLGLWrapper.cs -csharp -fn
 
+REM Generate Python ctypes module
+call :Generate .\LLGLWrapper.py -python -fn
+
+REM Generate NumPy structured dtypes for blittable structs
+call :Generate .\LLGLDtypes.py -numpy
+
+REM Generate command stream decoder for C99 and encoder for C#
+call :Generate .\LLGLCommandStream.h "-c99 -cmdstream" -fn
+call :Generate .\LLGLCommandStream.cs "-csharp -cmdstream" -fn
+
+REM Generate enum and flags string conversion tables for C99 and C#
+call :Generate .\LLGLEnumStrings.h "-c99 -strings"
+call :Generate .\LLGLEnumStrings.cs "-csharp -strings"
+
+REM Generate format attribute tables from native Format.cpp for C99 and C#
+call :Generate .\LLGLFormatTable.h "-c99 -formats=..\sources\Renderer\Format.cpp"
+call :Generate .\LLGLFormatTable.cs "-csharp -formats=..\sources\Renderer\Format.cpp"
+
+REM Generate C99/C++ enum, flags, and struct layout assertions
+call :Generate .\C99TypeAssertions.cpp "-c99 -layout"
+
+REM Generate C99 struct reflection tables with generic hasher and serializer
+call :Generate .\LLGLReflection.h "-c99 -reflection"
+
+REM Generate C benchmark program for the C99 wrapper
+call :Generate .\Test_WrapperBenchmark.c "-c99 -bench" -fn
+
 exit /B 0
 
 :Generate
 set OUTPUT=%~1
+set NAME=%~n1
 set LANGUAGE=%~2
 set FUNCTIONS=%~3
 
 REM Generate wrapper
 if "%FUNCTIONS%"=="" (
-    set ARGS=WrapperGen "-name=LLGLWrapper" %LANGUAGE% %INPUT%
+    set ARGS=WrapperGen "-name=%NAME%" %LANGUAGE% %INPUT%
 ) else (
-    set ARGS=WrapperGen "-name=LLGLWrapper" %LANGUAGE% %FUNCTIONS% %INPUT_FN%
+    set ARGS=WrapperGen "-name=%NAME%" %LANGUAGE% %FUNCTIONS% %INPUT_FN%
 )
 
 REM Run Python script to parse LLGL headers and write result into output file
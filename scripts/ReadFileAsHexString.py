@@ -5,88 +5,708 @@
 # Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
 #
 
+import array
+import binascii
+import collections
+import io
+import lzma
+import mmap
+import multiprocessing
+import os
+import re
 import sys
+import time
+import zlib
+
+import BlobCache
+import ResourcePack
 
 def printHelp():
     print("help:")
     print("  prints the input file as hex encoded string in C/C++ syntax")
     print("usage:")
     print("  ReadFileAsHexString.py FILE [flags]")
+    print("  ReadFileAsHexString.py -decl ([-name NAME] FILE)+ [-manifest MANIFEST] [flags]")
+    print("  ReadFileAsHexString.py -pack PACK ([-name NAME] FILE)+ [-manifest MANIFEST] [-pack-file FILE] [flags]")
+    print("  import ReadFileAsHexString; text = ReadFileAsHexString.encodeHexString(BYTES|PATH|STREAM, columns, spaces, offsets, paren)")
     print("flags:")
     print("  -len:           prints the size in bytes of the input file only")
     print("  -col N:         prints N hex encoded bytes for each row (16 by default)")
     print("  -spaces N:      prints N spaces at the beginning of each row (0 by default)")
     print("  -paren:         prints parenthesis around the output (disabled by default)")
     print("  -offsets STYLE: prints address offsets for each row (disabled by default); accepted styles: 'c', 'cxx'/'c++'")
+    print("  -bench:         encodes the input file without printing it and reports the throughput in MB/s")
+    print("  -decl:          prints 'static const char* NAME' and 'static const std::size_t NAME_Len' declarations for all input files,")
+    print("                  reading each file only once; NAME is the filename by default and every character that is not valid")
+    print("                  in a C identifier is replaced by '_' (with a leading '_' if NAME starts with a digit)")
+    print("  -name NAME:     declaration name for the next input file (with -decl)")
+    print("  -format FMT:    output format (string by default); accepted formats: 'string', 'array' (unsigned char initializer),")
+    print("                  'words' (uint32_t initializer, input size must be a multiple of 4 and -col a multiple of 4),")
+    print("                  'embed' (#embed relative to the output file with array fallback, with -decl and -out or manifest OUTPUT),")
+    print("                  'incbin' (extern declarations, with -decl and -asm)")
+    print("  -align N:       declares arrays with alignas(N) (with -decl); N must be a power of two")
+    print("  -endian ORDER:  byte order of words for format 'words' (little by default); accepted orders: 'little', 'big'")
+    print("  -compress CODEC: compresses the content of declarations with format 'string' or 'array' and emits NAME_DecompressedLen,")
+    print("                  NAME_Codec, and NAME_CRC32 (with -decl); accepted codecs: 'zlib' (ID 1), 'lzma' (ID 2, .xz container)")
+    print("  -min-saving P:  stores content uncompressed (codec ID 0) if compression saves less than P percent (10 by default)")
+    print("  -asm FILE:      writes the GNU assembler file with .incbin directives for format 'incbin' to FILE")
+    print("  -pack NAME:     prints a C header for a resource pack NAME_Data that contains all input files, each aligned to -align bytes")
+    print("                  (16 by default), with an index NAME_Entries sorted by name and a binary search NAME_Find(name);")
+    print("                  entries are named by -name or manifest NAME, or the filename by default; manifest OUTPUT is ignored")
+    print("  -pack-file FILE: writes the resource pack to FILE, e.g. to be memory mapped, instead of embedding it in the header (with -pack)")
+    print("  -cache FILE:    skips output files of declarations whose input content, name, and flags are unchanged since the last run")
+    print("                  with the same cache FILE, which stores the SHA-256 keys of all output files (with -decl)")
+    print("  -dedupe:        declares input files with the same content as aliases of the first declaration on stdout, shares .incbin")
+    print("                  directives for format 'incbin', and shares the content within a resource pack (with -decl or -pack)")
+    print("  -out FILE:      writes the output to FILE instead of stdout; declarations with manifest OUTPUT are still written to that file")
+    print("  -jobs N:        encodes input files with N processes, each formatting parts of whole rows (1 by default; inputs below 8 MiB and single-CPU machines are encoded serially)")
+    print("  -progress:      reports the progress of encoding each input file on stderr")
+    print("  -manifest FILE: reads input files from FILE, one 'INPUT [NAME [OUTPUT]]' entry per line (with -decl);")
+    print("                  declarations with OUTPUT are written to that file instead of stdout; relative paths are relative to FILE")
 
-def fatal(msg):
-    print(sys.argv[0] + ': ' + msg)
-    sys.exit(1)
-
-def readBytes(filename, chunkSize=8192):
+def readChunks(filename, chunkSize=65536):
     try:
         with open(filename, mode="rb") as file:
             while True:
                 chunk = file.read(chunkSize)
                 if chunk:
-                    for b in chunk:
-                        yield b
+                    yield chunk
                 else:
                     break
     except IOError:
-        fatal('failed to open file: ' + filename)
+        raise OSError('failed to open file: ' + filename)
 
-# Generates the C/C++ header file with a string that contains the binary content
-def printHexString(filename, columns=16, spaces=0, offsets='', paren=False):
-    if paren:
-        print('(')
-    byteRange = (0, 0)
-    def writeNewline():
+# Size of the ranges of mapped pages that are released by mapChunks after they have been consumed
+MAP_RELEASE_SIZE = 16*1024*1024
+
+# Returns the content of the file in chunks like readChunks, but as memoryview slices of a read-only memory mapping, so the content is not copied.
+# Pages before the current chunk are released as the chunks are consumed, so the memory use does not grow with the size of the file.
+# Files that cannot be mapped, e.g. empty files and pipes, are read with readChunks.
+def mapChunks(filename, chunkSize=65536):
+    try:
+        file = open(filename, mode="rb")
+    except IOError:
+        raise OSError('failed to open file: ' + filename)
+    with file:
+        try:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            mapping = None
+    if mapping is None:
+        yield from readChunks(filename, chunkSize)
+        return
+    canRelease = hasattr(mapping, 'madvise') and hasattr(mmap, 'MADV_DONTNEED')
+    if canRelease and hasattr(mmap, 'MADV_SEQUENTIAL'):
+        mapping.madvise(mmap.MADV_SEQUENTIAL)
+    view = memoryview(mapping)
+    released = 0
+    for i in range(0, len(view), chunkSize):
+        yield view[i:i + chunkSize]
+        if canRelease and i - released >= MAP_RELEASE_SIZE:
+            # The mapping is read-only, so released pages are only read again from the file if they are still referenced
+            end = i // mmap.PAGESIZE * mmap.PAGESIZE
+            mapping.madvise(mmap.MADV_DONTNEED, released, end - released)
+            released = end
+
+# Passes the specified chunks through and reports the progress of 'totalSize' bytes on stderr at most once per 'interval' seconds
+def progressChunks(chunks, totalSize, label, interval=0.5):
+    startTime = time.perf_counter()
+    reportTime = startTime
+    done = 0
+
+    def report(end):
+        duration = max(time.perf_counter() - startTime, 1e-9)
+        percent = 100.0 * done / totalSize if totalSize > 0 else 100.0
+        sys.stderr.write(f'\r{label}: {done / (1024*1024):.1f} of {totalSize / (1024*1024):.1f} MB ({percent:.1f}%), {done / (1024*1024) / duration:.1f} MB/s{end}')
+        sys.stderr.flush()
+
+    for chunk in chunks:
+        yield chunk
+        done += len(chunk)
+        if time.perf_counter() - reportTime >= interval:
+            reportTime = time.perf_counter()
+            report('')
+    report('\n')
+
+# Returns each token of 'tokenBytes' bytes as hex digits between the specified prefix and suffix, e.g. '\xHH' escape sequences by default.
+# The hex digits are interleaved with slice assignments instead of formatting each byte separately.
+def encodeHex(data, prefix=b'\\x', suffix=b'', tokenBytes=1):
+    n = len(data) // tokenBytes
+    numDigits = tokenBytes * 2
+    digits = binascii.hexlify(data).upper()
+    tokenLen = len(prefix) + numDigits + len(suffix)
+    encoded = bytearray(n * tokenLen)
+    for i, c in enumerate(prefix):
+        encoded[i::tokenLen] = bytes([c]) * n
+    for i in range(numDigits):
+        encoded[len(prefix) + i::tokenLen] = digits[i::numDigits]
+    for i, c in enumerate(suffix):
+        encoded[len(prefix) + numDigits + i::tokenLen] = bytes([c]) * n
+    return encoded
+
+# Returns the data with the byte order of each 32-bit word reversed, so the hex digits of little-endian words can be encoded in order
+def swapWords(data):
+    words = array.array('I')
+    words.frombytes(data)
+    words.byteswap()
+    return words.tobytes()
+
+# Returns the hex numbers of the specified range with 8 digits, or up to 16 digits as specified, as one string of ASCII bytes
+def encodeOffsets(start, stop, step, numDigits=8):
+    values = array.array('I' if numDigits <= 8 else 'Q', range(start, stop, step))
+    if sys.byteorder == 'little':
+        values.byteswap()
+    digits = binascii.hexlify(values.tobytes()).upper()
+    if numDigits <= 8 or numDigits == 16:
+        return digits
+    # Remove the leading zeros of each 16 digit number
+    encoded = bytearray(len(digits) // 16 * numDigits)
+    for i in range(numDigits):
+        encoded[i::numDigits] = digits[16 - numDigits + i::16]
+    return encoded
+
+# Assembles rows of equal length from the specified segments, each given as (block, width): a block of 'width' bytes is repeated in every row,
+# a larger block contains the segment of all rows back to back. Each column is copied with one slice assignment, so there is no per-row loop.
+def interleaveRows(segments, numRows):
+    rowLen = sum(width for _, width in segments)
+    rows = bytearray(rowLen * numRows)
+    pos = 0
+    for block, width in segments:
+        for i in range(width):
+            rows[pos + i::rowLen] = block[i::width] if len(block) > width else block[i:i + 1] * numRows
+        pos += width
+    return rows
+
+# Row formats as (row begin, token prefix, token suffix, row end, token bytes) for each format that is printed row by row;
+# trailing whitespace of the last token in each row is removed
+rowFormats = {
+    'string': ('"', b'\\x', b'', '"', 1),
+    'array': ('', b'0x', b', ', '', 1),
+    'words': ('', b'0x', b', ', '', 4)
+}
+
+SPIRV_MAGIC = 0x07230203
+
+# Checks whether content of the specified size, starting with the specified bytes, can be encoded as 32-bit words with the specified byte order
+def checkWords(size, head, endian, source):
+    if size % 4 != 0:
+        raise ValueError(f"size of input must be a multiple of 4 to be encoded as 32-bit words, but got {size} bytes: {source}")
+    if len(head) >= 4 and int.from_bytes(head[:4], endian) == int.from_bytes(SPIRV_MAGIC.to_bytes(4, 'little'), 'big'):
+        # Words of a SPIR-V module must start with its magic number in the byte order of the target
+        raise ValueError(f"SPIR-V module has opposite byte order of {endian}-endian words: {source}")
+
+# Checks whether the input file can be encoded as 32-bit words with the specified byte order
+def validateWords(filename, endian):
+    try:
+        size = os.path.getsize(filename)
+        with open(filename, mode="rb") as file:
+            head = file.read(4)
+    except OSError:
+        raise OSError('failed to open file: ' + filename)
+    checkWords(size, head, endian, filename)
+
+# Returns the chunk size for the specified number of bytes per row, so each chunk consists of whole rows
+def rowChunkSize(columns):
+    return max(1, 65536 // max(1, columns)) * max(1, columns)
+
+# Returns the specified bytes in chunks of the specified size
+def sliceChunks(data, chunkSize):
+    for i in range(0, len(data), chunkSize):
+        yield data[i:i + chunkSize]
+
+# Generates the C/C++ header file with a string (or array initializer) that contains the binary content and returns the number of bytes
+# If 'progress' is true, the progress is reported on stderr. If 'jobs' is greater than 1, the rows are encoded by that many processes,
+# unless only one CPU is available or the input is too small for the pool to pay off (see useParallelJobs).
+def printHexString(filename, columns=16, spaces=0, offsets='', paren=False, out=None, format='string', endian='little', progress=False, jobs=1):
+    if rowFormats[format][4] > 1:
+        validateWords(filename, endian)
+    if useParallelJobs(filename, jobs):
+        return printHexStringParallel(filename, jobs, columns, spaces, offsets, paren, out, format, endian, progress)
+    chunks = mapChunks(filename, rowChunkSize(columns))
+    if progress:
+        chunks = progressChunks(chunks, os.path.getsize(filename), filename)
+    return printHexChunks(chunks, columns, spaces, offsets, paren, out, format, endian)
+
+# Returns the number of bytes per row, which must be a multiple of the token size of the specified format
+def rowColumns(columns, format):
+    columns = max(1, columns)
+    tokenBytes = rowFormats[format][4]
+    if tokenBytes > 1 and columns % tokenBytes != 0:
+        raise ValueError(f"number of bytes per row must be a multiple of {tokenBytes} for format '{format}', but got {columns}")
+    return columns
+
+# Checks the number of bytes per row and, for format 'words', the size and byte order of all (inputFile, name, outputFile) entries,
+# so invalid options are reported before any output file is opened
+def validateEntries(entries, columns, format, endian):
+    rowColumns(columns, format if format in rowFormats else 'string')
+    if format == 'words':
+        for inputFile, _, _ in entries:
+            validateWords(inputFile, endian)
+
+# Returns the hex encoded rows of the specified bytes, which start at the specified offset within the input. Each row is formatted independently
+# of the others, so the rows of the input can be formatted in any number of parts of whole rows. If the size is not a multiple of 'columns',
+# the last row is incomplete, which must only be the case for the last part of the input.
+def formatRows(data, offset, columns=16, spaces=0, offsets='', format='string', endian='little'):
+    indent = ' '*spaces
+    rowBegin, tokenPrefix, tokenSuffix, rowClose, tokenBytes = rowFormats[format]
+    tokenLen = len(tokenPrefix) + tokenBytes*2 + len(tokenSuffix)
+    trimLen = len(tokenSuffix) - len(tokenSuffix.rstrip())
+    columnTokens = columns // tokenBytes
+
+    def rowEnd(first, last):
         if offsets in ['c++', 'cxx']:
-            print('" // 0x{0:0{2}X} - 0x{1:0{2}X}'.format(byteRange[0], byteRange[1], 8))
+            return rowClose + ' // 0x{0:0{2}X} - 0x{1:0{2}X}\n'.format(first, last, 8)
         elif offsets == 'c':
-            print('" /* 0x{0:0{2}X} - 0x{1:0{2}X} */'.format(byteRange[0], byteRange[1], 8))
+            return rowClose + ' /* 0x{0:0{2}X} - 0x{1:0{2}X} */\n'.format(first, last, 8)
         else:
-            print('"')
-    c = 0
-    for b in readBytes(filename):
-        if c == 0:
-            if spaces > 0:
-                print(' '*spaces, end='')
-            print('"', end='')
-        print('\\x{:02X}'.format(b), end='')
-        c += 1
-        if c >= columns:
-            c = 0
-            writeNewline()
-            byteRange = (byteRange[1] + 1, byteRange[1])
-        byteRange = (byteRange[0], byteRange[1] + 1)
-    if c > 0:
-        writeNewline()
+            return rowClose + '\n'
+
+    def encodeTokens(data):
+        return encodeHex(swapWords(data) if tokenBytes == 4 and endian == 'little' else data, tokenPrefix, tokenSuffix, tokenBytes)
+
+    def encodeRows(data):
+        encoded = encodeTokens(data)
+        if trimLen > 0:
+            del encoded[columnTokens*tokenLen - 1::columnTokens*tokenLen]
+        return encoded
+
+    def formatFullRows(data, offset):
+        numRows = len(data) // columns
+        rowLen = columnTokens*tokenLen - trimLen
+        segments = [ ((indent + rowBegin).encode(), len(indent) + len(rowBegin)), (encodeRows(data), rowLen) ]
+        numDigits = max(8, len(f'{offset + len(data) - 1:X}'))
+        if offsets and len(f'{offset:08X}') < numDigits:
+            # Offsets with more than 8 digits vary in width within these rows, so format the rows one by one
+            encoded = segments[1][0].decode('ascii')
+            return ''.join(
+                indent + rowBegin + encoded[i*rowLen:(i + 1)*rowLen] + rowEnd(offset + i*columns, offset + (i + 1)*columns - 1)
+                for i in range(numRows)
+            )
+        # Split the row end into its constant parts and the first and last offset of each row
+        parts = rowEnd(0, 0).split('00000000')
+        segments.append((parts[0].encode(), len(parts[0])))
+        if offsets:
+            segments += [
+                (encodeOffsets(offset, offset + len(data), columns, numDigits), numDigits),
+                (parts[1].encode(), len(parts[1])),
+                (encodeOffsets(offset + columns - 1, offset + len(data), columns, numDigits), numDigits),
+                (parts[2].encode(), len(parts[2]))
+            ]
+        return interleaveRows(segments, numRows).decode('ascii')
+
+    size = len(data) // columns * columns
+    text = formatFullRows(data[:size], offset) if size > 0 else ''
+    if size < len(data):
+        # The last offset of an incomplete last row is one past its last byte
+        encoded = encodeTokens(data[size:]).decode('ascii')
+        text += indent + rowBegin + encoded[:len(encoded) - trimLen] + rowEnd(offset + size, offset + len(data))
+    return text
+
+# Generates the hex encoded rows of the specified chunks of bytes, which may be of any size, and returns the number of bytes
+def printHexChunks(chunks, columns=16, spaces=0, offsets='', paren=False, out=None, format='string', endian='little'):
+    out = out or sys.stdout
+    columns = rowColumns(columns, format)
+    if paren:
+        out.write('(\n')
+    offset = 0
+    pending = b''
+    for chunk in chunks:
+        data = pending + chunk if pending else chunk
+        size = len(data) // columns * columns
+        if size > 0:
+            out.write(formatRows(data[:size], offset, columns, spaces, offsets, format, endian))
+            offset += size
+        pending = bytes(data[size:])
+    if pending:
+        out.write(formatRows(pending, offset, columns, spaces, offsets, format, endian))
     if paren:
-        print(')')
+        out.write(')\n')
+    return offset + len(pending)
+
+# Size of the parts of the input that are formatted by the worker processes of printHexStringParallel
+PARALLEL_PART_SIZE = 1024*1024
+
+# Minimum input size for printHexStringParallel; smaller inputs are encoded faster than the worker processes are started
+PARALLEL_MIN_SIZE = 8*PARALLEL_PART_SIZE
+
+# Returns the number of CPUs this process can run on
+def availableCpus():
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+# Returns true if the specified file is to be encoded by printHexStringParallel with the specified number of jobs.
+# Pipes, inputs below PARALLEL_MIN_SIZE, and machines with a single CPU use the serial path, where more processes only add overhead.
+def useParallelJobs(filename, jobs):
+    return jobs > 1 and os.path.isfile(filename) and os.path.getsize(filename) >= PARALLEL_MIN_SIZE and availableCpus() > 1
+
+# Memory mapping of the input file in each worker process of printHexStringParallel
+workerMapping = None
+
+def initWorker(filename):
+    global workerMapping
+    with open(filename, mode="rb") as file:
+        workerMapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+# Returns the hex encoded rows of the specified range of the input file, which is mapped by initWorker
+def formatMappedRows(start, stop, columns, spaces, offsets, format, endian):
+    data = workerMapping[start:stop]
+    if hasattr(workerMapping, 'madvise') and hasattr(mmap, 'MADV_DONTNEED'):
+        # The range has been copied, so its pages can be released (see mapChunks)
+        first = start // mmap.PAGESIZE * mmap.PAGESIZE
+        workerMapping.madvise(mmap.MADV_DONTNEED, first, stop - first)
+    return formatRows(data, start, columns, spaces, offsets, format, endian)
+
+# Generates the same output as printHexString, but the input file is split into parts of whole rows that are formatted by a pool of 'jobs' processes,
+# each of which maps the input file into memory. The formatted parts are written in order, and at most two parts per process are pending at a time.
+def printHexStringParallel(filename, jobs, columns=16, spaces=0, offsets='', paren=False, out=None, format='string', endian='little', progress=False):
+    out = out or sys.stdout
+    columns = rowColumns(columns, format)
+    size = os.path.getsize(filename)
+    partSize = max(1, PARALLEL_PART_SIZE // columns) * columns
+
+    # Returns the ranges of all parts as they are written, so the progress is reported for the output
+    def writeParts(pool):
+        pending = collections.deque()
+        for start in range(0, size, partSize):
+            part = range(start, min(start + partSize, size))
+            pending.append((part, pool.apply_async(formatMappedRows, (part.start, part.stop, columns, spaces, offsets, format, endian))))
+            if len(pending) >= 2*jobs:
+                part, result = pending.popleft()
+                out.write(result.get())
+                yield part
+        while pending:
+            part, result = pending.popleft()
+            out.write(result.get())
+            yield part
+
+    if paren:
+        out.write('(\n')
+    with multiprocessing.Pool(jobs, initWorker, (filename,)) as pool:
+        writtenParts = writeParts(pool)
+        if progress:
+            writtenParts = progressChunks(writtenParts, size, filename)
+        for _ in writtenParts:
+            pass
+    if paren:
+        out.write(')\n')
+    return size
+
+# Returns the content of the specified binary stream in chunks of the specified size
+def streamChunks(stream, chunkSize=65536):
+    while True:
+        chunk = stream.read(chunkSize)
+        if not chunk:
+            break
+        if not isinstance(chunk, (bytes, bytearray)):
+            raise ValueError(f"stream must be opened in binary mode, but read {type(chunk).__name__}")
+        yield chunk
+
+# Returns the hex encoded rows of the specified source as text, or writes them to 'out' and returns the number of bytes if 'out' is specified.
+# The source can be a bytes-like object, a binary stream, or the path of a file. This is the function to use when this file is imported as module,
+# e.g. 'encodeHexString(data, spaces=4, offsets='cxx')' returns the same text as the command line 'ReadFileAsHexString.py FILE -spaces 4 -offsets cxx'.
+def encodeHexString(source, columns=16, spaces=0, offsets='', paren=False, out=None, format='string', endian='little', jobs=1):
+    if not format in rowFormats:
+        raise ValueError(f"accepted formats are 'string', 'array', and 'words', but got '{format}'")
+    if not offsets in ['', 'c', 'cxx', 'c++']:
+        raise ValueError(f"accepted offset styles are 'c', 'cxx', and 'c++', but got '{offsets}'")
+    target = io.StringIO() if out is None else out
+    if hasattr(source, 'read') and rowFormats[format][4] > 1:
+        # Words are validated for their total size, so the stream is read entirely
+        source = b''.join(streamChunks(source))
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = memoryview(source).cast('B')
+        if rowFormats[format][4] > 1:
+            checkWords(len(data), bytes(data[:4]), endian, 'bytes')
+        n = printHexChunks(sliceChunks(data, rowChunkSize(columns)), columns, spaces, offsets, paren, target, format, endian)
+    elif hasattr(source, 'read'):
+        n = printHexChunks(streamChunks(source, rowChunkSize(columns)), columns, spaces, offsets, paren, target, format, endian)
+    else:
+        n = printHexString(os.fspath(source), columns, spaces, offsets, paren, target, format, endian, False, jobs)
+    return n if out is not None else target.getvalue()
+
+# Encodes the input file without printing it and reports the throughput of the encoder
+def printBenchmark(filename, columns=16, spaces=0, offsets='', paren=False, format='string', endian='little', jobs=1):
+    size = os.path.getsize(filename)
+    with open(os.devnull, 'w') as devnull:
+        startTime = time.perf_counter()
+        printHexString(filename, columns, spaces, offsets, paren, devnull, format, endian, False, jobs)
+        duration = time.perf_counter() - startTime
+    print(f'{size} bytes encoded in {duration:.3f} s ({size / (1024*1024) / max(duration, 1e-9):.1f} MB/s)')
 
 def printFileSize(filename, paren=False):
-    n = 0
-    for _ in readBytes(filename):
-        n += 1
+    try:
+        n = os.path.getsize(filename)
+    except OSError:
+        raise OSError('failed to open file: ' + filename)
     if paren:
         print(f'( {str(n)} )')
     else:
         print(str(n))
 
-args = sys.argv
-if len(args) < 2:
-    printHelp()
-    sys.exit(1)
+# Returns the declaration name for the specified name, which is the filename by default, as a valid C identifier:
+# every character other than [A-Za-z0-9_] is replaced by '_'; this is the only place where declaration names are derived
+def declName(name):
+    name = re.sub(r'[^A-Za-z0-9_]', '_', name)
+    return '_' + name if name[:1].isdigit() else name
+
+# Codec IDs that are emitted as NAME_Codec for compressed declarations
+codecIDs = {
+    'none': 0,
+    'zlib': 1,
+    'lzma': 2
+}
+
+def compressData(data, codec):
+    if codec == 'zlib':
+        return zlib.compress(data, 9)
+    elif codec == 'lzma':
+        return lzma.compress(data, preset=9 | lzma.PRESET_EXTREME)
+    return data
+
+# Returns the (payload, codec) for the specified content; the content is stored uncompressed if the saving is below the specified percentage.
+# Reports the compression ratio on stderr, since stdout may be the output.
+def compressPayload(data, codec, minSaving, name):
+    compressed = compressData(data, codec)
+    saving = 100.0 * (1.0 - len(compressed) / len(data)) if len(data) > 0 else 0.0
+    if saving < minSaving:
+        print(f'{name}: {len(data)} bytes stored uncompressed ({codec} would save {saving:.1f}%, threshold is {minSaving:g}%)', file=sys.stderr)
+        return (data, 'none')
+    print(f'{name}: {len(data)} -> {len(compressed)} bytes with {codec} ({len(compressed) * 100.0 / len(data):.1f}%)', file=sys.stderr)
+    return (compressed, codec)
+
+# Generates the declarations of the binary content and its length in the specified format; for all formats except 'incbin', the length is counted
+# while encoding, so the file is read only once. Formats 'embed' and 'incbin' refer to the input file by the specified include path.
+# If 'align' is non-zero, arrays are declared with alignas(align). If 'compress' specifies a codec, the content is compressed unless
+# the saving is below 'minSaving' percent, and the codec, decompressed size, and CRC-32 of the decompressed content are declared as well.
+def printDeclaration(filename, name, columns=16, spaces=0, offsets='', out=None, format='string', includePath='', align=0, endian='little', compress='', minSaving=10.0,
+                     progress=False, jobs=1):
+    out = out or sys.stdout
+    alignSpec = f'alignas({align}) ' if align > 0 else ''
+
+    payload = None
+    if compress:
+        if not format in ['string', 'array']:
+            raise ValueError(f"compression requires format 'string' or 'array', but got '{format}'")
+        data = b''.join(readChunks(filename))
+        payload, codec = compressPayload(data, compress, minSaving, name)
+
+    def printBody(bodyFormat):
+        if payload is None:
+            return printHexString(filename, columns, spaces, offsets, False, out, bodyFormat, endian, progress, jobs)
+        return printHexChunks(sliceChunks(payload, rowChunkSize(columns)), columns, spaces, offsets, False, out, bodyFormat, endian)
+
+    if format == 'string':
+        out.write(f'static const char* {name} =\n')
+        n = printBody('string')
+        out.write(';\n')
+    elif format == 'incbin':
+        # The content is included by the assembler (see printIncbinAssembly), so only the symbol is declared here
+        try:
+            n = os.path.getsize(filename)
+        except OSError:
+            raise OSError('failed to open file: ' + filename)
+        out.write(f'extern "C" const unsigned char {name}[];\n')
+    elif format == 'words':
+        # Words are only valid on targets with the byte order they were encoded for
+        validateWords(filename, endian)
+        out.write(f'#if defined __BYTE_ORDER__ && __BYTE_ORDER__ != __ORDER_{endian.upper()}_ENDIAN__\n')
+        out.write(f'#   error "{name} is encoded for {endian}-endian targets"\n')
+        out.write('#endif\n')
+        out.write(f'{alignSpec}static const std::uint32_t {name}[] =\n')
+        out.write('{\n')
+        n = printHexString(filename, columns, spaces, offsets, False, out, 'words', endian, progress, jobs)
+        if n == 0:
+            # Arrays of size zero are ill-formed
+            out.write(' '*spaces + '0\n')
+        out.write('};\n')
+    else:
+        if format == 'embed':
+            # #embed requires C23 or C++26, so the numeric initializer is kept as fallback for other compilers
+            out.write('#if defined __has_embed\n')
+            out.write(f'#   if __has_embed("{includePath}")\n')
+            out.write(f'#       define {name}_HAS_EMBED\n')
+            out.write('#   endif\n')
+            out.write('#endif\n')
+        out.write(f'{alignSpec}static const unsigned char {name}[] =\n')
+        out.write('{\n')
+        if format == 'embed':
+            out.write(f'#ifdef {name}_HAS_EMBED\n')
+            out.write(f'#embed "{includePath}" if_empty(0)\n')
+            out.write('#else\n')
+        n = printBody('array')
+        if n == 0:
+            # Arrays of size zero are ill-formed
+            out.write(' '*spaces + '0\n')
+        if format == 'embed':
+            out.write('#endif\n')
+        out.write('};\n')
+        if format == 'embed':
+            out.write(f'#undef {name}_HAS_EMBED\n')
+    out.write(f'static const std::size_t {name}_Len = ( {n} );\n')
+    if compress:
+        out.write(f'static const std::size_t {name}_DecompressedLen = ( {len(data)} );\n')
+        out.write(f'static const int {name}_Codec = ( {codecIDs[codec]} ); /* {codec} */\n')
+        out.write(f'static const std::uint32_t {name}_CRC32 = ( 0x{zlib.crc32(data):08X} );\n')
+
+# Generates a GNU assembler file that includes the content of all (names, includePath) entries with .incbin directives; all names of an entry
+# are labels of the same content. The include paths are relative to the directory of the assembler file, which must be passed as include
+# directory (-I) to the assembler.
+def printIncbinAssembly(entries, out, align=16):
+    out.write('/* Generated by ReadFileAsHexString.py; assemble with a GNU compatible assembler, e.g. as .S file with GCC or Clang */\n')
+    out.write('\n')
+    out.write('#if defined __APPLE__ || (defined _WIN32 && !defined _WIN64)\n')
+    out.write('#   define SYMBOL(NAME) _##NAME\n')
+    out.write('#else\n')
+    out.write('#   define SYMBOL(NAME) NAME\n')
+    out.write('#endif\n')
+    out.write('\n')
+    out.write('#if defined __APPLE__\n')
+    out.write('    .section __TEXT,__const\n')
+    out.write('#else\n')
+    out.write('    .section .rodata\n')
+    out.write('#endif\n')
+    for names, includePath in entries:
+        out.write('\n')
+        for name in names:
+            out.write(f'    .global SYMBOL({name})\n')
+        out.write(f'    .balign {align}\n')
+        for name in names:
+            out.write(f'SYMBOL({name}):\n')
+        out.write(f'    .incbin "{includePath}"\n')
+    out.write('\n')
+    out.write('#if defined __ELF__\n')
+    out.write('    .section .note.GNU-stack,"",%progbits\n')
+    out.write('#endif\n')
 
-def main():
+# Generates declarations that refer to the declarations of the specified target, which has the same content, instead of another copy of it
+def printAlias(name, target, out=None, format='string', compress=''):
+    out = out or sys.stdout
+    if format == 'string':
+        out.write(f'static const char* {name} = {target};\n')
+    else:
+        # Reference to the array, so sizeof and alignment are the same as for the target
+        out.write(f'static const auto& {name} = {target};\n')
+    out.write(f'static const std::size_t {name}_Len = {target}_Len;\n')
+    if compress:
+        out.write(f'static const std::size_t {name}_DecompressedLen = {target}_DecompressedLen;\n')
+        out.write(f'static const int {name}_Codec = {target}_Codec;\n')
+        out.write(f'static const std::uint32_t {name}_CRC32 = {target}_CRC32;\n')
+
+# Returns the list of (inputFile, name, outputFile) entries of the specified manifest file; name is an empty string if the default name is used
+# and outputFile is an empty string for stdout
+def readManifest(filename):
+    entries = []
+    baseDir = os.path.dirname(filename)
+    try:
+        with open(filename) as file:
+            for line in file:
+                tokens = line.split()
+                if len(tokens) == 0 or tokens[0].startswith('#'):
+                    continue
+                if len(tokens) > 3:
+                    raise ValueError(f"too many tokens in manifest entry, expected 'INPUT [NAME [OUTPUT]]', but got '{line.strip()}'")
+                inputFile = os.path.join(baseDir, tokens[0])
+                name = tokens[1] if len(tokens) > 1 else ''
+                outputFile = os.path.join(baseDir, tokens[2]) if len(tokens) > 2 else ''
+                entries.append((inputFile, name, outputFile))
+    except IOError:
+        raise OSError('failed to open manifest file: ' + filename)
+    return entries
+
+# Returns the path of the input file relative to the directory of the file that refers to it, with forward slashes for #embed and .incbin
+def includePathOf(inputFile, referrerFile):
+    return os.path.relpath(inputFile, os.path.dirname(os.path.abspath(referrerFile))).replace(os.sep, '/')
+
+# Generates the declarations for all (inputFile, name, outputFile) entries in a single process.
+# If 'cacheFile' is specified, output files whose cache key is unchanged are not generated again (see BlobCache.cacheKey).
+# If 'dedupe' is true, declarations on stdout with the same content as a previous one are aliases of it (see printAlias),
+# and labels of the same content share one .incbin directive; output files are independent of each other, so their content is not shared.
+# Declarations without output file are written to 'out' (stdout by default), which is written to 'outFile' if its path is known.
+# Format 'embed' refers to the input files relative to the output file, so declarations on 'out' require 'outFile'.
+def printDeclarations(entries, columns=16, spaces=0, offsets='', format='string', asmFile='', align=0, endian='little', compress='', minSaving=10.0,
+                      cacheFile='', dedupe=False, out=None, progress=False, outFile='', jobs=1):
+    out = out or sys.stdout
+    if format == 'incbin' and not asmFile:
+        raise ValueError("format 'incbin' requires an assembler output file (-asm FILE)")
+    if format == 'embed' and not outFile and any(not outputFile for _, _, outputFile in entries):
+        raise ValueError("format 'embed' requires an output file (-out FILE or manifest OUTPUT) to resolve the #embed paths")
+    validateEntries(entries, columns, format, endian)
+    entries = [ (inputFile, declName(name or os.path.basename(inputFile)), outputFile) for inputFile, name, outputFile in entries ]
+    options = repr((columns, spaces, offsets, format, align, endian, compress, minSaving))
+    cache = BlobCache.readCache(cacheFile) if cacheFile else None
+    scriptHash = BlobCache.fileHash(os.path.abspath(__file__)) if cacheFile else ''
+    inputHashes = [ BlobCache.fileHash(inputFile) if cacheFile or dedupe else '' for inputFile, _, _ in entries ]
+    firstNames = {}
+    numOutputs = 0
+    numSkipped = 0
+    isFirst = True
+    for (inputFile, name, outputFile), inputHash in zip(entries, inputHashes):
+        includePath = includePathOf(inputFile, outputFile or outFile) if outputFile or outFile else ''
+        if outputFile:
+            numOutputs += 1
+            if cache is not None:
+                key = BlobCache.cacheKey(scriptHash, inputHash, name, includePath, options)
+                if BlobCache.isUpToDate(cache, includePathOf(outputFile, cacheFile), key, outputFile):
+                    numSkipped += 1
+                    continue
+            with open(outputFile, 'w') as file:
+                printDeclaration(inputFile, name, columns, spaces, offsets, file, format, includePath, align, endian, compress, minSaving, progress, jobs)
+        else:
+            if not isFirst:
+                out.write('\n')
+            isFirst = False
+            if dedupe and format != 'incbin' and inputHash in firstNames:
+                printAlias(name, firstNames[inputHash], out, format, compress)
+            else:
+                firstNames.setdefault(inputHash, name)
+                printDeclaration(inputFile, name, columns, spaces, offsets, out, format, includePath, align, endian, compress, minSaving, progress, jobs)
+    if cache is not None:
+        BlobCache.writeCache(cacheFile, cache)
+        print(f'{numSkipped} of {numOutputs} output files are up to date', file=sys.stderr)
+    if format == 'incbin':
+        asmEntries = []
+        asmIndices = {}
+        for (inputFile, name, _), inputHash in zip(entries, inputHashes):
+            if dedupe and inputHash in asmIndices:
+                asmEntries[asmIndices[inputHash]][0].append(name)
+            else:
+                asmIndices[inputHash] = len(asmEntries)
+                asmEntries.append(([ name ], includePathOf(inputFile, asmFile)))
+        with open(asmFile, 'w') as file:
+            printIncbinAssembly(asmEntries, file, align or 16)
+
+# Generates a C header for a resource pack of all (inputFile, name, outputFile) entries (see ResourcePack.printPack),
+# where the pack is embedded with the hex encoder of this script unless it is written to 'packFile'
+def printPack(entries, packName, columns=16, spaces=0, offsets='', format='string', align=16, packFile='', out=None, dedupe=False):
+    def printRows(data, out):
+        printHexChunks(sliceChunks(data, rowChunkSize(columns)), columns, spaces, offsets, False, out, format)
+    ResourcePack.printPack(entries, packName, printRows, spaces, format, align, packFile, out, dedupe)
+
+# Processes the command line arguments, where args[0] is the name of the script, as described by printHelp
+def main(args):
     printLenOnly = False
+    benchmark = False
+    declMode = False
+    declEntries = []
+    nextName = ''
+    packName = ''
+    packFile = ''
+    cacheFile = ''
+    dedupe = False
+    outFile = ''
+    progress = False
+    jobs = 1
     columns = 16
     spaces = 0
-    filename = ""
     paren = False
     offsets = ''
+    format = 'string'
+    asmFile = ''
+    align = 0
+    endian = 'little'
+    compress = ''
+    minSaving = 10.0
     i = 1
 
     def argValue(argName):
@@ -95,34 +715,125 @@ def main():
             i += 1
             return args[i]
         else:
-            fatal('missing value after argument ' + argName)
+            raise ValueError('missing value after argument ' + argName)
 
     while i < len(args):
         arg = args[i]
         if arg == "-len":
             printLenOnly = True
+        elif arg == "-bench":
+            benchmark = True
+        elif arg == "-decl":
+            declMode = True
+        elif arg == "-name":
+            nextName = argValue('-name')
+        elif arg == "-manifest":
+            declMode = True
+            declEntries += readManifest(argValue('-manifest'))
+        elif arg == "-pack":
+            packName = argValue('-pack')
+        elif arg == "-pack-file":
+            packFile = argValue('-pack-file')
+        elif arg == "-cache":
+            cacheFile = argValue('-cache')
+        elif arg == "-dedupe":
+            dedupe = True
+        elif arg == "-out":
+            outFile = argValue('-out')
+        elif arg == "-progress":
+            progress = True
+        elif arg == "-jobs":
+            jobs = int(argValue('-jobs'))
+            if jobs < 1:
+                raise ValueError(f"number of jobs must be at least 1, but got {jobs}")
         elif arg == "-paren":
             paren = True
         elif arg == "-offsets":
             offsets = argValue('-offsets')
             if not offsets in ['c', 'cxx', 'c++']:
-                fatal(f"accepted offset styles are 'c', 'cxx', and 'c++', but got '{offsets}'");
+                raise ValueError(f"accepted offset styles are 'c', 'cxx', and 'c++', but got '{offsets}'")
+        elif arg == "-format":
+            format = argValue('-format')
+            if not format in ['string', 'array', 'words', 'embed', 'incbin']:
+                raise ValueError(f"accepted formats are 'string', 'array', 'words', 'embed', and 'incbin', but got '{format}'")
+        elif arg == "-align":
+            align = int(argValue('-align'))
+            if align <= 0 or (align & (align - 1)) != 0:
+                raise ValueError(f"alignment must be a power of two, but got {align}")
+        elif arg == "-endian":
+            endian = argValue('-endian')
+            if not endian in ['little', 'big']:
+                raise ValueError(f"accepted byte orders are 'little' and 'big', but got '{endian}'")
+        elif arg == "-compress":
+            compress = argValue('-compress')
+            if not compress in ['zlib', 'lzma']:
+                raise ValueError(f"accepted codecs are 'zlib' and 'lzma', but got '{compress}'")
+        elif arg == "-min-saving":
+            minSaving = float(argValue('-min-saving'))
+        elif arg == "-asm":
+            asmFile = argValue('-asm')
         elif arg == "-col":
             columns = int(argValue('-col'))
         elif arg == "-spaces":
             spaces = int(argValue('-spaces'))
         else:
-            if filename == "":
-                filename = arg
-            else:
-                fatal(f"cannot process more than one filename at a time, but got '{arg}'")
+            declEntries.append((arg, nextName, ''))
+            nextName = ''
         i += 1
 
-    if filename == "":
-        fatal('missing filename')
-    if printLenOnly:
+    if len(declEntries) == 0:
+        raise ValueError('missing filename')
+    if packName:
+        if compress:
+            raise ValueError("compression is not supported with -pack")
+    else:
+        if packFile:
+            raise ValueError("-pack-file requires -pack")
+        if cacheFile and not declMode:
+            raise ValueError("-cache requires -decl")
+        if declMode:
+            if align > 0 and format == 'string':
+                raise ValueError("alignment requires an array format, but got format 'string'")
+        else:
+            if not format in rowFormats:
+                raise ValueError(f"format '{format}' requires -decl")
+            if compress:
+                raise ValueError("compression requires -decl")
+            if len(declEntries) > 1:
+                raise ValueError(f"cannot process more than one filename at a time without -decl, but got '{declEntries[1][0]}'")
+
+    validateEntries(declEntries, columns, format, endian)
+
+    out = None
+    if outFile:
+        try:
+            out = open(outFile, 'w')
+        except IOError:
+            raise OSError('failed to write output file: ' + outFile)
+
+    filename = declEntries[0][0]
+    if packName:
+        printPack(declEntries, packName, columns, spaces, offsets, format, align or 16, packFile, out, dedupe)
+    elif declMode:
+        printDeclarations(declEntries, columns, spaces, offsets, format, asmFile, align, endian, compress, minSaving, cacheFile, dedupe, out, progress, outFile, jobs)
+    elif printLenOnly:
         printFileSize(filename, paren)
+    elif benchmark:
+        printBenchmark(filename, columns, spaces, offsets, paren, format, endian, jobs)
     else:
-        printHexString(filename, columns, spaces, offsets, paren)
+        printHexString(filename, columns, spaces, offsets, paren, out, format, endian, progress, jobs)
 
-main()
+    if out:
+        out.close()
+
+if __name__ == '__main__':
+    # This file can be imported as module (see encodeHexString), e.g. by worker processes of printHexStringParallel,
+    # so the command line is only processed when it is run as script
+    if len(sys.argv) < 2:
+        printHelp()
+        sys.exit(1)
+    try:
+        main(sys.argv)
+    except (ValueError, OSError) as error:
+        print(sys.argv[0] + ': ' + str(error))
+        sys.exit(1)
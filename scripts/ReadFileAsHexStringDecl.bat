@@ -6,13 +6,8 @@ if "%2" == "" (
     exit 1
 )
 
-set INPUT=%1
-set DECL=%2
+set INPUT=%~1
+set DECL=%~2
 
 set SCRIPT_PATH=%~dp0ReadFileAsHexString.py
-echo static const char* %DECL% =
-python3 "%SCRIPT_PATH%" -spaces 4 -offsets cxx "%INPUT%"
-echo ;
-echo|set /p="static const std::size_t %DECL%_Len = "
-for /F "tokens=*" %%F in ('python3 "%SCRIPT_PATH%" -len -paren "%INPUT%"') do set STR_LEN_LINE=%%F
-echo %STR_LEN_LINE%;
+python3 "%SCRIPT_PATH%" -decl -spaces 4 -offsets cxx -name "%DECL%" "%INPUT%"
@@ -6,15 +6,10 @@ if [ $# -ne 1 ] && [ $# -ne 2 ]; then
 fi
 
 INPUT=$1
-DECL=$(basename $1)
+DECL=$(basename "$1")
 if [ $# -eq 2 ]; then
     DECL=$2
 fi
 
-SCRIPT_PATH="$(dirname $0)/ReadFileAsHexString.py"
-echo "static const char* ${DECL} =" | sed -e "s/\./_/"
-python3 "$SCRIPT_PATH" -spaces 4 -offsets cxx "$INPUT"
-echo ";"
-echo -n "static const std::size_t ${DECL}_Len = " | sed -e "s/\./_/"
-STR_LEN_LINE=$(python3 "$SCRIPT_PATH" -len -paren "$INPUT")
-echo "${STR_LEN_LINE};"
+SCRIPT_PATH="$(dirname "$0")/ReadFileAsHexString.py"
+python3 "$SCRIPT_PATH" -decl -spaces 4 -offsets cxx -name "$DECL" "$INPUT"
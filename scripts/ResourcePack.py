@@ -0,0 +1,145 @@
+#
+# ResourcePack.py
+#
+# Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+# Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+#
+
+# Resource pack generator for ReadFileAsHexString.py (see -pack): a C header with a sorted name index into one aligned blob.
+
+import os
+import sys
+import zlib
+
+import BlobCache
+
+# Returns the entire content of the specified file
+def readFile(filename):
+    try:
+        with open(filename, mode="rb") as file:
+            return file.read()
+    except IOError:
+        raise OSError('failed to open file: ' + filename)
+
+# Returns the specified name as C string literal
+def stringLiteral(name):
+    return '"' + name.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+# Generates a C header for a resource pack that concatenates the content of all (inputFile, name, outputFile) entries, each aligned to 'align' bytes.
+# The entries are indexed by name (the filename by default) in strcmp order, so PACK_Find can look them up with a binary search. The pack is embedded
+# as PACK_Data in the specified format ('string' or 'array'), or written to 'packFile', which can be memory mapped, since mappings are page aligned.
+# If 'dedupe' is true, entries with the same content share the same offset within the pack.
+# The rows of PACK_Data are generated by 'printRows(data, out)', which is the hex encoder of ReadFileAsHexString.py.
+def printPack(entries, packName, printRows, spaces=0, format='string', align=16, packFile='', out=None, dedupe=False):
+    out = out or sys.stdout
+    if not format in ['string', 'array']:
+        raise ValueError(f"resource packs require format 'string' or 'array', but got '{format}'")
+
+    # Concatenate the content of all entries and sort the index by name as unsigned bytes, which is the order of strcmp
+    pack = bytearray()
+    index = []
+    dataOffsets = {}
+    for inputFile, name, _ in entries:
+        data = readFile(inputFile)
+        dataHash = BlobCache.dataHash(data) if dedupe else None
+        if dataHash in dataOffsets:
+            index.append((name or os.path.basename(inputFile), dataOffsets[dataHash], len(data), zlib.crc32(data)))
+            continue
+        pack += bytes(-len(pack) % align)
+        index.append((name or os.path.basename(inputFile), len(pack), len(data), zlib.crc32(data)))
+        if dedupe:
+            dataOffsets[dataHash] = len(pack)
+        pack += data
+    index.sort(key=lambda entry: entry[0].encode('utf-8'))
+    for prev, entry in zip(index, index[1:]):
+        if prev[0] == entry[0]:
+            raise ValueError(f"duplicate name in resource pack: '{entry[0]}'")
+
+    if packFile:
+        try:
+            with open(packFile, 'wb') as file:
+                file.write(pack)
+        except IOError:
+            raise OSError('failed to write pack file: ' + packFile)
+
+    out.write('/* Generated by ReadFileAsHexString.py */\n')
+    out.write('\n')
+    out.write(f'#ifndef {packName.upper()}_INCLUDED\n')
+    out.write(f'#define {packName.upper()}_INCLUDED\n')
+    out.write('\n')
+    out.write('#include <stddef.h>\n')
+    out.write('#include <stdint.h>\n')
+    out.write('#include <string.h>\n')
+    out.write('\n')
+    out.write(f'typedef struct {packName}_Entry\n')
+    out.write('{\n')
+    out.write('    const char* name;\n')
+    out.write('    size_t      offset; /* Offset from the beginning of the pack, a multiple of the pack alignment */\n')
+    out.write('    size_t      size;\n')
+    out.write('    uint32_t    crc32;\n')
+    out.write('}\n')
+    out.write(f'{packName}_Entry;\n')
+    out.write('\n')
+    out.write(f'static const {packName}_Entry {packName}_Entries[] =\n')
+    out.write('{\n')
+    for name, offset, size, crc32 in index:
+        out.write(f'{" "*spaces}{{ {stringLiteral(name)}, {offset}, {size}, 0x{crc32:08X} }},\n')
+    out.write('};\n')
+    out.write(f'static const size_t {packName}_NumEntries = ( {len(index)} );\n')
+    out.write(f'static const size_t {packName}_Align = ( {align} );\n')
+    out.write(f'static const size_t {packName}_Len = ( {len(pack)} );\n')
+    out.write(f'static const uint32_t {packName}_CRC32 = ( 0x{zlib.crc32(pack):08X} );\n')
+    out.write('\n')
+
+    if not packFile:
+        out.write('#if defined __cplusplus\n')
+        out.write(f'alignas({align})\n')
+        out.write('#else\n')
+        out.write(f'_Alignas({align})\n')
+        out.write('#endif\n')
+        if format == 'string':
+            out.write(f'static const char {packName}_Data[] =\n')
+        else:
+            out.write(f'static const unsigned char {packName}_Data[] =\n')
+            out.write('{\n')
+        printRows(bytes(pack), out)
+        if len(pack) == 0:
+            out.write(' '*spaces + ('""\n' if format == 'string' else '0\n'))
+        if format == 'array':
+            out.write('}')
+        out.write(';\n')
+        out.write('\n')
+
+    out.write('/* Returns the entry with the specified name or NULL if there is no such entry */\n')
+    out.write(f'static inline const {packName}_Entry* {packName}_Find(const char* name)\n')
+    out.write('{\n')
+    out.write(f'    size_t first = 0, last = {packName}_NumEntries;\n')
+    out.write('    while (first < last)\n')
+    out.write('    {\n')
+    out.write('        size_t mid = first + (last - first) / 2;\n')
+    out.write(f'        int order = strcmp(name, {packName}_Entries[mid].name);\n')
+    out.write('        if (order == 0)\n')
+    out.write(f'            return &{packName}_Entries[mid];\n')
+    out.write('        if (order < 0)\n')
+    out.write('            last = mid;\n')
+    out.write('        else\n')
+    out.write('            first = mid + 1;\n')
+    out.write('    }\n')
+    out.write('    return NULL;\n')
+    out.write('}\n')
+    out.write('\n')
+    if packFile:
+        out.write(f'/* Returns the content of the specified entry within the pack file, e.g. mapped into memory;\n')
+        out.write(f'   the size and CRC-32 of the file must match {packName}_Len and {packName}_CRC32 */\n')
+        out.write(f'static inline const unsigned char* {packName}_Content(const void* pack, const {packName}_Entry* entry)\n')
+        out.write('{\n')
+        out.write('    return (const unsigned char*)pack + entry->offset;\n')
+        out.write('}\n')
+    else:
+        out.write('/* Returns the content of the specified entry within the embedded pack */\n')
+        out.write(f'static inline const unsigned char* {packName}_Content(const {packName}_Entry* entry)\n')
+        out.write('{\n')
+        out.write(f'    return (const unsigned char*){packName}_Data + entry->offset;\n')
+        out.write('}\n')
+    out.write('\n')
+    out.write(f'#endif /* {packName.upper()}_INCLUDED */\n')
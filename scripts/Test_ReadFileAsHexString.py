@@ -0,0 +1,163 @@
+#
+# Test_ReadFileAsHexString.py
+#
+# Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+# Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+#
+
+# Compares the output of ReadFileAsHexString.py with a per-byte reference formatter.
+# Run from any directory with 'python3 -m unittest scripts/Test_ReadFileAsHexString.py' or 'python3 scripts/Test_ReadFileAsHexString.py'.
+
+import io
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import unittest
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPT_PATH = os.path.join(SCRIPT_DIR, 'ReadFileAsHexString.py')
+
+sys.path.insert(0, SCRIPT_DIR)
+import ReadFileAsHexString
+
+# Formats the specified bytes one at a time like the original printHexString; 'start' is the offset of the first byte within the input.
+# Format 'array' uses '0xHH,' tokens separated by a space instead of '\xHH' escape sequences within quotes.
+def referenceHexString(data, columns=16, spaces=0, offsets='', paren=False, format='string', start=0):
+    out = io.StringIO()
+    rowBegin, rowClose, tokenFormat, separator = ('"', '"', '\\x{:02X}', '') if format == 'string' else ('', '', '0x{:02X},', ' ')
+    if paren:
+        out.write('(\n')
+    byteRange = (start, start)
+    def writeNewline():
+        if offsets in ['c++', 'cxx']:
+            out.write(rowClose + ' // 0x{0:0{2}X} - 0x{1:0{2}X}\n'.format(byteRange[0], byteRange[1], 8))
+        elif offsets == 'c':
+            out.write(rowClose + ' /* 0x{0:0{2}X} - 0x{1:0{2}X} */\n'.format(byteRange[0], byteRange[1], 8))
+        else:
+            out.write(rowClose + '\n')
+    c = 0
+    for b in data:
+        if c == 0:
+            out.write(' '*spaces + rowBegin)
+        else:
+            out.write(separator)
+        out.write(tokenFormat.format(b))
+        c += 1
+        if c >= columns:
+            c = 0
+            writeNewline()
+            byteRange = (byteRange[1] + 1, byteRange[1])
+        byteRange = (byteRange[0], byteRange[1] + 1)
+    if c > 0:
+        writeNewline()
+    if paren:
+        out.write(')\n')
+    return out.getvalue()
+
+# Returns the declarations that the original ReadFileAsHexStringDecl.sh printed for the specified identifier
+def referenceDeclaration(data, name, spaces=4, offsets='cxx'):
+    return (
+        f'static const char* {name} =\n' +
+        referenceHexString(data, 16, spaces, offsets) +
+        ';\n' +
+        f'static const std::size_t {name}_Len = ( {len(data)} );\n'
+    )
+
+class TestReadFileAsHexString(unittest.TestCase):
+    def setUp(self):
+        self.random = random.Random(42)
+        self.tempDir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+    def randomBytes(self, size):
+        return bytes(self.random.getrandbits(8) for _ in range(size))
+
+    def writeFile(self, filename, data):
+        path = os.path.join(self.tempDir.name, filename)
+        with open(path, 'wb') as file:
+            file.write(data)
+        return path
+
+    def runScript(self, *args):
+        result = subprocess.run([sys.executable, SCRIPT_PATH] + list(args), cwd=self.tempDir.name, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        return result.stdout
+
+    def testEncodeHexString(self):
+        # Sizes around the 64 KiB chunks of the encoder, including empty input and an incomplete last row
+        for size in [0, 1, 15, 16, 17, 1000, 65535, 65536, 65537, 200003]:
+            data = self.randomBytes(size)
+            for columns, spaces, offsets, paren in [(16, 0, '', False), (16, 4, 'cxx', False), (7, 2, 'c', True), (1, 0, 'c++', False)]:
+                with self.subTest(size=size, columns=columns, spaces=spaces, offsets=offsets, paren=paren):
+                    expected = referenceHexString(data, columns, spaces, offsets, paren)
+                    self.assertEqual(ReadFileAsHexString.encodeHexString(data, columns, spaces, offsets, paren), expected)
+                    self.assertEqual(ReadFileAsHexString.encodeHexString(io.BytesIO(data), columns, spaces, offsets, paren), expected)
+
+    def testEncodeHexStringArray(self):
+        data = self.randomBytes(1000)
+        for columns, offsets in [(16, ''), (12, 'cxx'), (5, 'c')]:
+            with self.subTest(columns=columns, offsets=offsets):
+                expected = referenceHexString(data, columns, 4, offsets, format='array')
+                self.assertEqual(ReadFileAsHexString.encodeHexString(data, columns, 4, offsets, format='array'), expected)
+
+    def testCommandLine(self):
+        data = self.randomBytes(5000)
+        path = self.writeFile('blob.bin', data)
+        self.assertEqual(self.runScript(path, '-spaces', '4', '-offsets', 'cxx', '-paren', '-col', '10'), referenceHexString(data, 10, 4, 'cxx', True))
+        self.assertEqual(self.runScript(path, '-len', '-paren'), f'( {len(data)} )\n')
+
+    def testOffsetsAbove32Bits(self):
+        # Rows that start below and end above 0xFFFFFFFF have offsets of different width
+        data = self.randomBytes(100)
+        for start in [0xFFFFFFF0, 0xFFFFFFFF, 0x100000000, 0x123456789AB]:
+            for columns, offsets in [(16, 'cxx'), (7, 'c')]:
+                with self.subTest(start=start, columns=columns, offsets=offsets):
+                    expected = referenceHexString(data, columns, 4, offsets, start=start)
+                    self.assertEqual(ReadFileAsHexString.formatRows(data, start, columns, 4, offsets), expected)
+
+    def testParallelJobs(self):
+        # Parts of a few rows, so the workers format many parts with offsets that continue across them
+        data = self.randomBytes(10007)
+        path = self.writeFile('blob.bin', data)
+        partSize = ReadFileAsHexString.PARALLEL_PART_SIZE
+        ReadFileAsHexString.PARALLEL_PART_SIZE = 1000
+        try:
+            for jobs, columns, offsets, paren in [(2, 16, 'cxx', False), (3, 7, 'c', True)]:
+                with self.subTest(jobs=jobs, columns=columns, offsets=offsets, paren=paren):
+                    out = io.StringIO()
+                    n = ReadFileAsHexString.printHexStringParallel(path, jobs, columns, 4, offsets, paren, out)
+                    self.assertEqual(n, len(data))
+                    self.assertEqual(out.getvalue(), referenceHexString(data, columns, 4, offsets, paren))
+        finally:
+            ReadFileAsHexString.PARALLEL_PART_SIZE = partSize
+
+    def testDeclarations(self):
+        inputs = [
+            ('shader.vert.spv', 'shader_vert_spv', self.randomBytes(333)),
+            ('empty.bin', 'empty_bin', b''),
+            ('2d-image (1).png', '_2d_image__1__png', self.randomBytes(4096)),
+        ]
+        paths = [self.writeFile(filename, data) for filename, _, data in inputs]
+
+        # Default names from the filename and explicit names both replace every non-identifier character
+        expected = '\n'.join(referenceDeclaration(data, ident) for _, ident, data in inputs)
+        self.assertEqual(self.runScript('-decl', '-spaces', '4', '-offsets', 'cxx', *paths), expected)
+
+        args = []
+        for path in paths:
+            args += ['-name', 'g.' + os.path.basename(path), path]
+        idents = ['g_shader_vert_spv', 'g_empty_bin', 'g_2d_image__1__png']
+        expected = '\n'.join(referenceDeclaration(data, ident) for ident, (_, _, data) in zip(idents, inputs))
+        self.assertEqual(self.runScript('-decl', '-spaces', '4', '-offsets', 'cxx', *args), expected)
+
+        # ReadFileAsHexStringDecl.sh passes the filename as explicit name
+        if os.name == 'posix':
+            result = subprocess.run(['sh', os.path.join(SCRIPT_DIR, 'ReadFileAsHexStringDecl.sh'), paths[2]], capture_output=True, text=True)
+            self.assertEqual(result.stdout, referenceDeclaration(inputs[2][2], inputs[2][1]))
+
+if __name__ == '__main__':
+    unittest.main()
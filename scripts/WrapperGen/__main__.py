@@ -6,10 +6,20 @@
 # Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
 #
 
+import os
 import sys
 import llgl_parser as parser
 import llgl_translator_c99 as translator_c99
 import llgl_translator_csharp as translator_csharp
+import llgl_translator_cmdstream as translator_cmdstream
+import llgl_translator_bench as translator_bench
+import llgl_translator_strings as translator_strings
+import llgl_translator_formats as translator_formats
+import llgl_translator_layout as translator_layout
+import llgl_translator_padding as translator_padding
+import llgl_translator_reflection as translator_reflection
+import llgl_translator_python as translator_python
+import llgl_translator_numpy as translator_numpy
 
 def iterate(func, cont):
     return list(map(func, cont))
@@ -22,8 +32,22 @@ def printHelp():
     print("flags:")
     print("  -c99 ......... Translate header to C99")
     print("  -csharp ...... Translate header to C#")
+    print("  -python ...... Translate header to Python ctypes module (requires -fn for function bindings)")
+    print("  -numpy ....... Emit NumPy structured dtypes for all blittable structs")
     print("  -name=NAME ... Override name for consolidated headers")
+    print("  -split=DIR ... Write one C99 header per input module into DIR and print umbrella header NAME (with -c99)")
+    print("                 or one C# file per input module with partial NativeLLGL class into DIR (with -csharp)")
     print("  -fn .......... Also parse exported C function declarations")
+    print("  -fnptr ....... Emit C# callbacks as unmanaged function pointers (requires C# 9)")
+    print("  -cmdstream ... Emit command stream decoder (with -c99) or encoder (with -csharp) for exported functions")
+    print("  -bench[=F,..]  Emit C benchmark program for exported functions F (or a default selection)")
+    print("  -roots=R,..|FILE  Only translate functions and types reachable from roots R (or names listed in FILE, one per line);")
+    print("                 function roots require -fn")
+    print("  -strings ..... Emit enum and flags to/from string lookup tables (with -c99 or -csharp)")
+    print("  -formats=FILE  Emit format attribute table from native FILE (Format.cpp) (with -c99 or -csharp)")
+    print("  -layout ...... Report x86-64 SysV struct layouts or emit C99/C++ type assertions (with -c99)")
+    print("  -padding ..... Report struct padding and size-minimizing field orders of C++ structs (or C99 structs with -c99)")
+    print("  -reflection .. Emit C99 struct reflection tables with generic hasher and serializer")
 
 def parseFile(filename, processFunctions = False):
     prs = parser.Parser()
@@ -68,13 +92,14 @@ if len(files) > 0:
         return None
 
     singleName = findArgValue(args, '-name')
+    splitDir = findArgValue(args, '-split')
 
     # Are function declarations includes?
     processFunctions = '-fn' in args
     
     # Parse input headers
     modules = iterate(lambda filename: parseFile(filename, processFunctions), files)
-    if singleName and len(modules) > 0:
+    if singleName and not splitDir and len(modules) > 0:
         singleModule = modules[0]
         singleModule.name = singleName
         if len(modules) > 1:
@@ -83,12 +108,58 @@ if len(files) > 0:
         singleModule.structs = singleModule.sortStructsByDependencies()
         modules = [singleModule]
 
+    # Prune all declarations that are not reachable from the specified roots
+    rootsArg = findArgValue(args, '-roots')
+    if rootsArg:
+        if os.path.isfile(rootsArg):
+            with open(rootsArg, 'r') as file:
+                roots = list(filter(lambda line: len(line) > 0 and line[0] != '#', map(str.strip, file.read().splitlines())))
+        else:
+            roots = rootsArg.split(',')
+        unknownRoots = parser.LLGLModule.pruneUnreachable(modules, roots)
+        if len(unknownRoots) > 0:
+            parser.fatal(f"error: unknown roots: {', '.join(unknownRoots)}")
+
     # Translate or just print meta data of input header files
-    if '-c99' in args:
+    benchFunctions = findArgValue(args, '-bench')
+    if '-bench' in args or benchFunctions:
+        trans = translator_bench.BenchmarkTranslator(benchFunctions.split(',') if benchFunctions else None)
+        iterate(trans.translateModule, modules)
+    elif findArgValue(args, '-formats'):
+        trans = translator_formats.FormatTableTranslator(findArgValue(args, '-formats'), 'csharp' if '-csharp' in args else 'c99')
+        iterate(trans.translateModule, modules)
+    elif '-reflection' in args:
+        trans = translator_reflection.ReflectionTranslator()
+        iterate(trans.translateModule, modules)
+    elif '-padding' in args:
+        trans = translator_padding.PaddingTranslator(parser.LLGLModule.LAYOUT_C99 if '-c99' in args else parser.LLGLModule.LAYOUT_CPP)
+        iterate(trans.translateModule, modules)
+    elif '-layout' in args:
+        trans = translator_layout.LayoutTranslator('c99' if '-c99' in args else None)
+        iterate(trans.translateModule, modules)
+    elif '-strings' in args:
+        trans = translator_strings.EnumStringsTranslator('csharp' if '-csharp' in args else 'c99')
+        iterate(trans.translateModule, modules)
+    elif '-cmdstream' in args:
+        trans = translator_cmdstream.CommandStreamTranslator('csharp' if '-csharp' in args else 'c99')
+        iterate(trans.translateModule, modules)
+    elif '-c99' in args and splitDir:
+        trans = translator_c99.C99Translator(os.path.basename(os.path.normpath(splitDir)))
+        trans.translateSplitModules(singleName if singleName else 'LLGLWrapper', modules, splitDir)
+    elif '-c99' in args:
         trans = translator_c99.C99Translator()
         iterate(trans.translateModule, modules)
+    elif '-csharp' in args and splitDir:
+        trans = translator_csharp.CsharpTranslator(unmanagedCallbacks = '-fnptr' in args)
+        trans.translateSplitModules(singleName if singleName else 'LLGLWrapper', modules, splitDir)
     elif '-csharp' in args:
-        trans = translator_csharp.CsharpTranslator()
+        trans = translator_csharp.CsharpTranslator(unmanagedCallbacks = '-fnptr' in args)
+        iterate(trans.translateModule, modules)
+    elif '-numpy' in args:
+        trans = translator_numpy.NumpyTranslator()
+        iterate(trans.translateModule, modules)
+    elif '-python' in args:
+        trans = translator_python.PythonTranslator()
         iterate(trans.translateModule, modules)
     else:
         iterate(printModule, modules)
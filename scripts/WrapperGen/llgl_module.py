@@ -5,6 +5,7 @@
 # Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
 #
 
+import re
 from enum import Enum
 
 class StdType(Enum):
@@ -37,6 +38,36 @@ class StdTypeLimits:
     MAX_UINT32 = 0xFFFF_FFFF
     MAX_UINT64 = 0xFFFF_FFFF_FFFF_FFFF
 
+class StdTypeLayout:
+    # Sizes in bytes under the x86-64 System V ABI; the alignment of each builtin type equals its size
+    sizes = {
+        StdType.BOOL: 1,
+        StdType.CHAR: 1,
+        StdType.WCHAR: 4,
+        StdType.INT8: 1,
+        StdType.INT16: 2,
+        StdType.INT32: 4,
+        StdType.INT64: 8,
+        StdType.UINT8: 1,
+        StdType.UINT16: 2,
+        StdType.UINT32: 4,
+        StdType.UINT64: 8,
+        StdType.LONG: 8,
+        StdType.SIZE_T: 8,
+        StdType.FLOAT: 4,
+        StdType.FUNC: 8
+    }
+    containerSizes = {
+        'vector': 24, # libstdc++ and libc++: begin, end, and capacity pointers
+        'ArrayView': 16 # data_ and size_
+    }
+    stringSizes = {
+        'UTF8String': 32, # SmallVector<char> with local buffer
+        'string': 32 # libstdc++ with small string buffer
+    }
+    POINTER = 8
+    ENUM = 4 # Enumerations without underlying type are 'int' in C++ and 'unsigned int' in C
+
 class ConditionalType:
     name = ''
     cond = None
@@ -121,6 +152,14 @@ class LLGLMeta:
     structFlagProperties = [
         'ColorMask'
     ]
+    fixedLayouts = [
+        # Records whose layout is defined by the graphics APIs and must not be reordered
+        'DrawIndirectArguments',
+        'DrawIndexedIndirectArguments',
+        'DrawPatchIndirectArguments',
+        'DispatchIndirectArguments',
+        'QueryPipelineStatistics'
+    ]
     constants = {
         'LLGL_MAX_NUM_COLOR_ATTACHMENTS': 8,
         'LLGL_MAX_NUM_ATTACHMENTS': 9,
@@ -135,6 +174,10 @@ class LLGLMeta:
     includes = {
         '<LLGL-C/Types.h>'
     }
+    namespaces = [
+        'LLGL',
+        'LLGL::Log'
+    ]
     copyright = [
         'Copyright (c) 2015 Lukas Hermanns. All rights reserved.',
         'Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).'
@@ -153,6 +196,84 @@ class LLGLMacros:
         else:
             return int(ident)
 
+class LLGLExpression:
+    # Integer division that truncates toward zero like C/C++ instead of flooring like Python's '//' operator
+    @staticmethod
+    def divide(a, b):
+        if b == 0:
+            raise ValueError('division by zero')
+        quotient = abs(a) // abs(b)
+        return quotient if (a < 0) == (b < 0) else -quotient
+
+    # Remainder with the sign of the dividend like C/C++, i.e. a == divide(a, b) * b + remainder(a, b)
+    @staticmethod
+    def remainder(a, b):
+        return a - LLGLExpression.divide(a, b) * b
+
+    # Evaluates a constant integer expression of an enumeration entry, e.g. "(1<<2)" or "(Read|Write)".
+    # Identifiers are resolved by the specified symbol dictionary. Raises ValueError if the expression cannot be folded.
+    @staticmethod
+    def evaluate(expr, symbols = {}):
+        tokens = re.findall(r'(?:0[xX][0-9a-fA-F]+|\d+)[uUlL]*|\w+|<<|>>|\S', expr)
+        pos = 0
+
+        def tok():
+            return tokens[pos] if pos < len(tokens) else None
+
+        def accept():
+            nonlocal pos
+            pos += 1
+            return tokens[pos - 1]
+
+        def parseBinary(operators, parseOperand):
+            value = parseOperand()
+            while tok() in operators:
+                op = accept()
+                value = operators[op](value, parseOperand())
+            return value
+
+        def parsePrimary():
+            if tok() is None:
+                raise ValueError(f"unexpected end of expression '{expr}'")
+            token = accept()
+            if token == '(':
+                value = parseOr()
+                if accept() != ')':
+                    raise ValueError(f"missing ')' in expression '{expr}'")
+                return value
+            elif token == '~':
+                return ~parsePrimary()
+            elif token == '-':
+                return -parsePrimary()
+            elif token[0].isdigit():
+                return int(token.rstrip('uUlL'), 0)
+            elif token in symbols:
+                return symbols[token]
+            raise ValueError(f"unknown identifier '{token}' in expression '{expr}'")
+
+        def parseMul():
+            return parseBinary({ '*': lambda a, b: a * b, '/': LLGLExpression.divide, '%': LLGLExpression.remainder }, parsePrimary)
+
+        def parseAdd():
+            return parseBinary({ '+': lambda a, b: a + b, '-': lambda a, b: a - b }, parseMul)
+
+        def parseShift():
+            return parseBinary({ '<<': lambda a, b: a << b, '>>': lambda a, b: a >> b }, parseAdd)
+
+        def parseAnd():
+            return parseBinary({ '&': lambda a, b: a & b }, parseShift)
+
+        def parseXor():
+            return parseBinary({ '^': lambda a, b: a ^ b }, parseAnd)
+
+        def parseOr():
+            return parseBinary({ '|': lambda a, b: a | b }, parseXor)
+
+        value = parseOr()
+        if tok() is not None:
+            raise ValueError(f"unexpected token '{tok()}' in expression '{expr}'")
+        return value
+
 class LLGLType:
     baseType = StdType.UNDEFINED
     typename = '' # E.g. "Format" or "BufferDescriptor"
@@ -160,6 +281,7 @@ class LLGLType:
     isConst = False
     isPointer = False
     externalCond = None # Conditional expression string for external typenames (see LLGLMeta.externals)
+    container = None # Container typename of dynamic arrays, e.g. 'vector' or 'ArrayView'
 
     DYNAMIC_ARRAY = -1
 
@@ -170,6 +292,7 @@ class LLGLType:
         self.isConst = isConst
         self.isPointer = isPointer
         self.externalCond = next((external.cond for external in LLGLMeta.externals if external.name == typename), None)
+        self.container = None
 
     def setArraySize(self, arraySize):
         if isinstance(arraySize, str):
@@ -229,13 +352,17 @@ class LLGLField:
     init = None
     deprecated = None
     annotations = []
+    arrayLength = None # Name of the parameter that specifies the number of elements for LLGLAnnotation.ARRAY
+    value = None # Folded integer value of enumeration and flags entries (see LLGLRecord.foldEntryValues)
 
     def __init__(self, inName, inType = LLGLType()):
         self.name = inName
         self.type = inType
         self.init = None
+        self.value = None
         self.deprecated = None
         self.annotations = []
+        self.arrayLength = None
 
     def __str__(self):
         s = ''
@@ -265,21 +392,91 @@ class LLGLRecord:
                 return False
         return True
 
+    # Folds the initializers of all enumeration or flags entries into integer values.
+    # Entries without initializer continue with the previous value plus one like in C/C++.
+    # Entries that cannot be folded keep their symbolic initializer and a value of None, as do entries without initializer that follow them.
+    # Returns the list of entry names that could not be folded.
+    def foldEntryValues(self):
+        symbols = dict(LLGLMeta.constants)
+        nextValue = 0
+        for field in self.fields:
+            if field.init:
+                try:
+                    field.value = LLGLExpression.evaluate(field.init, symbols)
+                except ValueError:
+                    field.value = None
+            else:
+                field.value = nextValue
+            if field.value is not None:
+                symbols[field.name] = field.value
+                nextValue = field.value + 1
+            else:
+                nextValue = None
+        return self.unresolvedEntries()
+
+    # Returns the list of enumeration or flags entry names whose values could not be folded (see foldEntryValues)
+    def unresolvedEntries(self):
+        return [field.name for field in self.fields if field.value is None]
+
     # Returns set of struct names that this record depends on
     def deriveDependencies(self):
         for field in self.fields:
             if field.type.isCustomType() and not field.type.isInterface() and field.type.typename != self.name:
                 self.deps.add(field.type.typename)
 
+class LLGLFieldLayout:
+    name = ''
+    offset = 0 # Offset in bytes
+    size = 0 # Size in bytes including all elements of fixed size arrays
+    align = 1
+    bitOffset = 0 # Offset in bits within the storage unit for bitfields
+    bitsize = 0 # Non-zero for bitfields
+
+    def __init__(self, name, offset, size, align, bitOffset = 0, bitsize = 0):
+        self.name = name
+        self.offset = offset
+        self.size = size
+        self.align = align
+        self.bitOffset = bitOffset
+        self.bitsize = bitsize
+
+    def isBitfield(self):
+        return self.bitsize > 0
+
+class LLGLRecordLayout:
+    name = ''
+    size = 0
+    align = 1
+    fields = [] # Array of LLGLFieldLayout
+
+    def __init__(self, name):
+        self.name = name
+        self.size = 0
+        self.align = 1
+        self.fields = []
+
+    def findFieldByName(self, name):
+        for field in self.fields:
+            if field.name == name:
+                return field
+        return None
+
+    # Returns the number of padding bytes between and after all fields
+    def paddingSize(self):
+        usedBits = sum(field.bitsize if field.isBitfield() else field.size * 8 for field in self.fields)
+        return self.size - (usedBits + 7) // 8
+
 class LLGLFunction:
     returnType = LLGLType()
     name = ''
     params = [] # Array of LLGLField
+    moduleName = '' # Name of the module (header file without extension) the function is declared in
 
     def __init__(self, name, returnType = LLGLType()):
         self.returnType = returnType
         self.name = name
         self.params = []
+        self.moduleName = ''
 
     def hasVargs(self):
         for param in self.params:
@@ -295,6 +492,10 @@ class LLGLModule:
     funcs = [] # Array of LLGLFunction
     delegates = [] # Array of LLGLFunction
     typeDeps = set() # Set of types used in this header
+    layouts = {} # Dictionary of computed LLGLRecordLayout per (struct name, language)
+
+    LAYOUT_C99 = 'c99' # Layout of the structs emitted by the C99 translator
+    LAYOUT_CPP = 'cpp' # Layout of the parsed C++ structs
 
     def __init__(self):
         self.name = ''
@@ -304,6 +505,7 @@ class LLGLModule:
         self.funcs = []
         self.delegates = []
         self.typeDeps = set()
+        self.layouts = {}
 
     def deriveDependencies(self):
         for struct in self.structs:
@@ -336,6 +538,149 @@ class LLGLModule:
                 return struct
         return None
 
+    def findDelegateByName(self, name):
+        for delegate in self.delegates:
+            if delegate.name == name:
+                return delegate
+        return None
+
+    # Returns the size, alignment, and bitsize of a single element of the specified field type under the x86-64 System V ABI,
+    # or a string with the reason why the layout cannot be determined.
+    def computeTypeLayout(self, fieldType, language):
+        if fieldType.isPointer or fieldType.baseType == StdType.FUNC:
+            return (StdTypeLayout.POINTER, StdTypeLayout.POINTER, 0)
+        if fieldType.typename in [LLGLMeta.UTF8STRING, LLGLMeta.STRING]:
+            if language == LLGLModule.LAYOUT_C99:
+                return (StdTypeLayout.POINTER, StdTypeLayout.POINTER, 0)
+            return (StdTypeLayout.stringSizes[fieldType.typename], StdTypeLayout.POINTER, 0)
+        if fieldType.isInterface():
+            if language == LLGLModule.LAYOUT_C99:
+                return (StdTypeLayout.POINTER, StdTypeLayout.POINTER, 0)
+            return f"interface '{fieldType.typename}' stored by value"
+        builtinSize = StdTypeLayout.sizes.get(fieldType.baseType)
+        if builtinSize:
+            return (builtinSize, builtinSize, 0)
+
+        record = self.findEnumByName(fieldType.typename) or self.findFlagsByName(fieldType.typename)
+        if record:
+            bitsize = record.base.getFixedBitsize() if record.base else 0
+            if bitsize == 0:
+                return (StdTypeLayout.ENUM, StdTypeLayout.ENUM, 0)
+            elif language == LLGLModule.LAYOUT_C99:
+                # C99 translator emits enumerations with underlying type as bitfields
+                return (StdTypeLayout.ENUM, StdTypeLayout.ENUM, bitsize)
+            else:
+                return (bitsize // 8, bitsize // 8, 0)
+
+        struct = self.findStructByName(fieldType.typename)
+        if struct:
+            layout = self.computeRecordLayout(struct, language)
+            if isinstance(layout, str):
+                return f"nested struct '{struct.name}': {layout}"
+            return (layout.size, layout.align, 0)
+
+        return f"unknown type '{fieldType.typename}'"
+
+    # Computes the size, alignment, and field offsets of the specified struct under the x86-64 System V ABI.
+    # Returns an LLGLRecordLayout or a string with the reason why the layout cannot be determined.
+    def computeRecordLayout(self, struct, language):
+        key = (struct.name, language)
+        if not key in self.layouts:
+            self.layouts[key] = self.computeFieldsLayout(struct.name, struct.fields, language)
+        return self.layouts[key]
+
+    # Computes the layout of a struct with the specified fields in the specified order; see computeRecordLayout.
+    def computeFieldsLayout(self, name, fields, language):
+        def alignUp(value, alignment):
+            return (value + alignment - 1) // alignment * alignment
+
+        layout = LLGLRecordLayout(name)
+        bitPos = 0
+
+        def appendField(name, size, align, bitsize = 0, count = 1):
+            nonlocal bitPos
+            if bitsize > 0:
+                # Bitfields must not straddle a storage unit of their declared type
+                unitBits = size * 8
+                if bitPos % unitBits + bitsize > unitBits:
+                    bitPos = alignUp(bitPos, unitBits)
+                unitOffset = bitPos // unitBits * size
+                layout.fields.append(LLGLFieldLayout(name, unitOffset, size, align, bitPos - unitOffset * 8, bitsize))
+                bitPos += bitsize
+            else:
+                offset = alignUp((bitPos + 7) // 8, align)
+                layout.fields.append(LLGLFieldLayout(name, offset, size * count, align))
+                bitPos = (offset + size * count) * 8
+            layout.align = max(layout.align, align)
+
+        for field in fields:
+            fieldType = field.type
+            if fieldType.baseType == StdType.CONST or fieldType.externalCond:
+                # Skip constants and platform specific fields that are not declared on this platform
+                continue
+
+            if fieldType.isDynamicArray():
+                if language == LLGLModule.LAYOUT_C99:
+                    # C99 translator emits dynamic arrays as element count and pointer
+                    appendField(f'num{field.name[0].upper()}{field.name[1:]}', StdTypeLayout.sizes[StdType.SIZE_T], StdTypeLayout.sizes[StdType.SIZE_T])
+                    appendField(field.name, StdTypeLayout.POINTER, StdTypeLayout.POINTER)
+                else:
+                    containerSize = StdTypeLayout.containerSizes.get(fieldType.container)
+                    if not containerSize:
+                        return f"unknown layout of container '{fieldType.container}' in field '{field.name}'"
+                    appendField(field.name, containerSize, StdTypeLayout.POINTER)
+                continue
+
+            typeLayout = self.computeTypeLayout(fieldType, language)
+            if isinstance(typeLayout, str):
+                return f"field '{field.name}': {typeLayout}"
+
+            size, align, bitsize = typeLayout
+            if bitsize > 0 and fieldType.arraySize > 0:
+                return f"field '{field.name}': array of bitfields"
+            appendField(field.name, size, align, bitsize, max(1, fieldType.arraySize))
+
+        layout.size = alignUp((bitPos + 7) // 8, layout.align)
+        return layout
+
+    # Returns None if the C99 struct emitted for the specified struct has the same layout as the parsed C++ struct under the x86-64 System V ABI,
+    # i.e. a pointer to the C99 struct can be reinterpreted as a pointer to the C++ struct. Otherwise, returns a string with the reason why they differ.
+    # Byte-aligned bitfields of enumerations with underlying type are compatible with their C++ counterpart on little-endian targets,
+    # but raise the alignment of the C99 struct, which is why the C99 alignment may be stricter than the C++ alignment.
+    def findLayoutMismatch(self, struct):
+        for field in struct.fields:
+            fieldType = field.type
+            if fieldType.externalCond:
+                return f"platform specific field '{field.name}'"
+            if fieldType.isDynamicArray():
+                return f"dynamic array '{field.name}'"
+            if fieldType.typename in [LLGLMeta.UTF8STRING, LLGLMeta.STRING] and not fieldType.isPointer:
+                return f"string '{field.name}'"
+            if fieldType.isCustomType() and not fieldType.isPointer and not fieldType.isInterface():
+                nestedStruct = self.findStructByName(fieldType.typename)
+                if nestedStruct and self.findLayoutMismatch(nestedStruct):
+                    return f"nested struct '{nestedStruct.name}' in field '{field.name}' differs"
+
+        layoutC99 = self.computeRecordLayout(struct, LLGLModule.LAYOUT_C99)
+        if isinstance(layoutC99, str):
+            return layoutC99
+        layoutCpp = self.computeRecordLayout(struct, LLGLModule.LAYOUT_CPP)
+        if isinstance(layoutCpp, str):
+            return layoutCpp
+
+        for fieldC99, fieldCpp in zip(layoutC99.fields, layoutCpp.fields):
+            offset, size = fieldC99.offset, fieldC99.size
+            if fieldC99.isBitfield():
+                if fieldC99.bitOffset % 8 != 0 or fieldC99.bitsize % 8 != 0:
+                    return f"bitfield '{fieldC99.name}' is not byte-aligned"
+                offset, size = fieldC99.offset + fieldC99.bitOffset // 8, fieldC99.bitsize // 8
+            if offset != fieldCpp.offset or size != fieldCpp.size:
+                return f"field '{fieldC99.name}' at offset {offset} with size {size} in C99 but offset {fieldCpp.offset} with size {fieldCpp.size} in C++"
+        if layoutC99.size != layoutCpp.size or layoutC99.align < layoutCpp.align:
+            return f"size {layoutC99.size} with alignment {layoutC99.align} in C99 but size {layoutCpp.size} with alignment {layoutCpp.align} in C++"
+
+        return None
+
     def sortStructsByDependencies(self):
         # Derive dependencies for all structs
         for struct in self.structs:
@@ -379,3 +724,94 @@ class LLGLModule:
 
         return sortedStructs
 
+    # Removes all enumerations, flags, structs, functions, and delegates from the specified modules that are not reachable from the root names.
+    # Roots can be function names with or without prefix (e.g. 'llglCreateBuffer' or 'CreateBuffer'), type names (e.g. 'BufferDescriptor'),
+    # and C99 names of enumeration and flags entries (e.g. 'LLGLFormatRGBA8UNorm').
+    # Reachability follows parameter, return, and field types, delegates, records named in default initializers (e.g. 'BindFlags::Sampled'),
+    # and flags that are passed as 'long' by naming convention (e.g. 'bindFlags' for 'BindFlags' or 'flags' in 'CommandBufferDescriptor').
+    # Returns a list of root names that could not be found.
+    @staticmethod
+    def pruneUnreachable(modules, roots):
+        records = dict()
+        funcs = dict()
+        for module in modules:
+            for record in module.enums + module.flags + module.structs:
+                records[record.name] = record
+            for func in module.funcs + module.delegates:
+                funcs[func.name] = func
+
+        flagRecords = [flag for module in modules for flag in module.flags]
+
+        def findFlagsByConvention(name):
+            return next((flag.name for flag in flagRecords if flag.name.lower() == name.lower()), None)
+
+        # Types in exported C functions use the 'LLGL' prefix, e.g. 'LLGLBufferDescriptor'
+        def typenameOf(typename):
+            return typename[len(LLGLMeta.typePrefix):] if typename.startswith(LLGLMeta.typePrefix) and not typename in records else typename
+
+        # Entries of enumerations and flags as they are named in C99, e.g. 'LLGLFormatRGBA8UNorm' or 'LLGLBindVertexBuffer'
+        def findRecordByEntryName(name):
+            for module in modules:
+                for record in module.enums + module.flags:
+                    basename = record.name[:-len('Flags')] if record in module.flags else record.name
+                    if any(name == f'{LLGLMeta.typePrefix}{basename}{field.name}' for field in record.fields):
+                        return record.name
+            return None
+
+        reachable = set()
+        pending = []
+        unknownRoots = []
+
+        def visit(name):
+            if name and not name in reachable and (name in records or name in funcs):
+                reachable.add(name)
+                pending.append(name)
+
+        def visitField(field, ownerName):
+            visit(typenameOf(field.type.typename))
+            if field.init:
+                for match in re.finditer(r'(\w+)::', field.init):
+                    visit(match.group(1))
+            if field.type.baseType == StdType.LONG:
+                if field.name.endswith('Flags'):
+                    visit(findFlagsByConvention(field.name))
+                elif field.name == 'flags' and ownerName:
+                    visit(findFlagsByConvention(re.sub(r'Descriptor$', '', ownerName) + 'Flags'))
+                visit(LLGLMeta.structFlags.get(ownerName))
+
+        for root in roots:
+            if root in records or root in funcs:
+                visit(root)
+            elif LLGLMeta.funcPrefix + root[0].upper() + root[1:] in funcs:
+                visit(LLGLMeta.funcPrefix + root[0].upper() + root[1:])
+            elif typenameOf(root) in records:
+                visit(typenameOf(root))
+            elif findRecordByEntryName(root):
+                visit(findRecordByEntryName(root))
+            elif not root in LLGLMeta.interfaces and not typenameOf(root) in LLGLMeta.interfaces:
+                unknownRoots.append(root)
+
+        while len(pending) > 0:
+            name = pending.pop()
+            if name in records:
+                for field in records[name].fields:
+                    visitField(field, name)
+            else:
+                func = funcs[name]
+                visitField(LLGLField('', func.returnType), None)
+                for param in func.params:
+                    visitField(param, None)
+                # Functions that return flags as 'long' by naming convention, e.g. 'llglGetBufferBindFlags'
+                if func.returnType.baseType == StdType.LONG:
+                    visit(next((flag.name for flag in flagRecords if func.name.endswith(flag.name)), None))
+
+        for module in modules:
+            module.enums = list(filter(lambda record: record.name in reachable, module.enums))
+            module.flags = list(filter(lambda record: record.name in reachable, module.flags))
+            module.structs = list(filter(lambda record: record.name in reachable, module.structs))
+            module.funcs = list(filter(lambda func: func.name in reachable, module.funcs))
+            module.delegates = list(filter(lambda func: func.name in reachable, module.delegates))
+            module.typeDeps = set()
+            module.deriveDependencies()
+
+        return unknownRoots
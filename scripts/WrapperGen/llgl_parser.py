@@ -206,12 +206,14 @@ class Parser:
             typename = self.scanner.accept()
             isConst = self.scanner.acceptIf('const') or isConst
             if typename in LLGLMeta.containers and self.scanner.acceptIf('<'):
+                container = typename
                 isConst = self.scanner.acceptIf('const') or isConst
                 typename = self.scanner.accept()
                 isPointer = self.scanner.acceptIf('*')
                 self.scanner.acceptOrFail('>')
                 outType = LLGLType(typename, isConst, isPointer)
                 outType.setArraySize(LLGLType.DYNAMIC_ARRAY)
+                outType.container = container
                 return outType
             else:
                 isPointer = self.scanner.acceptIf('*')
@@ -264,11 +266,11 @@ class Parser:
                 self.scanner.acceptOrFail(';')
         return members
 
-    def parseAnnotationArgument(self):
+    def parseAnnotationArgument(self, param):
         if self.scanner.acceptIf('NULL'):
             return LLGLAnnotation.NULLABLE
         elif self.scanner.acceptIf('['):
-            self.scanner.accept()
+            param.arrayLength = self.scanner.accept()
             self.scanner.acceptOrFail(']')
             return LLGLAnnotation.ARRAY
         else:
@@ -292,7 +294,7 @@ class Parser:
         if self.scanner.acceptIf('LLGL_ANNOTATE'):
             self.scanner.acceptOrFail('(')
             while self.scanner.good():
-                param.annotations.append(self.parseAnnotationArgument())
+                param.annotations.append(self.parseAnnotationArgument(param))
                 if not self.scanner.acceptIf(','):
                     break
             self.scanner.acceptOrFail(')')
@@ -356,7 +358,9 @@ class Parser:
         while self.scanner.good():
             if processFunctions and self.scanner.acceptIf('LLGL_C_EXPORT'):
                 # Parse function declaration
-                mod.funcs.append(self.parseFunctionDecl())
+                func = self.parseFunctionDecl()
+                func.moduleName = mod.name
+                mod.funcs.append(func)
             elif self.scanner.acceptIf('typedef') and not self.scanner.match('struct'):
                 # Parse type alias
                 typeDecl = self.parseType()
@@ -376,6 +380,7 @@ class Parser:
                 self.scanner.acceptOrFail('{')
                 enum.fields = self.parseEnumEntries()
                 self.scanner.acceptOrFail('}')
+                enum.foldEntryValues()
                 mod.enums.append(enum)
             elif self.scanner.acceptIf('struct'):
                 self.scanner.acceptIf('LLGL_EXPORT')
@@ -406,6 +411,7 @@ class Parser:
                         flag.base = self.parseType()
                     self.scanner.acceptOrFail('{')
                     flag.fields = self.parseEnumEntries()
+                    flag.foldEntryValues()
                     if not ignoreRecord:
                         mod.flags.append(flag)
                 else:
@@ -5,6 +5,8 @@
 # Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
 #
 
+import io
+import contextlib
 from llgl_parser import *
 
 class Translator:
@@ -68,6 +70,29 @@ class Translator:
         self.indent -= 1
         self.statement(stmt)
 
+    # Writes everything the specified function prints into a file, but leaves the file untouched if its content has not changed.
+    # This keeps the timestamps of unchanged outputs so build systems do not recompile their dependents.
+    @staticmethod
+    def writeFile(filename, translateFunc):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            translateFunc()
+        content = output.getvalue()
+        if os.path.isfile(filename):
+            with open(filename, 'r', newline = '') as file:
+                if file.read() == content:
+                    return False
+        with open(filename, 'w', newline = '') as file:
+            file.write(content)
+        return True
+
+    # Aborts translation if any entry of the specified enumeration or flags record has no folded value (see LLGLRecord.foldEntryValues)
+    @staticmethod
+    def requireFoldedValues(record):
+        unresolved = record.unresolvedEntries()
+        if len(unresolved) > 0:
+            fatal(f"error: failed to fold initializers of '{record.name}' entries: {', '.join(unresolved)}")
+
     @staticmethod
     def convertNameToHeaderGuard(name):
         return re.sub(r'([A-Z]+)', r'_\1', name).upper()
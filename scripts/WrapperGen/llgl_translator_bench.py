@@ -0,0 +1,318 @@
+#
+# llgl_translator_bench.py
+#
+# Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+# Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+#
+
+from llgl_translator import *
+from llgl_translator_c99 import C99Translator
+
+class BenchmarkTranslator(Translator):
+    # Functions that are benchmarked if no explicit selection is specified
+    defaultFunctions = [
+        'llglCreateBuffer',
+        'llglCreateSampler',
+        'llglCreateTexture',
+        'llglSetViewport',
+        'llglSetScissor',
+        'llglSetVertexBuffer',
+        'llglSetIndexBuffer',
+        'llglSetBlendFactor',
+        'llglSetStencilReference',
+        'llglDraw',
+        'llglDrawIndexed',
+        'llglDrawInstanced',
+        'llglDispatch'
+    ]
+
+    # Functions that must not be recorded inside a benchmark loop
+    excludedFunctions = [
+        'llglBegin',
+        'llglEnd',
+        'llglExecute',
+        'llglLoadRenderSystem',
+        'llglLoadRenderSystemExt',
+        'llglUnloadRenderSystem',
+        'llglMakeRenderSystemCurrent'
+    ]
+
+    class Benchmark:
+        func = None
+        name = ''
+        releaseFunc = None # Release function for creator benchmarks, e.g. 'llglReleaseBuffer' for 'llglCreateBuffer'
+        decls = [] # Static argument declarations
+        args = [] # Argument expressions
+        handles = [] # Interface typenames this benchmark depends on
+        error = None # Reason why this function cannot be benchmarked
+
+        def __init__(self, func):
+            self.func = func
+            self.name = func.name[len(LLGLMeta.funcPrefix):]
+            self.releaseFunc = None
+            self.decls = []
+            self.args = []
+            self.handles = []
+            self.error = None
+
+    # Field values that replace the defaults of resource descriptors which are invalid as is, e.g. a buffer with zero size.
+    # The buffer can be bound as vertex and index buffer since it is also used as argument for llglSetVertexBuffer and llglSetIndexBuffer.
+    resourceInitializers = {
+        'BufferDescriptor': {
+            'size': 'LLGL_BENCHMARK_BUFFER_SIZE',
+            'format': 'LLGLFormatR32UInt',
+            'bindFlags': '(LLGLBindVertexBuffer | LLGLBindIndexBuffer)',
+        },
+    }
+
+    functions = None
+
+    def __init__(self, functions = None):
+        self.functions = functions if functions else BenchmarkTranslator.defaultFunctions
+
+    @staticmethod
+    def stripTypePrefix(typename):
+        return typename[len(LLGLMeta.typePrefix):] if typename.startswith(LLGLMeta.typePrefix) else typename
+
+    @staticmethod
+    def isInterfaceType(fieldType):
+        return fieldType.baseType == StdType.STRUCT and BenchmarkTranslator.stripTypePrefix(fieldType.typename) in LLGLMeta.interfaces
+
+    @staticmethod
+    def translateHandleName(typename):
+        typename = BenchmarkTranslator.stripTypePrefix(typename)
+        return f'g_{typename[0].lower()}{typename[1:]}'
+
+    @staticmethod
+    def translateScalarDefault(fieldType):
+        if fieldType.baseType == StdType.BOOL:
+            return 'false'
+        elif fieldType.baseType == StdType.FLOAT:
+            return '0.0f'
+        elif fieldType.baseType == StdType.STRUCT:
+            # Enumerations and flags start with their first entry
+            return f'({fieldType.typename})0'
+        return '0'
+
+    # Replaces the top-level scalar field initializers of the specified struct initializer by those in 'resourceInitializers'
+    @staticmethod
+    def translateResourceInitializer(structName, init):
+        for fieldName, value in BenchmarkTranslator.resourceInitializers.get(structName, {}).items():
+            init = re.sub(rf'\.{fieldName} = [^,{{}}]+', lambda match: f'.{fieldName} = {value}', init, count = 1)
+        return init
+
+    # Derives the static arguments for a single function call or sets the 'error' field if the function cannot be called generically
+    @staticmethod
+    def deriveBenchmark(doc, func):
+        bench = BenchmarkTranslator.Benchmark(func)
+        if func.name in BenchmarkTranslator.excludedFunctions:
+            bench.error = 'excluded from benchmarks'
+            return bench
+
+        # Creators are benchmarked together with their release function to avoid unbounded allocations
+        if BenchmarkTranslator.isInterfaceType(func.returnType) and not func.returnType.isPointer:
+            releaseName = func.name.replace('Create', 'Release', 1)
+            releaseFunc = next((other for other in doc.funcs if other.name == releaseName), None)
+            if releaseFunc is None:
+                bench.error = f'missing release function {releaseName}'
+                return bench
+            bench.releaseFunc = releaseFunc.name
+
+        # Length parameters of dynamic arrays are resolved by their array parameters
+        lengthParams = set(filter(None, map(lambda param: param.arrayLength if LLGLAnnotation.ARRAY in param.annotations else None, func.params)))
+
+        for param in func.params:
+            paramType = param.type
+            declName = f'{func.name}_{param.name}'
+            if paramType.baseType in [StdType.UNDEFINED, StdType.VARGS, StdType.FUNC]:
+                bench.error = f'unsupported parameter type for \'{param.name}\''
+                return bench
+            elif param.name in lengthParams:
+                bench.args.append('1')
+            elif BenchmarkTranslator.isInterfaceType(paramType) and not paramType.isPointer:
+                if LLGLAnnotation.NULLABLE in param.annotations:
+                    bench.args.append(f'({paramType.typename})LLGL_NULL_OBJECT')
+                else:
+                    bench.args.append(BenchmarkTranslator.translateHandleName(paramType.typename))
+                    bench.handles.append(paramType.typename)
+            elif LLGLAnnotation.NULLABLE in param.annotations and paramType.isPointer:
+                bench.args.append('NULL')
+            elif paramType.isPointer:
+                if paramType.baseType == StdType.CHAR:
+                    bench.args.append('""')
+                elif paramType.baseType == StdType.VOID:
+                    bench.args.append('g_scratchMemory')
+                elif BenchmarkTranslator.isInterfaceType(paramType):
+                    bench.args.append(f'&{BenchmarkTranslator.translateHandleName(paramType.typename)}')
+                    bench.handles.append(paramType.typename)
+                else:
+                    # Single default-initialized element for struct references and arrays
+                    init = None
+                    if paramType.baseType == StdType.STRUCT:
+                        struct = doc.findStructByName(BenchmarkTranslator.stripTypePrefix(paramType.typename))
+                        if struct:
+                            init = C99Translator.translateStructInitializer(doc, struct)
+                            if init:
+                                init = BenchmarkTranslator.translateResourceInitializer(struct.name, init)
+                    const = 'const ' if paramType.isConst else ''
+                    bench.decls.append(f'static {const}{paramType.typename} {declName} = {init if init else "{ 0 }"};')
+                    bench.args.append(f'&{declName}')
+            elif paramType.arraySize > 0:
+                bench.decls.append(f'static const {paramType.typename} {declName}[{paramType.arraySize}] = {{ 0 }};')
+                bench.args.append(declName)
+            else:
+                bench.args.append(BenchmarkTranslator.translateScalarDefault(paramType))
+
+        return bench
+
+    def translateModule(self, doc):
+        benchmarks = []
+        for funcName in self.functions:
+            func = next((func for func in doc.funcs if func.name == funcName), None)
+            if func:
+                benchmarks.append(BenchmarkTranslator.deriveBenchmark(doc, func))
+
+        validBenchmarks = list(filter(lambda bench: bench.error is None, benchmarks))
+
+        # Resolve handles that must be created before the benchmarks run
+        handleCreators = []
+        for bench in validBenchmarks:
+            for typename in bench.handles:
+                if typename != 'LLGLCommandBuffer' and not next((creator for creator in handleCreators if creator.func.returnType.typename == typename), None):
+                    creatorFunc = next((func for func in doc.funcs if func.name == f'{LLGLMeta.funcPrefix}Create{BenchmarkTranslator.stripTypePrefix(typename)}'), None)
+                    creator = BenchmarkTranslator.deriveBenchmark(doc, creatorFunc) if creatorFunc else None
+                    if creator is None or creator.error or len(creator.handles) > 0:
+                        bench.error = f'cannot create handle of type {typename}'
+                    else:
+                        handleCreators.append(creator)
+
+        validBenchmarks = list(filter(lambda bench: bench.error is None, validBenchmarks))
+        handleCreators = list(filter(lambda creator: any(creator.func.returnType.typename in bench.handles for bench in validBenchmarks), handleCreators))
+
+        usesScratchMemory = any('g_scratchMemory' in bench.args for bench in handleCreators + validBenchmarks)
+
+        self.statement('/*')
+        self.statement(f' * {doc.name}.c')
+        self.statement(' *')
+        for line in LLGLMeta.copyright:
+            self.statement(f' * {line}')
+        self.statement(' */')
+        self.statement()
+        for line in LLGLMeta.info:
+            self.statement(f'/* {line} */')
+        self.statement()
+        self.statement('/*')
+        self.statement('Measures the call overhead of the C wrapper against a render system (Null by default).')
+        self.statement(f'Usage: {doc.name} [MODULE] [ITERATIONS]')
+        self.statement('Output: CSV with one line per function: function,iterations,total_ns,ns_per_call')
+        self.statement('*/')
+        self.statement()
+        self.statement('#include <LLGL-C/LLGL.h>')
+        self.statement('#include <stdio.h>')
+        self.statement('#include <stdlib.h>')
+        self.statement()
+        self.statement()
+        self.statement('#define LLGL_BENCHMARK_DEFAULT_MODULE       "Null"')
+        self.statement('#define LLGL_BENCHMARK_DEFAULT_ITERATIONS   ( 100000 )')
+        if usesScratchMemory:
+            self.statement('#define LLGL_BENCHMARK_SCRATCH_SIZE         ( 256 )')
+        self.statement('#define LLGL_BENCHMARK_BUFFER_SIZE          ( 256 )')
+        self.statement()
+        self.statement()
+
+        # Write static arguments
+        self.statement('/* ----- Arguments ----- */')
+        self.statement()
+        if usesScratchMemory:
+            self.statement('static char g_scratchMemory[LLGL_BENCHMARK_SCRATCH_SIZE];')
+        self.statement('static LLGLCommandBuffer g_commandBuffer;')
+        for creator in handleCreators:
+            typename = creator.func.returnType.typename
+            self.statement(f'static {typename} {BenchmarkTranslator.translateHandleName(typename)};')
+        self.statement()
+        writtenDecls = set()
+        for bench in handleCreators + validBenchmarks:
+            for decl in bench.decls:
+                if not decl in writtenDecls:
+                    self.statement(decl)
+                    writtenDecls.add(decl)
+        self.statement()
+        self.statement()
+
+        # Write benchmark functions
+        self.statement('/* ----- Benchmarks ----- */')
+        self.statement()
+
+        for bench in benchmarks:
+            if bench.error:
+                self.statement(f'/* {bench.func.name}: {bench.error} */')
+                self.statement()
+                continue
+
+            call = f'{bench.func.name}({", ".join(bench.args)})'
+            self.statement(f'static void Benchmark{bench.name}(int numIterations)')
+            self.openScope()
+            if bench.releaseFunc:
+                self.statement('for (int i = 0; i < numIterations; ++i)')
+                self.openScope()
+                self.statement(f'{bench.func.returnType.typename} obj = {call};')
+                self.statement(f'{bench.releaseFunc}(obj);')
+                self.closeScope()
+            else:
+                self.statement('llglBegin(g_commandBuffer);')
+                self.statement('for (int i = 0; i < numIterations; ++i)')
+                self.statement(f'    {call};')
+                self.statement('llglEnd();')
+            self.closeScope()
+            self.statement()
+
+        self.statement()
+
+        # Write main entry point
+        self.statement('/* ----- Main ----- */')
+        self.statement()
+        self.statement('static void PrintResult(const char* name, int numIterations, uint64_t ticks)')
+        self.openScope()
+        self.statement('const double totalNs = (double)ticks * 1.0e9 / (double)llglTimerFrequency();')
+        self.statement('printf("%s,%d,%.0f,%.3f\\n", name, numIterations, totalNs, totalNs / (double)numIterations);')
+        self.closeScope()
+        self.statement()
+        self.statement('int main(int argc, char* argv[])')
+        self.openScope()
+        self.statement('const char* moduleName = (argc > 1 ? argv[1] : LLGL_BENCHMARK_DEFAULT_MODULE);')
+        self.statement('const int numIterations = (argc > 2 ? atoi(argv[2]) : LLGL_BENCHMARK_DEFAULT_ITERATIONS);')
+        self.statement()
+        self.statement('if (llglLoadRenderSystem(moduleName) == 0)')
+        self.openScope()
+        self.statement('fprintf(stderr, "Failed to load render system: %s\\n", moduleName);')
+        self.statement('return 1;')
+        self.closeScope()
+        self.statement()
+        self.statement('const LLGLCommandBufferDescriptor commandBufferDesc = { .flags = 0 };')
+        self.statement('g_commandBuffer = llglCreateCommandBuffer(&commandBufferDesc);')
+        for creator in handleCreators:
+            typename = creator.func.returnType.typename
+            self.statement(f'{BenchmarkTranslator.translateHandleName(typename)} = {creator.func.name}({", ".join(creator.args)});')
+        self.statement()
+        self.statement('printf("function,iterations,total_ns,ns_per_call\\n");')
+        self.statement()
+        for bench in validBenchmarks:
+            self.statement('{')
+            self.statement('    const uint64_t startTick = llglTimerTick();')
+            self.statement(f'    Benchmark{bench.name}(numIterations);')
+            self.statement(f'    PrintResult("{bench.func.name}", numIterations, llglTimerTick() - startTick);')
+            self.statement('}')
+        self.statement()
+        for creator in reversed(handleCreators):
+            typename = creator.func.returnType.typename
+            self.statement(f'{creator.releaseFunc}({BenchmarkTranslator.translateHandleName(typename)});')
+        self.statement('llglReleaseCommandBuffer(g_commandBuffer);')
+        self.statement('llglUnloadRenderSystem();')
+        self.statement()
+        self.statement('return 0;')
+        self.closeScope()
+        self.statement()
+        self.statement()
+        self.statement()
+        self.statement('/* ================================================================================ */')
+        self.statement()
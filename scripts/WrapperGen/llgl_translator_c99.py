@@ -8,6 +8,59 @@
 from llgl_translator import *
 
 class C99Translator(Translator):
+    includeDir = '' # Subdirectory within <LLGL-C/...> for split module headers (see translateSplitModules)
+    moduleHeaders = {} # Dictionary of include paths per typename that is declared in a split module header
+    sizedTypes = {} # Dictionary of fixed bitsizes per enumeration name across all split module headers
+    lookupDoc = None # Module with the declarations of all split module headers to look up nested structs
+
+    def __init__(self, includeDir = ''):
+        self.includeDir = includeDir
+        self.moduleHeaders = {}
+        self.sizedTypes = {}
+        self.lookupDoc = None
+
+    @staticmethod
+    def translateFieldInitializer(fieldType, init):
+        if fieldType.isDynamicArray():
+            return 'NULL'
+        if init:
+            if init == 'nullptr':
+                return 'LLGL_NULL_OBJECT' if fieldType.isInterface() else 'NULL'
+            else:
+                return re.sub(r'(\w+::)', r'LLGL\1', init).replace('::', '').replace('|', ' | ').replace('Flags', '')
+        return None
+
+    # Returns a designated initializer list with the default values of the specified struct including nested structs,
+    # or None if all fields of this struct are zero-initialized by default.
+    # If 'useMacros' is true, nested structs refer to their initializer macros (see translateInitializerMacroName) instead of being expanded.
+    @staticmethod
+    def translateStructInitializer(doc, struct, useMacros = False):
+        def translateConstants(init):
+            # Constants such as LLGL_WHOLE_SIZE are only declared in the C++ headers
+            return re.sub(r'\bLLGL_\w+\b', lambda match: f'({LLGLMeta.constants[match.group(0)]})' if match.group(0) in LLGLMeta.constants else match.group(0), init)
+
+        inits = []
+        for field in struct.fields:
+            if field.type.externalCond or field.type.isDynamicArray() or field.type.isPointer:
+                continue
+            init = C99Translator.translateFieldInitializer(field.type, field.init)
+            if init is None and field.type.isCustomType():
+                nestedStruct = doc.findStructByName(field.type.typename)
+                if nestedStruct:
+                    init = C99Translator.translateStructInitializer(doc, nestedStruct, useMacros)
+                    if init is not None and useMacros:
+                        init = C99Translator.translateInitializerMacroName(nestedStruct.name)
+                    if init is not None and field.type.arraySize > 0:
+                        # Fixed size arrays of structs with default values, e.g. BlendDescriptor::targets
+                        init = '{ ' + ', '.join([init] * field.type.arraySize) + ' }'
+            if init is not None:
+                inits.append(f'.{field.name} = {translateConstants(init)}')
+        return '{ ' + ', '.join(inits) + ' }' if len(inits) > 0 else None
+
+    @staticmethod
+    def translateInitializerMacroName(name):
+        return f'LLGL_{name.upper()}_INIT'
+
     def translateModule(self, doc):
         def translateDependency(inType):
             if inType.baseType in [StdType.BOOL]:
@@ -18,19 +71,29 @@ class C99Translator(Translator):
                 return '<stddef.h>', True
             elif inType.baseType in [StdType.CHAR, StdType.WCHAR, StdType.LONG, StdType.FLOAT]:
                 return None, True
-            return f'<LLGL-C/{inType.typename}Flags.h>', False
+            return self.moduleHeaders.get(inType.typename), False
 
         def translateIncludes(typeDeps):
+            # Split module headers only include what their own fields require
             stdIncludes = set()
-            llglIncludes = LLGLMeta.includes.copy()
+            llglIncludes = set() if self.includeDir else LLGLMeta.includes.copy()
+            ownHeader = self.translateModuleHeader(doc.name)
             for dep in typeDeps:
                 inc = translateDependency(dep)
                 if inc and inc[0]:
                     if inc[1]:
                         stdIncludes.add(inc[0])
-                    #else:
-                    #    llglIncludes.add(inc[0])
-            return stdIncludes, llglIncludes
+                    elif inc[0] != ownHeader:
+                        llglIncludes.add(inc[0])
+                if dep.isDynamicArray():
+                    stdIncludes.add('<stddef.h>') # size_t for array length field
+                if dep.isInterface():
+                    llglIncludes.update(LLGLMeta.includes)
+            llglIncludes.update(self.findInitializerHeaders(doc) - { ownHeader })
+            return sorted(stdIncludes), sorted(llglIncludes)
+
+        def isExternalRequired(external):
+            return not self.includeDir or any(dep.externalCond == external.cond for dep in doc.typeDeps)
 
         def translateDeprecationMessage(msg):
             if msg is not None:
@@ -53,7 +116,7 @@ class C99Translator(Translator):
         self.statement()
 
         # Write header guard
-        headerGuardName = f'LLGL_C99{Translator.convertNameToHeaderGuard(doc.name)}_H'
+        headerGuardName = f'LLGL_C99{Translator.convertNameToHeaderGuard(self.includeDir + doc.name)}_H'
         self.statement(f'#ifndef {headerGuardName}')
         self.statement(f'#define {headerGuardName}')
         self.statement()
@@ -67,7 +130,7 @@ class C99Translator(Translator):
                     self.statement(f'#include {inc}')
 
             for external in LLGLMeta.externals:
-                if external.cond and external.include:
+                if external.cond and external.include and isExternalRequired(external):
                     self.statement()
                     self.statement(f'#if {external.cond}')
                     self.statement(f'#   include {external.include}')
@@ -96,7 +159,7 @@ class C99Translator(Translator):
             self.statement()
 
         # Write all enumerations
-        sizedTypes = dict()
+        sizedTypes = dict(self.sizedTypes)
 
         if len(doc.enums) > 0:
             self.statement('/* ----- Enumerations ----- */')
@@ -216,16 +279,6 @@ class C99Translator(Translator):
 
                 return (typeStr, declStr)
 
-            def translateFieldInitializer(fieldType, init):
-                if fieldType.isDynamicArray():
-                    return 'NULL'
-                if init:
-                    if init == 'nullptr':
-                        return 'LLGL_NULL_OBJECT' if fieldType.isInterface() else 'NULL'
-                    else:
-                        return re.sub(r'(\w+::)', r'LLGL\1', init).replace('::', '').replace('|', ' | ').replace('Flags', '')
-                return None
-
             self.statement('/* ----- Structures ----- */')
             self.statement()
 
@@ -247,7 +300,7 @@ class C99Translator(Translator):
                         Translator.Declaration(
                             declStr[0],
                             declStr[1],
-                            translateFieldInitializer(field.type, field.init),
+                            C99Translator.translateFieldInitializer(field.type, field.init),
                             inComment = translateDeprecationMessage(field.deprecated)))
                     if externalCond:
                         declList.append(Translator.Declaration(inDirective = f'#endif /* {externalCond} */'))
@@ -265,6 +318,26 @@ class C99Translator(Translator):
                 self.statement(f'LLGL{struct.name};')
                 self.statement()
 
+                # Write designated initializer with default values that can be constant-folded by the compiler
+                init = C99Translator.translateStructInitializer(self.lookupDoc if self.lookupDoc else doc, struct, useMacros = True)
+                self.statement(f'#define {C99Translator.translateInitializerMacroName(struct.name)} {init if init else "{ 0 }"}')
+                self.statement()
+
+            self.statement()
+
+            # Write default instances; designated initializers are not available in C++ prior to C++20
+            self.statement('/* ----- Default values ----- */')
+            self.statement()
+            self.statement('#ifndef __cplusplus')
+            self.statement()
+            declList = Translator.DeclarationList()
+            for struct in commonStructs:
+                declList.append(Translator.Declaration(f'LLGL{struct.name}', f'g_llgl{struct.name}Default', C99Translator.translateInitializerMacroName(struct.name)))
+            for decl in declList.decls:
+                self.statement(f'static const {decl.type}{declList.spaces(0, decl.type)}{decl.name}{declList.spaces(1, decl.name)}= {decl.init};')
+            self.statement()
+            self.statement('#endif /* __cplusplus */')
+            self.statement()
             self.statement()
 
         self.statement(f'#endif /* {headerGuardName} */')
@@ -274,3 +347,87 @@ class C99Translator(Translator):
         self.statement('/* ================================================================================ */')
         self.statement()
 
+    def translateModuleHeader(self, name):
+        return f'<LLGL-C/{self.includeDir}/{name}.h>' if self.includeDir else None
+
+    # Returns the set of split module headers that declare the enumerations and flags used in default values, e.g. 'BindFlags::Sampled'
+    def findInitializerHeaders(self, doc):
+        headers = set()
+        for struct in doc.structs:
+            for field in struct.fields:
+                if field.init:
+                    for match in re.finditer(r'(\w+)::', field.init):
+                        if match.group(1) in self.moduleHeaders:
+                            headers.add(self.moduleHeaders[match.group(1)])
+        return headers
+
+    # Writes one header per module into the specified output directory and prints an umbrella header that includes all of them.
+    # Each module header only includes the standard headers and module headers its own declarations depend on.
+    def translateSplitModules(self, name, modules, outputDir):
+        # Map each declared typename to the header of its module
+        self.moduleHeaders = {}
+        self.sizedTypes = {}
+        self.lookupDoc = LLGLModule()
+        for module in modules:
+            self.lookupDoc.merge(module)
+            for record in module.enums + module.flags + module.structs:
+                self.moduleHeaders[record.name] = self.translateModuleHeader(module.name)
+            for enum in module.enums:
+                bitsize = enum.base.getFixedBitsize() if enum.base else 0
+                if bitsize > 0:
+                    self.sizedTypes[enum.name] = bitsize
+
+        # Include graph must be acyclic since each header includes its dependencies before its own declarations
+        moduleDeps = dict()
+        for module in modules:
+            ownHeader = self.translateModuleHeader(module.name)
+            moduleDeps[ownHeader] = (set(self.moduleHeaders[dep.typename] for dep in module.typeDeps if dep.typename in self.moduleHeaders) | self.findInitializerHeaders(module)) - { ownHeader }
+
+        def findIncludeCycle(header, path):
+            if header in path:
+                return path[path.index(header):] + [header]
+            for dep in sorted(moduleDeps.get(header, [])):
+                cycle = findIncludeCycle(dep, path + [header])
+                if cycle:
+                    return cycle
+            return None
+
+        for header in moduleDeps:
+            cycle = findIncludeCycle(header, [])
+            if cycle:
+                fatal(f'error: cyclic include dependency between split module headers: {" -> ".join(cycle)}')
+
+        # Write module headers and only touch files whose content has changed
+        os.makedirs(outputDir, exist_ok = True)
+        for module in modules:
+            if len(module.enums) + len(module.flags) + len(module.structs) > 0:
+                Translator.writeFile(os.path.join(outputDir, f'{module.name}.h'), lambda: self.translateModule(module))
+
+        # Write umbrella header for compatibility with the consolidated header
+        self.statement('/*')
+        self.statement(f' * {name}.h')
+        self.statement(' *')
+        for line in LLGLMeta.copyright:
+            self.statement(f' * {line}')
+        self.statement(' */')
+        self.statement()
+        for line in LLGLMeta.info:
+            self.statement(f'/* {line} */')
+        self.statement()
+        headerGuardName = f'LLGL_C99{Translator.convertNameToHeaderGuard(name)}_H'
+        self.statement(f'#ifndef {headerGuardName}')
+        self.statement(f'#define {headerGuardName}')
+        self.statement()
+        self.statement()
+        self.statement('#include <LLGL-C/Types.h>')
+        for module in modules:
+            if len(module.enums) + len(module.flags) + len(module.structs) > 0:
+                self.statement(f'#include {self.translateModuleHeader(module.name)}')
+        self.statement()
+        self.statement()
+        self.statement(f'#endif /* {headerGuardName} */')
+        self.statement()
+        self.statement()
+        self.statement()
+        self.statement('/* ================================================================================ */')
+        self.statement()
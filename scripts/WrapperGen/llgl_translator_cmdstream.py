@@ -0,0 +1,642 @@
+#
+# llgl_translator_cmdstream.py
+#
+# Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+# Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+#
+
+from enum import Enum
+from llgl_translator import *
+from llgl_translator_csharp import CsharpTranslator
+
+class CommandParamKind(Enum):
+    VALUE = 0           # Scalar, enum, or interface handle stored in the packet
+    FIXED_ARRAY = 1     # Fixed size array stored in the packet, e.g. 'const float color[4]'
+    STRUCT_REF = 2      # Constant pointer to a single struct that is stored by value in the packet
+    ARRAY = 3           # Pointer annotated with LLGL_ANNOTATE([count]), stored in the trailing payload
+    STRING = 4          # Null-terminated string, stored in the trailing payload
+    BLOB = 5            # Untyped data pointer followed by a '<name>Size' parameter, stored in the trailing payload
+
+class CommandParam:
+    kind = CommandParamKind.VALUE
+    field = None
+    lengthParam = None # Name of the parameter that specifies the length of an ARRAY or BLOB parameter
+    lengthOf = None # Name of the ARRAY or BLOB parameter whose length is specified by this parameter
+
+    def __init__(self, kind, field):
+        self.kind = kind
+        self.field = field
+        self.lengthParam = None
+        self.lengthOf = None
+
+    def isPacked(self):
+        return self.kind in [CommandParamKind.VALUE, CommandParamKind.FIXED_ARRAY, CommandParamKind.STRUCT_REF]
+
+class Command:
+    func = None
+    name = ''
+    params = [] # Array of CommandParam
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.name[len(LLGLMeta.funcPrefix):]
+        self.params = []
+
+    def packedParams(self):
+        return list(filter(lambda param: param.isPacked(), self.params))
+
+    def trailingParams(self):
+        return list(filter(lambda param: not param.isPacked(), self.params))
+
+    def findParam(self, name):
+        return next((param for param in self.params if param.field.name == name), None)
+
+class CommandStream:
+    DECODER_NAME = 'llglExecuteCommandStream'
+    # Functions that switch or submit command buffers must not be recorded, since a stream is replayed against the current command buffer
+    EXCLUDED_FUNCTIONS = [ DECODER_NAME, 'llglBegin', 'llglEnd', 'llglExecute' ]
+    ALIGNMENT = 8
+    MODULE_NAME = 'CommandBuffer' # Only commands of the command buffer interface are recorded; functions of other modules, e.g. llglSubmitCommandBuffer, are not
+
+    @staticmethod
+    def classifyParam(func, paramIndex):
+        field = func.params[paramIndex]
+        fieldType = field.type
+
+        if fieldType.baseType in [StdType.UNDEFINED, StdType.VARGS, StdType.FUNC] or LLGLAnnotation.NULLABLE in field.annotations:
+            return None
+        if LLGLAnnotation.ARRAY in field.annotations:
+            return CommandParamKind.ARRAY if fieldType.isPointer and field.arrayLength else None
+        if fieldType.arraySize > 0:
+            return CommandParamKind.FIXED_ARRAY if not fieldType.isPointer and fieldType.baseType != StdType.STRUCT else None
+        if fieldType.isPointer:
+            if fieldType.baseType == StdType.CHAR:
+                return CommandParamKind.STRING
+            if fieldType.baseType == StdType.VOID and fieldType.isConst:
+                nextField = func.params[paramIndex + 1] if paramIndex + 1 < len(func.params) else None
+                return CommandParamKind.BLOB if nextField and nextField.name == f'{field.name}Size' else None
+            if fieldType.baseType == StdType.STRUCT and fieldType.isConst and not fieldType.isInterface():
+                return CommandParamKind.STRUCT_REF
+            return None
+        return CommandParamKind.VALUE
+
+    # Returns the command for the specified function or None if the function cannot be recorded into a command stream
+    @staticmethod
+    def deriveCommand(func):
+        if func.moduleName != CommandStream.MODULE_NAME:
+            return None
+        if func.name in CommandStream.EXCLUDED_FUNCTIONS or func.returnType.baseType != StdType.VOID or func.returnType.isPointer:
+            return None
+
+        cmd = Command(func)
+        for paramIndex in range(0, len(func.params)):
+            kind = CommandStream.classifyParam(func, paramIndex)
+            if kind is None:
+                return None
+            cmd.params.append(CommandParam(kind, func.params[paramIndex]))
+
+        # Link dynamic arrays and blobs to their length parameters
+        for paramIndex in range(0, len(cmd.params)):
+            param = cmd.params[paramIndex]
+            if param.kind == CommandParamKind.ARRAY:
+                param.lengthParam = param.field.arrayLength
+            elif param.kind == CommandParamKind.BLOB:
+                param.lengthParam = cmd.params[paramIndex + 1].field.name
+            if param.lengthParam:
+                lengthParam = cmd.findParam(param.lengthParam)
+                if lengthParam is None or lengthParam.kind != CommandParamKind.VALUE or lengthParam.field.type.isPointer:
+                    return None
+                lengthParam.lengthOf = param.field.name
+
+        return cmd
+
+    @staticmethod
+    def deriveCommands(doc):
+        return list(filter(None, map(CommandStream.deriveCommand, doc.funcs)))
+
+class CommandStreamTranslator(Translator):
+    language = 'c99'
+
+    def __init__(self, language = 'c99'):
+        self.language = language
+
+    def translateModule(self, doc):
+        commands = CommandStream.deriveCommands(doc)
+        if self.language == 'csharp':
+            self.translateEncoder(doc, commands)
+        else:
+            self.translateDecoder(doc, commands)
+
+    # Writes a C99 header with opcodes, packet structures, and the decoder that replays a command stream against the C API
+    def translateDecoder(self, doc, commands):
+        def translatePacketType(fieldType):
+            # Use fixed size types for packet fields that differ in size between platforms
+            if fieldType.baseType == StdType.BOOL:
+                return 'uint8_t'
+            elif fieldType.baseType == StdType.LONG:
+                return 'uint32_t'
+            elif fieldType.baseType == StdType.SIZE_T:
+                return 'uint64_t'
+            return fieldType.typename
+
+        def translateElementType(fieldType):
+            return 'char' if fieldType.baseType == StdType.VOID else fieldType.typename
+
+        self.statement('/*')
+        self.statement(f' * {doc.name}.h')
+        self.statement(' *')
+        for line in LLGLMeta.copyright:
+            self.statement(f' * {line}')
+        self.statement(' */')
+        self.statement()
+        for line in LLGLMeta.info:
+            self.statement(f'/* {line} */')
+        self.statement()
+
+        headerGuardName = f'LLGL_C99{Translator.convertNameToHeaderGuard(doc.name)}_H'
+        self.statement(f'#ifndef {headerGuardName}')
+        self.statement(f'#define {headerGuardName}')
+        self.statement()
+        self.statement()
+        self.statement('#include <LLGL-C/LLGL.h>')
+        self.statement('#include <stdint.h>')
+        self.statement('#include <stddef.h>')
+        self.statement('#include <stdlib.h>')
+        self.statement('#include <string.h>')
+        self.statement()
+        self.statement()
+        self.statement(f'#define LLGL_COMMAND_STREAM_ALIGNMENT   ( {CommandStream.ALIGNMENT} )')
+        self.statement(f'#define LLGL_COMMAND_STREAM_ALIGN(SIZE) ( ((SIZE) + {CommandStream.ALIGNMENT - 1}u) & ~((size_t){CommandStream.ALIGNMENT - 1}u) )')
+        self.statement()
+        self.statement()
+
+        # Write opcodes
+        self.statement('/* ----- Enumerations ----- */')
+        self.statement()
+        self.statement('typedef enum LLGLCommandOpcode')
+        self.openScope()
+        self.statement('LLGLCommandOpcodeUndefined = 0,')
+        for cmd in commands:
+            self.statement(f'LLGLCommandOpcode{cmd.name},')
+        self.statement('LLGLCommandOpcodeCount, /* Number of opcodes; packets with this or a greater opcode are skipped by the decoder */')
+        self.closeScope()
+        self.statement('LLGLCommandOpcode;')
+        self.statement()
+        self.statement()
+
+        # Write packet structures
+        self.statement('/* ----- Structures ----- */')
+        self.statement()
+        self.statement('typedef struct LLGLCommandHeader')
+        self.openScope()
+        self.statement('uint32_t opcode; /* LLGLCommandOpcode */')
+        self.statement('uint32_t size;   /* Packet size in bytes including this header and the trailing payload, aligned to LLGL_COMMAND_STREAM_ALIGNMENT */')
+        self.closeScope()
+        self.statement('LLGLCommandHeader;')
+        self.statement()
+        self.statement('typedef struct LLGLCommandStreamBuffer')
+        self.openScope()
+        self.statement('char*   data;')
+        self.statement('size_t  size;     /* Number of bytes encoded so far */')
+        self.statement('size_t  capacity; /* Number of bytes allocated for data */')
+        self.closeScope()
+        self.statement('LLGLCommandStreamBuffer;')
+        self.statement()
+
+        for cmd in commands:
+            packedParams = cmd.packedParams()
+            if len(packedParams) > 0:
+                self.statement(f'typedef struct LLGLCommand{cmd.name}')
+                self.openScope()
+
+                declList = Translator.DeclarationList()
+                for param in packedParams:
+                    declName = param.field.name
+                    if param.kind == CommandParamKind.FIXED_ARRAY:
+                        declName += f'[{param.field.type.arraySize}]'
+                    declList.append(Translator.Declaration(translatePacketType(param.field.type), declName))
+
+                for decl in declList.decls:
+                    self.statement(f'{decl.type}{declList.spaces(0, decl.type)}{decl.name};')
+
+                self.closeScope()
+                self.statement(f'LLGLCommand{cmd.name};')
+                self.statement()
+
+        self.statement()
+
+        # Write encoder helper
+        self.statement('/* ----- Functions ----- */')
+        self.statement()
+        self.statement('/*')
+        self.statement('Appends a packet with the specified opcode to the stream and returns a pointer to its payload of at least \'payloadSize\' bytes.')
+        self.statement('The stream grows with realloc; release it with free(stream->data). Returns NULL and leaves the stream unchanged')
+        self.statement('if the packet size does not fit into LLGLCommandHeader::size or if the stream could not grow.')
+        self.statement('*/')
+        self.statement('static inline void* llglAllocCommandPacket(LLGLCommandStreamBuffer* stream, LLGLCommandOpcode opcode, size_t payloadSize)')
+        self.openScope()
+        self.statement('if (payloadSize > (size_t)UINT32_MAX - sizeof(LLGLCommandHeader) - (LLGL_COMMAND_STREAM_ALIGNMENT - 1))')
+        self.statement('    return NULL;')
+        self.statement()
+        self.statement('const size_t packetSize = sizeof(LLGLCommandHeader) + LLGL_COMMAND_STREAM_ALIGN(payloadSize);')
+        self.statement()
+        self.statement('if (stream->size + packetSize > stream->capacity)')
+        self.openScope()
+        self.statement('if (stream->size > SIZE_MAX / 2 || packetSize > SIZE_MAX / 2 - stream->size)')
+        self.statement('    return NULL;')
+        self.statement('const size_t newCapacity = (stream->size + packetSize) * 2;')
+        self.statement('char* newData = (char*)realloc(stream->data, newCapacity);')
+        self.statement('if (newData == NULL)')
+        self.statement('    return NULL;')
+        self.statement('stream->data        = newData;')
+        self.statement('stream->capacity    = newCapacity;')
+        self.closeScope()
+        self.statement()
+        self.statement('LLGLCommandHeader* header = (LLGLCommandHeader*)(stream->data + stream->size);')
+        self.statement('header->opcode  = (uint32_t)opcode;')
+        self.statement('header->size    = (uint32_t)packetSize;')
+        self.statement('stream->size += packetSize;')
+        self.statement()
+        self.statement('return header + 1;')
+        self.closeScope()
+        self.statement()
+
+        # Write decoder
+        self.statement('/*')
+        self.statement('Replays all packets of the specified command stream against the current command buffer (see llglBegin).')
+        self.statement('The stream must be aligned to LLGL_COMMAND_STREAM_ALIGNMENT and is only read by this function.')
+        self.statement('Decoding stops at the first packet that is truncated or whose payload does not fit into its packet size.')
+        self.statement('Packets with an unknown opcode are skipped. llglBegin, llglEnd, and llglExecute have no opcode, so a stream cannot switch or submit command buffers.')
+        self.statement('*/')
+        self.statement(f'LLGL_C_EXPORT void {CommandStream.DECODER_NAME}(const void* stream, size_t streamSize);')
+        self.statement()
+        self.statement('#ifdef LLGL_COMMAND_STREAM_IMPLEMENTATION')
+        self.statement()
+        self.statement(f'LLGL_C_EXPORT void {CommandStream.DECODER_NAME}(const void* stream, size_t streamSize)')
+        self.openScope()
+        self.statement('const char* streamPos = (const char*)stream;')
+        self.statement('const char* streamEnd = streamPos + streamSize;')
+        self.statement()
+        self.statement('while (streamPos + sizeof(LLGLCommandHeader) <= streamEnd)')
+        self.openScope()
+        self.statement('const LLGLCommandHeader* header = (const LLGLCommandHeader*)streamPos;')
+        self.statement('const char* payload = streamPos + sizeof(LLGLCommandHeader);')
+        self.statement()
+        self.statement('if (header->size < sizeof(LLGLCommandHeader) || header->size > (size_t)(streamEnd - streamPos))')
+        self.statement('    break;')
+        self.statement()
+        self.statement('const char* packetEnd = streamPos + header->size;')
+        self.statement()
+        self.statement('switch (header->opcode)')
+        self.openScope()
+
+        for cmd in commands:
+            packedParams = cmd.packedParams()
+            trailingParams = cmd.trailingParams()
+
+            self.statement(f'case LLGLCommandOpcode{cmd.name}:')
+            self.openScope()
+
+            # Check that the packed fields fit into the packet, including the alignment that precedes the trailing payload
+            if len(packedParams) > 0:
+                packedSize = f'sizeof(LLGLCommand{cmd.name})'
+                if len(trailingParams) > 0:
+                    packedSize = f'LLGL_COMMAND_STREAM_ALIGN({packedSize})'
+                self.statement(f'if (header->size < sizeof(LLGLCommandHeader) + {packedSize})')
+                self.statement('    return;')
+                self.statement(f'const LLGLCommand{cmd.name}* cmd = (const LLGLCommand{cmd.name}*)payload;')
+                if len(trailingParams) > 0:
+                    self.statement(f'const char* tail = payload + {packedSize};')
+            elif len(trailingParams) > 0:
+                self.statement('const char* tail = payload;')
+
+            # Resolve pointers into the trailing payload; the aligned length of each part must fit into the remainder of the packet
+            for paramIndex in range(0, len(trailingParams)):
+                param = trailingParams[paramIndex]
+                paramName = param.field.name
+                if param.kind == CommandParamKind.STRING:
+                    self.statement(f'const char* {paramName}End = (const char*)memchr(tail, 0, (size_t)(packetEnd - tail));')
+                    self.statement(f'if ({paramName}End == NULL || LLGL_COMMAND_STREAM_ALIGN((size_t)({paramName}End - tail) + 1) > (size_t)(packetEnd - tail))')
+                    self.statement('    return;')
+                    self.statement(f'const char* {paramName} = tail;')
+                    paramSize = f'(size_t)({paramName}End - {paramName}) + 1'
+                else:
+                    elementSize = f'sizeof({translateElementType(param.field.type)})'
+                    paramSize = f'{elementSize} * cmd->{param.lengthParam}'
+                    self.statement(f'if (cmd->{param.lengthParam} > (size_t)(packetEnd - tail) / {elementSize} || LLGL_COMMAND_STREAM_ALIGN({paramSize}) > (size_t)(packetEnd - tail))')
+                    self.statement('    return;')
+                    self.statement(f'const {param.field.type.typename}* {paramName} = (const {param.field.type.typename}*)tail;')
+                if paramIndex + 1 < len(trailingParams):
+                    self.statement(f'tail += LLGL_COMMAND_STREAM_ALIGN({paramSize});')
+
+            # Forward command to C API
+            args = []
+            for param in cmd.params:
+                if param.kind == CommandParamKind.STRUCT_REF:
+                    args.append(f'&cmd->{param.field.name}')
+                elif param.isPacked():
+                    args.append(f'cmd->{param.field.name}')
+                else:
+                    args.append(param.field.name)
+            self.statement(f'{cmd.func.name}({", ".join(args)});')
+            self.statement('break;')
+            self.closeScope()
+
+        self.statement('default:')
+        self.statement('    break;')
+        self.closeScope()
+        self.statement()
+        self.statement('streamPos += header->size;')
+        self.closeScope()
+        self.closeScope()
+        self.statement()
+        self.statement('#endif /* LLGL_COMMAND_STREAM_IMPLEMENTATION */')
+        self.statement()
+        self.statement()
+        self.statement(f'#endif /* {headerGuardName} */')
+        self.statement()
+        self.statement()
+        self.statement()
+        self.statement('/* ================================================================================ */')
+        self.statement()
+
+    # Writes a C# encoder that packs commands into a blittable stream which is executed with a single native call
+    def translateEncoder(self, doc, commands):
+        def translateType(fieldType):
+            if fieldType.baseType == StdType.BOOL:
+                return 'byte'
+            elif fieldType.baseType == StdType.LONG:
+                return 'uint'
+            elif fieldType.baseType == StdType.SIZE_T:
+                return 'ulong'
+            elif fieldType.baseType == StdType.STRUCT:
+                typename = fieldType.typename[len(LLGLMeta.typePrefix):] if fieldType.typename.startswith(LLGLMeta.typePrefix) else fieldType.typename
+                if fieldType.isInterface() or typename in LLGLMeta.interfaces:
+                    return f'NativeLLGL.{typename}'
+                elif doc.findEnumByName(typename) or doc.findFlagsByName(typename) or typename in CsharpTranslator.saveStructs:
+                    return typename
+                return f'NativeLLGL.{typename}'
+            elif fieldType.baseType == StdType.VOID:
+                return 'byte'
+            return CsharpTranslator.builtinTypenames.get(fieldType.baseType)
+
+        def translateParamType(param):
+            if param.kind == CommandParamKind.STRING:
+                return 'string'
+            elif param.kind in [CommandParamKind.ARRAY, CommandParamKind.BLOB, CommandParamKind.FIXED_ARRAY]:
+                return f'ReadOnlySpan<{translateType(param.field.type)}>'
+            elif param.kind == CommandParamKind.STRUCT_REF:
+                return f'in {translateType(param.field.type)}'
+            elif param.field.type.baseType == StdType.BOOL:
+                return 'bool'
+            elif param.field.type.baseType == StdType.SIZE_T:
+                return 'UIntPtr'
+            return translateType(param.field.type)
+
+        # Largest span length that fits into a packed length field; lengths of 'int' spans always fit into wider fields
+        lengthLimits = {
+            'byte': 'byte.MaxValue',
+            'sbyte': 'sbyte.MaxValue',
+            'ushort': 'ushort.MaxValue',
+            'short': 'short.MaxValue',
+        }
+
+        self.statement('/*')
+        self.statement(f' * {doc.name}.cs')
+        self.statement(' *')
+        for line in LLGLMeta.copyright:
+            self.statement(f' * {line}')
+        self.statement(' */')
+        self.statement()
+        for line in LLGLMeta.info:
+            self.statement(f'/* {line} */')
+        self.statement()
+        self.statement('using System;')
+        self.statement('using System.Text;')
+        self.statement('using System.Runtime.InteropServices;')
+        self.statement()
+        self.statement('namespace LLGL')
+        self.openScope()
+
+        # Write opcodes
+        self.statement('internal enum CommandOpcode : uint')
+        self.openScope()
+        self.statement('Undefined = 0,')
+        for cmd in commands:
+            self.statement(f'{cmd.name},')
+        self.closeScope()
+        self.statement()
+
+        self.statement('internal unsafe sealed class CommandStreamEncoder : IDisposable')
+        self.openScope()
+        self.statement('#if DEBUG')
+        self.statement('const string DllName = "LLGLD";')
+        self.statement('#else')
+        self.statement('const string DllName = "LLGL";')
+        self.statement('#endif')
+        self.statement()
+        self.statement(f'private const int Alignment = {CommandStream.ALIGNMENT};')
+        self.statement()
+
+        # Write packet structures
+        self.statement('[StructLayout(LayoutKind.Sequential)]')
+        self.statement('private struct CommandHeader')
+        self.openScope()
+        self.statement('public uint opcode;')
+        self.statement('public uint size;')
+        self.closeScope()
+        self.statement()
+
+        for cmd in commands:
+            packedParams = cmd.packedParams()
+            if len(packedParams) > 0:
+                self.statement('[StructLayout(LayoutKind.Sequential)]')
+                self.statement(f'private struct {cmd.name}Command')
+                self.openScope()
+
+                declList = Translator.DeclarationList()
+                for param in packedParams:
+                    if param.kind == CommandParamKind.FIXED_ARRAY:
+                        declList.append(Translator.Declaration(f'fixed {translateType(param.field.type)}', f'{param.field.name}[{param.field.type.arraySize}]'))
+                    else:
+                        declList.append(Translator.Declaration(translateType(param.field.type), param.field.name))
+
+                for decl in declList.decls:
+                    self.statement(f'public {decl.type}{declList.spaces(0, decl.type)}{decl.name};')
+
+                self.closeScope()
+                self.statement()
+
+        self.statement(f'[DllImport(DllName, EntryPoint="{CommandStream.DECODER_NAME}", CallingConvention=CallingConvention.Cdecl)]')
+        self.statement('private static extern void ExecuteCommandStream(void* stream, UIntPtr streamSize);')
+        self.statement()
+
+        # Write stream management
+        self.statement('private byte* data = null;')
+        self.statement('private int capacity = 0;')
+        self.statement('private int size = 0;')
+        self.statement()
+        self.statement('public CommandStreamEncoder(int initialCapacity = 4096)')
+        self.openScope()
+        self.statement('Reserve(initialCapacity);')
+        self.closeScope()
+        self.statement()
+        self.statement('~CommandStreamEncoder()')
+        self.openScope()
+        self.statement('Release();')
+        self.closeScope()
+        self.statement()
+        self.statement('public void Dispose()')
+        self.openScope()
+        self.statement('Release();')
+        self.statement('GC.SuppressFinalize(this);')
+        self.closeScope()
+        self.statement()
+        self.statement('public int Size')
+        self.openScope()
+        self.statement('get { return size; }')
+        self.closeScope()
+        self.statement()
+        self.statement('public void Reset()')
+        self.openScope()
+        self.statement('size = 0;')
+        self.closeScope()
+        self.statement()
+        self.statement('// Replays all recorded commands with a single native call against the current command buffer (see NativeLLGL.Begin).')
+        self.statement('public void Replay()')
+        self.openScope()
+        self.statement('if (size > 0)')
+        self.openScope()
+        self.statement('ExecuteCommandStream(data, (UIntPtr)size);')
+        self.closeScope()
+        self.closeScope()
+        self.statement()
+        self.statement('private static int Align(int size)')
+        self.openScope()
+        self.statement('return (size + (Alignment - 1)) & ~(Alignment - 1);')
+        self.closeScope()
+        self.statement()
+        self.statement('private void Release()')
+        self.openScope()
+        self.statement('if (data != null)')
+        self.openScope()
+        self.statement('Marshal.FreeHGlobal((IntPtr)data);')
+        self.statement('data = null;')
+        self.statement('capacity = 0;')
+        self.statement('size = 0;')
+        self.closeScope()
+        self.closeScope()
+        self.statement()
+        self.statement('private void Reserve(int requiredCapacity)')
+        self.openScope()
+        self.statement('if (requiredCapacity > capacity)')
+        self.openScope()
+        self.statement('int newCapacity = Math.Max(requiredCapacity, capacity * 2);')
+        self.statement('if (data != null)')
+        self.openScope()
+        self.statement('data = (byte*)Marshal.ReAllocHGlobal((IntPtr)data, (IntPtr)newCapacity);')
+        self.closeScope()
+        self.statement('else')
+        self.openScope()
+        self.statement('data = (byte*)Marshal.AllocHGlobal(newCapacity);')
+        self.closeScope()
+        self.statement('capacity = newCapacity;')
+        self.closeScope()
+        self.closeScope()
+        self.statement()
+        self.statement('private byte* Allocate(CommandOpcode opcode, int payloadSize)')
+        self.openScope()
+        self.statement('int packetSize = sizeof(CommandHeader) + payloadSize;')
+        self.statement('Reserve(size + packetSize);')
+        self.statement('var header = (CommandHeader*)(data + size);')
+        self.statement('header->opcode = (uint)opcode;')
+        self.statement('header->size   = (uint)packetSize;')
+        self.statement('size += packetSize;')
+        self.statement('return (byte*)(header + 1);')
+        self.closeScope()
+        self.statement()
+
+        # Write one encoder function per command
+        for cmd in commands:
+            packedParams = cmd.packedParams()
+            trailingParams = cmd.trailingParams()
+
+            paramList = ', '.join(f'{translateParamType(param)} {param.field.name}' for param in cmd.params if not param.lengthOf)
+            self.statement(f'public void {cmd.name}({paramList})')
+            self.openScope()
+
+            # Reject spans whose length cannot be stored in the packet or does not match a fixed size array
+            for param in packedParams:
+                paramName = param.field.name
+                if param.lengthOf:
+                    maxLength = lengthLimits.get(translateType(param.field.type))
+                    if maxLength:
+                        self.statement(f'if ({param.lengthOf}.Length > {maxLength})')
+                        self.statement(f'    throw new ArgumentOutOfRangeException(nameof({param.lengthOf}), $"length must not exceed {{{maxLength}}}");')
+                elif param.kind == CommandParamKind.FIXED_ARRAY:
+                    arraySize = param.field.type.arraySize
+                    self.statement(f'if ({paramName}.Length != {arraySize})')
+                    self.statement(f'    throw new ArgumentOutOfRangeException(nameof({paramName}), "length must be {arraySize}");')
+
+            # Determine payload size
+            payloadSizes = []
+            if len(packedParams) > 0:
+                payloadSizes.append(f'Align(sizeof({cmd.name}Command))')
+            for param in trailingParams:
+                paramName = param.field.name
+                if param.kind == CommandParamKind.STRING:
+                    self.statement(f'int {paramName}Size = Encoding.ASCII.GetByteCount({paramName}) + 1;')
+                else:
+                    self.statement(f'int {paramName}Size = sizeof({translateType(param.field.type)}) * {paramName}.Length;')
+                payloadSizes.append(f'Align({paramName}Size)')
+
+            allocStmt = f'Allocate(CommandOpcode.{cmd.name}, {" + ".join(payloadSizes) if len(payloadSizes) > 0 else "0"})'
+            if len(packedParams) == 0 and len(trailingParams) == 0:
+                self.statement(f'{allocStmt};')
+                self.closeScope()
+                self.statement()
+                continue
+
+            self.statement(f'byte* payload = {allocStmt};')
+
+            # Write packed fields
+            if len(packedParams) > 0:
+                self.statement(f'var cmd = ({cmd.name}Command*)payload;')
+                for param in packedParams:
+                    paramName = param.field.name
+                    fieldType = translateType(param.field.type)
+                    if param.lengthOf:
+                        self.statement(f'cmd->{paramName} = ({fieldType}){param.lengthOf}.Length;')
+                    elif param.kind == CommandParamKind.FIXED_ARRAY:
+                        self.statement(f'{paramName}.CopyTo(new Span<{fieldType}>(cmd->{paramName}, {param.field.type.arraySize}));')
+                    elif param.field.type.baseType == StdType.BOOL:
+                        self.statement(f'cmd->{paramName} = (byte)({paramName} ? 1 : 0);')
+                    elif param.field.type.baseType == StdType.SIZE_T:
+                        self.statement(f'cmd->{paramName} = (ulong){paramName};')
+                    else:
+                        self.statement(f'cmd->{paramName} = {paramName};')
+                if len(trailingParams) > 0:
+                    self.statement(f'payload += Align(sizeof({cmd.name}Command));')
+
+            # Write trailing payload
+            for paramIndex in range(0, len(trailingParams)):
+                param = trailingParams[paramIndex]
+                paramName = param.field.name
+                if param.kind == CommandParamKind.STRING:
+                    self.statement(f'Encoding.ASCII.GetBytes({paramName}, new Span<byte>(payload, {paramName}Size - 1));')
+                    self.statement(f'payload[{paramName}Size - 1] = 0;')
+                else:
+                    self.statement(f'{paramName}.CopyTo(new Span<{translateType(param.field.type)}>(payload, {paramName}.Length));')
+                if paramIndex + 1 < len(trailingParams):
+                    self.statement(f'payload += Align({paramName}Size);')
+
+            self.closeScope()
+            self.statement()
+
+        self.closeScope()
+        self.closeScope()
+        self.statement()
+        self.statement()
+        self.statement()
+        self.statement()
+        self.statement('// ================================================================================')
@@ -18,73 +18,87 @@ class CsharpProperties:
         self.fullCtor = fullCtor
 
 class CsharpTranslator(Translator):
-    def translateModule(self, doc):
-        builtinTypenames = {
-            StdType.VOID: 'void',
-            StdType.BOOL: 'bool',
-            StdType.CHAR: 'byte',
-            StdType.WCHAR: 'char',
-            StdType.INT8: 'sbyte',
-            StdType.INT16: 'short',
-            StdType.INT32: 'int',
-            StdType.INT64: 'long',
-            StdType.UINT8: 'byte',
-            StdType.UINT16: 'ushort',
-            StdType.UINT32: 'uint',
-            StdType.UINT64: 'ulong',
-            StdType.LONG: 'uint',
-            StdType.SIZE_T: 'UIntPtr',
-            StdType.FLOAT: 'float',
-            StdType.FUNC: 'IntPtr',
-        }
-        saveStructs = {
-            'BindingSlot': CsharpProperties(fullCtor = True),
-            'DrawIndexedIndirectArguments': None,
-            'DrawIndirectArguments': None,
-            'DrawPatchIndirectArguments': None,
-            'Extent2D': CsharpProperties(fullCtor = True),
-            'Extent3D': CsharpProperties(fullCtor = True),
-            'FormatAttributes': None,
-            'Offset2D': CsharpProperties(fullCtor = True),
-            'Offset3D': CsharpProperties(fullCtor = True),
-            'QueryPipelineStatistics': None,
-            'Scissor': CsharpProperties(fullCtor = True),
-            'SubresourceFootprint': None,
-            'TextureLocation': None,
-            'TextureRegion': None,
-            'TextureSubresource': None,
-            'Viewport': CsharpProperties(fullCtor = True),
-        }
-        trivialClasses = {
-            'AttachmentClear': CsharpProperties(getter = True),
-            #'BlendDescriptor': CsharpProperties(getter = True),
-            'BlendTargetDescriptor': CsharpProperties(getter = True),
-            'BufferDescriptor': CsharpProperties(getter = True, setter = True),
-            'BufferViewDescriptor': CsharpProperties(getter = True),
-            'CommandBufferDescriptor': CsharpProperties(getter = True),
-            'ComputeShaderAttributes': CsharpProperties(getter = True, fullCtor = True),
-            'DepthBiasDescriptor': CsharpProperties(getter = True),
-            'DepthDescriptor': CsharpProperties(getter = True),
-            'DisplayModeDescriptor': CsharpProperties(getter = True, setter = True),
-            'FragmentAttribute': CsharpProperties(getter = True, fullCtor = True),
-            'FragmentShaderAttributes': CsharpProperties(getter = True, fullCtor = True),
-            'GraphicsPipelineDescriptor': CsharpProperties(getter = True),
-            'RasterizerDescriptor': CsharpProperties(getter = True),
-            'RenderingFeatures': CsharpProperties(setter = True),
-            #'RenderingLimits': CsharpProperties(setter = True),
-            'RenderingCapabilities': CsharpProperties(setter = True),
-            'ShaderMacro': CsharpProperties(getter = True, fullCtor = True),
-            'StencilDescriptor': CsharpProperties(getter = True),
-            'StencilFaceDescriptor': CsharpProperties(getter = True),
-            'SwapChainDescriptor': CsharpProperties(getter = True, fullCtor = True),
-            'TessellationDescriptor': CsharpProperties(getter = True),
-            'TextureDescriptor': CsharpProperties(getter = True, setter = True),
-            'VertexAttribute': CsharpProperties(getter = True, fullCtor = True),
-            'VertexShaderAttributes': CsharpProperties(getter = True, fullCtor = True),
-        }
+    builtinTypenames = {
+        StdType.VOID: 'void',
+        StdType.BOOL: 'bool',
+        StdType.CHAR: 'byte',
+        StdType.WCHAR: 'char',
+        StdType.INT8: 'sbyte',
+        StdType.INT16: 'short',
+        StdType.INT32: 'int',
+        StdType.INT64: 'long',
+        StdType.UINT8: 'byte',
+        StdType.UINT16: 'ushort',
+        StdType.UINT32: 'uint',
+        StdType.UINT64: 'ulong',
+        StdType.LONG: 'uint',
+        StdType.SIZE_T: 'UIntPtr',
+        StdType.FLOAT: 'float',
+        StdType.FUNC: 'IntPtr',
+    }
+    saveStructs = {
+        'BindingSlot': CsharpProperties(fullCtor = True),
+        'DrawIndexedIndirectArguments': None,
+        'DrawIndirectArguments': None,
+        'DrawPatchIndirectArguments': None,
+        'Extent2D': CsharpProperties(fullCtor = True),
+        'Extent3D': CsharpProperties(fullCtor = True),
+        'FormatAttributes': None,
+        'Offset2D': CsharpProperties(fullCtor = True),
+        'Offset3D': CsharpProperties(fullCtor = True),
+        'QueryPipelineStatistics': None,
+        'Scissor': CsharpProperties(fullCtor = True),
+        'SubresourceFootprint': None,
+        'TextureLocation': None,
+        'TextureRegion': None,
+        'TextureSubresource': None,
+        'Viewport': CsharpProperties(fullCtor = True),
+    }
+    trivialClasses = {
+        'AttachmentClear': CsharpProperties(getter = True),
+        #'BlendDescriptor': CsharpProperties(getter = True),
+        'BlendTargetDescriptor': CsharpProperties(getter = True),
+        'BufferDescriptor': CsharpProperties(getter = True, setter = True),
+        'BufferViewDescriptor': CsharpProperties(getter = True),
+        'CommandBufferDescriptor': CsharpProperties(getter = True),
+        'ComputeShaderAttributes': CsharpProperties(getter = True, fullCtor = True),
+        'DepthBiasDescriptor': CsharpProperties(getter = True),
+        'DepthDescriptor': CsharpProperties(getter = True),
+        'DisplayModeDescriptor': CsharpProperties(getter = True, setter = True),
+        'FragmentAttribute': CsharpProperties(getter = True, fullCtor = True),
+        'FragmentShaderAttributes': CsharpProperties(getter = True, fullCtor = True),
+        'GraphicsPipelineDescriptor': CsharpProperties(getter = True),
+        'RasterizerDescriptor': CsharpProperties(getter = True),
+        'RenderingFeatures': CsharpProperties(setter = True),
+        #'RenderingLimits': CsharpProperties(setter = True),
+        'RenderingCapabilities': CsharpProperties(setter = True),
+        'ShaderMacro': CsharpProperties(getter = True, fullCtor = True),
+        'StencilDescriptor': CsharpProperties(getter = True),
+        'StencilFaceDescriptor': CsharpProperties(getter = True),
+        'SwapChainDescriptor': CsharpProperties(getter = True, fullCtor = True),
+        'TessellationDescriptor': CsharpProperties(getter = True),
+        'TextureDescriptor': CsharpProperties(getter = True, setter = True),
+        'VertexAttribute': CsharpProperties(getter = True, fullCtor = True),
+        'VertexShaderAttributes': CsharpProperties(getter = True, fullCtor = True),
+    }
+    unmanagedCallbacks = False # Emit callbacks as 'delegate* unmanaged[Cdecl]' function pointers instead of delegate types
+
+    def __init__(self, unmanagedCallbacks = False):
+        self.unmanagedCallbacks = unmanagedCallbacks
+
+    # Translates the specified module into a single C# file. If 'shard' is specified, only the declarations of that module are written
+    # and 'doc' is only used to look up types. The 'NativeLLGL' class is then declared as partial and the shard with the same name
+    # as 'doc' holds the declarations that are shared by all shards, i.e. the DLL name and interface handles.
+    def translateModule(self, doc, shard = None):
+        builtinTypenames = CsharpTranslator.builtinTypenames
+        saveStructs = CsharpTranslator.saveStructs
+        trivialClasses = CsharpTranslator.trivialClasses
+
+        decls = shard if shard else doc
+        isCommonShard = shard is None or shard.name == doc.name
 
         self.statement('/*')
-        self.statement(' * {}.cs'.format(doc.name))
+        self.statement(' * {}.cs'.format(doc.name if isCommonShard else f'{doc.name}.{shard.name}'))
         self.statement(' *')
         for line in LLGLMeta.copyright:
             self.statement(' * ' + line)
@@ -96,6 +110,8 @@ class CsharpTranslator(Translator):
         self.statement('using System;')
         self.statement('using System.Text;')
         self.statement('using System.Runtime.InteropServices;')
+        if self.unmanagedCallbacks:
+            self.statement('using System.Runtime.CompilerServices;')
         self.statement()
         self.statement('namespace LLGL')
         self.openScope()
@@ -127,7 +143,9 @@ class CsharpTranslator(Translator):
 
             nonlocal builtinTypenames
 
-            if fieldType.baseType == StdType.STRUCT and fieldType.typename in LLGLMeta.interfaces:
+            if fieldType.baseType == StdType.FUNC and self.unmanagedCallbacks and doc.findDelegateByName(fieldType.typename):
+                decl.type = translateFunctionPointer(doc.findDelegateByName(fieldType.typename))
+            elif fieldType.baseType == StdType.STRUCT and fieldType.typename in LLGLMeta.interfaces:
                 decl.type = sanitizeTypename(fieldType.typename)
             elif fieldType.baseType == StdType.STRUCT and fieldType.typename in LLGLMeta.handles:
                 decl.type = 'IntPtr' # Translate any handle to generic pointer type
@@ -168,6 +186,30 @@ class CsharpTranslator(Translator):
         def translateReturnType(type):
             return translateField(LLGLField(inName = None, inType = type))
 
+        # Translates a type into its blittable counterpart as required for 'UnmanagedCallersOnly' signatures
+        def translateBlittableType(type):
+            nonlocal builtinTypenames
+
+            if type.baseType == StdType.FUNC and doc.findDelegateByName(type.typename):
+                return translateFunctionPointer(doc.findDelegateByName(type.typename))
+            elif type.baseType == StdType.STRUCT and type.typename in LLGLMeta.handles:
+                return 'IntPtr'
+            elif type.baseType == StdType.BOOL and not type.isPointer:
+                return 'byte' # bool is not blittable
+            elif type.baseType == StdType.WCHAR:
+                typeStr = 'ushort' # char is not blittable
+            else:
+                builtin = builtinTypenames.get(type.baseType)
+                typeStr = builtin if builtin else type.typename
+                if typeStr.startswith(LLGLMeta.typePrefix):
+                    typeStr = typeStr[len(LLGLMeta.typePrefix):]
+            return typeStr + '*' if type.isPointer or type.arraySize != 0 else typeStr
+
+        def translateFunctionPointer(delegate, callingConv = 'unmanaged[Cdecl]'):
+            typeArgs = [translateBlittableType(param.type) for param in delegate.params]
+            typeArgs.append(translateBlittableType(delegate.returnType))
+            return f'delegate* {callingConv}<{", ".join(typeArgs)}>'
+
         def translateDeprecationMessage(msg):
             if msg is not None:
                 msg = msg.replace('::', '.')
@@ -241,7 +283,7 @@ class CsharpTranslator(Translator):
             return None
 
         # Write all constants
-        constStructs = list(filter(lambda record: record.hasConstFieldsOnly(), doc.structs))
+        constStructs = list(filter(lambda record: record.hasConstFieldsOnly(), decls.structs))
 
         if len(constStructs) > 0:
             self.statement('/* ----- Constants ----- */')
@@ -265,11 +307,11 @@ class CsharpTranslator(Translator):
             self.statement()
 
         # Write all enumerations
-        if len(doc.enums) > 0:
+        if len(decls.enums) > 0:
             self.statement('/* ----- Enumerations ----- */')
             self.statement()
 
-            for enum in doc.enums:
+            for enum in decls.enums:
                 self.statement('public enum ' + enum.name)
                 self.openScope()
 
@@ -290,7 +332,7 @@ class CsharpTranslator(Translator):
             self.statement()
 
         # Write all flags
-        if len(doc.flags) > 0:
+        if len(decls.flags) > 0:
             def translateFlagInitializer(init):
                 s = init
                 s = re.sub(r'(\||<<|>>|\+|\-|\*|\/)', r' \1 ', s)
@@ -299,7 +341,7 @@ class CsharpTranslator(Translator):
             self.statement('/* ----- Flags ----- */')
             self.statement()
 
-            for flag in doc.flags:
+            for flag in decls.flags:
                 self.statement('[Flags]')
                 self.statement('public enum {} : uint'.format(flag.name))
                 #basename = flag.name[:-len('Flags')]
@@ -355,7 +397,7 @@ class CsharpTranslator(Translator):
 
 
         # Write records that are trivial to map between unmanaged and managed code
-        commonStructs = list(filter(lambda record: not record.hasConstFieldsOnly(), doc.structs))
+        commonStructs = list(filter(lambda record: not record.hasConstFieldsOnly(), decls.structs))
 
         def findRecordProperties(name):
             properties = saveStructs.get(name)
@@ -634,24 +676,30 @@ class CsharpTranslator(Translator):
                     writeStruct(struct, managedTypeProperties = trivialClasses.get(struct.name), fieldsAsProperties = True)
             self.statement()
 
-        # Write native LLGL interface
-        self.statement('internal static class NativeLLGL')
+        # Write native LLGL interface; shards without native declarations omit their part of the partial class
+        hasNativeDecls = (
+            isCommonShard or len(decls.delegates) > 0 or len(decls.funcs) > 0 or
+            any(not struct.name in saveStructs for struct in commonStructs)
+        )
+        if not hasNativeDecls:
+            self.closeScope()
+            self.writeFooter()
+            return
+
+        self.statement('internal static partial class NativeLLGL' if shard else 'internal static class NativeLLGL')
         self.openScope()
 
         # Write DLL name
-        self.statement('#if DEBUG')
-        self.statement('const string DllName = "LLGLD";')
-        self.statement('#else')
-        self.statement('const string DllName = "LLGL";')
-        self.statement('#endif')
-        self.statement()
+        if isCommonShard:
+            self.statement('#if DEBUG')
+            self.statement('const string DllName = "LLGLD";')
+            self.statement('#else')
+            self.statement('const string DllName = "LLGL";')
+            self.statement('#endif')
+            self.statement()
         self.statement('#pragma warning disable 0649 // Disable warning about unused fields')
         self.statement()
 
-        # Write all interface handles
-        self.statement('/* ----- Handles ----- */')
-        self.statement()
-
         def writeInterfaceCtor(self, interface, parent):
             self.statement(f'public {interface}({parent} instance)')
             self.openScope()
@@ -673,17 +721,22 @@ class CsharpTranslator(Translator):
                     writeInterfaceCtor(self, parent, child)
                     writeInterfaceInterpret(self, child)
 
-        for interface in LLGLMeta.interfaces:
-            self.statement(f'public unsafe struct {interface}')
-            self.openScope()
-            self.statement('internal unsafe void* ptr;')
-            writeInterfaceRelation(self, interface, 'Surface', ['Window', 'Canvas'])
-            writeInterfaceRelation(self, interface, 'RenderTarget', ['SwapChain'])
-            writeInterfaceRelation(self, interface, 'Resource', ['Buffer', 'Texture', 'Sampler'])
-            self.closeScope()
+        # Write all interface handles
+        if isCommonShard:
+            self.statement('/* ----- Handles ----- */')
             self.statement()
 
-        self.statement()
+            for interface in LLGLMeta.interfaces:
+                self.statement(f'public unsafe struct {interface}')
+                self.openScope()
+                self.statement('internal unsafe void* ptr;')
+                writeInterfaceRelation(self, interface, 'Surface', ['Window', 'Canvas'])
+                writeInterfaceRelation(self, interface, 'RenderTarget', ['SwapChain'])
+                writeInterfaceRelation(self, interface, 'Resource', ['Buffer', 'Texture', 'Sampler'])
+                self.closeScope()
+                self.statement()
+
+            self.statement()
 
         # Write all non-trivial native structures
         if len(commonStructs) > 0:
@@ -711,29 +764,102 @@ class CsharpTranslator(Translator):
             return paramListStr
 
         # Write all native delegates
-        if len(doc.delegates) > 0:
+        if len(decls.delegates) > 0:
             self.statement('/* ----- Native delegates ----- */')
             self.statement()
 
-            for delegate in doc.delegates:
+            for delegate in decls.delegates:
+                delegateName = delegate.name[len(LLGLMeta.delegatePrefix):]
+
+                if self.unmanagedCallbacks:
+                    # Write trampoline that forwards native calls to a managed function pointer without delegate allocation
+                    paramList = ', '.join(f'{translateBlittableType(param.type)} {param.name}' for param in delegate.params)
+                    argList = ', '.join(param.name for param in delegate.params)
+                    returnTypeStr = translateBlittableType(delegate.returnType)
+
+                    managedPointer = translateFunctionPointer(delegate, "managed")
+                    hasUserData = any(param.name == 'userData' and param.type.isPointer for param in delegate.params)
+
+                    if hasUserData:
+                        # Dispatch through 'userData', so every registration can have its own handler
+                        self.statement(f'/* Native {delegateName} callbacks are dispatched through \'userData\': pass the result of Register(handler) as userData */')
+                        self.statement('/* and release it with Unregister(userData) once the callback is no longer used; callbacks with a null userData */')
+                        self.statement('/* are forwarded to the static Handler. Any other userData is invalid for this trampoline. */')
+                    else:
+                        # Without 'userData' all native callbacks of this type share a single handler, so replacing it silently is an error
+                        self.statement(f'/* Only one handler per callback type: every native {delegateName} callback is forwarded to the same static Handler. */')
+                        self.statement('/* Setting a different handler while one is set throws InvalidOperationException; set Handler to null first to replace it. */')
+                    self.statement(f'public static unsafe class {delegateName}Trampoline')
+                    self.openScope()
+                    if hasUserData:
+                        self.statement('private sealed class Target')
+                        self.openScope()
+                        self.statement(f'public {managedPointer} Handler;')
+                        self.closeScope()
+                        self.statement()
+                        self.statement(f'public static {managedPointer} Handler;')
+                        self.statement()
+                        self.statement(f'public static void* Register({managedPointer} handler)')
+                        self.openScope()
+                        self.statement('var target = new Target();')
+                        self.statement('target.Handler = handler;')
+                        self.statement('return (void*)GCHandle.ToIntPtr(GCHandle.Alloc(target));')
+                        self.closeScope()
+                        self.statement()
+                        self.statement('public static void Unregister(void* userData)')
+                        self.openScope()
+                        self.statement('GCHandle.FromIntPtr((IntPtr)userData).Free();')
+                        self.closeScope()
+                    else:
+                        self.statement(f'private static {managedPointer} handler;')
+                        self.statement()
+                        self.statement(f'public static {managedPointer} Handler')
+                        self.openScope()
+                        self.statement('get { return handler; }')
+                        self.statement('set')
+                        self.openScope()
+                        self.statement('if (handler != null && value != null && handler != value)')
+                        self.statement(f'    throw new InvalidOperationException("{delegateName} handler is already set");')
+                        self.statement('handler = value;')
+                        self.closeScope()
+                        self.closeScope()
+                    self.statement()
+                    self.statement('[UnmanagedCallersOnly(CallConvs = new[] { typeof(CallConvCdecl) })]')
+                    self.statement(f'private static {returnTypeStr} Invoke({paramList})')
+                    self.openScope()
+                    if hasUserData:
+                        self.statement(f'{managedPointer} handler = userData != null ? ((Target)GCHandle.FromIntPtr((IntPtr)userData).Target).Handler : Handler;')
+                    if returnTypeStr == 'void':
+                        self.statement('if (handler != null)')
+                        self.openScope()
+                        self.statement(f'handler({argList});')
+                        self.closeScope()
+                    else:
+                        self.statement(f'return handler != null ? handler({argList}) : default;')
+                    self.closeScope()
+                    self.statement()
+                    self.statement(f'public static {translateFunctionPointer(delegate)} Pointer => &Invoke;')
+                    self.closeScope()
+                    self.statement()
+                    continue
+
                 self.statement(f'[UnmanagedFunctionPointer(CallingConvention.Cdecl)]');
 
                 returnType = translateReturnType(delegate.returnType)
                 if returnType.marshal and returnType.marshal != 'ref':
                     self.statement(f'[return: {returnType.marshal}]')
 
-                delegateName = delegate.name[len(LLGLMeta.delegatePrefix):]
                 self.statement(f'public unsafe delegate {returnType.type} {delegateName}Delegate({translateParamList(delegate)});');
                 self.statement()
 
             self.statement()
 
         # Write all native functions
-        if len(doc.funcs) > 0:
+        if len(decls.funcs) > 0:
             self.statement('/* ----- Native functions ----- */')
             self.statement()
 
-            for func in doc.funcs:
+            for func in decls.funcs:
                 # Ignore functions with variadic arguments for now
                 if func.hasVargs():
                     continue
@@ -753,8 +879,42 @@ class CsharpTranslator(Translator):
 
         self.closeScope()
         self.closeScope()
+        self.writeFooter()
+
+    def writeFooter(self):
         self.statement()
         self.statement()
         self.statement()
         self.statement()
         self.statement('// ================================================================================')
+
+    # Writes one C# file per source header into the specified output directory plus one file with the declarations shared by all shards.
+    # Modules with the same name, e.g. <LLGL/Log.h> and <LLGL-C/Log.h>, are written into the same shard. Files are only rewritten
+    # if their content has changed and stale shards of the same name prefix are removed.
+    def translateSplitModules(self, name, modules, outputDir):
+        doc = LLGLModule()
+        doc.name = name
+        shards = []
+        for module in modules:
+            doc.merge(module)
+            shard = next((shard for shard in shards if shard.name == module.name), None)
+            if not shard:
+                shard = LLGLModule()
+                shard.name = module.name
+                shards.append(shard)
+            shard.merge(module)
+        doc.structs = doc.sortStructsByDependencies()
+
+        commonShard = LLGLModule()
+        commonShard.name = name
+
+        os.makedirs(outputDir, exist_ok = True)
+        filenames = [ f'{name}.cs' ]
+        Translator.writeFile(os.path.join(outputDir, filenames[0]), lambda: self.translateModule(doc, commonShard))
+        for shard in shards:
+            filenames.append(f'{name}.{shard.name}.cs')
+            Translator.writeFile(os.path.join(outputDir, filenames[-1]), lambda: self.translateModule(doc, shard))
+
+        for filename in os.listdir(outputDir):
+            if filename.startswith(f'{name}.') and filename.endswith('.cs') and not filename in filenames:
+                os.remove(os.path.join(outputDir, filename))
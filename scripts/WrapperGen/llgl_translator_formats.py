@@ -0,0 +1,220 @@
+#
+# llgl_translator_formats.py
+#
+# Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+# Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+#
+
+from llgl_translator import *
+
+class FormatAttributeRow:
+    name = '' # Format entry name, e.g. 'RGBA8UNorm'
+    bitSize = 0
+    blockWidth = 0
+    blockHeight = 0
+    components = 0
+    imageFormat = '' # ImageFormat entry name
+    dataType = '' # DataType entry name
+    flags = 0
+
+    def __init__(self, name):
+        self.name = name
+
+class FormatTable:
+    # Parses the 'g_formatAttribs' table from the native source file (sources/Renderer/Format.cpp)
+    # and validates that there is exactly one row per 'Format' entry in the same order.
+    @staticmethod
+    def parseAttributes(doc, filename):
+        formatEnum = doc.findEnumByName('Format')
+        formatFlags = doc.findFlagsByName('FormatFlags')
+        if not formatEnum or not formatFlags or not doc.findEnumByName('ImageFormat') or not doc.findEnumByName('DataType'):
+            fatal('error: format table requires Format, FormatFlags, ImageFormat, and DataType from <LLGL/Format.h>')
+        Translator.requireFoldedValues(formatEnum)
+        Translator.requireFoldedValues(formatFlags)
+
+        with open(filename, 'r') as file:
+            text = file.read()
+
+        # Resolve flag shortcuts such as 'static constexpr long UNorm = UInt | Norm;'
+        symbols = dict(map(lambda field: (field.name, field.value), formatFlags.fields))
+        for match in re.finditer(r'static\s+constexpr\s+long\s+(\w+)\s*=\s*([^;]+);', text):
+            symbols[match.group(1)] = LLGLExpression.evaluate(re.sub(r'\w+::', '', match.group(2)), symbols)
+
+        # Parse table rows, e.g. '{ 8, 1, 1, 1, ImageFormat::R, DataType::UInt8, Vertex | UNorm }, // R8UNorm'
+        rows = []
+        rowPattern = r'^\s*\{\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*ImageFormat::(\w+)\s*,\s*DataType::(\w+)\s*,\s*([^}]*)\}\s*,?\s*//\s*(\w+)'
+        for match in re.finditer(rowPattern, text, re.MULTILINE):
+            row = FormatAttributeRow(match.group(8))
+            row.bitSize = int(match.group(1))
+            row.blockWidth = int(match.group(2))
+            row.blockHeight = int(match.group(3))
+            row.components = int(match.group(4))
+            row.imageFormat = match.group(5)
+            row.dataType = match.group(6)
+            try:
+                row.flags = LLGLExpression.evaluate(match.group(7), symbols)
+            except ValueError as error:
+                fatal(f"error: failed to fold flags of format '{row.name}': {error}")
+            rows.append(row)
+
+        # Validate rows against enumeration entries since the native table is indexed by Format values
+        for field in formatEnum.fields:
+            if field.value >= len(rows) or rows[field.value].name != field.name:
+                fatal(f"error: native format table in '{filename}' does not match Format::{field.name} at index {field.value}")
+        if len(rows) != len(formatEnum.fields):
+            fatal(f"error: native format table in '{filename}' has {len(rows)} rows but Format has {len(formatEnum.fields)} entries")
+
+        return rows
+
+class FormatTableTranslator(Translator):
+    sourceFilename = ''
+    language = 'c99'
+
+    def __init__(self, sourceFilename, language = 'c99'):
+        self.sourceFilename = sourceFilename
+        self.language = language
+
+    def translateModule(self, doc):
+        rows = FormatTable.parseAttributes(doc, self.sourceFilename)
+        if self.language == 'csharp':
+            self.translateCsharp(doc, rows)
+        else:
+            self.translateC99(doc, rows)
+
+    # Writes a C99 header with a static copy of the native format attributes
+    def translateC99(self, doc, rows):
+        self.statement('/*')
+        self.statement(f' * {doc.name}.h')
+        self.statement(' *')
+        for line in LLGLMeta.copyright:
+            self.statement(f' * {line}')
+        self.statement(' */')
+        self.statement()
+        for line in LLGLMeta.info:
+            self.statement(f'/* {line} */')
+        self.statement()
+
+        headerGuardName = f'LLGL_C99{Translator.convertNameToHeaderGuard(doc.name)}_H'
+        self.statement(f'#ifndef {headerGuardName}')
+        self.statement(f'#define {headerGuardName}')
+        self.statement()
+        self.statement()
+        self.statement('#include <LLGL-C/LLGLWrapper.h>')
+        self.statement('#include <LLGL-C/Export.h>')
+        self.statement()
+        self.statement()
+        self.statement(f'#define LLGL_FORMAT_TABLE_SIZE ( {len(rows)} )')
+        self.statement()
+        self.statement()
+        self.statement('/* ----- Tables ----- */')
+        self.statement()
+        self.statement('static const LLGLFormatAttributes g_llglFormatTable[LLGL_FORMAT_TABLE_SIZE] =')
+        self.openScope()
+        for row in rows:
+            imageFormat = f'LLGLImageFormat{row.imageFormat},'
+            dataType = f'LLGLDataType{row.dataType},'
+            self.statement(f'{{ {row.bitSize:>4}, {row.blockWidth}, {row.blockHeight}, {row.components}, {imageFormat:<31} {dataType:<30} 0x{row.flags:08X} }}, /* {row.name} */')
+        self.closeScope('};')
+        self.statement()
+        self.statement()
+        self.statement('/* ----- Functions ----- */')
+        self.statement()
+        self.statement('/* Native lookup of format attributes (see C99FlagsAndDescriptors.cpp) */')
+        self.statement('LLGL_C_EXPORT const LLGLFormatAttributes* llglGetFormatAttribs(LLGLFormat format);')
+        self.statement()
+        self.statement('/* Same as llglGetFormatAttribs but without a call into the native library */')
+        self.statement('static inline const LLGLFormatAttributes* llglLookupFormatAttribs(LLGLFormat format)')
+        self.openScope()
+        self.statement('const size_t index = (size_t)format;')
+        self.statement('return &g_llglFormatTable[index < LLGL_FORMAT_TABLE_SIZE ? index : 0];')
+        self.closeScope()
+        self.statement()
+        self.statement()
+        self.statement(f'#endif /* {headerGuardName} */')
+        self.statement()
+        self.statement()
+        self.statement()
+        self.statement('/* ================================================================================ */')
+        self.statement()
+
+    # Writes a C# static class with a read-only copy of the native format attributes
+    def translateCsharp(self, doc, rows):
+        self.statement('/*')
+        self.statement(f' * {doc.name}.cs')
+        self.statement(' *')
+        for line in LLGLMeta.copyright:
+            self.statement(f' * {line}')
+        self.statement(' */')
+        self.statement()
+        for line in LLGLMeta.info:
+            self.statement(f'/* {line} */')
+        self.statement()
+        self.statement('using System;')
+        self.statement('using System.Runtime.InteropServices;')
+        self.statement()
+        self.statement('namespace LLGL')
+        self.openScope()
+        self.statement('public static class FormatTable')
+        self.openScope()
+        self.statement('#if DEBUG')
+        self.statement('const string DllName = "LLGLD";')
+        self.statement('#else')
+        self.statement('const string DllName = "LLGL";')
+        self.statement('#endif')
+        self.statement()
+        self.statement('private static readonly FormatAttributes[] Attribs =')
+        self.openScope()
+        for row in rows:
+            self.statement(
+                f'new FormatAttributes {{ BitSize = {row.bitSize:>3}, BlockWidth = {row.blockWidth}, BlockHeight = {row.blockHeight}, Components = {row.components}, ' +
+                f'Format = ImageFormat.{row.imageFormat}, DataType = DataType.{row.dataType}, Flags = 0x{row.flags:08X} }}, // {row.name}'
+            )
+        self.closeScope('};')
+        self.statement()
+        self.statement('public static FormatAttributes GetFormatAttribs(Format format)')
+        self.openScope()
+        self.statement('uint index = (uint)format;')
+        self.statement('return Attribs[index < (uint)Attribs.Length ? index : 0];')
+        self.closeScope()
+        self.statement()
+        self.statement('public static ulong GetMemoryFootprint(Format format, ulong numTexels)')
+        self.openScope()
+        self.statement('FormatAttributes formatAttribs = GetFormatAttribs(format);')
+        self.statement('ulong blockSize = (ulong)formatAttribs.BlockWidth * formatAttribs.BlockHeight;')
+        self.statement('if (blockSize > 0 && numTexels % blockSize == 0)')
+        self.statement('    return ((numTexels / blockSize * formatAttribs.BitSize) / 8);')
+        self.statement('else')
+        self.statement('    return 0;')
+        self.closeScope()
+        self.statement()
+        self.statement('[DllImport(DllName, EntryPoint="llglGetFormatAttribs", CallingConvention=CallingConvention.Cdecl)]')
+        self.statement('private static extern IntPtr GetNativeFormatAttribs(Format format);')
+        self.statement()
+        self.statement('// Returns the first format whose managed attributes differ from the native library, or null if all formats are equal')
+        self.statement('public static Format? FindMismatchWithNative()')
+        self.openScope()
+        self.statement('for (int i = 0; i < Attribs.Length; ++i)')
+        self.openScope()
+        self.statement('// Read native struct with C layout: uint16_t bitSize, uint8_t blockWidth, blockHeight, components, enum format, enum dataType, long flags')
+        self.statement('IntPtr native = GetNativeFormatAttribs((Format)i);')
+        self.statement('FormatAttributes attribs = Attribs[i];')
+        self.statement('if ((ushort)Marshal.ReadInt16(native, 0) != attribs.BitSize ||')
+        self.statement('    Marshal.ReadByte(native, 2) != attribs.BlockWidth ||')
+        self.statement('    Marshal.ReadByte(native, 3) != attribs.BlockHeight ||')
+        self.statement('    Marshal.ReadByte(native, 4) != attribs.Components ||')
+        self.statement('    Marshal.ReadInt32(native, 8) != (int)attribs.Format ||')
+        self.statement('    Marshal.ReadInt32(native, 12) != (int)attribs.DataType ||')
+        self.statement('    (uint)Marshal.ReadInt32(native, 16) != attribs.Flags)')
+        self.openScope()
+        self.statement('return (Format)i;')
+        self.closeScope()
+        self.closeScope()
+        self.statement('return null;')
+        self.closeScope()
+        self.closeScope()
+        self.closeScope()
+        self.statement()
+        self.statement()
+        self.statement()
+        self.statement()
+        self.statement('// ================================================================================')
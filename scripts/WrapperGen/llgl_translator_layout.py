@@ -0,0 +1,149 @@
+#
+# llgl_translator_layout.py
+#
+# Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+# Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+#
+
+from llgl_translator import *
+
+class LayoutTranslator(Translator):
+    language = None
+
+    def __init__(self, language = None):
+        self.language = language
+
+    def translateModule(self, doc):
+        commonStructs = list(filter(lambda record: not record.hasConstFieldsOnly(), doc.structs))
+        if self.language == 'c99':
+            self.translateAssertions(doc, commonStructs)
+        else:
+            self.translateReport(doc, commonStructs)
+
+    # Writes a plain text report of the C99 and C++ layout of each struct and whether the C99 struct can be reinterpreted as the C++ struct
+    def translateReport(self, doc, structs):
+        def formatLayout(layout):
+            return '?' if isinstance(layout, str) else f'{layout.size}/{layout.align}'
+
+        nameLen = max([len(struct.name) for struct in structs] + [len('struct')])
+        self.statement(f'{"struct":<{nameLen}}  {"C99":>7}  {"C++":>7}  layout')
+        numIdentical = 0
+        for struct in structs:
+            layoutC99 = doc.computeRecordLayout(struct, LLGLModule.LAYOUT_C99)
+            layoutCpp = doc.computeRecordLayout(struct, LLGLModule.LAYOUT_CPP)
+            mismatch = doc.findLayoutMismatch(struct)
+            if mismatch:
+                status = f'differs: {mismatch}'
+            else:
+                status = 'identical'
+                numIdentical += 1
+            self.statement(f'{struct.name:<{nameLen}}  {formatLayout(layoutC99):>7}  {formatLayout(layoutCpp):>7}  {status}')
+        self.statement()
+        self.statement(f'{numIdentical} of {len(structs)} structs are layout-identical (size/alignment in bytes, x86-64 System V ABI)')
+
+    # Writes a C++ source file with static assertions for all enumeration entries, flags, and structs that are shared between the C99 and C++ API.
+    # Structs are only asserted if they are layout-identical, i.e. they can be passed between both APIs with reinterpret_cast.
+    def translateAssertions(self, doc, structs):
+        self.statement('/*')
+        self.statement(f' * {doc.name}.cpp')
+        self.statement(' *')
+        for line in LLGLMeta.copyright:
+            self.statement(f' * {line}')
+        self.statement(' */')
+        self.statement()
+        for line in LLGLMeta.info:
+            self.statement(f'/* {line} */')
+        self.statement()
+        self.statement('#include <LLGL/LLGL.h>')
+        self.statement('#include <LLGL-C/LLGL.h>')
+        self.statement('#include <cstddef>')
+        self.statement()
+        self.statement()
+        self.statement('#define LLGL_STATIC_ASSERT_ENUM(TYPE, VALUE) \\')
+        self.statement('    static_assert(TYPE::VALUE == (TYPE)(LLGL ## TYPE ## VALUE), "LLGL" #TYPE #VALUE " does not equal enumeration value of LLGL::" #TYPE "::" #VALUE)')
+        self.statement()
+        self.statement('#define LLGL_STATIC_ASSERT_FLAG(TYPE, VALUE) \\')
+        self.statement('    static_assert(static_cast<long>(TYPE ## Flags::VALUE) == static_cast<long>(LLGL ## TYPE ## VALUE), "LLGL" #TYPE #VALUE " does not equal flags value of LLGL::" #TYPE "Flags::" #VALUE)')
+        self.statement()
+        self.statement('#define LLGL_STATIC_ASSERT_SIZE(TYPE) \\')
+        self.statement('    static_assert(sizeof(LLGL::TYPE) == sizeof(LLGL ## TYPE) && alignof(LLGL::TYPE) <= alignof(LLGL ## TYPE), "LLGL" #TYPE " does not match size or alignment of LLGL::" #TYPE)')
+        self.statement()
+        self.statement('#define LLGL_STATIC_ASSERT_OFFSET(TYPE, FIELD) \\')
+        self.statement('    static_assert(offsetof(LLGL::TYPE, FIELD) == offsetof(LLGL ## TYPE, FIELD) && sizeof(LLGL::TYPE::FIELD) == sizeof(LLGL ## TYPE::FIELD), "LLGL" #TYPE "::" #FIELD " does not match offset and size of LLGL::" #TYPE "::" #FIELD)')
+        self.statement()
+        self.statement('#define LLGL_STATIC_ASSERT_SYSV_SIZE(TYPE, SIZE, ALIGN) \\')
+        self.statement('    static_assert(sizeof(LLGL ## TYPE) == (SIZE) && alignof(LLGL ## TYPE) == (ALIGN), "LLGL" #TYPE " does not match size and alignment computed by WrapperGen")')
+        self.statement()
+        self.statement('#define LLGL_STATIC_ASSERT_SYSV_OFFSET(TYPE, FIELD, OFFSET) \\')
+        self.statement('    static_assert(offsetof(LLGL ## TYPE, FIELD) == (OFFSET), "LLGL" #TYPE "::" #FIELD " does not match offset computed by WrapperGen")')
+        self.statement()
+        self.statement()
+        for namespace in LLGLMeta.namespaces:
+            self.statement(f'using namespace {namespace};')
+        self.statement()
+        self.statement()
+
+        # Write assertions for all enumeration entries
+        if len(doc.enums) > 0:
+            self.statement('/* ----- Enumerations ----- */')
+            self.statement()
+            for enum in doc.enums:
+                for field in enum.fields:
+                    self.statement(f'LLGL_STATIC_ASSERT_ENUM({enum.name}, {field.name});')
+                self.statement()
+            self.statement()
+
+        # Write assertions for all flags except those the C99 translator omits due to name collisions (see C99Translator)
+        if len(doc.flags) > 0:
+            omittedFlags = [ 'CPUAccessReadWrite' ]
+            self.statement('/* ----- Flags ----- */')
+            self.statement()
+            for flag in doc.flags:
+                basename = flag.name[:-len('Flags')]
+                for field in flag.fields:
+                    if not f'{basename}{field.name}' in omittedFlags:
+                        self.statement(f'LLGL_STATIC_ASSERT_FLAG({basename}, {field.name});')
+                self.statement()
+            self.statement()
+
+        # Write assertions that make reinterpret_cast between layout-identical C99 and C++ structs safe
+        if len(structs) > 0:
+            self.statement('/* ----- Structures ----- */')
+            self.statement()
+            for struct in structs:
+                mismatch = doc.findLayoutMismatch(struct)
+                if mismatch:
+                    self.statement(f'/* LLGL{struct.name} requires conversion: {mismatch} */')
+                else:
+                    self.statement(f'LLGL_STATIC_ASSERT_SIZE({struct.name});')
+                    deprecatedFields = set(field.name for field in struct.fields if field.deprecated)
+                    for field in doc.computeRecordLayout(struct, LLGLModule.LAYOUT_C99).fields:
+                        if field.isBitfield() or field.name in deprecatedFields:
+                            # offsetof is ill-formed for bitfields and deprecated fields would emit warnings
+                            self.statement(f'//LLGL_STATIC_ASSERT_OFFSET({struct.name}, {field.name});')
+                        else:
+                            self.statement(f'LLGL_STATIC_ASSERT_OFFSET({struct.name}, {field.name});')
+                self.statement()
+            self.statement()
+
+            # Write assertions for computed layouts; bitfields are excluded since offsetof is ill-formed for them
+            self.statement('/* ----- x86-64 System V ABI ----- */')
+            self.statement()
+            self.statement('#if defined __x86_64__ && !defined _WIN32')
+            self.statement()
+            for struct in structs:
+                layout = doc.computeRecordLayout(struct, LLGLModule.LAYOUT_C99)
+                if isinstance(layout, str):
+                    continue
+                self.statement(f'LLGL_STATIC_ASSERT_SYSV_SIZE({struct.name}, {layout.size}, {layout.align});')
+                for field in layout.fields:
+                    if not field.isBitfield():
+                        self.statement(f'LLGL_STATIC_ASSERT_SYSV_OFFSET({struct.name}, {field.name}, {field.offset});')
+                self.statement()
+            self.statement('#endif /* __x86_64__ && !_WIN32 */')
+            self.statement()
+
+        self.statement()
+        self.statement()
+        self.statement()
+        self.statement('// ================================================================================')
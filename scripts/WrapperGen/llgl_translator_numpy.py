@@ -0,0 +1,173 @@
+#
+# llgl_translator_numpy.py
+#
+# Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+# Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+#
+
+from llgl_translator import *
+from llgl_translator_python import PythonTranslator
+
+class NumpyTranslator(PythonTranslator):
+    # Only types with the same size and alignment on all supported ABIs; 'long', 'size_t', and 'wchar_t' are platform dependent
+    builtinDtypes = {
+        StdType.BOOL: 'np.bool_',
+        StdType.CHAR: 'np.int8',
+        StdType.INT8: 'np.int8',
+        StdType.INT16: 'np.int16',
+        StdType.INT32: 'np.int32',
+        StdType.INT64: 'np.int64',
+        StdType.UINT8: 'np.uint8',
+        StdType.UINT16: 'np.uint16',
+        StdType.UINT32: 'np.uint32',
+        StdType.UINT64: 'np.uint64',
+        StdType.FLOAT: 'np.float32'
+    }
+
+    # Types whose size depends on the data model; they are only emitted for LP64 targets, where the computed x86-64 System V layout applies
+    lp64Dtypes = {
+        StdType.WCHAR: 'np.int32',
+        StdType.LONG: 'np.int64',
+        StdType.SIZE_T: 'np.uint64'
+    }
+
+    POINTER_DTYPE = 'np.uintp'
+
+    @staticmethod
+    def translateDtypeName(name):
+        return f'{name}Dtype'
+
+    # Returns a list of (name, dtype) tuples for the specified struct field as laid out by the C99 translator,
+    # or a string with the reason why the field cannot be represented on all targets (or LP64 targets if lp64 is True).
+    def translateFieldDtypes(self, doc, field, lp64):
+        fieldType = field.type
+        if fieldType.externalCond:
+            return f"field '{field.name}': platform specific type '{fieldType.typename}'"
+
+        if fieldType.isDynamicArray():
+            if not lp64:
+                return f"field '{field.name}': pointer"
+            return [
+                (f'num{field.name[0].upper()}{field.name[1:]}', NumpyTranslator.lp64Dtypes[StdType.SIZE_T]),
+                (field.name, NumpyTranslator.POINTER_DTYPE)
+            ]
+
+        dtype = None
+        if fieldType.isPointerOrString() or fieldType.isInterface() or fieldType.baseType == StdType.FUNC:
+            if not lp64:
+                return f"field '{field.name}': pointer"
+            dtype = NumpyTranslator.POINTER_DTYPE
+        elif doc.findEnumByName(fieldType.typename) or doc.findFlagsByName(fieldType.typename):
+            record = doc.findEnumByName(fieldType.typename) or doc.findFlagsByName(fieldType.typename)
+            if record.base and record.base.getFixedBitsize() > 0:
+                # C99 translator emits enumerations with underlying type as bitfields, whose layout is implementation defined
+                return f"field '{field.name}': bitfield of type '{fieldType.typename}'"
+            dtype = 'np.uint32'
+        elif doc.findStructByName(fieldType.typename):
+            reason = self.findNonBlittableReason(doc, doc.findStructByName(fieldType.typename), lp64)
+            if reason:
+                return f"field '{field.name}': nested struct '{fieldType.typename}'"
+            dtype = NumpyTranslator.translateDtypeName(fieldType.typename)
+        elif fieldType.baseType in NumpyTranslator.builtinDtypes:
+            dtype = NumpyTranslator.builtinDtypes[fieldType.baseType]
+        elif lp64 and fieldType.baseType in NumpyTranslator.lp64Dtypes:
+            dtype = NumpyTranslator.lp64Dtypes[fieldType.baseType]
+        else:
+            return f"field '{field.name}': platform dependent type '{fieldType.typename}'"
+
+        if fieldType.arraySize > 0:
+            dtype = f'({dtype}, {fieldType.arraySize})'
+        return [ (field.name, dtype) ]
+
+    # Returns None if the C99 struct can be copied bytewise from a NumPy array with identical layout on all targets (or LP64 targets if lp64 is True).
+    # Otherwise, returns a string with the reason why the struct is not blittable.
+    def findNonBlittableReason(self, doc, struct, lp64 = False):
+        for field in struct.fields:
+            if field.type.baseType != StdType.CONST:
+                dtypes = self.translateFieldDtypes(doc, field, lp64)
+                if isinstance(dtypes, str):
+                    return dtypes
+        return None
+
+    def translateDtype(self, doc, struct, lp64):
+        # Use explicit offsets from the computed C99 layout; 'aligned' makes NumPy reject offsets that violate field alignment
+        layout = doc.computeRecordLayout(struct, LLGLModule.LAYOUT_C99)
+        formats = {}
+        for field in struct.fields:
+            if field.type.baseType != StdType.CONST:
+                formats.update(self.translateFieldDtypes(doc, field, lp64))
+
+        self.statement(f'{NumpyTranslator.translateDtypeName(struct.name)} = np.dtype({{')
+        self.indent += 1
+        self.statement(f"'names':    [ {', '.join(repr(field.name) for field in layout.fields)} ],")
+        self.statement(f"'formats':  [ {', '.join(formats[field.name] for field in layout.fields)} ],")
+        self.statement(f"'offsets':  [ {', '.join(str(field.offset) for field in layout.fields)} ],")
+        self.statement(f"'itemsize': {layout.size},")
+        self.statement("'aligned':  True,")
+        self.indent -= 1
+        self.statement('})')
+        self.statement()
+
+    def translateModule(self, doc):
+        self.translateHeader(doc, [ 'import ctypes', 'import numpy as np' ])
+
+        commonStructs = list(filter(lambda record: not record.hasConstFieldsOnly(), doc.structs))
+        blittableStructs = []
+        lp64Structs = []
+        otherStructs = []
+        for struct in commonStructs:
+            if not self.findNonBlittableReason(doc, struct):
+                blittableStructs.append(struct)
+            else:
+                reason = self.findNonBlittableReason(doc, struct, lp64 = True)
+                if reason:
+                    otherStructs.append((struct.name, reason))
+                else:
+                    lp64Structs.append(struct)
+
+        # Write structured dtypes in declaration order, so nested dtypes precede their users
+        if len(blittableStructs) > 0:
+            self.statement('# ----- Structured dtypes -----')
+            self.statement()
+            for struct in blittableStructs:
+                self.translateDtype(doc, struct, lp64 = False)
+            self.statement()
+
+        # Write structured dtypes with pointers, 'long', or 'size_t' fields only for LP64 targets, e.g. x86-64 and AArch64 on Linux and macOS
+        if len(lp64Structs) > 0:
+            self.statement('# ----- Structured dtypes (LP64) -----')
+            self.statement()
+            self.statement('if ctypes.sizeof(ctypes.c_void_p) == 8 and ctypes.sizeof(ctypes.c_long) == 8:')
+            self.indent += 1
+            for struct in lp64Structs:
+                self.translateDtype(doc, struct, lp64 = True)
+            self.indent -= 1
+            self.statement()
+
+        # Write list of non-blittable structs with the reason why they cannot be represented by a dtype
+        if len(otherStructs) > 0:
+            self.statement('# Structs that are not blittable:')
+            for name, reason in otherStructs:
+                self.statement(f'#   {name}: {reason}')
+            self.statement()
+            self.statement()
+
+        self.statement('# Returns the (data, dataSize) arguments of the specified C-contiguous array to pass it to functions like llglWriteBuffer without copying.')
+        self.statement('# If a dtype is specified, the array must be of that type, e.g. bufferData(args, DrawIndirectArgumentsDtype).')
+        self.statement('def bufferData(array, dtype = None):')
+        self.indent += 1
+        self.statement('if dtype is not None and array.dtype != dtype:')
+        self.indent += 1
+        self.statement("raise TypeError(f'array of type {array.dtype} does not match {dtype}')")
+        self.indent -= 1
+        self.statement("if not array.flags['C_CONTIGUOUS']:")
+        self.indent += 1
+        self.statement("raise ValueError('array must be C-contiguous to be passed without copying')")
+        self.indent -= 1
+        self.statement('return (ctypes.c_void_p(array.ctypes.data), array.nbytes)')
+        self.indent -= 1
+        self.statement()
+        self.statement()
+
+        self.statement()
+        self.statement('# ================================================================================')
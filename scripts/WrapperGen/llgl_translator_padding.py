@@ -0,0 +1,123 @@
+#
+# llgl_translator_padding.py
+#
+# Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+# Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+#
+
+from llgl_translator import *
+
+class PaddingTranslator(Translator):
+    language = LLGLModule.LAYOUT_CPP
+
+    CACHE_LINE_SIZE = 64
+
+    class StructReport:
+        name = ''
+        layout = None # LLGLRecordLayout
+        reorderedLayout = None # LLGLRecordLayout with minimal size or None if the order is already minimal or fixed
+        splitFields = [] # Names of fields that span two cache lines if the struct starts on a cache line boundary
+
+        def __init__(self, name, layout):
+            self.name = name
+            self.layout = layout
+            self.reorderedLayout = None
+            self.splitFields = []
+
+        def cacheLines(self):
+            return (self.layout.size + PaddingTranslator.CACHE_LINE_SIZE - 1) // PaddingTranslator.CACHE_LINE_SIZE
+
+        def savedSize(self):
+            return self.layout.size - self.reorderedLayout.size if self.reorderedLayout else 0
+
+    def __init__(self, language = LLGLModule.LAYOUT_CPP):
+        self.language = language
+
+    # Returns the fields of the specified struct sorted by alignment in descending order, which yields the minimal size
+    # since all field sizes are multiples of their power-of-two alignment. Fields with equal alignment keep their order.
+    def sortFieldsByAlignment(self, struct, layout):
+        def fieldAlignment(field):
+            fieldLayout = layout.findFieldByName(field.name)
+            return fieldLayout.align if fieldLayout else 0
+
+        return sorted(struct.fields, key = lambda field: -fieldAlignment(field))
+
+    def analyzeStruct(self, doc, struct):
+        layout = doc.computeRecordLayout(struct, self.language)
+        if isinstance(layout, str):
+            return None
+
+        report = PaddingTranslator.StructReport(struct.name, layout)
+
+        for field in layout.fields:
+            if not field.isBitfield() and field.size > 0:
+                firstLine = field.offset // PaddingTranslator.CACHE_LINE_SIZE
+                lastLine = (field.offset + field.size - 1) // PaddingTranslator.CACHE_LINE_SIZE
+                if firstLine != lastLine and field.size <= PaddingTranslator.CACHE_LINE_SIZE:
+                    report.splitFields.append(field.name)
+
+        if not struct.name in LLGLMeta.fixedLayouts:
+            reorderedLayout = doc.computeFieldsLayout(struct.name, self.sortFieldsByAlignment(struct, layout), self.language)
+            if not isinstance(reorderedLayout, str) and reorderedLayout.size < layout.size:
+                report.reorderedLayout = reorderedLayout
+
+        return report
+
+    def translateModule(self, doc):
+        commonStructs = list(filter(lambda record: not record.hasConstFieldsOnly(), doc.structs))
+        reports = []
+        unknownStructs = []
+        for struct in commonStructs:
+            report = self.analyzeStruct(doc, struct)
+            if report:
+                reports.append(report)
+            else:
+                unknownStructs.append(struct.name)
+
+        languageName = 'C99' if self.language == LLGLModule.LAYOUT_C99 else 'C++'
+        self.statement(f'Padding of {languageName} structs (x86-64 System V ABI, {PaddingTranslator.CACHE_LINE_SIZE} byte cache lines)')
+        self.statement()
+
+        # Write table with one row per struct
+        nameLen = max([len(report.name) for report in reports] + [len('struct')])
+        self.statement(f'{"struct":<{nameLen}}  {"size":>5}  {"align":>5}  {"padding":>7}  {"lines":>5}  {"split":>5}  {"minimal":>7}')
+        for report in reports:
+            minimalSize = report.reorderedLayout.size if report.reorderedLayout else report.layout.size
+            minimalStr = 'fixed' if report.name in LLGLMeta.fixedLayouts else str(minimalSize)
+            self.statement(
+                f'{report.name:<{nameLen}}  {report.layout.size:>5}  {report.layout.align:>5}  {report.layout.paddingSize():>7}  ' +
+                f'{report.cacheLines():>5}  {len(report.splitFields):>5}  {minimalStr:>7}'
+            )
+        self.statement()
+
+        # Write suggested field orders sorted by the number of saved bytes
+        suggestions = sorted(filter(lambda report: report.reorderedLayout, reports), key = lambda report: -report.savedSize())
+        if len(suggestions) > 0:
+            self.statement('Suggested field orders:')
+            for report in suggestions:
+                linesStr = ''
+                reorderedLines = (report.reorderedLayout.size + PaddingTranslator.CACHE_LINE_SIZE - 1) // PaddingTranslator.CACHE_LINE_SIZE
+                if reorderedLines < report.cacheLines():
+                    linesStr = f', {report.cacheLines()} -> {reorderedLines} cache lines'
+                self.statement(f'  {report.name}: {report.layout.size} -> {report.reorderedLayout.size} bytes{linesStr}')
+                self.statement(f'    {", ".join(field.name for field in report.reorderedLayout.fields)}')
+            self.statement()
+
+        # Write fields that span two cache lines
+        splitReports = list(filter(lambda report: len(report.splitFields) > 0, reports))
+        if len(splitReports) > 0:
+            self.statement('Fields spanning two cache lines:')
+            for report in splitReports:
+                self.statement(f'  {report.name}: {", ".join(report.splitFields)}')
+            self.statement()
+
+        if len(unknownStructs) > 0:
+            self.statement(f'Unknown layout: {", ".join(unknownStructs)}')
+            self.statement()
+
+        # Write summary for entire API surface
+        totalSize = sum(report.layout.size for report in reports)
+        totalPadding = sum(report.layout.paddingSize() for report in reports)
+        totalSaved = sum(report.savedSize() for report in reports)
+        self.statement(f'Total: {totalPadding} of {totalSize} bytes are padding ({totalPadding * 100.0 / max(1, totalSize):.1f}%) in {len(reports)} structs')
+        self.statement(f'Reordering {len(suggestions)} structs saves {totalSaved} bytes; fixed layouts: {", ".join(LLGLMeta.fixedLayouts)}')
@@ -0,0 +1,315 @@
+#
+# llgl_translator_python.py
+#
+# Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+# Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+#
+
+import keyword
+from llgl_translator import *
+
+class PythonTranslator(Translator):
+    builtinTypenames = {
+        StdType.VOID: 'None',
+        StdType.BOOL: 'ctypes.c_bool',
+        StdType.CHAR: 'ctypes.c_char',
+        StdType.WCHAR: 'ctypes.c_wchar',
+        StdType.INT8: 'ctypes.c_int8',
+        StdType.INT16: 'ctypes.c_int16',
+        StdType.INT32: 'ctypes.c_int32',
+        StdType.INT64: 'ctypes.c_int64',
+        StdType.UINT8: 'ctypes.c_uint8',
+        StdType.UINT16: 'ctypes.c_uint16',
+        StdType.UINT32: 'ctypes.c_uint32',
+        StdType.UINT64: 'ctypes.c_uint64',
+        StdType.LONG: 'ctypes.c_long',
+        StdType.SIZE_T: 'ctypes.c_size_t',
+        StdType.FLOAT: 'ctypes.c_float'
+    }
+
+    # Python expressions for the preprocessor conditions of external types (see LLGLMeta.externals)
+    conditions = {
+        'defined LLGL_OS_ANDROID': "hasattr(sys, 'getandroidapilevel')"
+    }
+
+    # Enumerations are 'unsigned int' in C99 since none of them has negative entries
+    ENUM_TYPE = 'ctypes.c_uint'
+
+    @staticmethod
+    def translateIdent(ident):
+        # Entries such as 'None' are reserved keywords in Python
+        return f'{ident}_' if keyword.iskeyword(ident) else ident
+
+    @staticmethod
+    def stripTypePrefix(typename):
+        return typename[len(LLGLMeta.typePrefix):] if typename.startswith(LLGLMeta.typePrefix) else typename
+
+    @staticmethod
+    def translateDelegateName(name):
+        return f'{name[len(LLGLMeta.delegatePrefix):]}Delegate'
+
+    # Returns the ctypes type of a single element of the specified type without pointer or array qualifiers
+    def translateElementType(self, doc, fieldType):
+        typename = PythonTranslator.stripTypePrefix(fieldType.typename)
+        if fieldType.baseType == StdType.FUNC:
+            return PythonTranslator.translateDelegateName(fieldType.typename) if doc.findDelegateByName(fieldType.typename) else 'ctypes.c_void_p'
+        if fieldType.typename in LLGLMeta.handles:
+            return 'ctypes.c_void_p'
+        if fieldType.typename in [LLGLMeta.UTF8STRING, LLGLMeta.STRING]:
+            return 'ctypes.c_char_p'
+        if typename in LLGLMeta.interfaces or doc.findStructByName(typename):
+            return typename
+        if doc.findEnumByName(typename):
+            return PythonTranslator.ENUM_TYPE
+        if doc.findFlagsByName(typename):
+            return 'ctypes.c_long'
+        builtin = PythonTranslator.builtinTypenames.get(fieldType.baseType)
+        return builtin if builtin else 'ctypes.c_void_p'
+
+    # Returns the ctypes type of the specified parameter, return value, or struct field (excluding dynamic arrays)
+    def translateType(self, doc, fieldType):
+        elementType = self.translateElementType(doc, fieldType)
+        if fieldType.isPointer:
+            if fieldType.baseType == StdType.CHAR:
+                return 'ctypes.c_char_p'
+            elif fieldType.baseType == StdType.WCHAR:
+                return 'ctypes.c_wchar_p'
+            elif fieldType.baseType == StdType.VOID or elementType == 'ctypes.c_void_p':
+                return 'ctypes.c_void_p'
+            return f'ctypes.POINTER({elementType})'
+        return elementType
+
+    # Returns a list of (name, type[, bitsize]) tuples for the specified struct field as laid out by the C99 translator
+    def translateStructField(self, doc, field):
+        fieldType = field.type
+        if fieldType.isDynamicArray():
+            # Dynamic arrays are a pair of element count and pointer to the first element
+            elementType = self.translateElementType(doc, fieldType)
+            pointerType = 'ctypes.c_void_p' if elementType == 'ctypes.c_void_p' else f'ctypes.POINTER({elementType})'
+            return [
+                (f'num{field.name[0].upper()}{field.name[1:]}', 'ctypes.c_size_t'),
+                (field.name, pointerType)
+            ]
+
+        typeStr = self.translateType(doc, fieldType)
+        if fieldType.arraySize > 0:
+            return [ (field.name, f'{typeStr} * {fieldType.arraySize}') ]
+
+        # Enumerations with underlying type are emitted as bitfields in C99 (see C99Translator)
+        enum = doc.findEnumByName(fieldType.typename)
+        if enum and enum.base and enum.base.getFixedBitsize() > 0 and not fieldType.isPointer:
+            return [ (field.name, typeStr, enum.base.getFixedBitsize()) ]
+
+        return [ (field.name, typeStr) ]
+
+    # Writes the file header with copyright notice and the specified import statements
+    def translateHeader(self, doc, imports):
+        self.statement('#')
+        self.statement(f'# {doc.name}.py')
+        self.statement('#')
+        for line in LLGLMeta.copyright:
+            self.statement(f'# {line}')
+        self.statement('#')
+        self.statement()
+        for line in LLGLMeta.info:
+            self.statement(f'# {line}')
+        self.statement()
+        for line in imports:
+            self.statement(line)
+        self.statement()
+        self.statement()
+
+    def translateModule(self, doc):
+        self.translateHeader(doc, [ 'import ctypes', 'import enum', 'import os', 'import sys' ])
+
+        def writeEnum(record, baseClass, values):
+            self.statement(f'class {record.name}({baseClass}):')
+            self.indent += 1
+            declList = Translator.DeclarationList()
+            for field, value in zip(record.fields, values):
+                declList.append(Translator.Declaration('', PythonTranslator.translateIdent(field.name), value))
+            for decl in declList.decls:
+                self.statement(f'{decl.name}{declList.spaces(1, decl.name)}= {decl.init}')
+            self.indent -= 1
+            self.statement()
+
+        # Write all constants
+        constStructs = list(filter(lambda record: record.hasConstFieldsOnly(), doc.structs))
+        if len(constStructs) > 0:
+            self.statement('# ----- Constants -----')
+            self.statement()
+            for struct in constStructs:
+                writeEnum(struct, 'enum.IntEnum', [field.init for field in struct.fields])
+            self.statement()
+
+        # Write all enumerations with folded values
+        if len(doc.enums) > 0:
+            self.statement('# ----- Enumerations -----')
+            self.statement()
+            for enum in doc.enums:
+                Translator.requireFoldedValues(enum)
+                writeEnum(enum, 'enum.IntEnum', [str(field.value) for field in enum.fields])
+            self.statement()
+
+        # Write all flags with folded values
+        if len(doc.flags) > 0:
+            self.statement('# ----- Flags -----')
+            self.statement()
+            for flag in doc.flags:
+                Translator.requireFoldedValues(flag)
+                writeEnum(flag, 'enum.IntFlag', [f'0x{field.value:08X}' for field in flag.fields])
+            self.statement()
+
+        # Write all interface handles; all of them are a struct with a single opaque pointer
+        self.statement('# ----- Handles -----')
+        self.statement()
+        for interface in LLGLMeta.interfaces:
+            self.statement(f'class {interface}(ctypes.Structure):')
+            self.indent += 1
+            self.statement("_fields_ = [ ('internal', ctypes.c_void_p) ]")
+            self.indent -= 1
+            self.statement()
+        self.statement()
+
+        # Declare all structures first, so delegates and fields can refer to them before their fields are defined
+        commonStructs = list(filter(lambda record: not record.hasConstFieldsOnly(), doc.structs))
+        if len(commonStructs) > 0:
+            self.statement('# ----- Structures -----')
+            self.statement()
+            for struct in commonStructs:
+                self.statement(f'class {struct.name}(ctypes.Structure):')
+                self.indent += 1
+                self.statement('pass')
+                self.indent -= 1
+                self.statement()
+            self.statement()
+
+        # Write all delegates as C function pointer types
+        if len(doc.delegates) > 0:
+            self.statement('# ----- Delegates -----')
+            self.statement()
+            for delegate in doc.delegates:
+                typeArgs = [self.translateType(doc, delegate.returnType)] + [self.translateType(doc, param.type) for param in delegate.params]
+                self.statement(f'{PythonTranslator.translateDelegateName(delegate.name)} = ctypes.CFUNCTYPE({", ".join(typeArgs)})')
+            self.statement()
+            self.statement()
+
+        # Write fields of all structures in dependency order, since by-value fields require complete types
+        if len(commonStructs) > 0:
+            self.statement('# ----- Structure fields -----')
+            self.statement()
+            for struct in commonStructs:
+                fieldGroups = [ (None, []) ]
+                for field in struct.fields:
+                    cond = field.type.externalCond
+                    if cond != fieldGroups[-1][0]:
+                        fieldGroups.append((cond, []))
+                    fieldGroups[-1][1].extend(self.translateStructField(doc, field))
+
+                nameLen = max([len(decl[0]) for group in fieldGroups for decl in group[1]] + [0])
+                def writeFields(fields):
+                    for decl in fields:
+                        name = f"'{decl[0]}',"
+                        bitsize = f', {decl[2]}' if len(decl) > 2 else ''
+                        self.statement(f'({name:<{nameLen + 3}} {decl[1]}{bitsize}),')
+
+                # Fields of external types are only appended if their preprocessor condition holds on the running platform
+                self.statement(f'{struct.name}._fields_ = [')
+                self.indent += 1
+                for cond, fields in filter(lambda group: len(group[1]) > 0, fieldGroups):
+                    if cond:
+                        self.statement('*([')
+                        self.indent += 1
+                        writeFields(fields)
+                        self.indent -= 1
+                        self.statement(f'] if {PythonTranslator.conditions.get(cond, "False")} else []),')
+                    else:
+                        writeFields(fields)
+                self.indent -= 1
+                self.statement(']')
+                self.statement()
+            self.statement()
+
+        # Write signatures of all exported functions that are bound to the library on first use
+        if len(doc.funcs) > 0:
+            self.statement('# ----- Functions -----')
+            self.statement()
+            self.statement('# Signatures of all exported functions as (restype, argtypes)')
+            self.statement('_functions = {')
+            self.indent += 1
+            for func in doc.funcs:
+                # Ignore functions with variadic arguments for now
+                if func.hasVargs():
+                    continue
+                argTypes = ', '.join(self.translateType(doc, param.type) for param in func.params)
+                self.statement(f"'{func.name}': ({self.translateType(doc, func.returnType)}, [{argTypes}]),")
+            self.indent -= 1
+            self.statement('}')
+            self.statement()
+            self.statement('_library = None')
+            self.statement()
+            self.statement('# Loads the LLGL shared library from the specified path, the LLGL_LIBRARY environment variable, or the library search path.')
+            self.statement('# This is called implicitly when the first function is used.')
+            self.statement('def load(path = None):')
+            self.indent += 1
+            self.statement('global _library')
+            self.statement('if _library is None:')
+            self.indent += 1
+            self.statement("path = path or os.environ.get('LLGL_LIBRARY')")
+            self.statement('if path:')
+            self.indent += 1
+            self.statement('_library = ctypes.CDLL(path)')
+            self.indent -= 1
+            self.statement('else:')
+            self.indent += 1
+            self.statement("if sys.platform == 'win32':")
+            self.indent += 1
+            self.statement("names = [ 'LLGL.dll', 'LLGLD.dll' ]")
+            self.indent -= 1
+            self.statement("elif sys.platform == 'darwin':")
+            self.indent += 1
+            self.statement("names = [ 'libLLGL.dylib', 'libLLGLD.dylib' ]")
+            self.indent -= 1
+            self.statement('else:')
+            self.indent += 1
+            self.statement("names = [ 'libLLGL.so', 'libLLGLD.so' ]")
+            self.indent -= 1
+            self.statement('for name in names:')
+            self.indent += 1
+            self.statement('try:')
+            self.indent += 1
+            self.statement('_library = ctypes.CDLL(name)')
+            self.statement('break')
+            self.indent -= 1
+            self.statement('except OSError:')
+            self.indent += 1
+            self.statement('pass')
+            self.indent -= 1
+            self.indent -= 1
+            self.statement('if _library is None:')
+            self.indent += 1
+            self.statement("raise OSError(f'failed to load LLGL library (tried {\", \".join(names)}); set LLGL_LIBRARY to its path')")
+            self.indent -= 1
+            self.indent -= 1
+            self.indent -= 1
+            self.statement('return _library')
+            self.indent -= 1
+            self.statement()
+            self.statement('# Binds exported functions lazily on first access, so importing this module does not resolve any symbols (PEP 562)')
+            self.statement('def __getattr__(name):')
+            self.indent += 1
+            self.statement('signature = _functions.get(name)')
+            self.statement('if signature is None:')
+            self.indent += 1
+            self.statement("raise AttributeError(f'module {__name__!r} has no attribute {name!r}')")
+            self.indent -= 1
+            self.statement('func = getattr(load(), name)')
+            self.statement('func.restype, func.argtypes = signature')
+            self.statement('globals()[name] = func')
+            self.statement('return func')
+            self.indent -= 1
+            self.statement()
+            self.statement()
+
+        self.statement()
+        self.statement('# ================================================================================')
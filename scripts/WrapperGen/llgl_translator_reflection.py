@@ -0,0 +1,359 @@
+#
+# llgl_translator_reflection.py
+#
+# Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+# Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+#
+
+from llgl_translator import *
+
+class ReflectionField:
+    name = ''
+    macro = '' # Name of the LLGL_REFLECT_* macro that declares this field
+    args = [] # Macro arguments after struct and field name
+
+    def __init__(self, name, macro, args = []):
+        self.name = name
+        self.macro = macro
+        self.args = args
+
+class ReflectionTable:
+    struct = None
+    fields = [] # Array of ReflectionField
+
+    def __init__(self, doc, struct):
+        self.struct = struct
+        self.fields = []
+
+        def isNestedStruct(fieldType):
+            return fieldType.isCustomType() and not fieldType.isInterface() and doc.findStructByName(fieldType.typename) is not None
+
+        def typeRef(fieldType):
+            return f'&g_llglStructInfo{fieldType.typename}' if isNestedStruct(fieldType) else 'NULL'
+
+        fieldNames = [field.name for field in struct.fields if field.type.baseType != StdType.CONST]
+        layout = doc.computeRecordLayout(struct, LLGLModule.LAYOUT_C99)
+
+        # Pointers with a size field of the same name, e.g. 'data' and 'dataSize', are treated as byte buffers
+        def findSizeField(name):
+            sizeFieldName = f'{name}Size'
+            return sizeFieldName if sizeFieldName in fieldNames else None
+
+        pendingCountFields = [] # Array of (index, name of count field) that are resolved after all fields are known
+        bitfieldUnitOffset = None
+
+        for field in struct.fields:
+            fieldType = field.type
+            if fieldType.baseType == StdType.CONST or fieldType.externalCond:
+                # Skip constants and platform specific fields that are not declared on all platforms
+                continue
+
+            # Merge bitfields that share the same storage unit into a single scalar field, since offsetof is ill-formed for bitfields
+            fieldLayout = layout.findFieldByName(field.name) if not isinstance(layout, str) else None
+            if fieldLayout and fieldLayout.isBitfield():
+                if bitfieldUnitOffset != fieldLayout.offset:
+                    bitfieldUnitOffset = fieldLayout.offset
+                    self.fields.append(ReflectionField(field.name, 'LLGL_REFLECT_BITFIELD', [str(fieldLayout.offset), str(fieldLayout.size)]))
+                continue
+            bitfieldUnitOffset = None
+
+            if fieldType.isDynamicArray():
+                countFieldName = f'num{field.name[0].upper()}{field.name[1:]}'
+                self.fields.append(ReflectionField(countFieldName, 'LLGL_REFLECT_FIELD', ['Scalar', 'NULL']))
+                kind = 'StringArray' if fieldType.typename in [LLGLMeta.UTF8STRING, LLGLMeta.STRING] else 'Array'
+                self.fields.append(ReflectionField(field.name, 'LLGL_REFLECT_DYNAMIC_ARRAY', [kind, str(len(self.fields) - 1), typeRef(fieldType)]))
+            elif fieldType.typename in [LLGLMeta.UTF8STRING, LLGLMeta.STRING]:
+                self.fields.append(ReflectionField(field.name, 'LLGL_REFLECT_FIELD', ['String', 'NULL']))
+            elif fieldType.isInterface():
+                self.fields.append(ReflectionField(field.name, 'LLGL_REFLECT_FIELD', ['Object', 'NULL']))
+            elif fieldType.isPointer or fieldType.baseType == StdType.FUNC:
+                sizeFieldName = findSizeField(field.name) if fieldType.isPointer else None
+                if sizeFieldName:
+                    kind = 'Text' if fieldType.baseType == StdType.CHAR else 'Array'
+                    pendingCountFields.append((len(self.fields), sizeFieldName))
+                    self.fields.append(ReflectionField(field.name, 'LLGL_REFLECT_BUFFER', [kind, None]))
+                elif fieldType.isPointer and fieldType.baseType == StdType.CHAR:
+                    self.fields.append(ReflectionField(field.name, 'LLGL_REFLECT_FIELD', ['String', 'NULL']))
+                else:
+                    self.fields.append(ReflectionField(field.name, 'LLGL_REFLECT_FIELD', ['Pointer', 'NULL']))
+            elif fieldType.arraySize > 0:
+                kind = 'Struct' if isNestedStruct(fieldType) else 'Scalar'
+                self.fields.append(ReflectionField(field.name, 'LLGL_REFLECT_ARRAY', [str(fieldType.arraySize), kind, typeRef(fieldType)]))
+            else:
+                kind = 'Struct' if isNestedStruct(fieldType) else 'Scalar'
+                self.fields.append(ReflectionField(field.name, 'LLGL_REFLECT_FIELD', [kind, typeRef(fieldType)]))
+
+        # Resolve indices of size fields that follow their buffer field
+        fieldIndices = dict((field.name, index) for index, field in enumerate(self.fields))
+        for index, sizeFieldName in pendingCountFields:
+            self.fields[index].args[1] = str(fieldIndices[sizeFieldName])
+
+class ReflectionTranslator(Translator):
+    def translateModule(self, doc):
+        commonStructs = list(filter(lambda record: not record.hasConstFieldsOnly(), doc.structs))
+        tables = list(map(lambda struct: ReflectionTable(doc, struct), commonStructs))
+
+        self.statement('/*')
+        self.statement(f' * {doc.name}.h')
+        self.statement(' *')
+        for line in LLGLMeta.copyright:
+            self.statement(f' * {line}')
+        self.statement(' */')
+        self.statement()
+        for line in LLGLMeta.info:
+            self.statement(f'/* {line} */')
+        self.statement()
+
+        headerGuardName = f'LLGL_C99{Translator.convertNameToHeaderGuard(doc.name)}_H'
+        self.statement(f'#ifndef {headerGuardName}')
+        self.statement(f'#define {headerGuardName}')
+        self.statement()
+        self.statement()
+        self.statement('#include <LLGL-C/LLGL.h>')
+        self.statement('#include <stddef.h>')
+        self.statement('#include <stdint.h>')
+        self.statement()
+        self.statement()
+        self.statement(f'#define LLGL_NUM_STRUCT_TYPES ( {len(tables)} )')
+        self.statement()
+        self.statement()
+
+        self.statement('/* ----- Enumerations ----- */')
+        self.statement()
+        self.statement('typedef enum LLGLStructType')
+        self.openScope()
+        for table in tables:
+            self.statement(f'LLGLStructType{table.struct.name},')
+        self.closeScope()
+        self.statement('LLGLStructType;')
+        self.statement()
+        self.statement('typedef enum LLGLFieldKind')
+        self.openScope()
+        self.statement('LLGLFieldKindScalar,        /* Plain bytes: integers, floats, booleans, enumerations, flags, and merged bitfields */')
+        self.statement('LLGLFieldKindString,        /* Null-terminated string (const char*) */')
+        self.statement('LLGLFieldKindStruct,        /* Nested struct described by LLGLFieldInfo::type */')
+        self.statement('LLGLFieldKindArray,         /* Pointer to elements; the number of elements is stored in the field at LLGLFieldInfo::countField */')
+        self.statement('LLGLFieldKindStringArray,   /* Pointer to strings; the number of strings is stored in the field at LLGLFieldInfo::countField */')
+        self.statement('LLGLFieldKindText,          /* Pointer to characters with the length in LLGLFieldInfo::countField or null-terminated if the length is 0 */')
+        self.statement('LLGLFieldKindObject,        /* Interface handle such as LLGLTexture; reflected by identity */')
+        self.statement('LLGLFieldKindPointer,       /* Opaque pointer or function pointer; reflected by address */')
+        self.closeScope()
+        self.statement('LLGLFieldKind;')
+        self.statement()
+        self.statement()
+
+        self.statement('/* ----- Structures ----- */')
+        self.statement()
+        self.statement('typedef struct LLGLStructInfo LLGLStructInfo;')
+        self.statement()
+        self.statement('typedef struct LLGLFieldInfo')
+        self.openScope()
+        self.statement('const char*             name;       /* Field name, e.g. "vertexAttribs" */')
+        self.statement('size_t                  offset;     /* Byte offset within the struct */')
+        self.statement('size_t                  size;       /* Size of the field or of a single element for arrays */')
+        self.statement('size_t                  count;      /* Number of elements for fixed size arrays, 1 otherwise */')
+        self.statement('LLGLFieldKind           kind;')
+        self.statement('int                     countField; /* Index of the size_t field with the number of elements for array kinds, -1 otherwise */')
+        self.statement('const LLGLStructInfo*   type;       /* Struct info of nested structs and struct elements, NULL otherwise */')
+        self.closeScope()
+        self.statement('LLGLFieldInfo;')
+        self.statement()
+        self.statement('struct LLGLStructInfo')
+        self.openScope()
+        self.statement('const char*             name;       /* Struct name without prefix, e.g. "BufferDescriptor" */')
+        self.statement('size_t                  size;')
+        self.statement('size_t                  numFields;')
+        self.statement('const LLGLFieldInfo*    fields;')
+        self.closeScope('};')
+        self.statement()
+        self.statement()
+
+        self.statement('/* ----- Functions ----- */')
+        self.statement()
+        self.statement('/*')
+        self.statement('llglGetStructInfo returns the reflection table of the specified struct type or NULL if the type is out of range.')
+        self.statement('llglHashStruct hashes all fields of a struct in a single pass including strings, arrays, and nested structs, but excluding padding bytes.')
+        self.statement('llglSerializeStruct writes all fields of a struct into the output buffer and returns the size of the entire serialization like snprintf.')
+        self.statement('Strings are written as 32-bit length (0xFFFFFFFF for NULL) followed by the characters, arrays as 64-bit element count followed by the elements.')
+        self.statement('Objects and pointers are written by value and are therefore only valid within the same process.')
+        self.statement('Neither function allocates memory.')
+        self.statement('*/')
+        self.statement()
+        self.statement('LLGL_C_EXPORT const LLGLStructInfo* llglGetStructInfo(LLGLStructType type);')
+        self.statement('LLGL_C_EXPORT uint64_t llglHashStruct(const LLGLStructInfo* info, const void* data, uint64_t seed);')
+        self.statement('LLGL_C_EXPORT size_t llglSerializeStruct(const LLGLStructInfo* info, const void* data, void* buffer, size_t bufferSize);')
+        self.statement()
+
+        implMacro = f'LLGL{Translator.convertNameToHeaderGuard(doc.name[len(LLGLMeta.typePrefix):])}_IMPLEMENTATION'
+        self.statement(f'#ifdef {implMacro}')
+        self.statement()
+        self.statement('#include <string.h>')
+        self.statement()
+        self.statement('#define LLGL_REFLECT_FIELD(STRUCT, FIELD, KIND, TYPE) \\')
+        self.statement('    { #FIELD, offsetof(LLGL ## STRUCT, FIELD), sizeof(((const LLGL ## STRUCT*)0)->FIELD), 1, LLGLFieldKind ## KIND, -1, TYPE }')
+        self.statement()
+        self.statement('#define LLGL_REFLECT_ARRAY(STRUCT, FIELD, COUNT, KIND, TYPE) \\')
+        self.statement('    { #FIELD, offsetof(LLGL ## STRUCT, FIELD), sizeof(((const LLGL ## STRUCT*)0)->FIELD[0]), COUNT, LLGLFieldKind ## KIND, -1, TYPE }')
+        self.statement()
+        self.statement('#define LLGL_REFLECT_DYNAMIC_ARRAY(STRUCT, FIELD, KIND, COUNT_FIELD, TYPE) \\')
+        self.statement('    { #FIELD, offsetof(LLGL ## STRUCT, FIELD), sizeof(((const LLGL ## STRUCT*)0)->FIELD[0]), 1, LLGLFieldKind ## KIND, COUNT_FIELD, TYPE }')
+        self.statement()
+        self.statement('#define LLGL_REFLECT_BUFFER(STRUCT, FIELD, KIND, COUNT_FIELD) \\')
+        self.statement('    { #FIELD, offsetof(LLGL ## STRUCT, FIELD), 1, 1, LLGLFieldKind ## KIND, COUNT_FIELD, NULL }')
+        self.statement()
+        self.statement('#define LLGL_REFLECT_BITFIELD(STRUCT, FIELD, OFFSET, SIZE) \\')
+        self.statement('    { #FIELD, OFFSET, SIZE, 1, LLGLFieldKindScalar, -1, NULL }')
+        self.statement()
+        self.statement('#define LLGL_REFLECT_STRUCT(STRUCT) \\')
+        self.statement('    static const LLGLStructInfo g_llglStructInfo ## STRUCT = { #STRUCT, sizeof(LLGL ## STRUCT), sizeof(g_llglFields ## STRUCT)/sizeof(g_llglFields ## STRUCT[0]), g_llglFields ## STRUCT }')
+        self.statement()
+
+        # Write reflection tables in dependency order so nested struct infos are declared before they are referenced
+        for table in tables:
+            self.statement(f'static const LLGLFieldInfo g_llglFields{table.struct.name}[] =')
+            self.openScope()
+            for field in table.fields:
+                self.statement(f'{field.macro}({", ".join([table.struct.name, field.name] + field.args)}),')
+            self.closeScope('};')
+            self.statement(f'LLGL_REFLECT_STRUCT({table.struct.name});')
+            self.statement()
+
+        self.statement('static const LLGLStructInfo* const g_llglStructInfos[LLGL_NUM_STRUCT_TYPES] =')
+        self.openScope()
+        for table in tables:
+            self.statement(f'&g_llglStructInfo{table.struct.name},')
+        self.closeScope('};')
+        self.statement()
+
+        self.statement('typedef struct LLGLReflectionWriter')
+        self.openScope()
+        self.statement('void    (*write)(struct LLGLReflectionWriter* self, const void* data, size_t size);')
+        self.statement('uint64_t hash;')
+        self.statement('char*   buffer;')
+        self.statement('size_t  bufferSize;')
+        self.statement('size_t  size;')
+        self.closeScope()
+        self.statement('LLGLReflectionWriter;')
+        self.statement()
+        self.statement('/* 64-bit FNV-1a */')
+        self.statement('static void llglReflectionWriteHash(LLGLReflectionWriter* self, const void* data, size_t size)')
+        self.openScope()
+        self.statement('const unsigned char* bytes = (const unsigned char*)data;')
+        self.statement('for (size_t i = 0; i < size; ++i)')
+        self.openScope()
+        self.statement('self->hash ^= bytes[i];')
+        self.statement('self->hash *= 0x00000100000001B3ull;')
+        self.closeScope()
+        self.closeScope()
+        self.statement()
+        self.statement('static void llglReflectionWriteBuffer(LLGLReflectionWriter* self, const void* data, size_t size)')
+        self.openScope()
+        self.statement('if (self->size < self->bufferSize)')
+        self.openScope()
+        self.statement('const size_t remaining = self->bufferSize - self->size;')
+        self.statement('memcpy(self->buffer + self->size, data, size < remaining ? size : remaining);')
+        self.closeScope()
+        self.statement('self->size += size;')
+        self.closeScope()
+        self.statement()
+        self.statement('static void llglReflectString(LLGLReflectionWriter* writer, const char* str, size_t len)')
+        self.openScope()
+        self.statement('const uint32_t len32 = (str != NULL ? (uint32_t)len : 0xFFFFFFFFu);')
+        self.statement('writer->write(writer, &len32, sizeof(len32));')
+        self.statement('if (str != NULL)')
+        self.statement('    writer->write(writer, str, len);')
+        self.closeScope()
+        self.statement()
+        self.statement('static void llglReflectStruct(LLGLReflectionWriter* writer, const LLGLStructInfo* info, const char* data)')
+        self.openScope()
+        self.statement('for (size_t i = 0; i < info->numFields; ++i)')
+        self.openScope()
+        self.statement('const LLGLFieldInfo* field = &info->fields[i];')
+        self.statement('const char* fieldData = data + field->offset;')
+        self.statement('switch (field->kind)')
+        self.openScope()
+        self.statement('case LLGLFieldKindScalar:')
+        self.statement('case LLGLFieldKindObject:')
+        self.statement('case LLGLFieldKindPointer:')
+        self.openScope()
+        self.statement('writer->write(writer, fieldData, field->size * field->count);')
+        self.closeScope()
+        self.statement('break;')
+        self.statement()
+        self.statement('case LLGLFieldKindString:')
+        self.openScope()
+        self.statement('const char* str = *(const char* const*)fieldData;')
+        self.statement('llglReflectString(writer, str, (str != NULL ? strlen(str) : 0));')
+        self.closeScope()
+        self.statement('break;')
+        self.statement()
+        self.statement('case LLGLFieldKindStruct:')
+        self.openScope()
+        self.statement('for (size_t j = 0; j < field->count; ++j)')
+        self.statement('    llglReflectStruct(writer, field->type, fieldData + j * field->size);')
+        self.closeScope()
+        self.statement('break;')
+        self.statement()
+        self.statement('case LLGLFieldKindText:')
+        self.openScope()
+        self.statement('const char* str = *(const char* const*)fieldData;')
+        self.statement('const size_t len = *(const size_t*)(data + info->fields[field->countField].offset);')
+        self.statement('llglReflectString(writer, str, (str != NULL && len == 0 ? strlen(str) : len));')
+        self.closeScope()
+        self.statement('break;')
+        self.statement()
+        self.statement('case LLGLFieldKindArray:')
+        self.statement('case LLGLFieldKindStringArray:')
+        self.openScope()
+        self.statement('const char* elements = *(const char* const*)fieldData;')
+        self.statement('const uint64_t count = (elements != NULL ? (uint64_t)*(const size_t*)(data + info->fields[field->countField].offset) : 0);')
+        self.statement('writer->write(writer, &count, sizeof(count));')
+        self.statement('if (field->kind == LLGLFieldKindStringArray)')
+        self.openScope()
+        self.statement('for (uint64_t j = 0; j < count; ++j)')
+        self.openScope()
+        self.statement('const char* str = ((const char* const*)elements)[j];')
+        self.statement('llglReflectString(writer, str, (str != NULL ? strlen(str) : 0));')
+        self.closeScope()
+        self.closeScope()
+        self.statement('else if (field->type != NULL)')
+        self.openScope()
+        self.statement('for (uint64_t j = 0; j < count; ++j)')
+        self.statement('    llglReflectStruct(writer, field->type, elements + j * field->size);')
+        self.closeScope()
+        self.statement('else if (count > 0)')
+        self.statement('    writer->write(writer, elements, (size_t)count * field->size);')
+        self.closeScope()
+        self.statement('break;')
+        self.closeScope()
+        self.closeScope()
+        self.closeScope()
+        self.statement()
+        self.statement('LLGL_C_EXPORT const LLGLStructInfo* llglGetStructInfo(LLGLStructType type)')
+        self.openScope()
+        self.statement('return ((size_t)type < LLGL_NUM_STRUCT_TYPES ? g_llglStructInfos[type] : NULL);')
+        self.closeScope()
+        self.statement()
+        self.statement('LLGL_C_EXPORT uint64_t llglHashStruct(const LLGLStructInfo* info, const void* data, uint64_t seed)')
+        self.openScope()
+        self.statement('LLGLReflectionWriter writer = { llglReflectionWriteHash, 0xCBF29CE484222325ull ^ seed, NULL, 0, 0 };')
+        self.statement('llglReflectStruct(&writer, info, (const char*)data);')
+        self.statement('return writer.hash;')
+        self.closeScope()
+        self.statement()
+        self.statement('LLGL_C_EXPORT size_t llglSerializeStruct(const LLGLStructInfo* info, const void* data, void* buffer, size_t bufferSize)')
+        self.openScope()
+        self.statement('LLGLReflectionWriter writer = { llglReflectionWriteBuffer, 0, (char*)buffer, bufferSize, 0 };')
+        self.statement('llglReflectStruct(&writer, info, (const char*)data);')
+        self.statement('return writer.size;')
+        self.closeScope()
+        self.statement()
+        self.statement(f'#endif /* {implMacro} */')
+        self.statement()
+        self.statement()
+        self.statement(f'#endif /* {headerGuardName} */')
+        self.statement()
+        self.statement()
+        self.statement()
+        self.statement('/* ================================================================================ */')
+        self.statement()
@@ -0,0 +1,422 @@
+#
+# llgl_translator_strings.py
+#
+# Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+# Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+#
+
+from llgl_translator import *
+
+class EnumLookupTable:
+    record = None
+    isFlags = False
+    minValue = 0
+    denseNames = None # Array of entry names indexed by (value - minValue) or None if the values are too sparse
+    valueEntries = [] # Array of (value, name) sorted by value with the first name for duplicate values
+    nameEntries = [] # Array of (name, value) sorted by name
+    flagEntries = [] # Array of (name, value) in the order they are matched when a flag set is decomposed
+
+    # Maximum ratio between the value range and the number of distinct values to emit a dense value-to-name array
+    MAX_DENSE_RATIO = 2
+
+    def __init__(self, record, isFlags):
+        Translator.requireFoldedValues(record)
+        self.record = record
+        self.isFlags = isFlags
+
+        # Use the first entry for each value as its canonical name
+        valueNames = dict()
+        for field in record.fields:
+            if not field.value in valueNames:
+                valueNames[field.value] = field.name
+
+        self.valueEntries = sorted(valueNames.items())
+        self.nameEntries = sorted(map(lambda field: (field.name, field.value), record.fields))
+        self.minValue = self.valueEntries[0][0] if len(self.valueEntries) > 0 else 0
+        self.denseNames = None
+        self.flagEntries = []
+
+        if len(self.valueEntries) > 0 and self.minValue >= 0:
+            valueRange = self.valueEntries[-1][0] - self.minValue + 1
+            if valueRange <= len(self.valueEntries) * EnumLookupTable.MAX_DENSE_RATIO:
+                self.denseNames = [None] * valueRange
+                for value, name in self.valueEntries:
+                    self.denseNames[value - self.minValue] = name
+
+        if isFlags:
+            # Decompose flag sets greedily with combined entries first, e.g. "ReadWrite" before "Read" and "Write",
+            # and fall back to the zero entry only if no bit is set
+            def bitCount(value):
+                return bin(value & 0xFFFFFFFF).count('1')
+
+            nonZeroEntries = list(filter(lambda entry: entry[0] != 0, self.valueEntries))
+            self.flagEntries = list(map(lambda entry: (entry[1], entry[0]), sorted(nonZeroEntries, key = lambda entry: (-bitCount(entry[0]), entry[0]))))
+            zeroName = valueNames.get(0)
+            if zeroName:
+                self.flagEntries.append((zeroName, 0))
+
+    @staticmethod
+    def deriveTables(doc):
+        return (
+            list(map(lambda enum: EnumLookupTable(enum, False), doc.enums)) +
+            list(map(lambda flag: EnumLookupTable(flag, True), doc.flags))
+        )
+
+class EnumStringsTranslator(Translator):
+    language = 'c99'
+
+    def __init__(self, language = 'c99'):
+        self.language = language
+
+    # Writes an array initializer with as many items per line as fit into the maximum line length
+    def writeInitializerList(self, decl, items, terminator = ';', maxLineLength = 120):
+        self.statement(f'{decl} =')
+        self.openScope()
+        line = ''
+        for item in items:
+            if len(line) > 0 and len(self.indentation()) + len(line) + len(item) + 2 > maxLineLength:
+                self.statement(line.rstrip())
+                line = ''
+            line += f'{item}, '
+        if len(line) > 0:
+            self.statement(line.rstrip())
+        self.closeScope('}' + terminator)
+
+    def translateModule(self, doc):
+        tables = EnumLookupTable.deriveTables(doc)
+        if self.language == 'csharp':
+            self.translateCsharp(doc, tables)
+        else:
+            self.translateC99(doc, tables)
+
+    # Writes a C99 header with value-to-name and name-to-value functions for all enumerations and flags
+    def translateC99(self, doc, tables):
+        def translateEntryList(entries):
+            return list(map(lambda entry: f'{{ "{entry[0]}", {entry[1]} }}', entries))
+
+        def translateString(name):
+            return f'"{name}"' if name else 'NULL'
+
+        self.statement('/*')
+        self.statement(f' * {doc.name}.h')
+        self.statement(' *')
+        for line in LLGLMeta.copyright:
+            self.statement(f' * {line}')
+        self.statement(' */')
+        self.statement()
+        for line in LLGLMeta.info:
+            self.statement(f'/* {line} */')
+        self.statement()
+
+        headerGuardName = f'LLGL_C99{Translator.convertNameToHeaderGuard(doc.name)}_H'
+        self.statement(f'#ifndef {headerGuardName}')
+        self.statement(f'#define {headerGuardName}')
+        self.statement()
+        self.statement()
+        self.statement('#include <LLGL-C/LLGL.h>')
+        self.statement('#include <stdbool.h>')
+        self.statement('#include <stddef.h>')
+        self.statement()
+        self.statement()
+
+        # Write function declarations
+        self.statement('/* ----- Functions ----- */')
+        self.statement()
+        self.statement('/*')
+        self.statement('llgl<Enum>ToString returns the entry name without prefix, e.g. "RGBA8UNorm" for LLGLFormatRGBA8UNorm, or NULL for unknown values.')
+        self.statement('llgl<Flags>ToString writes the flag names separated by \'|\' into the output string and returns the length of the entire string')
+        self.statement('like snprintf, e.g. "Color|Stencil" for (LLGLClearColor | LLGLClearStencil). Unknown bits are written as a hexadecimal literal.')
+        self.statement('llgl<Enum>FromString and llgl<Flags>FromString return false if the name (or any name separated by \'|\') is unknown.')
+        self.statement('*/')
+        self.statement()
+
+        for table in tables:
+            name = table.record.name
+            if table.isFlags:
+                self.statement(f'LLGL_C_EXPORT size_t llgl{name}ToString(long flags, char* outString, size_t outStringSize);')
+                self.statement(f'LLGL_C_EXPORT bool llgl{name}FromString(const char* names, long* outFlags);')
+            else:
+                self.statement(f'LLGL_C_EXPORT const char* llgl{name}ToString(LLGL{name} value);')
+                self.statement(f'LLGL_C_EXPORT bool llgl{name}FromString(const char* name, LLGL{name}* outValue);')
+        self.statement()
+
+        # Write implementation
+        self.statement('#ifdef LLGL_ENUM_STRINGS_IMPLEMENTATION')
+        self.statement()
+        self.statement('#include <stdio.h>')
+        self.statement('#include <string.h>')
+        self.statement()
+        self.statement('typedef struct LLGLEnumEntry')
+        self.openScope()
+        self.statement('const char* name;')
+        self.statement('long        value;')
+        self.closeScope()
+        self.statement('LLGLEnumEntry;')
+        self.statement()
+
+        self.statement('static int llglCompareEnumName(const char* name, size_t nameLen, const char* entryName)')
+        self.openScope()
+        self.statement('const int order = strncmp(name, entryName, nameLen);')
+        self.statement('return (order != 0 ? order : (entryName[nameLen] != \'\\0\' ? -1 : 0));')
+        self.closeScope()
+        self.statement()
+        self.statement('/* Binary search in entries sorted by name */')
+        self.statement('static const LLGLEnumEntry* llglFindEnumEntryByName(const LLGLEnumEntry* entries, size_t numEntries, const char* name, size_t nameLen)')
+        self.openScope()
+        self.statement('size_t first = 0, last = numEntries;')
+        self.statement('while (first < last)')
+        self.openScope()
+        self.statement('const size_t mid = first + (last - first) / 2;')
+        self.statement('const int order = llglCompareEnumName(name, nameLen, entries[mid].name);')
+        self.statement('if (order == 0)')
+        self.statement('    return &entries[mid];')
+        self.statement('if (order < 0)')
+        self.statement('    last = mid;')
+        self.statement('else')
+        self.statement('    first = mid + 1;')
+        self.closeScope()
+        self.statement('return NULL;')
+        self.closeScope()
+        self.statement()
+        self.statement('/* Binary search in entries sorted by value */')
+        self.statement('static const char* llglFindEnumNameByValue(const LLGLEnumEntry* entries, size_t numEntries, long value)')
+        self.openScope()
+        self.statement('size_t first = 0, last = numEntries;')
+        self.statement('while (first < last)')
+        self.openScope()
+        self.statement('const size_t mid = first + (last - first) / 2;')
+        self.statement('if (entries[mid].value == value)')
+        self.statement('    return entries[mid].name;')
+        self.statement('if (value < entries[mid].value)')
+        self.statement('    last = mid;')
+        self.statement('else')
+        self.statement('    first = mid + 1;')
+        self.closeScope()
+        self.statement('return NULL;')
+        self.closeScope()
+        self.statement()
+        self.statement('static size_t llglAppendString(char* outString, size_t outStringSize, size_t len, const char* str)')
+        self.openScope()
+        self.statement('for (; *str != \'\\0\'; ++str, ++len)')
+        self.openScope()
+        self.statement('if (len + 1 < outStringSize)')
+        self.statement('    outString[len] = *str;')
+        self.closeScope()
+        self.statement('if (outStringSize > 0)')
+        self.statement('    outString[len + 1 < outStringSize ? len : outStringSize - 1] = \'\\0\';')
+        self.statement('return len;')
+        self.closeScope()
+        self.statement()
+        self.statement('/* Decomposes flags greedily in the order of the specified entries */')
+        self.statement('static size_t llglFlagsToString(const LLGLEnumEntry* entries, size_t numEntries, long flags, char* outString, size_t outStringSize)')
+        self.openScope()
+        self.statement('size_t len = 0;')
+        self.statement('if (outStringSize > 0)')
+        self.statement('    outString[0] = \'\\0\';')
+        self.statement('for (size_t i = 0; i < numEntries; ++i)')
+        self.openScope()
+        self.statement('const long value = entries[i].value;')
+        self.statement('if (value != 0 ? (flags & value) == value : (flags == 0 && len == 0))')
+        self.openScope()
+        self.statement('if (len > 0)')
+        self.statement('    len = llglAppendString(outString, outStringSize, len, "|");')
+        self.statement('len = llglAppendString(outString, outStringSize, len, entries[i].name);')
+        self.statement('flags &= ~value;')
+        self.closeScope()
+        self.closeScope()
+        self.statement('if (flags != 0)')
+        self.openScope()
+        self.statement('char hexString[32];')
+        self.statement('snprintf(hexString, sizeof(hexString), "0x%lX", (unsigned long)flags);')
+        self.statement('if (len > 0)')
+        self.statement('    len = llglAppendString(outString, outStringSize, len, "|");')
+        self.statement('len = llglAppendString(outString, outStringSize, len, hexString);')
+        self.closeScope()
+        self.statement('return len;')
+        self.closeScope()
+        self.statement()
+        self.statement('static bool llglFlagsFromString(const LLGLEnumEntry* entries, size_t numEntries, const char* names, long* outFlags)')
+        self.openScope()
+        self.statement('long flags = 0;')
+        self.statement('while (*names != \'\\0\')')
+        self.openScope()
+        self.statement('const char* nameEnd = strchr(names, \'|\');')
+        self.statement('const size_t nameLen = (nameEnd != NULL ? (size_t)(nameEnd - names) : strlen(names));')
+        self.statement('const LLGLEnumEntry* entry = llglFindEnumEntryByName(entries, numEntries, names, nameLen);')
+        self.statement('if (entry == NULL)')
+        self.statement('    return false;')
+        self.statement('flags |= entry->value;')
+        self.statement('names += (nameEnd != NULL ? nameLen + 1 : nameLen);')
+        self.closeScope()
+        self.statement('*outFlags = flags;')
+        self.statement('return true;')
+        self.closeScope()
+        self.statement()
+
+        for table in tables:
+            name = table.record.name
+            tableName = f'g_llgl{name}'
+
+            # Write lookup tables
+            if table.isFlags:
+                self.writeInitializerList(f'static const LLGLEnumEntry {tableName}Bits[]', translateEntryList(table.flagEntries))
+            elif table.denseNames:
+                self.writeInitializerList(f'static const char* const {tableName}Names[]', list(map(translateString, table.denseNames)))
+            else:
+                self.writeInitializerList(f'static const LLGLEnumEntry {tableName}Values[]', translateEntryList(map(lambda entry: (entry[1], entry[0]), table.valueEntries)))
+            self.statement()
+            self.writeInitializerList(f'static const LLGLEnumEntry {tableName}Entries[]', translateEntryList(table.nameEntries))
+            self.statement()
+
+            # Write lookup functions
+            if table.isFlags:
+                self.statement(f'LLGL_C_EXPORT size_t llgl{name}ToString(long flags, char* outString, size_t outStringSize)')
+                self.openScope()
+                self.statement(f'return llglFlagsToString({tableName}Bits, sizeof({tableName}Bits)/sizeof({tableName}Bits[0]), flags, outString, outStringSize);')
+                self.closeScope()
+                self.statement()
+                self.statement(f'LLGL_C_EXPORT bool llgl{name}FromString(const char* names, long* outFlags)')
+                self.openScope()
+                self.statement(f'return llglFlagsFromString({tableName}Entries, sizeof({tableName}Entries)/sizeof({tableName}Entries[0]), names, outFlags);')
+                self.closeScope()
+            else:
+                self.statement(f'LLGL_C_EXPORT const char* llgl{name}ToString(LLGL{name} value)')
+                self.openScope()
+                if table.denseNames:
+                    index = f'(long)value - {table.minValue}' if table.minValue != 0 else '(long)value'
+                    self.statement(f'const long index = {index};')
+                    self.statement(f'return (index >= 0 && index < (long)(sizeof({tableName}Names)/sizeof({tableName}Names[0])) ? {tableName}Names[index] : NULL);')
+                else:
+                    self.statement(f'return llglFindEnumNameByValue({tableName}Values, sizeof({tableName}Values)/sizeof({tableName}Values[0]), (long)value);')
+                self.closeScope()
+                self.statement()
+                self.statement(f'LLGL_C_EXPORT bool llgl{name}FromString(const char* name, LLGL{name}* outValue)')
+                self.openScope()
+                self.statement(f'const LLGLEnumEntry* entry = llglFindEnumEntryByName({tableName}Entries, sizeof({tableName}Entries)/sizeof({tableName}Entries[0]), name, strlen(name));')
+                self.statement('if (entry == NULL)')
+                self.statement('    return false;')
+                self.statement(f'*outValue = (LLGL{name})entry->value;')
+                self.statement('return true;')
+                self.closeScope()
+            self.statement()
+
+        self.statement('#endif /* LLGL_ENUM_STRINGS_IMPLEMENTATION */')
+        self.statement()
+        self.statement()
+        self.statement(f'#endif /* {headerGuardName} */')
+        self.statement()
+        self.statement()
+        self.statement()
+        self.statement('/* ================================================================================ */')
+        self.statement()
+
+    # Writes a C# static class with GetName/TryParse overloads for all enumerations and flags
+    def translateCsharp(self, doc, tables):
+        def translateStringList(names):
+            return list(map(lambda name: f'"{name}"' if name else 'null', names))
+
+        def translateValueList(values, typename):
+            return list(map(lambda value: f'({typename}){value}' if value >= 0 else f'unchecked(({typename})({value}))', values))
+
+        self.statement('/*')
+        self.statement(f' * {doc.name}.cs')
+        self.statement(' *')
+        for line in LLGLMeta.copyright:
+            self.statement(f' * {line}')
+        self.statement(' */')
+        self.statement()
+        for line in LLGLMeta.info:
+            self.statement(f'/* {line} */')
+        self.statement()
+        self.statement('using System;')
+        self.statement('using System.Text;')
+        self.statement()
+        self.statement('namespace LLGL')
+        self.openScope()
+        self.statement('public static class EnumNames')
+        self.openScope()
+
+        for table in tables:
+            name = table.record.name
+            self.statement(f'/* ----- {name} ----- */')
+            self.statement()
+
+            # Write lookup tables
+            self.writeInitializerList(f'private static readonly string[] {name}SortedNames', translateStringList(map(lambda entry: entry[0], table.nameEntries)))
+            self.writeInitializerList(f'private static readonly {name}[] {name}SortedValues', translateValueList(map(lambda entry: entry[1], table.nameEntries), name))
+            if table.isFlags:
+                self.writeInitializerList(f'private static readonly string[] {name}BitNames', translateStringList(map(lambda entry: entry[0], table.flagEntries)))
+                self.writeInitializerList(f'private static readonly {name}[] {name}BitValues', translateValueList(map(lambda entry: entry[1], table.flagEntries), name))
+            elif table.denseNames:
+                self.writeInitializerList(f'private static readonly string[] {name}Names', translateStringList(table.denseNames))
+            else:
+                self.writeInitializerList(f'private static readonly int[] {name}Values', list(map(lambda entry: str(entry[0]), table.valueEntries)))
+                self.writeInitializerList(f'private static readonly string[] {name}ValueNames', translateStringList(map(lambda entry: entry[1], table.valueEntries)))
+            self.statement()
+
+            # Write lookup functions
+            if table.isFlags:
+                self.statement(f'public static string GetNames({name} flags)')
+                self.openScope()
+                self.statement('var names = new StringBuilder();')
+                self.statement(f'for (int i = 0; i < {name}BitValues.Length; ++i)')
+                self.openScope()
+                self.statement(f'var value = {name}BitValues[i];')
+                self.statement('if (value != 0 ? (flags & value) == value : (flags == 0 && names.Length == 0))')
+                self.openScope()
+                self.statement('if (names.Length > 0)')
+                self.statement('    names.Append(\'|\');')
+                self.statement(f'names.Append({name}BitNames[i]);')
+                self.statement('flags &= ~value;')
+                self.closeScope()
+                self.closeScope()
+                self.statement('if (flags != 0)')
+                self.openScope()
+                self.statement('if (names.Length > 0)')
+                self.statement('    names.Append(\'|\');')
+                self.statement('names.Append("0x").Append(((uint)flags).ToString("X"));')
+                self.closeScope()
+                self.statement('return names.ToString();')
+                self.closeScope()
+                self.statement()
+                self.statement(f'public static bool TryParse(string names, out {name} flags)')
+                self.openScope()
+                self.statement('flags = 0;')
+                self.statement('if (names.Length == 0)')
+                self.statement('    return true;')
+                self.statement('foreach (var name in names.Split(\'|\'))')
+                self.openScope()
+                self.statement(f'int index = Array.BinarySearch({name}SortedNames, name, StringComparer.Ordinal);')
+                self.statement('if (index < 0)')
+                self.statement('    return false;')
+                self.statement(f'flags |= {name}SortedValues[index];')
+                self.closeScope()
+                self.statement('return true;')
+                self.closeScope()
+            else:
+                self.statement(f'public static string GetName({name} value)')
+                self.openScope()
+                if table.denseNames:
+                    index = f'(int)value - {table.minValue}' if table.minValue != 0 else '(int)value'
+                    self.statement(f'int index = {index};')
+                    self.statement(f'return (index >= 0 && index < {name}Names.Length ? {name}Names[index] : null);')
+                else:
+                    self.statement(f'int index = Array.BinarySearch({name}Values, (int)value);')
+                    self.statement(f'return (index >= 0 ? {name}ValueNames[index] : null);')
+                self.closeScope()
+                self.statement()
+                self.statement(f'public static bool TryParse(string name, out {name} value)')
+                self.openScope()
+                self.statement(f'int index = Array.BinarySearch({name}SortedNames, name, StringComparer.Ordinal);')
+                self.statement(f'value = (index >= 0 ? {name}SortedValues[index] : default({name}));')
+                self.statement('return (index >= 0);')
+                self.closeScope()
+            self.statement()
+
+        self.closeScope()
+        self.closeScope()
+        self.statement()
+        self.statement()
+        self.statement()
+        self.statement()
+        self.statement('// ================================================================================')
@@ -0,0 +1,111 @@
+/*
+ * Test_CommandStream.c
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+#include <LLGL-C/LLGL.h>
+#include <LLGL-C/LLGLCommandStream.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+
+/*
+Measures the native side of the command stream only: direct C API calls versus encoding in C
+and replaying with llglExecuteCommandStream. No managed boundary is crossed, so the numbers do
+not include the per-call P/Invoke transition that the C# CommandStreamEncoder avoids; they show
+the decoder's overhead that such a transition saving must amortize.
+*/
+
+#define NUM_FRAMES          100
+#define NUM_DRAWS_PER_FRAME 10000
+#define NUM_COMMANDS        (NUM_FRAMES * NUM_DRAWS_PER_FRAME * 2)
+
+// Encodes the same commands that RecordDirect() submits with one call each
+static void EncodeFrame(LLGLCommandStreamBuffer* stream, const LLGLViewport* viewport)
+{
+    stream->size = 0;
+    for (uint32_t i = 0; i < NUM_DRAWS_PER_FRAME; ++i)
+    {
+        LLGLCommandSetViewport* setViewport = (LLGLCommandSetViewport*)llglAllocCommandPacket(stream, LLGLCommandOpcodeSetViewport, sizeof(LLGLCommandSetViewport));
+        setViewport->viewport = *viewport;
+
+        LLGLCommandDraw* draw = (LLGLCommandDraw*)llglAllocCommandPacket(stream, LLGLCommandOpcodeDraw, sizeof(LLGLCommandDraw));
+        draw->numVertices   = 3;
+        draw->firstVertex   = i;
+    }
+}
+
+static void RecordDirect(const LLGLViewport* viewport)
+{
+    for (uint32_t i = 0; i < NUM_DRAWS_PER_FRAME; ++i)
+    {
+        llglSetViewport(viewport);
+        llglDraw(3, i);
+    }
+}
+
+static double TicksToNanosecondsPerCommand(uint64_t ticks)
+{
+    return ((double)ticks * 1.0e9 / (double)llglTimerFrequency()) / (double)NUM_COMMANDS;
+}
+
+int main(int argc, char* argv[])
+{
+    // Load Null render system to measure wrapper overhead only
+    if (llglLoadRenderSystem("Null") == 0)
+    {
+        fprintf(stderr, "Failed to load render system: Null\n");
+        return 1;
+    }
+
+    LLGLCommandBufferDescriptor cmdBufferDesc = { .flags = 0 };
+    LLGLCommandBuffer cmdBuffer = llglCreateCommandBuffer(&cmdBufferDesc);
+
+    const LLGLViewport viewport = { .x = 0.0f, .y = 0.0f, .width = 800.0f, .height = 600.0f, .minDepth = 0.0f, .maxDepth = 1.0f };
+
+    LLGLCommandStreamBuffer stream = { NULL, 0, 0 };
+
+    // Record commands with one C API call each
+    uint64_t startTick = llglTimerTick();
+    for (int frame = 0; frame < NUM_FRAMES; ++frame)
+    {
+        llglBegin(cmdBuffer);
+        RecordDirect(&viewport);
+        llglEnd();
+    }
+    const uint64_t directTicks = llglTimerTick() - startTick;
+
+    // Encode commands into a stream every frame and replay them with a single C API call
+    startTick = llglTimerTick();
+    for (int frame = 0; frame < NUM_FRAMES; ++frame)
+    {
+        EncodeFrame(&stream, &viewport);
+        llglBegin(cmdBuffer);
+        llglExecuteCommandStream(stream.data, stream.size);
+        llglEnd();
+    }
+    const uint64_t streamTicks = llglTimerTick() - startTick;
+
+    // Replay a pre-encoded stream to isolate the decoder throughput
+    startTick = llglTimerTick();
+    for (int frame = 0; frame < NUM_FRAMES; ++frame)
+    {
+        llglBegin(cmdBuffer);
+        llglExecuteCommandStream(stream.data, stream.size);
+        llglEnd();
+    }
+    const uint64_t replayTicks = llglTimerTick() - startTick;
+
+    printf("commands:       %d\n", NUM_COMMANDS);
+    printf("stream size:    %zu bytes/frame\n", stream.size);
+    printf("direct calls:   %.2f ns/command\n", TicksToNanosecondsPerCommand(directTicks));
+    printf("encode+replay:  %.2f ns/command\n", TicksToNanosecondsPerCommand(streamTicks));
+    printf("replay only:    %.2f ns/command\n", TicksToNanosecondsPerCommand(replayTicks));
+
+    free(stream.data);
+    llglUnloadRenderSystem();
+
+    return 0;
+}
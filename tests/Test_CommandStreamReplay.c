@@ -0,0 +1,302 @@
+/*
+ * Test_CommandStreamReplay.c
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+#include <LLGL-C/LLGL.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+typedef struct CallLog
+{
+    char    data[4096];
+    size_t  size;
+}
+CallLog;
+
+static CallLog* activeLog = NULL;
+
+static void LogBytes(const void* data, size_t size)
+{
+    if (activeLog->size + size <= sizeof(activeLog->data))
+        memcpy(activeLog->data + activeLog->size, data, size);
+    activeLog->size += size;
+}
+
+static void LogCall(const char* name)
+{
+    LogBytes(name, strlen(name) + 1);
+}
+
+// Recording stubs that replace the C API functions the decoder calls for the commands of this test
+static void RecordSetViewport(const LLGLViewport* viewport)
+{
+    LogCall("SetViewport");
+    LogBytes(viewport, sizeof(*viewport));
+}
+
+static void RecordSetViewports(uint32_t numViewports, const LLGLViewport* viewports)
+{
+    LogCall("SetViewports");
+    LogBytes(&numViewports, sizeof(numViewports));
+    LogBytes(viewports, sizeof(*viewports) * numViewports);
+}
+
+static void RecordSetScissors(uint32_t numScissors, const LLGLScissor* scissors)
+{
+    LogCall("SetScissors");
+    LogBytes(&numScissors, sizeof(numScissors));
+    LogBytes(scissors, sizeof(*scissors) * numScissors);
+}
+
+static void RecordUpdateBuffer(LLGLBuffer dstBuffer, uint64_t dstOffset, const void* data, uint16_t dataSize)
+{
+    LogCall("UpdateBuffer");
+    LogBytes(&dstBuffer.internal, sizeof(dstBuffer.internal));
+    LogBytes(&dstOffset, sizeof(dstOffset));
+    LogBytes(&dataSize, sizeof(dataSize));
+    LogBytes(data, dataSize);
+}
+
+static void RecordSetVertexBuffer(LLGLBuffer buffer)
+{
+    LogCall("SetVertexBuffer");
+    LogBytes(&buffer.internal, sizeof(buffer.internal));
+}
+
+static void RecordSetBlendFactor(const float color[4])
+{
+    LogCall("SetBlendFactor");
+    LogBytes(color, sizeof(float) * 4);
+}
+
+static void RecordDraw(uint32_t numVertices, uint32_t firstVertex)
+{
+    LogCall("Draw");
+    LogBytes(&numVertices, sizeof(numVertices));
+    LogBytes(&firstVertex, sizeof(firstVertex));
+}
+
+static void RecordDrawInstanced(uint32_t numVertices, uint32_t firstVertex, uint32_t numInstances)
+{
+    LogCall("DrawInstanced");
+    LogBytes(&numVertices, sizeof(numVertices));
+    LogBytes(&firstVertex, sizeof(firstVertex));
+    LogBytes(&numInstances, sizeof(numInstances));
+}
+
+static void RecordPushDebugGroup(const char* name)
+{
+    LogCall("PushDebugGroup");
+    LogCall(name);
+}
+
+static void RecordPopDebugGroup()
+{
+    LogCall("PopDebugGroup");
+}
+
+// Redirect the decoder and the direct calls below to the recording stubs
+#define llglSetViewport         RecordSetViewport
+#define llglSetViewports        RecordSetViewports
+#define llglSetScissors         RecordSetScissors
+#define llglUpdateBuffer        RecordUpdateBuffer
+#define llglSetVertexBuffer     RecordSetVertexBuffer
+#define llglSetBlendFactor      RecordSetBlendFactor
+#define llglDraw                RecordDraw
+#define llglDrawInstanced       RecordDrawInstanced
+#define llglPushDebugGroup      RecordPushDebugGroup
+#define llglPopDebugGroup       RecordPopDebugGroup
+
+// Functions that switch or submit command buffers have no opcode, so the decoder must never call them
+#define llglBegin(CMD)          LogCall("Begin")
+#define llglEnd()               LogCall("End")
+#define llglExecute(CMD)        LogCall("Execute")
+
+// Compile a local copy of the decoder that does not clash with the one exported by the C99 wrapper
+#undef LLGL_C_EXPORT
+#define LLGL_C_EXPORT static
+#define llglExecuteCommandStream ReplayCommandStream
+
+#define LLGL_COMMAND_STREAM_IMPLEMENTATION
+#include <LLGL-C/LLGLCommandStream.h>
+
+
+static int numErrors = 0;
+
+static void Check(int condition, const char* message)
+{
+    if (!condition)
+    {
+        fprintf(stderr, "Failed: %s\n", message);
+        ++numErrors;
+    }
+}
+
+static LLGLCommandSetViewports* EncodeSetViewports(LLGLCommandStreamBuffer* stream, uint32_t numViewports, const LLGLViewport* viewports)
+{
+    const size_t viewportsSize = sizeof(LLGLViewport) * numViewports;
+    char* payload = (char*)llglAllocCommandPacket(stream, LLGLCommandOpcodeSetViewports, LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLCommandSetViewports)) + viewportsSize);
+    ((LLGLCommandSetViewports*)payload)->numViewports = numViewports;
+    memcpy(payload + LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLCommandSetViewports)), viewports, viewportsSize);
+    return (LLGLCommandSetViewports*)payload;
+}
+
+static void EncodeSetScissors(LLGLCommandStreamBuffer* stream, uint32_t numScissors, const LLGLScissor* scissors)
+{
+    const size_t scissorsSize = sizeof(LLGLScissor) * numScissors;
+    char* payload = (char*)llglAllocCommandPacket(stream, LLGLCommandOpcodeSetScissors, LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLCommandSetScissors)) + scissorsSize);
+    ((LLGLCommandSetScissors*)payload)->numScissors = numScissors;
+    memcpy(payload + LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLCommandSetScissors)), scissors, scissorsSize);
+}
+
+static void EncodeUpdateBuffer(LLGLCommandStreamBuffer* stream, LLGLBuffer dstBuffer, uint64_t dstOffset, const void* data, uint16_t dataSize)
+{
+    char* payload = (char*)llglAllocCommandPacket(stream, LLGLCommandOpcodeUpdateBuffer, LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLCommandUpdateBuffer)) + dataSize);
+    LLGLCommandUpdateBuffer* cmd = (LLGLCommandUpdateBuffer*)payload;
+    cmd->dstBuffer  = dstBuffer;
+    cmd->dstOffset  = dstOffset;
+    cmd->dataSize   = dataSize;
+    memcpy(payload + LLGL_COMMAND_STREAM_ALIGN(sizeof(LLGLCommandUpdateBuffer)), data, dataSize);
+}
+
+static void EncodePushDebugGroup(LLGLCommandStreamBuffer* stream, const char* name)
+{
+    const size_t nameSize = strlen(name) + 1;
+    memcpy(llglAllocCommandPacket(stream, LLGLCommandOpcodePushDebugGroup, nameSize), name, nameSize);
+}
+
+static void EncodeDraw(LLGLCommandStreamBuffer* stream, uint32_t numVertices, uint32_t firstVertex)
+{
+    LLGLCommandDraw* cmd = (LLGLCommandDraw*)llglAllocCommandPacket(stream, LLGLCommandOpcodeDraw, sizeof(LLGLCommandDraw));
+    cmd->numVertices    = numVertices;
+    cmd->firstVertex    = firstVertex;
+}
+
+// Replays the stream into a new call log and returns whether it matches the expected call log
+static int ReplayMatches(const LLGLCommandStreamBuffer* stream, const CallLog* expected)
+{
+    CallLog replayed;
+    replayed.size = 0;
+    activeLog = &replayed;
+    ReplayCommandStream(stream->data, stream->size);
+    return (replayed.size == expected->size && memcmp(replayed.data, expected->data, expected->size) == 0);
+}
+
+int main(int argc, char* argv[])
+{
+    const LLGLViewport viewports[3] =
+    {
+        { .x =   0.0f, .y = 0.0f, .width = 800.0f, .height = 600.0f, .minDepth = 0.0f, .maxDepth = 1.0f },
+        { .x = 100.0f, .y = 5.0f, .width = 320.0f, .height = 240.0f, .minDepth = 0.5f, .maxDepth = 1.0f },
+        { .x =  16.0f, .y = 8.0f, .width =  64.0f, .height =  32.0f, .minDepth = 0.0f, .maxDepth = 0.25f },
+    };
+    const LLGLScissor scissors[2] =
+    {
+        { .x = 1, .y = 2, .width = 3, .height = 4 },
+        { .x = 5, .y = 6, .width = 7, .height = 8 },
+    };
+    const float         blendFactor[4]  = { 0.25f, 0.5f, 0.75f, 1.0f };
+    const unsigned char bufferData[13]  = { 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13 }; // Not a multiple of the stream alignment
+    const LLGLBuffer    buffer          = { (void*)(uintptr_t)0x1234 };
+
+    LLGLCommandStreamBuffer stream = { NULL, 0, 0 };
+
+    // Encode fixed-size, array-tail, and string-tail commands
+    LLGLCommandSetViewport* setViewport = (LLGLCommandSetViewport*)llglAllocCommandPacket(&stream, LLGLCommandOpcodeSetViewport, sizeof(LLGLCommandSetViewport));
+    setViewport->viewport = viewports[1];
+
+    EncodeSetViewports(&stream, 3, viewports);
+    EncodeSetScissors(&stream, 2, scissors);
+    EncodeUpdateBuffer(&stream, buffer, 256, bufferData, sizeof(bufferData));
+
+    LLGLCommandSetVertexBuffer* setVertexBuffer = (LLGLCommandSetVertexBuffer*)llglAllocCommandPacket(&stream, LLGLCommandOpcodeSetVertexBuffer, sizeof(LLGLCommandSetVertexBuffer));
+    setVertexBuffer->buffer = buffer;
+
+    LLGLCommandSetBlendFactor* setBlendFactor = (LLGLCommandSetBlendFactor*)llglAllocCommandPacket(&stream, LLGLCommandOpcodeSetBlendFactor, sizeof(LLGLCommandSetBlendFactor));
+    memcpy(setBlendFactor->color, blendFactor, sizeof(blendFactor));
+
+    EncodePushDebugGroup(&stream, "Replay");
+    EncodeDraw(&stream, 3, 7);
+
+    LLGLCommandDrawInstanced* drawInstanced = (LLGLCommandDrawInstanced*)llglAllocCommandPacket(&stream, LLGLCommandOpcodeDrawInstanced, sizeof(LLGLCommandDrawInstanced));
+    drawInstanced->numVertices  = 6;
+    drawInstanced->firstVertex  = 0;
+    drawInstanced->numInstances = 4;
+
+    llglAllocCommandPacket(&stream, LLGLCommandOpcodePopDebugGroup, 0);
+
+    // Record the same commands with direct calls, which are redirected to the recording stubs as well
+    CallLog expected;
+    expected.size = 0;
+    activeLog = &expected;
+    {
+        llglSetViewport(&viewports[1]);
+        llglSetViewports(3, viewports);
+        llglSetScissors(2, scissors);
+        llglUpdateBuffer(buffer, 256, bufferData, sizeof(bufferData));
+        llglSetVertexBuffer(buffer);
+        llglSetBlendFactor(blendFactor);
+        llglPushDebugGroup("Replay");
+        llglDraw(3, 7);
+        llglDrawInstanced(6, 0, 4);
+        llglPopDebugGroup();
+    }
+    Check(ReplayMatches(&stream, &expected), "replayed commands match direct calls");
+
+    // A packet whose array count exceeds its size must stop decoding before any of its data is read
+    stream.size = 0;
+    EncodeDraw(&stream, 3, 0);
+    EncodeSetViewports(&stream, 3, viewports)->numViewports = 4;
+    EncodeDraw(&stream, 3, 1);
+
+    expected.size = 0;
+    activeLog = &expected;
+    llglDraw(3, 0);
+    Check(ReplayMatches(&stream, &expected), "decoding stops at array tail that exceeds packet size");
+
+    // A string without null terminator inside its packet must stop decoding
+    stream.size = 0;
+    EncodeDraw(&stream, 3, 0);
+    memset(llglAllocCommandPacket(&stream, LLGLCommandOpcodePushDebugGroup, 8), 'x', 8);
+    EncodeDraw(&stream, 3, 1);
+    Check(ReplayMatches(&stream, &expected), "decoding stops at unterminated string tail");
+
+    // A packet that is too small for its fixed-size command must stop decoding
+    stream.size = 0;
+    EncodeDraw(&stream, 3, 0);
+    llglAllocCommandPacket(&stream, LLGLCommandOpcodeDrawInstanced, 0);
+    EncodeDraw(&stream, 3, 1);
+    Check(ReplayMatches(&stream, &expected), "decoding stops at packet smaller than its command");
+
+    // Packets with unknown opcodes, e.g. with a command buffer as payload like llglBegin and llglExecute would take, are skipped
+    stream.size = 0;
+    EncodeDraw(&stream, 3, 0);
+    const LLGLCommandBuffer cmdBuffer = { (void*)(uintptr_t)0x5678 };
+    const uint32_t unknownOpcodes[3] = { LLGLCommandOpcodeUndefined, LLGLCommandOpcodeCount, 0xFFFFFFFFu };
+    for (int i = 0; i < 3; ++i)
+        memcpy(llglAllocCommandPacket(&stream, (LLGLCommandOpcode)unknownOpcodes[i], sizeof(cmdBuffer)), &cmdBuffer, sizeof(cmdBuffer));
+    EncodeDraw(&stream, 3, 1);
+
+    expected.size = 0;
+    activeLog = &expected;
+    llglDraw(3, 0);
+    llglDraw(3, 1);
+    Check(ReplayMatches(&stream, &expected), "packets with unknown opcodes are skipped without calling llglBegin, llglEnd, or llglExecute");
+
+    // Packets whose size does not fit into the 32-bit packet header must be rejected without changing the stream
+    const size_t streamSize = stream.size;
+    Check(llglAllocCommandPacket(&stream, LLGLCommandOpcodeUpdateBuffer, (size_t)UINT32_MAX) == NULL, "packet larger than 4 GiB is rejected");
+    Check(stream.size == streamSize, "rejected packet leaves stream unchanged");
+
+    free(stream.data);
+
+    if (numErrors == 0)
+        printf("Command stream replay passed\n");
+
+    return (numErrors == 0 ? 0 : 1);
+}
@@ -0,0 +1,40 @@
+/*
+ * Test_FormatTable.c
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+#include <LLGL-C/LLGL.h>
+#include <LLGL-C/LLGLFormatTable.h>
+#include <stdio.h>
+
+
+// Compares the generated format table with the native format attributes
+int main(int argc, char* argv[])
+{
+    int numErrors = 0;
+
+    for (int i = 0; i < LLGL_FORMAT_TABLE_SIZE; ++i)
+    {
+        const LLGLFormatAttributes* expected = llglGetFormatAttribs((LLGLFormat)i);
+        const LLGLFormatAttributes* actual = llglLookupFormatAttribs((LLGLFormat)i);
+
+        if (expected->bitSize       != actual->bitSize      ||
+            expected->blockWidth    != actual->blockWidth   ||
+            expected->blockHeight   != actual->blockHeight  ||
+            expected->components    != actual->components   ||
+            expected->format        != actual->format       ||
+            expected->dataType      != actual->dataType     ||
+            expected->flags         != actual->flags)
+        {
+            fprintf(stderr, "Mismatch in format table at index %d\n", i);
+            ++numErrors;
+        }
+    }
+
+    if (numErrors == 0)
+        printf("Format table matches native format attributes (%d formats)\n", LLGL_FORMAT_TABLE_SIZE);
+
+    return (numErrors == 0 ? 0 : 1);
+}
@@ -0,0 +1,93 @@
+/*
+ * Test_StructReflection.c
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+#include <LLGL-C/LLGL.h>
+#include <LLGL-C/LLGLReflection.h>
+#include <stdio.h>
+#include <string.h>
+
+
+static int numErrors = 0;
+
+static void Check(int condition, const char* message)
+{
+    if (!condition)
+    {
+        fprintf(stderr, "Failed: %s\n", message);
+        ++numErrors;
+    }
+}
+
+// Initializes a buffer descriptor on top of the specified garbage byte pattern to simulate uninitialized padding bytes
+static void InitBufferDesc(LLGLBufferDescriptor* desc, int garbage, const LLGLVertexAttribute* attribs, size_t numAttribs)
+{
+    memset(desc, garbage, sizeof(*desc));
+    desc->size              = 1024;
+    desc->stride            = 16;
+    desc->format            = LLGLFormatUndefined;
+    desc->bindFlags         = LLGLBindVertexBuffer;
+    desc->cpuAccessFlags    = 0;
+    desc->miscFlags         = 0;
+    desc->numVertexAttribs  = numAttribs;
+    desc->vertexAttribs     = attribs;
+}
+
+static void InitVertexAttrib(LLGLVertexAttribute* attrib, int garbage, const char* name, LLGLFormat format, uint32_t offset)
+{
+    memset(attrib, garbage, sizeof(*attrib));
+    attrib->name            = name;
+    attrib->format          = format;
+    attrib->location        = 0;
+    attrib->semanticIndex   = 0;
+    attrib->systemValue     = LLGLSystemValueUndefined;
+    attrib->slot            = 0;
+    attrib->offset          = offset;
+    attrib->stride          = 16;
+    attrib->instanceDivisor = 0;
+}
+
+int main(int argc, char* argv[])
+{
+    const LLGLStructInfo* info = llglGetStructInfo(LLGLStructTypeBufferDescriptor);
+    Check(info != NULL && strcmp(info->name, "BufferDescriptor") == 0, "llglGetStructInfo(LLGLStructTypeBufferDescriptor)");
+    Check(llglGetStructInfo((LLGLStructType)LLGL_NUM_STRUCT_TYPES) == NULL, "llglGetStructInfo(LLGL_NUM_STRUCT_TYPES) == NULL");
+
+    // Equal descriptors with different padding bytes and string addresses must have the same hash
+    char nameA[] = "position", nameB[] = "position";
+    LLGLVertexAttribute attribsA[2], attribsB[2];
+    InitVertexAttrib(&attribsA[0], 0x00, nameA, LLGLFormatRGB32Float, 0);
+    InitVertexAttrib(&attribsA[1], 0x00, "color", LLGLFormatRGBA8UNorm, 12);
+    InitVertexAttrib(&attribsB[0], 0xCD, nameB, LLGLFormatRGB32Float, 0);
+    InitVertexAttrib(&attribsB[1], 0xCD, "color", LLGLFormatRGBA8UNorm, 12);
+
+    LLGLBufferDescriptor descA, descB;
+    InitBufferDesc(&descA, 0x00, attribsA, 2);
+    InitBufferDesc(&descB, 0xCD, attribsB, 2);
+    Check(llglHashStruct(info, &descA, 0) == llglHashStruct(info, &descB, 0), "hash ignores padding and string addresses");
+    Check(llglHashStruct(info, &descA, 0) != llglHashStruct(info, &descA, 1), "hash depends on seed");
+
+    // Changes in nested arrays must change the hash
+    attribsB[1].offset = 16;
+    Check(llglHashStruct(info, &descA, 0) != llglHashStruct(info, &descB, 0), "hash covers dynamic array elements");
+    nameB[0] = 'P';
+    attribsB[1].offset = 12;
+    Check(llglHashStruct(info, &descA, 0) != llglHashStruct(info, &descB, 0), "hash covers strings in dynamic array elements");
+    nameB[0] = 'p';
+
+    // Serialization returns the required size like snprintf and is independent of padding bytes
+    char bufferA[512], bufferB[512];
+    const size_t sizeA = llglSerializeStruct(info, &descA, NULL, 0);
+    Check(sizeA > 0 && sizeA <= sizeof(bufferA), "llglSerializeStruct returns required size");
+    Check(llglSerializeStruct(info, &descA, bufferA, sizeof(bufferA)) == sizeA, "llglSerializeStruct returns same size with buffer");
+    Check(llglSerializeStruct(info, &descB, bufferB, sizeof(bufferB)) == sizeA, "llglSerializeStruct size of equal descriptor");
+    Check(memcmp(bufferA, bufferB, sizeA) == 0, "serialization ignores padding and string addresses");
+
+    if (numErrors == 0)
+        printf("Struct reflection passed (%d struct types, BufferDescriptor serialized in %zu bytes)\n", LLGL_NUM_STRUCT_TYPES, sizeA);
+
+    return (numErrors == 0 ? 0 : 1);
+}
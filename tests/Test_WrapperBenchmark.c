@@ -0,0 +1,250 @@
+/*
+ * Test_WrapperBenchmark.c
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
+/*
+Measures the call overhead of the C wrapper against a render system (Null by default).
+Usage: Test_WrapperBenchmark [MODULE] [ITERATIONS]
+Output: CSV with one line per function: function,iterations,total_ns,ns_per_call
+*/
+
+#include <LLGL-C/LLGL.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+
+#define LLGL_BENCHMARK_DEFAULT_MODULE       "Null"
+#define LLGL_BENCHMARK_DEFAULT_ITERATIONS   ( 100000 )
+#define LLGL_BENCHMARK_BUFFER_SIZE          ( 256 )
+
+
+/* ----- Arguments ----- */
+
+static LLGLCommandBuffer g_commandBuffer;
+static LLGLBuffer g_buffer;
+
+static const LLGLBufferDescriptor llglCreateBuffer_bufferDesc = { .size = LLGL_BENCHMARK_BUFFER_SIZE, .stride = 0, .format = LLGLFormatR32UInt, .bindFlags = (LLGLBindVertexBuffer | LLGLBindIndexBuffer), .cpuAccessFlags = 0, .miscFlags = 0 };
+static const LLGLSamplerDescriptor llglCreateSampler_samplerDesc = { .addressModeU = LLGLSamplerAddressModeRepeat, .addressModeV = LLGLSamplerAddressModeRepeat, .addressModeW = LLGLSamplerAddressModeRepeat, .minFilter = LLGLSamplerFilterLinear, .magFilter = LLGLSamplerFilterLinear, .mipMapFilter = LLGLSamplerFilterLinear, .mipMapEnabled = true, .mipMapLODBias = 0.0f, .minLOD = 0.0f, .maxLOD = 1000.0f, .maxAnisotropy = 1, .compareEnabled = false, .compareOp = LLGLCompareOpLess, .borderColor = {0.0f,0.0f,0.0f,0.0f} };
+static const LLGLTextureDescriptor llglCreateTexture_textureDesc = { .type = LLGLTextureTypeTexture2D, .bindFlags = (LLGLBindSampled | LLGLBindColorAttachment), .miscFlags = (LLGLMiscFixedSamples | LLGLMiscGenerateMips), .format = LLGLFormatRGBA8UNorm, .extent = {1,1,1}, .arrayLayers = 1, .mipLevels = 0, .samples = 1, .clearValue = { .color = {0.0f,0.0f,0.0f,0.0f}, .depth = 1.0f, .stencil = 0 } };
+static const LLGLViewport llglSetViewport_viewport = { .x = 0.0f, .y = 0.0f, .width = 0.0f, .height = 0.0f, .minDepth = 0.0f, .maxDepth = 1.0f };
+static const LLGLScissor llglSetScissor_scissor = { .x = 0, .y = 0, .width = 0, .height = 0 };
+static const float llglSetBlendFactor_color[4] = { 0 };
+
+
+/* ----- Benchmarks ----- */
+
+static void BenchmarkCreateBuffer(int numIterations)
+{
+    for (int i = 0; i < numIterations; ++i)
+    {
+        LLGLBuffer obj = llglCreateBuffer(&llglCreateBuffer_bufferDesc, NULL);
+        llglReleaseBuffer(obj);
+    }
+}
+
+static void BenchmarkCreateSampler(int numIterations)
+{
+    for (int i = 0; i < numIterations; ++i)
+    {
+        LLGLSampler obj = llglCreateSampler(&llglCreateSampler_samplerDesc);
+        llglReleaseSampler(obj);
+    }
+}
+
+static void BenchmarkCreateTexture(int numIterations)
+{
+    for (int i = 0; i < numIterations; ++i)
+    {
+        LLGLTexture obj = llglCreateTexture(&llglCreateTexture_textureDesc, NULL);
+        llglReleaseTexture(obj);
+    }
+}
+
+static void BenchmarkSetViewport(int numIterations)
+{
+    llglBegin(g_commandBuffer);
+    for (int i = 0; i < numIterations; ++i)
+        llglSetViewport(&llglSetViewport_viewport);
+    llglEnd();
+}
+
+static void BenchmarkSetScissor(int numIterations)
+{
+    llglBegin(g_commandBuffer);
+    for (int i = 0; i < numIterations; ++i)
+        llglSetScissor(&llglSetScissor_scissor);
+    llglEnd();
+}
+
+static void BenchmarkSetVertexBuffer(int numIterations)
+{
+    llglBegin(g_commandBuffer);
+    for (int i = 0; i < numIterations; ++i)
+        llglSetVertexBuffer(g_buffer);
+    llglEnd();
+}
+
+static void BenchmarkSetIndexBuffer(int numIterations)
+{
+    llglBegin(g_commandBuffer);
+    for (int i = 0; i < numIterations; ++i)
+        llglSetIndexBuffer(g_buffer);
+    llglEnd();
+}
+
+static void BenchmarkSetBlendFactor(int numIterations)
+{
+    llglBegin(g_commandBuffer);
+    for (int i = 0; i < numIterations; ++i)
+        llglSetBlendFactor(llglSetBlendFactor_color);
+    llglEnd();
+}
+
+static void BenchmarkSetStencilReference(int numIterations)
+{
+    llglBegin(g_commandBuffer);
+    for (int i = 0; i < numIterations; ++i)
+        llglSetStencilReference(0, (LLGLStencilFace)0);
+    llglEnd();
+}
+
+static void BenchmarkDraw(int numIterations)
+{
+    llglBegin(g_commandBuffer);
+    for (int i = 0; i < numIterations; ++i)
+        llglDraw(0, 0);
+    llglEnd();
+}
+
+static void BenchmarkDrawIndexed(int numIterations)
+{
+    llglBegin(g_commandBuffer);
+    for (int i = 0; i < numIterations; ++i)
+        llglDrawIndexed(0, 0);
+    llglEnd();
+}
+
+static void BenchmarkDrawInstanced(int numIterations)
+{
+    llglBegin(g_commandBuffer);
+    for (int i = 0; i < numIterations; ++i)
+        llglDrawInstanced(0, 0, 0);
+    llglEnd();
+}
+
+static void BenchmarkDispatch(int numIterations)
+{
+    llglBegin(g_commandBuffer);
+    for (int i = 0; i < numIterations; ++i)
+        llglDispatch(0, 0, 0);
+    llglEnd();
+}
+
+
+/* ----- Main ----- */
+
+static void PrintResult(const char* name, int numIterations, uint64_t ticks)
+{
+    const double totalNs = (double)ticks * 1.0e9 / (double)llglTimerFrequency();
+    printf("%s,%d,%.0f,%.3f\n", name, numIterations, totalNs, totalNs / (double)numIterations);
+}
+
+int main(int argc, char* argv[])
+{
+    const char* moduleName = (argc > 1 ? argv[1] : LLGL_BENCHMARK_DEFAULT_MODULE);
+    const int numIterations = (argc > 2 ? atoi(argv[2]) : LLGL_BENCHMARK_DEFAULT_ITERATIONS);
+
+    if (llglLoadRenderSystem(moduleName) == 0)
+    {
+        fprintf(stderr, "Failed to load render system: %s\n", moduleName);
+        return 1;
+    }
+
+    const LLGLCommandBufferDescriptor commandBufferDesc = { .flags = 0 };
+    g_commandBuffer = llglCreateCommandBuffer(&commandBufferDesc);
+    g_buffer = llglCreateBuffer(&llglCreateBuffer_bufferDesc, NULL);
+
+    printf("function,iterations,total_ns,ns_per_call\n");
+
+    {
+        const uint64_t startTick = llglTimerTick();
+        BenchmarkCreateBuffer(numIterations);
+        PrintResult("llglCreateBuffer", numIterations, llglTimerTick() - startTick);
+    }
+    {
+        const uint64_t startTick = llglTimerTick();
+        BenchmarkCreateSampler(numIterations);
+        PrintResult("llglCreateSampler", numIterations, llglTimerTick() - startTick);
+    }
+    {
+        const uint64_t startTick = llglTimerTick();
+        BenchmarkCreateTexture(numIterations);
+        PrintResult("llglCreateTexture", numIterations, llglTimerTick() - startTick);
+    }
+    {
+        const uint64_t startTick = llglTimerTick();
+        BenchmarkSetViewport(numIterations);
+        PrintResult("llglSetViewport", numIterations, llglTimerTick() - startTick);
+    }
+    {
+        const uint64_t startTick = llglTimerTick();
+        BenchmarkSetScissor(numIterations);
+        PrintResult("llglSetScissor", numIterations, llglTimerTick() - startTick);
+    }
+    {
+        const uint64_t startTick = llglTimerTick();
+        BenchmarkSetVertexBuffer(numIterations);
+        PrintResult("llglSetVertexBuffer", numIterations, llglTimerTick() - startTick);
+    }
+    {
+        const uint64_t startTick = llglTimerTick();
+        BenchmarkSetIndexBuffer(numIterations);
+        PrintResult("llglSetIndexBuffer", numIterations, llglTimerTick() - startTick);
+    }
+    {
+        const uint64_t startTick = llglTimerTick();
+        BenchmarkSetBlendFactor(numIterations);
+        PrintResult("llglSetBlendFactor", numIterations, llglTimerTick() - startTick);
+    }
+    {
+        const uint64_t startTick = llglTimerTick();
+        BenchmarkSetStencilReference(numIterations);
+        PrintResult("llglSetStencilReference", numIterations, llglTimerTick() - startTick);
+    }
+    {
+        const uint64_t startTick = llglTimerTick();
+        BenchmarkDraw(numIterations);
+        PrintResult("llglDraw", numIterations, llglTimerTick() - startTick);
+    }
+    {
+        const uint64_t startTick = llglTimerTick();
+        BenchmarkDrawIndexed(numIterations);
+        PrintResult("llglDrawIndexed", numIterations, llglTimerTick() - startTick);
+    }
+    {
+        const uint64_t startTick = llglTimerTick();
+        BenchmarkDrawInstanced(numIterations);
+        PrintResult("llglDrawInstanced", numIterations, llglTimerTick() - startTick);
+    }
+    {
+        const uint64_t startTick = llglTimerTick();
+        BenchmarkDispatch(numIterations);
+        PrintResult("llglDispatch", numIterations, llglTimerTick() - startTick);
+    }
+
+    llglReleaseBuffer(g_buffer);
+    llglReleaseCommandBuffer(g_commandBuffer);
+    llglUnloadRenderSystem();
+
+    return 0;
+}
+
+
+
+/* ================================================================================ */
+
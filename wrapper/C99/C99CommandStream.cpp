@@ -0,0 +1,14 @@
+/*
+ * C99CommandStream.cpp
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+// Decoder is generated by WrapperGen (see scripts/GenerateWrappers.bat) and compiled only once
+#define LLGL_COMMAND_STREAM_IMPLEMENTATION
+#include <LLGL-C/LLGLCommandStream.h>
+
+
+
+// ================================================================================
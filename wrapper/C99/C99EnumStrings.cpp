@@ -0,0 +1,14 @@
+/*
+ * C99EnumStrings.cpp
+ *
+ * Copyright (c) 2015 Lukas Hermanns. All rights reserved.
+ * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
+ */
+
+// Lookup tables are generated by WrapperGen (see scripts/GenerateWrappers.bat) and compiled only once
+#define LLGL_ENUM_STRINGS_IMPLEMENTATION
+#include <LLGL-C/LLGLEnumStrings.h>
+
+
+
+// ================================================================================
@@ -7,6 +7,7 @@
 
 #include <LLGL/ResourceHeap.h>
 #include <LLGL-C/ResourceHeap.h>
+#include <LLGL-C/Wrapper/ResourceFlags.h>
 #include "C99Internal.h"
 
 
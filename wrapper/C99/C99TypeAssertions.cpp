@@ -5,8 +5,11 @@
  * Licensed under the terms of the BSD 3-Clause license (see LICENSE.txt).
  */
 
+/* AUTO GENERATED CODE - DO NOT EDIT */
+
 #include <LLGL/LLGL.h>
 #include <LLGL-C/LLGL.h>
+#include <cstddef>
 
 
 #define LLGL_STATIC_ASSERT_ENUM(TYPE, VALUE) \
@@ -16,188 +19,23 @@
     static_assert(static_cast<long>(TYPE ## Flags::VALUE) == static_cast<long>(LLGL ## TYPE ## VALUE), "LLGL" #TYPE #VALUE " does not equal flags value of LLGL::" #TYPE "Flags::" #VALUE)
 
 #define LLGL_STATIC_ASSERT_SIZE(TYPE) \
-    static_assert(sizeof(LLGL::TYPE) == sizeof(LLGL ## TYPE), "LLGL" #TYPE " does not match size of LLGL::" #TYPE)
+    static_assert(sizeof(LLGL::TYPE) == sizeof(LLGL ## TYPE) && alignof(LLGL::TYPE) <= alignof(LLGL ## TYPE), "LLGL" #TYPE " does not match size or alignment of LLGL::" #TYPE)
 
 #define LLGL_STATIC_ASSERT_OFFSET(TYPE, FIELD) \
-    static_assert(offsetof(LLGL::TYPE, FIELD) == offsetof(LLGL ## TYPE, FIELD), "LLGL" #TYPE "::" #FIELD " does not match offset of LLGL::" #TYPE "::" #FIELD)
-
-
-using namespace LLGL;
-
-// namespace LLGL {
-
-
-/* ----- Enumerations ----- */
-
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_110);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_120);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_130);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_140);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_150);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_330);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_400);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_410);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_420);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_430);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_440);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_450);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_460);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, ESSL);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, ESSL_100);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, ESSL_300);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, ESSL_310);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, ESSL_320);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_2_0);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_2_0a);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_2_0b);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_3_0);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_4_0);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_4_1);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_5_0);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_5_1);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_6_0);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_6_1);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_6_2);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_6_3);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_6_4);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, Metal);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, Metal_1_0);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, Metal_1_1);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, Metal_1_2);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, Metal_2_0);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, Metal_2_1);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, SPIRV);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, SPIRV_100);
-LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, VersionBitmask);
-
-LLGL_STATIC_ASSERT_ENUM(ScreenOrigin, LowerLeft);
-LLGL_STATIC_ASSERT_ENUM(ScreenOrigin, UpperLeft);
-
-LLGL_STATIC_ASSERT_ENUM(ClippingRange, MinusOneToOne);
-LLGL_STATIC_ASSERT_ENUM(ClippingRange, ZeroToOne);
-
-LLGL_STATIC_ASSERT_ENUM(CPUAccess, ReadOnly);
-LLGL_STATIC_ASSERT_ENUM(CPUAccess, WriteOnly);
-LLGL_STATIC_ASSERT_ENUM(CPUAccess, WriteDiscard);
-LLGL_STATIC_ASSERT_ENUM(CPUAccess, ReadWrite);
-
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, PointList);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, LineList);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, LineStrip);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, LineListAdjacency);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, LineStripAdjacency);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, TriangleList);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, TriangleStrip);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, TriangleListAdjacency);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, TriangleStripAdjacency);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches1);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches2);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches3);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches4);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches5);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches6);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches7);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches8);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches9);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches10);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches11);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches12);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches13);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches14);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches15);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches16);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches17);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches18);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches19);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches20);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches21);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches22);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches23);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches24);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches25);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches26);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches27);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches28);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches29);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches30);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches31);
-LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches32);
-
-LLGL_STATIC_ASSERT_ENUM(CompareOp, NeverPass);
-LLGL_STATIC_ASSERT_ENUM(CompareOp, Less);
-LLGL_STATIC_ASSERT_ENUM(CompareOp, Equal);
-LLGL_STATIC_ASSERT_ENUM(CompareOp, LessEqual);
-LLGL_STATIC_ASSERT_ENUM(CompareOp, Greater);
-LLGL_STATIC_ASSERT_ENUM(CompareOp, NotEqual);
-LLGL_STATIC_ASSERT_ENUM(CompareOp, GreaterEqual);
-LLGL_STATIC_ASSERT_ENUM(CompareOp, AlwaysPass);
-
-LLGL_STATIC_ASSERT_ENUM(StencilOp, Keep);
-LLGL_STATIC_ASSERT_ENUM(StencilOp, Zero);
-LLGL_STATIC_ASSERT_ENUM(StencilOp, Replace);
-LLGL_STATIC_ASSERT_ENUM(StencilOp, IncClamp);
-LLGL_STATIC_ASSERT_ENUM(StencilOp, DecClamp);
-LLGL_STATIC_ASSERT_ENUM(StencilOp, Invert);
-LLGL_STATIC_ASSERT_ENUM(StencilOp, IncWrap);
-LLGL_STATIC_ASSERT_ENUM(StencilOp, DecWrap);
+    static_assert(offsetof(LLGL::TYPE, FIELD) == offsetof(LLGL ## TYPE, FIELD) && sizeof(LLGL::TYPE::FIELD) == sizeof(LLGL ## TYPE::FIELD), "LLGL" #TYPE "::" #FIELD " does not match offset and size of LLGL::" #TYPE "::" #FIELD)
 
-LLGL_STATIC_ASSERT_ENUM(BlendOp, Zero);
-LLGL_STATIC_ASSERT_ENUM(BlendOp, One);
-LLGL_STATIC_ASSERT_ENUM(BlendOp, SrcColor);
-LLGL_STATIC_ASSERT_ENUM(BlendOp, InvSrcColor);
-LLGL_STATIC_ASSERT_ENUM(BlendOp, SrcAlpha);
-LLGL_STATIC_ASSERT_ENUM(BlendOp, InvSrcAlpha);
-LLGL_STATIC_ASSERT_ENUM(BlendOp, DstColor);
-LLGL_STATIC_ASSERT_ENUM(BlendOp, InvDstColor);
-LLGL_STATIC_ASSERT_ENUM(BlendOp, DstAlpha);
-LLGL_STATIC_ASSERT_ENUM(BlendOp, InvDstAlpha);
-LLGL_STATIC_ASSERT_ENUM(BlendOp, SrcAlphaSaturate);
-LLGL_STATIC_ASSERT_ENUM(BlendOp, BlendFactor);
-LLGL_STATIC_ASSERT_ENUM(BlendOp, InvBlendFactor);
-LLGL_STATIC_ASSERT_ENUM(BlendOp, Src1Color);
-LLGL_STATIC_ASSERT_ENUM(BlendOp, InvSrc1Color);
-LLGL_STATIC_ASSERT_ENUM(BlendOp, Src1Alpha);
-LLGL_STATIC_ASSERT_ENUM(BlendOp, InvSrc1Alpha);
+#define LLGL_STATIC_ASSERT_SYSV_SIZE(TYPE, SIZE, ALIGN) \
+    static_assert(sizeof(LLGL ## TYPE) == (SIZE) && alignof(LLGL ## TYPE) == (ALIGN), "LLGL" #TYPE " does not match size and alignment computed by WrapperGen")
 
-LLGL_STATIC_ASSERT_ENUM(BlendArithmetic, Add);
-LLGL_STATIC_ASSERT_ENUM(BlendArithmetic, Subtract);
-LLGL_STATIC_ASSERT_ENUM(BlendArithmetic, RevSubtract);
-LLGL_STATIC_ASSERT_ENUM(BlendArithmetic, Min);
-LLGL_STATIC_ASSERT_ENUM(BlendArithmetic, Max);
+#define LLGL_STATIC_ASSERT_SYSV_OFFSET(TYPE, FIELD, OFFSET) \
+    static_assert(offsetof(LLGL ## TYPE, FIELD) == (OFFSET), "LLGL" #TYPE "::" #FIELD " does not match offset computed by WrapperGen")
 
-LLGL_STATIC_ASSERT_ENUM(PolygonMode, Fill);
-LLGL_STATIC_ASSERT_ENUM(PolygonMode, Wireframe);
-LLGL_STATIC_ASSERT_ENUM(PolygonMode, Points);
 
-LLGL_STATIC_ASSERT_ENUM(CullMode, Disabled);
-LLGL_STATIC_ASSERT_ENUM(CullMode, Front);
-LLGL_STATIC_ASSERT_ENUM(CullMode, Back);
+using namespace LLGL;
+using namespace LLGL::Log;
 
-LLGL_STATIC_ASSERT_ENUM(LogicOp, Disabled);
-LLGL_STATIC_ASSERT_ENUM(LogicOp, Clear);
-LLGL_STATIC_ASSERT_ENUM(LogicOp, Set);
-LLGL_STATIC_ASSERT_ENUM(LogicOp, Copy);
-LLGL_STATIC_ASSERT_ENUM(LogicOp, CopyInverted);
-LLGL_STATIC_ASSERT_ENUM(LogicOp, NoOp);
-LLGL_STATIC_ASSERT_ENUM(LogicOp, Invert);
-LLGL_STATIC_ASSERT_ENUM(LogicOp, AND);
-LLGL_STATIC_ASSERT_ENUM(LogicOp, ANDReverse);
-LLGL_STATIC_ASSERT_ENUM(LogicOp, ANDInverted);
-LLGL_STATIC_ASSERT_ENUM(LogicOp, NAND);
-LLGL_STATIC_ASSERT_ENUM(LogicOp, OR);
-LLGL_STATIC_ASSERT_ENUM(LogicOp, ORReverse);
-LLGL_STATIC_ASSERT_ENUM(LogicOp, ORInverted);
-LLGL_STATIC_ASSERT_ENUM(LogicOp, NOR);
-LLGL_STATIC_ASSERT_ENUM(LogicOp, XOR);
-LLGL_STATIC_ASSERT_ENUM(LogicOp, Equiv);
 
-LLGL_STATIC_ASSERT_ENUM(TessellationPartition, Undefined);
-LLGL_STATIC_ASSERT_ENUM(TessellationPartition, Integer);
-LLGL_STATIC_ASSERT_ENUM(TessellationPartition, Pow2);
-LLGL_STATIC_ASSERT_ENUM(TessellationPartition, FractionalOdd);
-LLGL_STATIC_ASSERT_ENUM(TessellationPartition, FractionalEven);
+/* ----- Enumerations ----- */
 
 LLGL_STATIC_ASSERT_ENUM(RenderConditionMode, Wait);
 LLGL_STATIC_ASSERT_ENUM(RenderConditionMode, NoWait);
@@ -321,110 +159,8 @@ LLGL_STATIC_ASSERT_ENUM(DataType, Float16);
 LLGL_STATIC_ASSERT_ENUM(DataType, Float32);
 LLGL_STATIC_ASSERT_ENUM(DataType, Float64);
 
-LLGL_STATIC_ASSERT_ENUM(SystemValue, Undefined);
-LLGL_STATIC_ASSERT_ENUM(SystemValue, ClipDistance);
-LLGL_STATIC_ASSERT_ENUM(SystemValue, Color);
-LLGL_STATIC_ASSERT_ENUM(SystemValue, CullDistance);
-LLGL_STATIC_ASSERT_ENUM(SystemValue, Depth);
-LLGL_STATIC_ASSERT_ENUM(SystemValue, DepthGreater);
-LLGL_STATIC_ASSERT_ENUM(SystemValue, DepthLess);
-LLGL_STATIC_ASSERT_ENUM(SystemValue, FrontFacing);
-LLGL_STATIC_ASSERT_ENUM(SystemValue, InstanceID);
-LLGL_STATIC_ASSERT_ENUM(SystemValue, Position);
-LLGL_STATIC_ASSERT_ENUM(SystemValue, PrimitiveID);
-LLGL_STATIC_ASSERT_ENUM(SystemValue, RenderTargetIndex);
-LLGL_STATIC_ASSERT_ENUM(SystemValue, SampleMask);
-LLGL_STATIC_ASSERT_ENUM(SystemValue, SampleID);
-LLGL_STATIC_ASSERT_ENUM(SystemValue, Stencil);
-LLGL_STATIC_ASSERT_ENUM(SystemValue, VertexID);
-LLGL_STATIC_ASSERT_ENUM(SystemValue, ViewportIndex);
-
-LLGL_STATIC_ASSERT_ENUM(TextureType, Texture1D);
-LLGL_STATIC_ASSERT_ENUM(TextureType, Texture2D);
-LLGL_STATIC_ASSERT_ENUM(TextureType, Texture3D);
-LLGL_STATIC_ASSERT_ENUM(TextureType, TextureCube);
-LLGL_STATIC_ASSERT_ENUM(TextureType, Texture1DArray);
-LLGL_STATIC_ASSERT_ENUM(TextureType, Texture2DArray);
-LLGL_STATIC_ASSERT_ENUM(TextureType, TextureCubeArray);
-LLGL_STATIC_ASSERT_ENUM(TextureType, Texture2DMS);
-LLGL_STATIC_ASSERT_ENUM(TextureType, Texture2DMSArray);
-
-LLGL_STATIC_ASSERT_ENUM(TextureSwizzle, Zero);
-LLGL_STATIC_ASSERT_ENUM(TextureSwizzle, One);
-LLGL_STATIC_ASSERT_ENUM(TextureSwizzle, Red);
-LLGL_STATIC_ASSERT_ENUM(TextureSwizzle, Green);
-LLGL_STATIC_ASSERT_ENUM(TextureSwizzle, Blue);
-LLGL_STATIC_ASSERT_ENUM(TextureSwizzle, Alpha);
-
-LLGL_STATIC_ASSERT_ENUM(SamplerAddressMode, Repeat);
-LLGL_STATIC_ASSERT_ENUM(SamplerAddressMode, Mirror);
-LLGL_STATIC_ASSERT_ENUM(SamplerAddressMode, Clamp);
-LLGL_STATIC_ASSERT_ENUM(SamplerAddressMode, Border);
-LLGL_STATIC_ASSERT_ENUM(SamplerAddressMode, MirrorOnce);
-
-LLGL_STATIC_ASSERT_ENUM(SamplerFilter, Nearest);
-LLGL_STATIC_ASSERT_ENUM(SamplerFilter, Linear);
-
-LLGL_STATIC_ASSERT_ENUM(ShaderType, Undefined);
-LLGL_STATIC_ASSERT_ENUM(ShaderType, Vertex);
-LLGL_STATIC_ASSERT_ENUM(ShaderType, TessControl);
-LLGL_STATIC_ASSERT_ENUM(ShaderType, TessEvaluation);
-LLGL_STATIC_ASSERT_ENUM(ShaderType, Geometry);
-LLGL_STATIC_ASSERT_ENUM(ShaderType, Fragment);
-LLGL_STATIC_ASSERT_ENUM(ShaderType, Compute);
-
-LLGL_STATIC_ASSERT_ENUM(ShaderSourceType, CodeString);
-LLGL_STATIC_ASSERT_ENUM(ShaderSourceType, CodeFile);
-LLGL_STATIC_ASSERT_ENUM(ShaderSourceType, BinaryBuffer);
-LLGL_STATIC_ASSERT_ENUM(ShaderSourceType, BinaryFile);
-
-LLGL_STATIC_ASSERT_ENUM(UniformType, Undefined);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Float1);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Float2);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Float3);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Float4);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Double1);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Double2);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Double3);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Double4);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Int1);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Int2);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Int3);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Int4);
-LLGL_STATIC_ASSERT_ENUM(UniformType, UInt1);
-LLGL_STATIC_ASSERT_ENUM(UniformType, UInt2);
-LLGL_STATIC_ASSERT_ENUM(UniformType, UInt3);
-LLGL_STATIC_ASSERT_ENUM(UniformType, UInt4);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Bool1);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Bool2);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Bool3);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Bool4);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Float2x2);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Float2x3);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Float2x4);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Float3x2);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Float3x3);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Float3x4);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Float4x2);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Float4x3);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Float4x4);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Double2x2);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Double2x3);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Double2x4);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Double3x2);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Double3x3);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Double3x4);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Double4x2);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Double4x3);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Double4x4);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Sampler);
-LLGL_STATIC_ASSERT_ENUM(UniformType, Image);
-LLGL_STATIC_ASSERT_ENUM(UniformType, AtomicCounter);
-
-LLGL_STATIC_ASSERT_ENUM(ResourceType, Undefined);
-LLGL_STATIC_ASSERT_ENUM(ResourceType, Buffer);
-LLGL_STATIC_ASSERT_ENUM(ResourceType, Texture);
-LLGL_STATIC_ASSERT_ENUM(ResourceType, Sampler);
+LLGL_STATIC_ASSERT_ENUM(ReportType, Default);
+LLGL_STATIC_ASSERT_ENUM(ReportType, Error);
 
 LLGL_STATIC_ASSERT_ENUM(Key, LButton);
 LLGL_STATIC_ASSERT_ENUM(Key, RButton);
@@ -580,15 +316,164 @@ LLGL_STATIC_ASSERT_ENUM(Key, PA1);
 LLGL_STATIC_ASSERT_ENUM(Key, OEMClear);
 LLGL_STATIC_ASSERT_ENUM(Key, Any);
 
-LLGL_STATIC_ASSERT_ENUM(StorageBufferType, Undefined);
-LLGL_STATIC_ASSERT_ENUM(StorageBufferType, TypedBuffer);
-LLGL_STATIC_ASSERT_ENUM(StorageBufferType, StructuredBuffer);
-LLGL_STATIC_ASSERT_ENUM(StorageBufferType, ByteAddressBuffer);
-LLGL_STATIC_ASSERT_ENUM(StorageBufferType, RWTypedBuffer);
-LLGL_STATIC_ASSERT_ENUM(StorageBufferType, RWStructuredBuffer);
-LLGL_STATIC_ASSERT_ENUM(StorageBufferType, RWByteAddressBuffer);
-LLGL_STATIC_ASSERT_ENUM(StorageBufferType, AppendStructuredBuffer);
-LLGL_STATIC_ASSERT_ENUM(StorageBufferType, ConsumeStructuredBuffer);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Undefined);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Float1);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Float2);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Float3);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Float4);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Double1);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Double2);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Double3);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Double4);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Int1);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Int2);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Int3);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Int4);
+LLGL_STATIC_ASSERT_ENUM(UniformType, UInt1);
+LLGL_STATIC_ASSERT_ENUM(UniformType, UInt2);
+LLGL_STATIC_ASSERT_ENUM(UniformType, UInt3);
+LLGL_STATIC_ASSERT_ENUM(UniformType, UInt4);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Bool1);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Bool2);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Bool3);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Bool4);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Float2x2);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Float2x3);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Float2x4);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Float3x2);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Float3x3);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Float3x4);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Float4x2);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Float4x3);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Float4x4);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Double2x2);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Double2x3);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Double2x4);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Double3x2);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Double3x3);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Double3x4);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Double4x2);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Double4x3);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Double4x4);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Sampler);
+LLGL_STATIC_ASSERT_ENUM(UniformType, Image);
+LLGL_STATIC_ASSERT_ENUM(UniformType, AtomicCounter);
+
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, PointList);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, LineList);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, LineStrip);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, LineListAdjacency);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, LineStripAdjacency);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, TriangleList);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, TriangleStrip);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, TriangleListAdjacency);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, TriangleStripAdjacency);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches1);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches2);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches3);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches4);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches5);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches6);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches7);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches8);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches9);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches10);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches11);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches12);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches13);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches14);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches15);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches16);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches17);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches18);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches19);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches20);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches21);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches22);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches23);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches24);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches25);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches26);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches27);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches28);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches29);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches30);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches31);
+LLGL_STATIC_ASSERT_ENUM(PrimitiveTopology, Patches32);
+
+LLGL_STATIC_ASSERT_ENUM(CompareOp, NeverPass);
+LLGL_STATIC_ASSERT_ENUM(CompareOp, Less);
+LLGL_STATIC_ASSERT_ENUM(CompareOp, Equal);
+LLGL_STATIC_ASSERT_ENUM(CompareOp, LessEqual);
+LLGL_STATIC_ASSERT_ENUM(CompareOp, Greater);
+LLGL_STATIC_ASSERT_ENUM(CompareOp, NotEqual);
+LLGL_STATIC_ASSERT_ENUM(CompareOp, GreaterEqual);
+LLGL_STATIC_ASSERT_ENUM(CompareOp, AlwaysPass);
+
+LLGL_STATIC_ASSERT_ENUM(StencilOp, Keep);
+LLGL_STATIC_ASSERT_ENUM(StencilOp, Zero);
+LLGL_STATIC_ASSERT_ENUM(StencilOp, Replace);
+LLGL_STATIC_ASSERT_ENUM(StencilOp, IncClamp);
+LLGL_STATIC_ASSERT_ENUM(StencilOp, DecClamp);
+LLGL_STATIC_ASSERT_ENUM(StencilOp, Invert);
+LLGL_STATIC_ASSERT_ENUM(StencilOp, IncWrap);
+LLGL_STATIC_ASSERT_ENUM(StencilOp, DecWrap);
+
+LLGL_STATIC_ASSERT_ENUM(BlendOp, Zero);
+LLGL_STATIC_ASSERT_ENUM(BlendOp, One);
+LLGL_STATIC_ASSERT_ENUM(BlendOp, SrcColor);
+LLGL_STATIC_ASSERT_ENUM(BlendOp, InvSrcColor);
+LLGL_STATIC_ASSERT_ENUM(BlendOp, SrcAlpha);
+LLGL_STATIC_ASSERT_ENUM(BlendOp, InvSrcAlpha);
+LLGL_STATIC_ASSERT_ENUM(BlendOp, DstColor);
+LLGL_STATIC_ASSERT_ENUM(BlendOp, InvDstColor);
+LLGL_STATIC_ASSERT_ENUM(BlendOp, DstAlpha);
+LLGL_STATIC_ASSERT_ENUM(BlendOp, InvDstAlpha);
+LLGL_STATIC_ASSERT_ENUM(BlendOp, SrcAlphaSaturate);
+LLGL_STATIC_ASSERT_ENUM(BlendOp, BlendFactor);
+LLGL_STATIC_ASSERT_ENUM(BlendOp, InvBlendFactor);
+LLGL_STATIC_ASSERT_ENUM(BlendOp, Src1Color);
+LLGL_STATIC_ASSERT_ENUM(BlendOp, InvSrc1Color);
+LLGL_STATIC_ASSERT_ENUM(BlendOp, Src1Alpha);
+LLGL_STATIC_ASSERT_ENUM(BlendOp, InvSrc1Alpha);
+
+LLGL_STATIC_ASSERT_ENUM(BlendArithmetic, Add);
+LLGL_STATIC_ASSERT_ENUM(BlendArithmetic, Subtract);
+LLGL_STATIC_ASSERT_ENUM(BlendArithmetic, RevSubtract);
+LLGL_STATIC_ASSERT_ENUM(BlendArithmetic, Min);
+LLGL_STATIC_ASSERT_ENUM(BlendArithmetic, Max);
+
+LLGL_STATIC_ASSERT_ENUM(PolygonMode, Fill);
+LLGL_STATIC_ASSERT_ENUM(PolygonMode, Wireframe);
+LLGL_STATIC_ASSERT_ENUM(PolygonMode, Points);
+
+LLGL_STATIC_ASSERT_ENUM(CullMode, Disabled);
+LLGL_STATIC_ASSERT_ENUM(CullMode, Front);
+LLGL_STATIC_ASSERT_ENUM(CullMode, Back);
+
+LLGL_STATIC_ASSERT_ENUM(LogicOp, Disabled);
+LLGL_STATIC_ASSERT_ENUM(LogicOp, Clear);
+LLGL_STATIC_ASSERT_ENUM(LogicOp, Set);
+LLGL_STATIC_ASSERT_ENUM(LogicOp, Copy);
+LLGL_STATIC_ASSERT_ENUM(LogicOp, CopyInverted);
+LLGL_STATIC_ASSERT_ENUM(LogicOp, NoOp);
+LLGL_STATIC_ASSERT_ENUM(LogicOp, Invert);
+LLGL_STATIC_ASSERT_ENUM(LogicOp, AND);
+LLGL_STATIC_ASSERT_ENUM(LogicOp, ANDReverse);
+LLGL_STATIC_ASSERT_ENUM(LogicOp, ANDInverted);
+LLGL_STATIC_ASSERT_ENUM(LogicOp, NAND);
+LLGL_STATIC_ASSERT_ENUM(LogicOp, OR);
+LLGL_STATIC_ASSERT_ENUM(LogicOp, ORReverse);
+LLGL_STATIC_ASSERT_ENUM(LogicOp, ORInverted);
+LLGL_STATIC_ASSERT_ENUM(LogicOp, NOR);
+LLGL_STATIC_ASSERT_ENUM(LogicOp, XOR);
+LLGL_STATIC_ASSERT_ENUM(LogicOp, Equiv);
+
+LLGL_STATIC_ASSERT_ENUM(TessellationPartition, Undefined);
+LLGL_STATIC_ASSERT_ENUM(TessellationPartition, Integer);
+LLGL_STATIC_ASSERT_ENUM(TessellationPartition, Pow2);
+LLGL_STATIC_ASSERT_ENUM(TessellationPartition, FractionalOdd);
+LLGL_STATIC_ASSERT_ENUM(TessellationPartition, FractionalEven);
 
 LLGL_STATIC_ASSERT_ENUM(QueryType, SamplesPassed);
 LLGL_STATIC_ASSERT_ENUM(QueryType, AnySamplesPassed);
@@ -605,27 +490,155 @@ LLGL_STATIC_ASSERT_ENUM(AttachmentLoadOp, Clear);
 LLGL_STATIC_ASSERT_ENUM(AttachmentStoreOp, Undefined);
 LLGL_STATIC_ASSERT_ENUM(AttachmentStoreOp, Store);
 
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_110);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_120);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_130);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_140);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_150);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_330);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_400);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_410);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_420);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_430);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_440);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_450);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, GLSL_460);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, ESSL);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, ESSL_100);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, ESSL_300);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, ESSL_310);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, ESSL_320);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_2_0);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_2_0a);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_2_0b);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_3_0);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_4_0);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_4_1);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_5_0);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_5_1);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_6_0);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_6_1);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_6_2);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_6_3);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, HLSL_6_4);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, Metal);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, Metal_1_0);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, Metal_1_1);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, Metal_1_2);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, Metal_2_0);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, Metal_2_1);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, SPIRV);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, SPIRV_100);
+LLGL_STATIC_ASSERT_ENUM(ShadingLanguage, VersionBitmask);
 
-/* ----- Flags ----- */
+LLGL_STATIC_ASSERT_ENUM(ScreenOrigin, LowerLeft);
+LLGL_STATIC_ASSERT_ENUM(ScreenOrigin, UpperLeft);
 
-LLGL_STATIC_ASSERT_FLAG(CommandBuffer, Secondary);
-LLGL_STATIC_ASSERT_FLAG(CommandBuffer, MultiSubmit);
-LLGL_STATIC_ASSERT_FLAG(CommandBuffer, ImmediateSubmit);
+LLGL_STATIC_ASSERT_ENUM(ClippingRange, MinusOneToOne);
+LLGL_STATIC_ASSERT_ENUM(ClippingRange, ZeroToOne);
 
-LLGL_STATIC_ASSERT_FLAG(Clear, Color);
-LLGL_STATIC_ASSERT_FLAG(Clear, Depth);
-LLGL_STATIC_ASSERT_FLAG(Clear, Stencil);
-LLGL_STATIC_ASSERT_FLAG(Clear, ColorDepth);
-LLGL_STATIC_ASSERT_FLAG(Clear, DepthStencil);
-LLGL_STATIC_ASSERT_FLAG(Clear, All);
+LLGL_STATIC_ASSERT_ENUM(CPUAccess, ReadOnly);
+LLGL_STATIC_ASSERT_ENUM(CPUAccess, WriteOnly);
+LLGL_STATIC_ASSERT_ENUM(CPUAccess, WriteDiscard);
+LLGL_STATIC_ASSERT_ENUM(CPUAccess, ReadWrite);
 
-LLGL_STATIC_ASSERT_FLAG(Format, HasDepth);
-LLGL_STATIC_ASSERT_FLAG(Format, HasStencil);
-LLGL_STATIC_ASSERT_FLAG(Format, IsColorSpace_sRGB);
-LLGL_STATIC_ASSERT_FLAG(Format, IsCompressed);
-LLGL_STATIC_ASSERT_FLAG(Format, IsNormalized);
-LLGL_STATIC_ASSERT_FLAG(Format, IsInteger);
-LLGL_STATIC_ASSERT_FLAG(Format, IsUnsigned);
+LLGL_STATIC_ASSERT_ENUM(ResourceType, Undefined);
+LLGL_STATIC_ASSERT_ENUM(ResourceType, Buffer);
+LLGL_STATIC_ASSERT_ENUM(ResourceType, Texture);
+LLGL_STATIC_ASSERT_ENUM(ResourceType, Sampler);
+
+LLGL_STATIC_ASSERT_ENUM(SamplerAddressMode, Repeat);
+LLGL_STATIC_ASSERT_ENUM(SamplerAddressMode, Mirror);
+LLGL_STATIC_ASSERT_ENUM(SamplerAddressMode, Clamp);
+LLGL_STATIC_ASSERT_ENUM(SamplerAddressMode, Border);
+LLGL_STATIC_ASSERT_ENUM(SamplerAddressMode, MirrorOnce);
+
+LLGL_STATIC_ASSERT_ENUM(SamplerFilter, Nearest);
+LLGL_STATIC_ASSERT_ENUM(SamplerFilter, Linear);
+
+LLGL_STATIC_ASSERT_ENUM(ShaderType, Undefined);
+LLGL_STATIC_ASSERT_ENUM(ShaderType, Vertex);
+LLGL_STATIC_ASSERT_ENUM(ShaderType, TessControl);
+LLGL_STATIC_ASSERT_ENUM(ShaderType, TessEvaluation);
+LLGL_STATIC_ASSERT_ENUM(ShaderType, Geometry);
+LLGL_STATIC_ASSERT_ENUM(ShaderType, Fragment);
+LLGL_STATIC_ASSERT_ENUM(ShaderType, Compute);
+
+LLGL_STATIC_ASSERT_ENUM(ShaderSourceType, CodeString);
+LLGL_STATIC_ASSERT_ENUM(ShaderSourceType, CodeFile);
+LLGL_STATIC_ASSERT_ENUM(ShaderSourceType, BinaryBuffer);
+LLGL_STATIC_ASSERT_ENUM(ShaderSourceType, BinaryFile);
+
+LLGL_STATIC_ASSERT_ENUM(StorageBufferType, Undefined);
+LLGL_STATIC_ASSERT_ENUM(StorageBufferType, TypedBuffer);
+LLGL_STATIC_ASSERT_ENUM(StorageBufferType, StructuredBuffer);
+LLGL_STATIC_ASSERT_ENUM(StorageBufferType, ByteAddressBuffer);
+LLGL_STATIC_ASSERT_ENUM(StorageBufferType, RWTypedBuffer);
+LLGL_STATIC_ASSERT_ENUM(StorageBufferType, RWStructuredBuffer);
+LLGL_STATIC_ASSERT_ENUM(StorageBufferType, RWByteAddressBuffer);
+LLGL_STATIC_ASSERT_ENUM(StorageBufferType, AppendStructuredBuffer);
+LLGL_STATIC_ASSERT_ENUM(StorageBufferType, ConsumeStructuredBuffer);
+
+LLGL_STATIC_ASSERT_ENUM(SystemValue, Undefined);
+LLGL_STATIC_ASSERT_ENUM(SystemValue, ClipDistance);
+LLGL_STATIC_ASSERT_ENUM(SystemValue, Color);
+LLGL_STATIC_ASSERT_ENUM(SystemValue, CullDistance);
+LLGL_STATIC_ASSERT_ENUM(SystemValue, Depth);
+LLGL_STATIC_ASSERT_ENUM(SystemValue, DepthGreater);
+LLGL_STATIC_ASSERT_ENUM(SystemValue, DepthLess);
+LLGL_STATIC_ASSERT_ENUM(SystemValue, FrontFacing);
+LLGL_STATIC_ASSERT_ENUM(SystemValue, InstanceID);
+LLGL_STATIC_ASSERT_ENUM(SystemValue, Position);
+LLGL_STATIC_ASSERT_ENUM(SystemValue, PrimitiveID);
+LLGL_STATIC_ASSERT_ENUM(SystemValue, RenderTargetIndex);
+LLGL_STATIC_ASSERT_ENUM(SystemValue, SampleMask);
+LLGL_STATIC_ASSERT_ENUM(SystemValue, SampleID);
+LLGL_STATIC_ASSERT_ENUM(SystemValue, Stencil);
+LLGL_STATIC_ASSERT_ENUM(SystemValue, VertexID);
+LLGL_STATIC_ASSERT_ENUM(SystemValue, ViewportIndex);
+
+LLGL_STATIC_ASSERT_ENUM(TextureType, Texture1D);
+LLGL_STATIC_ASSERT_ENUM(TextureType, Texture2D);
+LLGL_STATIC_ASSERT_ENUM(TextureType, Texture3D);
+LLGL_STATIC_ASSERT_ENUM(TextureType, TextureCube);
+LLGL_STATIC_ASSERT_ENUM(TextureType, Texture1DArray);
+LLGL_STATIC_ASSERT_ENUM(TextureType, Texture2DArray);
+LLGL_STATIC_ASSERT_ENUM(TextureType, TextureCubeArray);
+LLGL_STATIC_ASSERT_ENUM(TextureType, Texture2DMS);
+LLGL_STATIC_ASSERT_ENUM(TextureType, Texture2DMSArray);
+
+LLGL_STATIC_ASSERT_ENUM(TextureSwizzle, Zero);
+LLGL_STATIC_ASSERT_ENUM(TextureSwizzle, One);
+LLGL_STATIC_ASSERT_ENUM(TextureSwizzle, Red);
+LLGL_STATIC_ASSERT_ENUM(TextureSwizzle, Green);
+LLGL_STATIC_ASSERT_ENUM(TextureSwizzle, Blue);
+LLGL_STATIC_ASSERT_ENUM(TextureSwizzle, Alpha);
+
+
+/* ----- Flags ----- */
+
+LLGL_STATIC_ASSERT_FLAG(Canvas, Borderless);
+
+LLGL_STATIC_ASSERT_FLAG(CommandBuffer, Secondary);
+LLGL_STATIC_ASSERT_FLAG(CommandBuffer, MultiSubmit);
+LLGL_STATIC_ASSERT_FLAG(CommandBuffer, ImmediateSubmit);
+
+LLGL_STATIC_ASSERT_FLAG(Clear, Color);
+LLGL_STATIC_ASSERT_FLAG(Clear, Depth);
+LLGL_STATIC_ASSERT_FLAG(Clear, Stencil);
+LLGL_STATIC_ASSERT_FLAG(Clear, ColorDepth);
+LLGL_STATIC_ASSERT_FLAG(Clear, DepthStencil);
+LLGL_STATIC_ASSERT_FLAG(Clear, All);
+
+LLGL_STATIC_ASSERT_FLAG(Format, HasDepth);
+LLGL_STATIC_ASSERT_FLAG(Format, HasStencil);
+LLGL_STATIC_ASSERT_FLAG(Format, IsColorSpace_sRGB);
+LLGL_STATIC_ASSERT_FLAG(Format, IsCompressed);
+LLGL_STATIC_ASSERT_FLAG(Format, IsNormalized);
+LLGL_STATIC_ASSERT_FLAG(Format, IsInteger);
+LLGL_STATIC_ASSERT_FLAG(Format, IsUnsigned);
 LLGL_STATIC_ASSERT_FLAG(Format, IsPacked);
 LLGL_STATIC_ASSERT_FLAG(Format, SupportsRenderTarget);
 LLGL_STATIC_ASSERT_FLAG(Format, SupportsMips);
@@ -638,28 +651,17 @@ LLGL_STATIC_ASSERT_FLAG(Format, SupportsVertex);
 LLGL_STATIC_ASSERT_FLAG(Format, IsUnsignedInteger);
 LLGL_STATIC_ASSERT_FLAG(Format, HasDepthStencil);
 
-LLGL_STATIC_ASSERT_FLAG(Barrier, StorageBuffer);
-LLGL_STATIC_ASSERT_FLAG(Barrier, StorageTexture);
-LLGL_STATIC_ASSERT_FLAG(Barrier, Storage);
-
-LLGL_STATIC_ASSERT_FLAG(ShaderCompile, Debug);
-LLGL_STATIC_ASSERT_FLAG(ShaderCompile, NoOptimization);
-LLGL_STATIC_ASSERT_FLAG(ShaderCompile, OptimizationLevel1);
-LLGL_STATIC_ASSERT_FLAG(ShaderCompile, OptimizationLevel2);
-LLGL_STATIC_ASSERT_FLAG(ShaderCompile, OptimizationLevel3);
-LLGL_STATIC_ASSERT_FLAG(ShaderCompile, WarningsAreErrors);
-LLGL_STATIC_ASSERT_FLAG(ShaderCompile, PatchClippingOrigin);
-LLGL_STATIC_ASSERT_FLAG(ShaderCompile, SeparateShader);
+LLGL_STATIC_ASSERT_FLAG(ColorMask, Zero);
+LLGL_STATIC_ASSERT_FLAG(ColorMask, R);
+LLGL_STATIC_ASSERT_FLAG(ColorMask, G);
+LLGL_STATIC_ASSERT_FLAG(ColorMask, B);
+LLGL_STATIC_ASSERT_FLAG(ColorMask, A);
+LLGL_STATIC_ASSERT_FLAG(ColorMask, All);
 
-LLGL_STATIC_ASSERT_FLAG(Stage, VertexStage);
-LLGL_STATIC_ASSERT_FLAG(Stage, TessControlStage);
-LLGL_STATIC_ASSERT_FLAG(Stage, TessEvaluationStage);
-LLGL_STATIC_ASSERT_FLAG(Stage, GeometryStage);
-LLGL_STATIC_ASSERT_FLAG(Stage, FragmentStage);
-LLGL_STATIC_ASSERT_FLAG(Stage, ComputeStage);
-LLGL_STATIC_ASSERT_FLAG(Stage, AllTessStages);
-LLGL_STATIC_ASSERT_FLAG(Stage, AllGraphicsStages);
-LLGL_STATIC_ASSERT_FLAG(Stage, AllStages);
+LLGL_STATIC_ASSERT_FLAG(RenderSystem, DebugDevice);
+LLGL_STATIC_ASSERT_FLAG(RenderSystem, PreferNVIDIA);
+LLGL_STATIC_ASSERT_FLAG(RenderSystem, PreferAMD);
+LLGL_STATIC_ASSERT_FLAG(RenderSystem, PreferIntel);
 
 LLGL_STATIC_ASSERT_FLAG(Bind, VertexBuffer);
 LLGL_STATIC_ASSERT_FLAG(Bind, IndexBuffer);
@@ -684,26 +686,82 @@ LLGL_STATIC_ASSERT_FLAG(Misc, NoInitialData);
 LLGL_STATIC_ASSERT_FLAG(Misc, Append);
 LLGL_STATIC_ASSERT_FLAG(Misc, Counter);
 
+LLGL_STATIC_ASSERT_FLAG(Barrier, StorageBuffer);
+LLGL_STATIC_ASSERT_FLAG(Barrier, StorageTexture);
+LLGL_STATIC_ASSERT_FLAG(Barrier, Storage);
+
+LLGL_STATIC_ASSERT_FLAG(ShaderCompile, Debug);
+LLGL_STATIC_ASSERT_FLAG(ShaderCompile, NoOptimization);
+LLGL_STATIC_ASSERT_FLAG(ShaderCompile, OptimizationLevel1);
+LLGL_STATIC_ASSERT_FLAG(ShaderCompile, OptimizationLevel2);
+LLGL_STATIC_ASSERT_FLAG(ShaderCompile, OptimizationLevel3);
+LLGL_STATIC_ASSERT_FLAG(ShaderCompile, WarningsAreErrors);
+LLGL_STATIC_ASSERT_FLAG(ShaderCompile, PatchClippingOrigin);
+LLGL_STATIC_ASSERT_FLAG(ShaderCompile, SeparateShader);
+LLGL_STATIC_ASSERT_FLAG(ShaderCompile, DefaultLibrary);
+
+LLGL_STATIC_ASSERT_FLAG(Stage, VertexStage);
+LLGL_STATIC_ASSERT_FLAG(Stage, TessControlStage);
+LLGL_STATIC_ASSERT_FLAG(Stage, TessEvaluationStage);
+LLGL_STATIC_ASSERT_FLAG(Stage, GeometryStage);
+LLGL_STATIC_ASSERT_FLAG(Stage, FragmentStage);
+LLGL_STATIC_ASSERT_FLAG(Stage, ComputeStage);
+LLGL_STATIC_ASSERT_FLAG(Stage, AllTessStages);
+LLGL_STATIC_ASSERT_FLAG(Stage, AllGraphicsStages);
+LLGL_STATIC_ASSERT_FLAG(Stage, AllStages);
+
+LLGL_STATIC_ASSERT_FLAG(ResizeBuffers, AdaptSurface);
+LLGL_STATIC_ASSERT_FLAG(ResizeBuffers, FullscreenMode);
+LLGL_STATIC_ASSERT_FLAG(ResizeBuffers, WindowedMode);
+
+LLGL_STATIC_ASSERT_FLAG(Window, Visible);
+LLGL_STATIC_ASSERT_FLAG(Window, Borderless);
+LLGL_STATIC_ASSERT_FLAG(Window, Resizable);
+LLGL_STATIC_ASSERT_FLAG(Window, Centered);
+LLGL_STATIC_ASSERT_FLAG(Window, AcceptDropFiles);
+LLGL_STATIC_ASSERT_FLAG(Window, DisableClearOnResize);
+LLGL_STATIC_ASSERT_FLAG(Window, DisableSizeScaling);
+
 
 /* ----- Structures ----- */
 
-LLGL_STATIC_ASSERT_SIZE(Extent2D);
-LLGL_STATIC_ASSERT_OFFSET(Extent2D, width);
-LLGL_STATIC_ASSERT_OFFSET(Extent2D, height);
+/* LLGLCanvasDescriptor requires conversion: string 'title' */
 
-LLGL_STATIC_ASSERT_SIZE(Extent3D);
-LLGL_STATIC_ASSERT_OFFSET(Extent3D, width);
-LLGL_STATIC_ASSERT_OFFSET(Extent3D, height);
-LLGL_STATIC_ASSERT_OFFSET(Extent3D, depth);
+LLGL_STATIC_ASSERT_SIZE(ClearValue);
+LLGL_STATIC_ASSERT_OFFSET(ClearValue, color);
+LLGL_STATIC_ASSERT_OFFSET(ClearValue, depth);
+LLGL_STATIC_ASSERT_OFFSET(ClearValue, stencil);
 
-LLGL_STATIC_ASSERT_SIZE(Offset2D);
-LLGL_STATIC_ASSERT_OFFSET(Offset2D, x);
-LLGL_STATIC_ASSERT_OFFSET(Offset2D, y);
+LLGL_STATIC_ASSERT_SIZE(CommandBufferDescriptor);
+LLGL_STATIC_ASSERT_OFFSET(CommandBufferDescriptor, flags);
+LLGL_STATIC_ASSERT_OFFSET(CommandBufferDescriptor, numNativeBuffers);
+LLGL_STATIC_ASSERT_OFFSET(CommandBufferDescriptor, minStagingPoolSize);
 
-LLGL_STATIC_ASSERT_SIZE(Offset3D);
-LLGL_STATIC_ASSERT_OFFSET(Offset3D, x);
-LLGL_STATIC_ASSERT_OFFSET(Offset3D, y);
-LLGL_STATIC_ASSERT_OFFSET(Offset3D, z);
+LLGL_STATIC_ASSERT_SIZE(DrawIndirectArguments);
+LLGL_STATIC_ASSERT_OFFSET(DrawIndirectArguments, numVertices);
+LLGL_STATIC_ASSERT_OFFSET(DrawIndirectArguments, numInstances);
+LLGL_STATIC_ASSERT_OFFSET(DrawIndirectArguments, firstVertex);
+LLGL_STATIC_ASSERT_OFFSET(DrawIndirectArguments, firstInstance);
+
+LLGL_STATIC_ASSERT_SIZE(DrawIndexedIndirectArguments);
+LLGL_STATIC_ASSERT_OFFSET(DrawIndexedIndirectArguments, numIndices);
+LLGL_STATIC_ASSERT_OFFSET(DrawIndexedIndirectArguments, numInstances);
+LLGL_STATIC_ASSERT_OFFSET(DrawIndexedIndirectArguments, firstIndex);
+LLGL_STATIC_ASSERT_OFFSET(DrawIndexedIndirectArguments, vertexOffset);
+LLGL_STATIC_ASSERT_OFFSET(DrawIndexedIndirectArguments, firstInstance);
+
+LLGL_STATIC_ASSERT_SIZE(DrawPatchIndirectArguments);
+LLGL_STATIC_ASSERT_OFFSET(DrawPatchIndirectArguments, numPatches);
+LLGL_STATIC_ASSERT_OFFSET(DrawPatchIndirectArguments, numInstances);
+LLGL_STATIC_ASSERT_OFFSET(DrawPatchIndirectArguments, firstPatch);
+LLGL_STATIC_ASSERT_OFFSET(DrawPatchIndirectArguments, firstInstance);
+
+LLGL_STATIC_ASSERT_SIZE(DispatchIndirectArguments);
+LLGL_STATIC_ASSERT_OFFSET(DispatchIndirectArguments, numThreadGroups);
+
+LLGL_STATIC_ASSERT_SIZE(BindingSlot);
+LLGL_STATIC_ASSERT_OFFSET(BindingSlot, index);
+LLGL_STATIC_ASSERT_OFFSET(BindingSlot, set);
 
 LLGL_STATIC_ASSERT_SIZE(Viewport);
 LLGL_STATIC_ASSERT_OFFSET(Viewport, x);
@@ -719,147 +777,29 @@ LLGL_STATIC_ASSERT_OFFSET(Scissor, y);
 LLGL_STATIC_ASSERT_OFFSET(Scissor, width);
 LLGL_STATIC_ASSERT_OFFSET(Scissor, height);
 
-LLGL_STATIC_ASSERT_SIZE(DepthDescriptor);
-LLGL_STATIC_ASSERT_OFFSET(DepthDescriptor, testEnabled);
-LLGL_STATIC_ASSERT_OFFSET(DepthDescriptor, writeEnabled);
-LLGL_STATIC_ASSERT_OFFSET(DepthDescriptor, compareOp);
-
-LLGL_STATIC_ASSERT_SIZE(StencilFaceDescriptor);
-LLGL_STATIC_ASSERT_OFFSET(StencilFaceDescriptor, stencilFailOp);
-LLGL_STATIC_ASSERT_OFFSET(StencilFaceDescriptor, depthFailOp);
-LLGL_STATIC_ASSERT_OFFSET(StencilFaceDescriptor, depthPassOp);
-LLGL_STATIC_ASSERT_OFFSET(StencilFaceDescriptor, compareOp);
-LLGL_STATIC_ASSERT_OFFSET(StencilFaceDescriptor, readMask);
-LLGL_STATIC_ASSERT_OFFSET(StencilFaceDescriptor, writeMask);
-LLGL_STATIC_ASSERT_OFFSET(StencilFaceDescriptor, reference);
-
-LLGL_STATIC_ASSERT_SIZE(StencilDescriptor);
-LLGL_STATIC_ASSERT_OFFSET(StencilDescriptor, testEnabled);
-LLGL_STATIC_ASSERT_OFFSET(StencilDescriptor, referenceDynamic);
-LLGL_STATIC_ASSERT_OFFSET(StencilDescriptor, front);
-LLGL_STATIC_ASSERT_OFFSET(StencilDescriptor, back);
-
 LLGL_STATIC_ASSERT_SIZE(DepthBiasDescriptor);
 LLGL_STATIC_ASSERT_OFFSET(DepthBiasDescriptor, constantFactor);
 LLGL_STATIC_ASSERT_OFFSET(DepthBiasDescriptor, slopeFactor);
 LLGL_STATIC_ASSERT_OFFSET(DepthBiasDescriptor, clamp);
 
-LLGL_STATIC_ASSERT_SIZE(RasterizerDescriptor);
-LLGL_STATIC_ASSERT_OFFSET(RasterizerDescriptor, polygonMode);
-LLGL_STATIC_ASSERT_OFFSET(RasterizerDescriptor, cullMode);
-LLGL_STATIC_ASSERT_OFFSET(RasterizerDescriptor, depthBias);
-LLGL_STATIC_ASSERT_OFFSET(RasterizerDescriptor, frontCCW);
-LLGL_STATIC_ASSERT_OFFSET(RasterizerDescriptor, discardEnabled);
-LLGL_STATIC_ASSERT_OFFSET(RasterizerDescriptor, depthClampEnabled);
-LLGL_STATIC_ASSERT_OFFSET(RasterizerDescriptor, scissorTestEnabled);
-LLGL_STATIC_ASSERT_OFFSET(RasterizerDescriptor, multiSampleEnabled);
-LLGL_STATIC_ASSERT_OFFSET(RasterizerDescriptor, antiAliasedLineEnabled);
-LLGL_STATIC_ASSERT_OFFSET(RasterizerDescriptor, conservativeRasterization);
-LLGL_STATIC_ASSERT_OFFSET(RasterizerDescriptor, lineWidth);
-
-LLGL_STATIC_ASSERT_SIZE(BlendTargetDescriptor);
-LLGL_STATIC_ASSERT_OFFSET(BlendTargetDescriptor, blendEnabled);
-LLGL_STATIC_ASSERT_OFFSET(BlendTargetDescriptor, srcColor);
-LLGL_STATIC_ASSERT_OFFSET(BlendTargetDescriptor, dstColor);
-LLGL_STATIC_ASSERT_OFFSET(BlendTargetDescriptor, colorArithmetic);
-LLGL_STATIC_ASSERT_OFFSET(BlendTargetDescriptor, srcAlpha);
-LLGL_STATIC_ASSERT_OFFSET(BlendTargetDescriptor, dstAlpha);
-LLGL_STATIC_ASSERT_OFFSET(BlendTargetDescriptor, alphaArithmetic);
-LLGL_STATIC_ASSERT_OFFSET(BlendTargetDescriptor, colorMask);
+LLGL_STATIC_ASSERT_SIZE(ComputePipelineDescriptor);
+LLGL_STATIC_ASSERT_OFFSET(ComputePipelineDescriptor, pipelineLayout);
+LLGL_STATIC_ASSERT_OFFSET(ComputePipelineDescriptor, computeShader);
 
-LLGL_STATIC_ASSERT_SIZE(BlendDescriptor);
-LLGL_STATIC_ASSERT_OFFSET(BlendDescriptor, alphaToCoverageEnabled);
-LLGL_STATIC_ASSERT_OFFSET(BlendDescriptor, independentBlendEnabled);
-LLGL_STATIC_ASSERT_OFFSET(BlendDescriptor, sampleMask);
-LLGL_STATIC_ASSERT_OFFSET(BlendDescriptor, logicOp);
-LLGL_STATIC_ASSERT_OFFSET(BlendDescriptor, blendFactor);
-LLGL_STATIC_ASSERT_OFFSET(BlendDescriptor, blendFactorDynamic);
-LLGL_STATIC_ASSERT_OFFSET(BlendDescriptor, targets);
+LLGL_STATIC_ASSERT_SIZE(QueryPipelineStatistics);
+LLGL_STATIC_ASSERT_OFFSET(QueryPipelineStatistics, inputAssemblyVertices);
+LLGL_STATIC_ASSERT_OFFSET(QueryPipelineStatistics, inputAssemblyPrimitives);
+LLGL_STATIC_ASSERT_OFFSET(QueryPipelineStatistics, vertexShaderInvocations);
+LLGL_STATIC_ASSERT_OFFSET(QueryPipelineStatistics, geometryShaderInvocations);
+LLGL_STATIC_ASSERT_OFFSET(QueryPipelineStatistics, geometryShaderPrimitives);
+LLGL_STATIC_ASSERT_OFFSET(QueryPipelineStatistics, clippingInvocations);
+LLGL_STATIC_ASSERT_OFFSET(QueryPipelineStatistics, clippingPrimitives);
+LLGL_STATIC_ASSERT_OFFSET(QueryPipelineStatistics, fragmentShaderInvocations);
+LLGL_STATIC_ASSERT_OFFSET(QueryPipelineStatistics, tessControlShaderInvocations);
+LLGL_STATIC_ASSERT_OFFSET(QueryPipelineStatistics, tessEvaluationShaderInvocations);
+LLGL_STATIC_ASSERT_OFFSET(QueryPipelineStatistics, computeShaderInvocations);
 
-LLGL_STATIC_ASSERT_SIZE(TessellationDescriptor);
-LLGL_STATIC_ASSERT_OFFSET(TessellationDescriptor, partition);
-LLGL_STATIC_ASSERT_OFFSET(TessellationDescriptor, maxTessFactor);
-LLGL_STATIC_ASSERT_OFFSET(TessellationDescriptor, outputWindingCCW);
-
-LLGL_STATIC_ASSERT_SIZE(ClearValue);
-LLGL_STATIC_ASSERT_OFFSET(ClearValue, color);
-LLGL_STATIC_ASSERT_OFFSET(ClearValue, depth);
-LLGL_STATIC_ASSERT_OFFSET(ClearValue, stencil);
-
-LLGL_STATIC_ASSERT_SIZE(AttachmentClear);
-LLGL_STATIC_ASSERT_OFFSET(AttachmentClear, flags);
-LLGL_STATIC_ASSERT_OFFSET(AttachmentClear, colorAttachment);
-LLGL_STATIC_ASSERT_OFFSET(AttachmentClear, clearValue);
-
-LLGL_STATIC_ASSERT_SIZE(CommandBufferDescriptor);
-LLGL_STATIC_ASSERT_OFFSET(CommandBufferDescriptor, flags);
-LLGL_STATIC_ASSERT_OFFSET(CommandBufferDescriptor, numNativeBuffers);
-LLGL_STATIC_ASSERT_OFFSET(CommandBufferDescriptor, minStagingPoolSize);
-
-LLGL_STATIC_ASSERT_SIZE(FormatAttributes);
-LLGL_STATIC_ASSERT_OFFSET(FormatAttributes, bitSize);
-LLGL_STATIC_ASSERT_OFFSET(FormatAttributes, blockWidth);
-LLGL_STATIC_ASSERT_OFFSET(FormatAttributes, blockHeight);
-LLGL_STATIC_ASSERT_OFFSET(FormatAttributes, components);
-LLGL_STATIC_ASSERT_OFFSET(FormatAttributes, format);
-LLGL_STATIC_ASSERT_OFFSET(FormatAttributes, dataType);
-LLGL_STATIC_ASSERT_OFFSET(FormatAttributes, flags);
-
-LLGL_STATIC_ASSERT_SIZE(TextureSwizzleRGBA);
-//LLGL_STATIC_ASSERT_OFFSET(TextureSwizzleRGBA, r);
-//LLGL_STATIC_ASSERT_OFFSET(TextureSwizzleRGBA, g);
-//LLGL_STATIC_ASSERT_OFFSET(TextureSwizzleRGBA, b);
-//LLGL_STATIC_ASSERT_OFFSET(TextureSwizzleRGBA, a);
-
-LLGL_STATIC_ASSERT_SIZE(TextureSubresource);
-LLGL_STATIC_ASSERT_OFFSET(TextureSubresource, baseArrayLayer);
-LLGL_STATIC_ASSERT_OFFSET(TextureSubresource, numArrayLayers);
-LLGL_STATIC_ASSERT_OFFSET(TextureSubresource, baseMipLevel);
-LLGL_STATIC_ASSERT_OFFSET(TextureSubresource, numMipLevels);
-
-LLGL_STATIC_ASSERT_SIZE(TextureLocation);
-LLGL_STATIC_ASSERT_OFFSET(TextureLocation, offset);
-LLGL_STATIC_ASSERT_OFFSET(TextureLocation, arrayLayer);
-LLGL_STATIC_ASSERT_OFFSET(TextureLocation, mipLevel);
-
-LLGL_STATIC_ASSERT_SIZE(TextureRegion);
-LLGL_STATIC_ASSERT_OFFSET(TextureRegion, subresource);
-LLGL_STATIC_ASSERT_OFFSET(TextureRegion, offset);
-LLGL_STATIC_ASSERT_OFFSET(TextureRegion, extent);
-
-LLGL_STATIC_ASSERT_SIZE(TextureDescriptor);
-LLGL_STATIC_ASSERT_OFFSET(TextureDescriptor, type);
-LLGL_STATIC_ASSERT_OFFSET(TextureDescriptor, bindFlags);
-LLGL_STATIC_ASSERT_OFFSET(TextureDescriptor, miscFlags);
-LLGL_STATIC_ASSERT_OFFSET(TextureDescriptor, format);
-LLGL_STATIC_ASSERT_OFFSET(TextureDescriptor, extent);
-LLGL_STATIC_ASSERT_OFFSET(TextureDescriptor, arrayLayers);
-LLGL_STATIC_ASSERT_OFFSET(TextureDescriptor, mipLevels);
-LLGL_STATIC_ASSERT_OFFSET(TextureDescriptor, samples);
-LLGL_STATIC_ASSERT_OFFSET(TextureDescriptor, clearValue);
-
-LLGL_STATIC_ASSERT_SIZE(TextureViewDescriptor);
-LLGL_STATIC_ASSERT_OFFSET(TextureViewDescriptor, type);
-LLGL_STATIC_ASSERT_OFFSET(TextureViewDescriptor, format);
-LLGL_STATIC_ASSERT_OFFSET(TextureViewDescriptor, subresource);
-LLGL_STATIC_ASSERT_OFFSET(TextureViewDescriptor, swizzle);
-
-LLGL_STATIC_ASSERT_SIZE(SubresourceFootprint);
-LLGL_STATIC_ASSERT_OFFSET(SubresourceFootprint, size);
-LLGL_STATIC_ASSERT_OFFSET(SubresourceFootprint, rowAlignment);
-LLGL_STATIC_ASSERT_OFFSET(SubresourceFootprint, rowSize);
-LLGL_STATIC_ASSERT_OFFSET(SubresourceFootprint, rowStride);
-LLGL_STATIC_ASSERT_OFFSET(SubresourceFootprint, layerSize);
-LLGL_STATIC_ASSERT_OFFSET(SubresourceFootprint, layerStride);
-
-LLGL_STATIC_ASSERT_SIZE(SwapChainDescriptor);
-LLGL_STATIC_ASSERT_OFFSET(SwapChainDescriptor, resolution);
-LLGL_STATIC_ASSERT_OFFSET(SwapChainDescriptor, colorBits);
-LLGL_STATIC_ASSERT_OFFSET(SwapChainDescriptor, depthBits);
-LLGL_STATIC_ASSERT_OFFSET(SwapChainDescriptor, stencilBits);
-LLGL_STATIC_ASSERT_OFFSET(SwapChainDescriptor, samples);
-LLGL_STATIC_ASSERT_OFFSET(SwapChainDescriptor, swapBuffers);
-LLGL_STATIC_ASSERT_OFFSET(SwapChainDescriptor, fullscreen);
+/* LLGLRendererInfo requires conversion: string 'rendererName' */
 
 LLGL_STATIC_ASSERT_SIZE(RenderingFeatures);
 LLGL_STATIC_ASSERT_OFFSET(RenderingFeatures, hasRenderTargets);
@@ -873,8 +813,10 @@ LLGL_STATIC_ASSERT_OFFSET(RenderingFeatures, hasTextureViews);
 LLGL_STATIC_ASSERT_OFFSET(RenderingFeatures, hasTextureViewSwizzle);
 LLGL_STATIC_ASSERT_OFFSET(RenderingFeatures, hasTextureViewFormatSwizzle);
 LLGL_STATIC_ASSERT_OFFSET(RenderingFeatures, hasBufferViews);
+//LLGL_STATIC_ASSERT_OFFSET(RenderingFeatures, hasSamplers);
 LLGL_STATIC_ASSERT_OFFSET(RenderingFeatures, hasConstantBuffers);
 LLGL_STATIC_ASSERT_OFFSET(RenderingFeatures, hasStorageBuffers);
+//LLGL_STATIC_ASSERT_OFFSET(RenderingFeatures, hasUniforms);
 LLGL_STATIC_ASSERT_OFFSET(RenderingFeatures, hasGeometryShaders);
 LLGL_STATIC_ASSERT_OFFSET(RenderingFeatures, hasTessellationShaders);
 LLGL_STATIC_ASSERT_OFFSET(RenderingFeatures, hasTessellatorStage);
@@ -916,6 +858,72 @@ LLGL_STATIC_ASSERT_OFFSET(RenderingLimits, maxDepthBufferSamples);
 LLGL_STATIC_ASSERT_OFFSET(RenderingLimits, maxStencilBufferSamples);
 LLGL_STATIC_ASSERT_OFFSET(RenderingLimits, maxNoAttachmentSamples);
 
+LLGL_STATIC_ASSERT_SIZE(ResourceHeapDescriptor);
+LLGL_STATIC_ASSERT_OFFSET(ResourceHeapDescriptor, pipelineLayout);
+LLGL_STATIC_ASSERT_OFFSET(ResourceHeapDescriptor, numResourceViews);
+LLGL_STATIC_ASSERT_OFFSET(ResourceHeapDescriptor, barrierFlags);
+
+LLGL_STATIC_ASSERT_SIZE(ShaderMacro);
+LLGL_STATIC_ASSERT_OFFSET(ShaderMacro, name);
+LLGL_STATIC_ASSERT_OFFSET(ShaderMacro, definition);
+
+LLGL_STATIC_ASSERT_SIZE(TextureSubresource);
+LLGL_STATIC_ASSERT_OFFSET(TextureSubresource, baseArrayLayer);
+LLGL_STATIC_ASSERT_OFFSET(TextureSubresource, numArrayLayers);
+LLGL_STATIC_ASSERT_OFFSET(TextureSubresource, baseMipLevel);
+LLGL_STATIC_ASSERT_OFFSET(TextureSubresource, numMipLevels);
+
+LLGL_STATIC_ASSERT_SIZE(SubresourceFootprint);
+LLGL_STATIC_ASSERT_OFFSET(SubresourceFootprint, size);
+LLGL_STATIC_ASSERT_OFFSET(SubresourceFootprint, rowAlignment);
+LLGL_STATIC_ASSERT_OFFSET(SubresourceFootprint, rowSize);
+LLGL_STATIC_ASSERT_OFFSET(SubresourceFootprint, rowStride);
+LLGL_STATIC_ASSERT_OFFSET(SubresourceFootprint, layerSize);
+LLGL_STATIC_ASSERT_OFFSET(SubresourceFootprint, layerStride);
+
+LLGL_STATIC_ASSERT_SIZE(Extent2D);
+LLGL_STATIC_ASSERT_OFFSET(Extent2D, width);
+LLGL_STATIC_ASSERT_OFFSET(Extent2D, height);
+
+LLGL_STATIC_ASSERT_SIZE(Extent3D);
+LLGL_STATIC_ASSERT_OFFSET(Extent3D, width);
+LLGL_STATIC_ASSERT_OFFSET(Extent3D, height);
+LLGL_STATIC_ASSERT_OFFSET(Extent3D, depth);
+
+LLGL_STATIC_ASSERT_SIZE(Offset2D);
+LLGL_STATIC_ASSERT_OFFSET(Offset2D, x);
+LLGL_STATIC_ASSERT_OFFSET(Offset2D, y);
+
+LLGL_STATIC_ASSERT_SIZE(Offset3D);
+LLGL_STATIC_ASSERT_OFFSET(Offset3D, x);
+LLGL_STATIC_ASSERT_OFFSET(Offset3D, y);
+LLGL_STATIC_ASSERT_OFFSET(Offset3D, z);
+
+LLGL_STATIC_ASSERT_SIZE(BufferViewDescriptor);
+LLGL_STATIC_ASSERT_OFFSET(BufferViewDescriptor, format);
+LLGL_STATIC_ASSERT_OFFSET(BufferViewDescriptor, offset);
+LLGL_STATIC_ASSERT_OFFSET(BufferViewDescriptor, size);
+
+LLGL_STATIC_ASSERT_SIZE(AttachmentClear);
+LLGL_STATIC_ASSERT_OFFSET(AttachmentClear, flags);
+LLGL_STATIC_ASSERT_OFFSET(AttachmentClear, colorAttachment);
+LLGL_STATIC_ASSERT_OFFSET(AttachmentClear, clearValue);
+
+LLGL_STATIC_ASSERT_SIZE(DisplayModeDescriptor);
+LLGL_STATIC_ASSERT_OFFSET(DisplayModeDescriptor, resolution);
+LLGL_STATIC_ASSERT_OFFSET(DisplayModeDescriptor, refreshRate);
+
+LLGL_STATIC_ASSERT_SIZE(FormatAttributes);
+LLGL_STATIC_ASSERT_OFFSET(FormatAttributes, bitSize);
+LLGL_STATIC_ASSERT_OFFSET(FormatAttributes, blockWidth);
+LLGL_STATIC_ASSERT_OFFSET(FormatAttributes, blockHeight);
+LLGL_STATIC_ASSERT_OFFSET(FormatAttributes, components);
+LLGL_STATIC_ASSERT_OFFSET(FormatAttributes, format);
+LLGL_STATIC_ASSERT_OFFSET(FormatAttributes, dataType);
+LLGL_STATIC_ASSERT_OFFSET(FormatAttributes, flags);
+
+/* LLGLFragmentAttribute requires conversion: string 'name' */
+
 LLGL_STATIC_ASSERT_SIZE(ImageView);
 LLGL_STATIC_ASSERT_OFFSET(ImageView, format);
 LLGL_STATIC_ASSERT_OFFSET(ImageView, dataType);
@@ -928,6 +936,72 @@ LLGL_STATIC_ASSERT_OFFSET(MutableImageView, dataType);
 LLGL_STATIC_ASSERT_OFFSET(MutableImageView, data);
 LLGL_STATIC_ASSERT_OFFSET(MutableImageView, dataSize);
 
+/* LLGLBindingDescriptor requires conversion: string 'name' */
+
+/* LLGLUniformDescriptor requires conversion: string 'name' */
+
+LLGL_STATIC_ASSERT_SIZE(DepthDescriptor);
+LLGL_STATIC_ASSERT_OFFSET(DepthDescriptor, testEnabled);
+LLGL_STATIC_ASSERT_OFFSET(DepthDescriptor, writeEnabled);
+LLGL_STATIC_ASSERT_OFFSET(DepthDescriptor, compareOp);
+
+LLGL_STATIC_ASSERT_SIZE(StencilFaceDescriptor);
+LLGL_STATIC_ASSERT_OFFSET(StencilFaceDescriptor, stencilFailOp);
+LLGL_STATIC_ASSERT_OFFSET(StencilFaceDescriptor, depthFailOp);
+LLGL_STATIC_ASSERT_OFFSET(StencilFaceDescriptor, depthPassOp);
+LLGL_STATIC_ASSERT_OFFSET(StencilFaceDescriptor, compareOp);
+LLGL_STATIC_ASSERT_OFFSET(StencilFaceDescriptor, readMask);
+LLGL_STATIC_ASSERT_OFFSET(StencilFaceDescriptor, writeMask);
+LLGL_STATIC_ASSERT_OFFSET(StencilFaceDescriptor, reference);
+
+LLGL_STATIC_ASSERT_SIZE(RasterizerDescriptor);
+LLGL_STATIC_ASSERT_OFFSET(RasterizerDescriptor, polygonMode);
+LLGL_STATIC_ASSERT_OFFSET(RasterizerDescriptor, cullMode);
+LLGL_STATIC_ASSERT_OFFSET(RasterizerDescriptor, depthBias);
+LLGL_STATIC_ASSERT_OFFSET(RasterizerDescriptor, frontCCW);
+LLGL_STATIC_ASSERT_OFFSET(RasterizerDescriptor, discardEnabled);
+LLGL_STATIC_ASSERT_OFFSET(RasterizerDescriptor, depthClampEnabled);
+LLGL_STATIC_ASSERT_OFFSET(RasterizerDescriptor, scissorTestEnabled);
+LLGL_STATIC_ASSERT_OFFSET(RasterizerDescriptor, multiSampleEnabled);
+LLGL_STATIC_ASSERT_OFFSET(RasterizerDescriptor, antiAliasedLineEnabled);
+LLGL_STATIC_ASSERT_OFFSET(RasterizerDescriptor, conservativeRasterization);
+LLGL_STATIC_ASSERT_OFFSET(RasterizerDescriptor, lineWidth);
+
+LLGL_STATIC_ASSERT_SIZE(BlendTargetDescriptor);
+LLGL_STATIC_ASSERT_OFFSET(BlendTargetDescriptor, blendEnabled);
+LLGL_STATIC_ASSERT_OFFSET(BlendTargetDescriptor, srcColor);
+LLGL_STATIC_ASSERT_OFFSET(BlendTargetDescriptor, dstColor);
+LLGL_STATIC_ASSERT_OFFSET(BlendTargetDescriptor, colorArithmetic);
+LLGL_STATIC_ASSERT_OFFSET(BlendTargetDescriptor, srcAlpha);
+LLGL_STATIC_ASSERT_OFFSET(BlendTargetDescriptor, dstAlpha);
+LLGL_STATIC_ASSERT_OFFSET(BlendTargetDescriptor, alphaArithmetic);
+LLGL_STATIC_ASSERT_OFFSET(BlendTargetDescriptor, colorMask);
+
+LLGL_STATIC_ASSERT_SIZE(TessellationDescriptor);
+LLGL_STATIC_ASSERT_OFFSET(TessellationDescriptor, partition);
+LLGL_STATIC_ASSERT_OFFSET(TessellationDescriptor, maxTessFactor);
+LLGL_STATIC_ASSERT_OFFSET(TessellationDescriptor, outputWindingCCW);
+
+LLGL_STATIC_ASSERT_SIZE(QueryHeapDescriptor);
+LLGL_STATIC_ASSERT_OFFSET(QueryHeapDescriptor, type);
+LLGL_STATIC_ASSERT_OFFSET(QueryHeapDescriptor, numQueries);
+LLGL_STATIC_ASSERT_OFFSET(QueryHeapDescriptor, renderCondition);
+
+LLGL_STATIC_ASSERT_SIZE(AttachmentFormatDescriptor);
+LLGL_STATIC_ASSERT_OFFSET(AttachmentFormatDescriptor, format);
+LLGL_STATIC_ASSERT_OFFSET(AttachmentFormatDescriptor, loadOp);
+LLGL_STATIC_ASSERT_OFFSET(AttachmentFormatDescriptor, storeOp);
+
+/* LLGLRenderSystemDescriptor requires conversion: string 'moduleName' */
+
+/* LLGLRenderingCapabilities requires conversion: dynamic array 'shadingLanguages' */
+
+LLGL_STATIC_ASSERT_SIZE(AttachmentDescriptor);
+LLGL_STATIC_ASSERT_OFFSET(AttachmentDescriptor, format);
+LLGL_STATIC_ASSERT_OFFSET(AttachmentDescriptor, texture);
+LLGL_STATIC_ASSERT_OFFSET(AttachmentDescriptor, mipLevel);
+LLGL_STATIC_ASSERT_OFFSET(AttachmentDescriptor, arrayLayer);
+
 LLGL_STATIC_ASSERT_SIZE(SamplerDescriptor);
 LLGL_STATIC_ASSERT_OFFSET(SamplerDescriptor, addressModeU);
 LLGL_STATIC_ASSERT_OFFSET(SamplerDescriptor, addressModeV);
@@ -944,64 +1018,67 @@ LLGL_STATIC_ASSERT_OFFSET(SamplerDescriptor, compareEnabled);
 LLGL_STATIC_ASSERT_OFFSET(SamplerDescriptor, compareOp);
 LLGL_STATIC_ASSERT_OFFSET(SamplerDescriptor, borderColor);
 
-LLGL_STATIC_ASSERT_SIZE(ResourceViewDescriptor);
-LLGL_STATIC_ASSERT_OFFSET(ResourceViewDescriptor, resource);
-LLGL_STATIC_ASSERT_OFFSET(ResourceViewDescriptor, textureView);
-LLGL_STATIC_ASSERT_OFFSET(ResourceViewDescriptor, bufferView);
-LLGL_STATIC_ASSERT_OFFSET(ResourceViewDescriptor, initialCount);
+LLGL_STATIC_ASSERT_SIZE(ComputeShaderAttributes);
+LLGL_STATIC_ASSERT_OFFSET(ComputeShaderAttributes, workGroupSize);
 
-LLGL_STATIC_ASSERT_SIZE(ResourceHeapDescriptor);
-LLGL_STATIC_ASSERT_OFFSET(ResourceHeapDescriptor, pipelineLayout);
-LLGL_STATIC_ASSERT_OFFSET(ResourceHeapDescriptor, numResourceViews);
-LLGL_STATIC_ASSERT_OFFSET(ResourceHeapDescriptor, barrierFlags);
+LLGL_STATIC_ASSERT_SIZE(SwapChainDescriptor);
+LLGL_STATIC_ASSERT_OFFSET(SwapChainDescriptor, resolution);
+LLGL_STATIC_ASSERT_OFFSET(SwapChainDescriptor, colorBits);
+LLGL_STATIC_ASSERT_OFFSET(SwapChainDescriptor, depthBits);
+LLGL_STATIC_ASSERT_OFFSET(SwapChainDescriptor, stencilBits);
+LLGL_STATIC_ASSERT_OFFSET(SwapChainDescriptor, samples);
+LLGL_STATIC_ASSERT_OFFSET(SwapChainDescriptor, swapBuffers);
+LLGL_STATIC_ASSERT_OFFSET(SwapChainDescriptor, fullscreen);
 
-LLGL_STATIC_ASSERT_SIZE(ShaderMacro);
-LLGL_STATIC_ASSERT_OFFSET(ShaderMacro, name);
-LLGL_STATIC_ASSERT_OFFSET(ShaderMacro, definition);
+LLGL_STATIC_ASSERT_SIZE(TextureSwizzleRGBA);
+//LLGL_STATIC_ASSERT_OFFSET(TextureSwizzleRGBA, r);
+//LLGL_STATIC_ASSERT_OFFSET(TextureSwizzleRGBA, g);
+//LLGL_STATIC_ASSERT_OFFSET(TextureSwizzleRGBA, b);
+//LLGL_STATIC_ASSERT_OFFSET(TextureSwizzleRGBA, a);
 
-LLGL_STATIC_ASSERT_SIZE(ComputeShaderAttributes);
-LLGL_STATIC_ASSERT_OFFSET(ComputeShaderAttributes, workGroupSize);
+LLGL_STATIC_ASSERT_SIZE(TextureLocation);
+LLGL_STATIC_ASSERT_OFFSET(TextureLocation, offset);
+LLGL_STATIC_ASSERT_OFFSET(TextureLocation, arrayLayer);
+LLGL_STATIC_ASSERT_OFFSET(TextureLocation, mipLevel);
 
-LLGL_STATIC_ASSERT_SIZE(AttachmentDescriptor);
-LLGL_STATIC_ASSERT_OFFSET(AttachmentDescriptor, format);
-LLGL_STATIC_ASSERT_OFFSET(AttachmentDescriptor, texture);
-LLGL_STATIC_ASSERT_OFFSET(AttachmentDescriptor, mipLevel);
-LLGL_STATIC_ASSERT_OFFSET(AttachmentDescriptor, arrayLayer);
+LLGL_STATIC_ASSERT_SIZE(TextureRegion);
+LLGL_STATIC_ASSERT_OFFSET(TextureRegion, subresource);
+LLGL_STATIC_ASSERT_OFFSET(TextureRegion, offset);
+LLGL_STATIC_ASSERT_OFFSET(TextureRegion, extent);
 
-LLGL_STATIC_ASSERT_SIZE(RenderTargetDescriptor);
-LLGL_STATIC_ASSERT_OFFSET(RenderTargetDescriptor, renderPass);
-LLGL_STATIC_ASSERT_OFFSET(RenderTargetDescriptor, resolution);
-LLGL_STATIC_ASSERT_OFFSET(RenderTargetDescriptor, samples);
-LLGL_STATIC_ASSERT_OFFSET(RenderTargetDescriptor, colorAttachments);
-LLGL_STATIC_ASSERT_OFFSET(RenderTargetDescriptor, resolveAttachments);
-LLGL_STATIC_ASSERT_OFFSET(RenderTargetDescriptor, depthStencilAttachment);
+LLGL_STATIC_ASSERT_SIZE(TextureDescriptor);
+LLGL_STATIC_ASSERT_OFFSET(TextureDescriptor, type);
+LLGL_STATIC_ASSERT_OFFSET(TextureDescriptor, bindFlags);
+LLGL_STATIC_ASSERT_OFFSET(TextureDescriptor, miscFlags);
+LLGL_STATIC_ASSERT_OFFSET(TextureDescriptor, format);
+LLGL_STATIC_ASSERT_OFFSET(TextureDescriptor, extent);
+LLGL_STATIC_ASSERT_OFFSET(TextureDescriptor, arrayLayers);
+LLGL_STATIC_ASSERT_OFFSET(TextureDescriptor, mipLevels);
+LLGL_STATIC_ASSERT_OFFSET(TextureDescriptor, samples);
+LLGL_STATIC_ASSERT_OFFSET(TextureDescriptor, clearValue);
 
-LLGL_STATIC_ASSERT_SIZE(BindingSlot);
-LLGL_STATIC_ASSERT_OFFSET(BindingSlot, index);
-LLGL_STATIC_ASSERT_OFFSET(BindingSlot, set);
+/* LLGLVertexAttribute requires conversion: string 'name' */
 
-LLGL_STATIC_ASSERT_SIZE(QueryPipelineStatistics);
-LLGL_STATIC_ASSERT_OFFSET(QueryPipelineStatistics, inputAssemblyVertices);
-LLGL_STATIC_ASSERT_OFFSET(QueryPipelineStatistics, inputAssemblyPrimitives);
-LLGL_STATIC_ASSERT_OFFSET(QueryPipelineStatistics, vertexShaderInvocations);
-LLGL_STATIC_ASSERT_OFFSET(QueryPipelineStatistics, geometryShaderInvocations);
-LLGL_STATIC_ASSERT_OFFSET(QueryPipelineStatistics, geometryShaderPrimitives);
-LLGL_STATIC_ASSERT_OFFSET(QueryPipelineStatistics, clippingInvocations);
-LLGL_STATIC_ASSERT_OFFSET(QueryPipelineStatistics, clippingPrimitives);
-LLGL_STATIC_ASSERT_OFFSET(QueryPipelineStatistics, fragmentShaderInvocations);
-LLGL_STATIC_ASSERT_OFFSET(QueryPipelineStatistics, tessControlShaderInvocations);
-LLGL_STATIC_ASSERT_OFFSET(QueryPipelineStatistics, tessEvaluationShaderInvocations);
-LLGL_STATIC_ASSERT_OFFSET(QueryPipelineStatistics, computeShaderInvocations);
+/* LLGLWindowDescriptor requires conversion: string 'title' */
 
-LLGL_STATIC_ASSERT_SIZE(QueryHeapDescriptor);
-LLGL_STATIC_ASSERT_OFFSET(QueryHeapDescriptor, type);
-LLGL_STATIC_ASSERT_OFFSET(QueryHeapDescriptor, numQueries);
-LLGL_STATIC_ASSERT_OFFSET(QueryHeapDescriptor, renderCondition);
+/* LLGLBufferDescriptor requires conversion: dynamic array 'vertexAttribs' */
 
-LLGL_STATIC_ASSERT_SIZE(AttachmentFormatDescriptor);
-LLGL_STATIC_ASSERT_OFFSET(AttachmentFormatDescriptor, format);
-LLGL_STATIC_ASSERT_OFFSET(AttachmentFormatDescriptor, loadOp);
-LLGL_STATIC_ASSERT_OFFSET(AttachmentFormatDescriptor, storeOp);
+/* LLGLStaticSamplerDescriptor requires conversion: string 'name' */
+
+LLGL_STATIC_ASSERT_SIZE(StencilDescriptor);
+LLGL_STATIC_ASSERT_OFFSET(StencilDescriptor, testEnabled);
+LLGL_STATIC_ASSERT_OFFSET(StencilDescriptor, referenceDynamic);
+LLGL_STATIC_ASSERT_OFFSET(StencilDescriptor, front);
+LLGL_STATIC_ASSERT_OFFSET(StencilDescriptor, back);
+
+LLGL_STATIC_ASSERT_SIZE(BlendDescriptor);
+LLGL_STATIC_ASSERT_OFFSET(BlendDescriptor, alphaToCoverageEnabled);
+LLGL_STATIC_ASSERT_OFFSET(BlendDescriptor, independentBlendEnabled);
+LLGL_STATIC_ASSERT_OFFSET(BlendDescriptor, sampleMask);
+LLGL_STATIC_ASSERT_OFFSET(BlendDescriptor, logicOp);
+LLGL_STATIC_ASSERT_OFFSET(BlendDescriptor, blendFactor);
+LLGL_STATIC_ASSERT_OFFSET(BlendDescriptor, blendFactorDynamic);
+LLGL_STATIC_ASSERT_OFFSET(BlendDescriptor, targets);
 
 LLGL_STATIC_ASSERT_SIZE(RenderPassDescriptor);
 LLGL_STATIC_ASSERT_OFFSET(RenderPassDescriptor, colorAttachments);
@@ -1009,34 +1086,556 @@ LLGL_STATIC_ASSERT_OFFSET(RenderPassDescriptor, depthAttachment);
 LLGL_STATIC_ASSERT_OFFSET(RenderPassDescriptor, stencilAttachment);
 LLGL_STATIC_ASSERT_OFFSET(RenderPassDescriptor, samples);
 
-LLGL_STATIC_ASSERT_SIZE(DisplayModeDescriptor);
-LLGL_STATIC_ASSERT_OFFSET(DisplayModeDescriptor, resolution);
-LLGL_STATIC_ASSERT_OFFSET(DisplayModeDescriptor, refreshRate);
+LLGL_STATIC_ASSERT_SIZE(RenderTargetDescriptor);
+LLGL_STATIC_ASSERT_OFFSET(RenderTargetDescriptor, renderPass);
+LLGL_STATIC_ASSERT_OFFSET(RenderTargetDescriptor, resolution);
+LLGL_STATIC_ASSERT_OFFSET(RenderTargetDescriptor, samples);
+LLGL_STATIC_ASSERT_OFFSET(RenderTargetDescriptor, colorAttachments);
+LLGL_STATIC_ASSERT_OFFSET(RenderTargetDescriptor, resolveAttachments);
+LLGL_STATIC_ASSERT_OFFSET(RenderTargetDescriptor, depthStencilAttachment);
 
-LLGL_STATIC_ASSERT_SIZE(DrawIndirectArguments);
-LLGL_STATIC_ASSERT_OFFSET(DrawIndirectArguments, numVertices);
-LLGL_STATIC_ASSERT_OFFSET(DrawIndirectArguments, numInstances);
-LLGL_STATIC_ASSERT_OFFSET(DrawIndirectArguments, firstVertex);
-LLGL_STATIC_ASSERT_OFFSET(DrawIndirectArguments, firstInstance);
+/* LLGLVertexShaderAttributes requires conversion: dynamic array 'inputAttribs' */
 
-LLGL_STATIC_ASSERT_SIZE(DrawIndexedIndirectArguments);
-LLGL_STATIC_ASSERT_OFFSET(DrawIndexedIndirectArguments, numIndices);
-LLGL_STATIC_ASSERT_OFFSET(DrawIndexedIndirectArguments, numInstances);
-LLGL_STATIC_ASSERT_OFFSET(DrawIndexedIndirectArguments, firstIndex);
-LLGL_STATIC_ASSERT_OFFSET(DrawIndexedIndirectArguments, vertexOffset);
-LLGL_STATIC_ASSERT_OFFSET(DrawIndexedIndirectArguments, firstInstance);
+/* LLGLFragmentShaderAttributes requires conversion: dynamic array 'outputAttribs' */
 
-LLGL_STATIC_ASSERT_SIZE(DrawPatchIndirectArguments);
-LLGL_STATIC_ASSERT_OFFSET(DrawPatchIndirectArguments, numPatches);
-LLGL_STATIC_ASSERT_OFFSET(DrawPatchIndirectArguments, numInstances);
-LLGL_STATIC_ASSERT_OFFSET(DrawPatchIndirectArguments, firstPatch);
-LLGL_STATIC_ASSERT_OFFSET(DrawPatchIndirectArguments, firstInstance);
+/* LLGLShaderResourceReflection requires conversion: nested struct 'BindingDescriptor' in field 'binding' differs */
 
-LLGL_STATIC_ASSERT_SIZE(DispatchIndirectArguments);
-LLGL_STATIC_ASSERT_OFFSET(DispatchIndirectArguments, numThreadGroups);
+LLGL_STATIC_ASSERT_SIZE(TextureViewDescriptor);
+LLGL_STATIC_ASSERT_OFFSET(TextureViewDescriptor, type);
+LLGL_STATIC_ASSERT_OFFSET(TextureViewDescriptor, format);
+LLGL_STATIC_ASSERT_OFFSET(TextureViewDescriptor, subresource);
+LLGL_STATIC_ASSERT_OFFSET(TextureViewDescriptor, swizzle);
+
+/* LLGLPipelineLayoutDescriptor requires conversion: dynamic array 'heapBindings' */
+
+/* LLGLGraphicsPipelineDescriptor requires conversion: dynamic array 'viewports' */
+
+LLGL_STATIC_ASSERT_SIZE(ResourceViewDescriptor);
+LLGL_STATIC_ASSERT_OFFSET(ResourceViewDescriptor, resource);
+LLGL_STATIC_ASSERT_OFFSET(ResourceViewDescriptor, textureView);
+LLGL_STATIC_ASSERT_OFFSET(ResourceViewDescriptor, bufferView);
+LLGL_STATIC_ASSERT_OFFSET(ResourceViewDescriptor, initialCount);
 
+/* LLGLShaderDescriptor requires conversion: nested struct 'VertexShaderAttributes' in field 'vertex' differs */
+
+/* LLGLShaderReflection requires conversion: dynamic array 'resources' */
+
+
+/* ----- x86-64 System V ABI ----- */
+
+#if defined __x86_64__ && !defined _WIN32
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(CanvasDescriptor, 16, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(CanvasDescriptor, title, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(CanvasDescriptor, flags, 8);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(ClearValue, 24, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ClearValue, color, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ClearValue, depth, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ClearValue, stencil, 20);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(CommandBufferDescriptor, 24, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(CommandBufferDescriptor, flags, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(CommandBufferDescriptor, numNativeBuffers, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(CommandBufferDescriptor, minStagingPoolSize, 16);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(DrawIndirectArguments, 16, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(DrawIndirectArguments, numVertices, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(DrawIndirectArguments, numInstances, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(DrawIndirectArguments, firstVertex, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(DrawIndirectArguments, firstInstance, 12);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(DrawIndexedIndirectArguments, 20, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(DrawIndexedIndirectArguments, numIndices, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(DrawIndexedIndirectArguments, numInstances, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(DrawIndexedIndirectArguments, firstIndex, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(DrawIndexedIndirectArguments, vertexOffset, 12);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(DrawIndexedIndirectArguments, firstInstance, 16);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(DrawPatchIndirectArguments, 16, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(DrawPatchIndirectArguments, numPatches, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(DrawPatchIndirectArguments, numInstances, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(DrawPatchIndirectArguments, firstPatch, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(DrawPatchIndirectArguments, firstInstance, 12);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(DispatchIndirectArguments, 12, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(DispatchIndirectArguments, numThreadGroups, 0);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(BindingSlot, 8, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BindingSlot, index, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BindingSlot, set, 4);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(Viewport, 24, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(Viewport, x, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(Viewport, y, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(Viewport, width, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(Viewport, height, 12);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(Viewport, minDepth, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(Viewport, maxDepth, 20);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(Scissor, 16, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(Scissor, x, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(Scissor, y, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(Scissor, width, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(Scissor, height, 12);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(DepthBiasDescriptor, 12, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(DepthBiasDescriptor, constantFactor, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(DepthBiasDescriptor, slopeFactor, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(DepthBiasDescriptor, clamp, 8);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(ComputePipelineDescriptor, 16, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ComputePipelineDescriptor, pipelineLayout, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ComputePipelineDescriptor, computeShader, 8);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(QueryPipelineStatistics, 88, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(QueryPipelineStatistics, inputAssemblyVertices, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(QueryPipelineStatistics, inputAssemblyPrimitives, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(QueryPipelineStatistics, vertexShaderInvocations, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(QueryPipelineStatistics, geometryShaderInvocations, 24);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(QueryPipelineStatistics, geometryShaderPrimitives, 32);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(QueryPipelineStatistics, clippingInvocations, 40);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(QueryPipelineStatistics, clippingPrimitives, 48);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(QueryPipelineStatistics, fragmentShaderInvocations, 56);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(QueryPipelineStatistics, tessControlShaderInvocations, 64);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(QueryPipelineStatistics, tessEvaluationShaderInvocations, 72);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(QueryPipelineStatistics, computeShaderInvocations, 80);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(RendererInfo, 64, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RendererInfo, rendererName, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RendererInfo, deviceName, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RendererInfo, vendorName, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RendererInfo, shadingLanguageName, 24);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RendererInfo, numExtensionNames, 32);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RendererInfo, extensionNames, 40);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RendererInfo, numPipelineCacheID, 48);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RendererInfo, pipelineCacheID, 56);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(RenderingFeatures, 29, 1);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasRenderTargets, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, has3DTextures, 1);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasCubeTextures, 2);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasArrayTextures, 3);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasCubeArrayTextures, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasMultiSampleTextures, 5);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasMultiSampleArrayTextures, 6);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasTextureViews, 7);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasTextureViewSwizzle, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasTextureViewFormatSwizzle, 9);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasBufferViews, 10);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasSamplers, 11);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasConstantBuffers, 12);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasStorageBuffers, 13);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasUniforms, 14);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasGeometryShaders, 15);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasTessellationShaders, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasTessellatorStage, 17);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasComputeShaders, 18);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasInstancing, 19);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasOffsetInstancing, 20);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasIndirectDrawing, 21);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasViewportArrays, 22);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasConservativeRasterization, 23);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasStreamOutputs, 24);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasLogicOp, 25);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasPipelineCaching, 26);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasPipelineStatistics, 27);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingFeatures, hasRenderCondition, 28);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(RenderingLimits, 144, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, lineWidthRange, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, maxTextureArrayLayers, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, maxColorAttachments, 12);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, maxPatchVertices, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, max1DTextureSize, 20);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, max2DTextureSize, 24);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, max3DTextureSize, 28);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, maxCubeTextureSize, 32);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, maxAnisotropy, 36);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, maxComputeShaderWorkGroups, 40);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, maxComputeShaderWorkGroupSize, 52);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, maxViewports, 64);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, maxViewportSize, 68);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, maxBufferSize, 80);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, maxConstantBufferSize, 88);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, maxStreamOutputs, 96);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, maxTessFactor, 100);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, minConstantBufferAlignment, 104);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, minSampledBufferAlignment, 112);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, minStorageBufferAlignment, 120);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, maxColorBufferSamples, 128);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, maxDepthBufferSamples, 132);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, maxStencilBufferSamples, 136);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingLimits, maxNoAttachmentSamples, 140);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(ResourceHeapDescriptor, 24, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ResourceHeapDescriptor, pipelineLayout, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ResourceHeapDescriptor, numResourceViews, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ResourceHeapDescriptor, barrierFlags, 16);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(ShaderMacro, 16, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderMacro, name, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderMacro, definition, 8);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(TextureSubresource, 16, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TextureSubresource, baseArrayLayer, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TextureSubresource, numArrayLayers, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TextureSubresource, baseMipLevel, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TextureSubresource, numMipLevels, 12);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(SubresourceFootprint, 32, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SubresourceFootprint, size, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SubresourceFootprint, rowAlignment, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SubresourceFootprint, rowSize, 12);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SubresourceFootprint, rowStride, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SubresourceFootprint, layerSize, 20);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SubresourceFootprint, layerStride, 24);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(Extent2D, 8, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(Extent2D, width, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(Extent2D, height, 4);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(Extent3D, 12, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(Extent3D, width, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(Extent3D, height, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(Extent3D, depth, 8);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(Offset2D, 8, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(Offset2D, x, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(Offset2D, y, 4);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(Offset3D, 12, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(Offset3D, x, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(Offset3D, y, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(Offset3D, z, 8);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(BufferViewDescriptor, 24, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BufferViewDescriptor, format, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BufferViewDescriptor, offset, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BufferViewDescriptor, size, 16);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(AttachmentClear, 40, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(AttachmentClear, flags, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(AttachmentClear, colorAttachment, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(AttachmentClear, clearValue, 12);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(DisplayModeDescriptor, 12, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(DisplayModeDescriptor, resolution, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(DisplayModeDescriptor, refreshRate, 8);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(FormatAttributes, 24, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(FormatAttributes, bitSize, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(FormatAttributes, blockWidth, 2);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(FormatAttributes, blockHeight, 3);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(FormatAttributes, components, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(FormatAttributes, format, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(FormatAttributes, dataType, 12);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(FormatAttributes, flags, 16);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(FragmentAttribute, 24, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(FragmentAttribute, name, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(FragmentAttribute, format, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(FragmentAttribute, location, 12);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(FragmentAttribute, systemValue, 16);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(ImageView, 24, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ImageView, format, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ImageView, dataType, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ImageView, data, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ImageView, dataSize, 16);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(MutableImageView, 24, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(MutableImageView, format, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(MutableImageView, dataType, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(MutableImageView, data, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(MutableImageView, dataSize, 16);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(BindingDescriptor, 48, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BindingDescriptor, name, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BindingDescriptor, type, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BindingDescriptor, bindFlags, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BindingDescriptor, stageFlags, 24);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BindingDescriptor, slot, 32);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BindingDescriptor, arraySize, 40);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(UniformDescriptor, 16, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(UniformDescriptor, name, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(UniformDescriptor, type, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(UniformDescriptor, arraySize, 12);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(DepthDescriptor, 8, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(DepthDescriptor, testEnabled, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(DepthDescriptor, writeEnabled, 1);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(DepthDescriptor, compareOp, 4);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(StencilFaceDescriptor, 28, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(StencilFaceDescriptor, stencilFailOp, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(StencilFaceDescriptor, depthFailOp, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(StencilFaceDescriptor, depthPassOp, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(StencilFaceDescriptor, compareOp, 12);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(StencilFaceDescriptor, readMask, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(StencilFaceDescriptor, writeMask, 20);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(StencilFaceDescriptor, reference, 24);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(RasterizerDescriptor, 32, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RasterizerDescriptor, polygonMode, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RasterizerDescriptor, cullMode, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RasterizerDescriptor, depthBias, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RasterizerDescriptor, frontCCW, 20);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RasterizerDescriptor, discardEnabled, 21);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RasterizerDescriptor, depthClampEnabled, 22);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RasterizerDescriptor, scissorTestEnabled, 23);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RasterizerDescriptor, multiSampleEnabled, 24);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RasterizerDescriptor, antiAliasedLineEnabled, 25);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RasterizerDescriptor, conservativeRasterization, 26);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RasterizerDescriptor, lineWidth, 28);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(BlendTargetDescriptor, 32, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BlendTargetDescriptor, blendEnabled, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BlendTargetDescriptor, srcColor, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BlendTargetDescriptor, dstColor, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BlendTargetDescriptor, colorArithmetic, 12);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BlendTargetDescriptor, srcAlpha, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BlendTargetDescriptor, dstAlpha, 20);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BlendTargetDescriptor, alphaArithmetic, 24);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BlendTargetDescriptor, colorMask, 28);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(TessellationDescriptor, 12, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TessellationDescriptor, partition, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TessellationDescriptor, maxTessFactor, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TessellationDescriptor, outputWindingCCW, 8);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(QueryHeapDescriptor, 12, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(QueryHeapDescriptor, type, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(QueryHeapDescriptor, numQueries, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(QueryHeapDescriptor, renderCondition, 8);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(AttachmentFormatDescriptor, 12, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(AttachmentFormatDescriptor, format, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(AttachmentFormatDescriptor, loadOp, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(AttachmentFormatDescriptor, storeOp, 8);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(RenderSystemDescriptor, 48, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderSystemDescriptor, moduleName, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderSystemDescriptor, flags, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderSystemDescriptor, profiler, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderSystemDescriptor, debugger, 24);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderSystemDescriptor, rendererConfig, 32);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderSystemDescriptor, rendererConfigSize, 40);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(RenderingCapabilities, 216, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingCapabilities, screenOrigin, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingCapabilities, clippingRange, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingCapabilities, numShadingLanguages, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingCapabilities, shadingLanguages, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingCapabilities, numTextureFormats, 24);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingCapabilities, textureFormats, 32);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingCapabilities, features, 40);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderingCapabilities, limits, 72);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(AttachmentDescriptor, 24, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(AttachmentDescriptor, format, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(AttachmentDescriptor, texture, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(AttachmentDescriptor, mipLevel, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(AttachmentDescriptor, arrayLayer, 20);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(SamplerDescriptor, 68, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SamplerDescriptor, addressModeU, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SamplerDescriptor, addressModeV, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SamplerDescriptor, addressModeW, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SamplerDescriptor, minFilter, 12);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SamplerDescriptor, magFilter, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SamplerDescriptor, mipMapFilter, 20);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SamplerDescriptor, mipMapEnabled, 24);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SamplerDescriptor, mipMapLODBias, 28);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SamplerDescriptor, minLOD, 32);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SamplerDescriptor, maxLOD, 36);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SamplerDescriptor, maxAnisotropy, 40);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SamplerDescriptor, compareEnabled, 44);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SamplerDescriptor, compareOp, 48);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SamplerDescriptor, borderColor, 52);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(ComputeShaderAttributes, 12, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ComputeShaderAttributes, workGroupSize, 0);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(SwapChainDescriptor, 32, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SwapChainDescriptor, resolution, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SwapChainDescriptor, colorBits, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SwapChainDescriptor, depthBits, 12);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SwapChainDescriptor, stencilBits, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SwapChainDescriptor, samples, 20);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SwapChainDescriptor, swapBuffers, 24);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(SwapChainDescriptor, fullscreen, 28);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(TextureSwizzleRGBA, 4, 4);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(TextureLocation, 20, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TextureLocation, offset, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TextureLocation, arrayLayer, 12);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TextureLocation, mipLevel, 16);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(TextureRegion, 40, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TextureRegion, subresource, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TextureRegion, offset, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TextureRegion, extent, 28);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(TextureDescriptor, 80, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TextureDescriptor, type, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TextureDescriptor, bindFlags, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TextureDescriptor, miscFlags, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TextureDescriptor, format, 24);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TextureDescriptor, extent, 28);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TextureDescriptor, arrayLayers, 40);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TextureDescriptor, mipLevels, 44);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TextureDescriptor, samples, 48);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TextureDescriptor, clearValue, 52);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(VertexAttribute, 40, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(VertexAttribute, name, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(VertexAttribute, format, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(VertexAttribute, location, 12);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(VertexAttribute, semanticIndex, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(VertexAttribute, systemValue, 20);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(VertexAttribute, slot, 24);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(VertexAttribute, offset, 28);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(VertexAttribute, stride, 32);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(VertexAttribute, instanceDivisor, 36);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(WindowDescriptor, 48, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(WindowDescriptor, title, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(WindowDescriptor, position, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(WindowDescriptor, size, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(WindowDescriptor, flags, 24);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(WindowDescriptor, windowContext, 32);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(WindowDescriptor, windowContextSize, 40);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(BufferDescriptor, 56, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BufferDescriptor, size, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BufferDescriptor, stride, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BufferDescriptor, format, 12);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BufferDescriptor, bindFlags, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BufferDescriptor, cpuAccessFlags, 24);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BufferDescriptor, miscFlags, 32);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BufferDescriptor, numVertexAttribs, 40);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BufferDescriptor, vertexAttribs, 48);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(StaticSamplerDescriptor, 96, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(StaticSamplerDescriptor, name, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(StaticSamplerDescriptor, stageFlags, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(StaticSamplerDescriptor, slot, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(StaticSamplerDescriptor, sampler, 24);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(StencilDescriptor, 60, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(StencilDescriptor, testEnabled, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(StencilDescriptor, referenceDynamic, 1);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(StencilDescriptor, front, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(StencilDescriptor, back, 32);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(BlendDescriptor, 288, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BlendDescriptor, alphaToCoverageEnabled, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BlendDescriptor, independentBlendEnabled, 1);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BlendDescriptor, sampleMask, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BlendDescriptor, logicOp, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BlendDescriptor, blendFactor, 12);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BlendDescriptor, blendFactorDynamic, 28);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(BlendDescriptor, targets, 32);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(RenderPassDescriptor, 124, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderPassDescriptor, colorAttachments, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderPassDescriptor, depthAttachment, 96);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderPassDescriptor, stencilAttachment, 108);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderPassDescriptor, samples, 120);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(RenderTargetDescriptor, 432, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderTargetDescriptor, renderPass, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderTargetDescriptor, resolution, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderTargetDescriptor, samples, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderTargetDescriptor, colorAttachments, 24);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderTargetDescriptor, resolveAttachments, 216);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(RenderTargetDescriptor, depthStencilAttachment, 408);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(VertexShaderAttributes, 32, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(VertexShaderAttributes, numInputAttribs, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(VertexShaderAttributes, inputAttribs, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(VertexShaderAttributes, numOutputAttribs, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(VertexShaderAttributes, outputAttribs, 24);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(FragmentShaderAttributes, 16, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(FragmentShaderAttributes, numOutputAttribs, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(FragmentShaderAttributes, outputAttribs, 8);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(ShaderResourceReflection, 56, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderResourceReflection, binding, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderResourceReflection, constantBufferSize, 48);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderResourceReflection, storageBufferType, 52);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(TextureViewDescriptor, 28, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TextureViewDescriptor, type, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TextureViewDescriptor, format, 4);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TextureViewDescriptor, subresource, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(TextureViewDescriptor, swizzle, 24);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(PipelineLayoutDescriptor, 64, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(PipelineLayoutDescriptor, numHeapBindings, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(PipelineLayoutDescriptor, heapBindings, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(PipelineLayoutDescriptor, numBindings, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(PipelineLayoutDescriptor, bindings, 24);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(PipelineLayoutDescriptor, numStaticSamplers, 32);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(PipelineLayoutDescriptor, staticSamplers, 40);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(PipelineLayoutDescriptor, numUniforms, 48);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(PipelineLayoutDescriptor, uniforms, 56);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(GraphicsPipelineDescriptor, 496, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(GraphicsPipelineDescriptor, pipelineLayout, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(GraphicsPipelineDescriptor, renderPass, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(GraphicsPipelineDescriptor, vertexShader, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(GraphicsPipelineDescriptor, tessControlShader, 24);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(GraphicsPipelineDescriptor, tessEvaluationShader, 32);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(GraphicsPipelineDescriptor, geometryShader, 40);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(GraphicsPipelineDescriptor, fragmentShader, 48);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(GraphicsPipelineDescriptor, indexFormat, 56);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(GraphicsPipelineDescriptor, primitiveTopology, 60);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(GraphicsPipelineDescriptor, numViewports, 64);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(GraphicsPipelineDescriptor, viewports, 72);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(GraphicsPipelineDescriptor, numScissors, 80);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(GraphicsPipelineDescriptor, scissors, 88);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(GraphicsPipelineDescriptor, depth, 96);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(GraphicsPipelineDescriptor, stencil, 104);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(GraphicsPipelineDescriptor, rasterizer, 164);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(GraphicsPipelineDescriptor, blend, 196);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(GraphicsPipelineDescriptor, tessellation, 484);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(ResourceViewDescriptor, 72, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ResourceViewDescriptor, resource, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ResourceViewDescriptor, textureView, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ResourceViewDescriptor, bufferView, 40);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ResourceViewDescriptor, initialCount, 64);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(ShaderDescriptor, 136, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderDescriptor, type, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderDescriptor, source, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderDescriptor, sourceSize, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderDescriptor, sourceType, 24);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderDescriptor, entryPoint, 32);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderDescriptor, profile, 40);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderDescriptor, defines, 48);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderDescriptor, flags, 56);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderDescriptor, name, 64);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderDescriptor, vertex, 72);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderDescriptor, fragment, 104);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderDescriptor, compute, 120);
+
+LLGL_STATIC_ASSERT_SYSV_SIZE(ShaderReflection, 96, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderReflection, numResources, 0);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderReflection, resources, 8);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderReflection, numUniforms, 16);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderReflection, uniforms, 24);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderReflection, vertex, 32);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderReflection, fragment, 64);
+LLGL_STATIC_ASSERT_SYSV_OFFSET(ShaderReflection, compute, 80);
+
+#endif /* __x86_64__ && !_WIN32 */
 
-// } /namespace LLGL
 
 
 